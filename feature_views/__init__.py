@@ -0,0 +1,102 @@
+"""
+Feast Feature Views - Lazily Loaded Package
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+Each of the 23 feature views lives in its own module and is only
+constructed when it is first accessed, so a service that needs three views
+does not build them all. `feast apply` imports every module in the repo and
+still registers every view.
+
+Usage:
+    from feature_views import pro_core_features_fv      # builds one view
+    feature_views.get_feature_view("pro_quiz_features")
+    feature_views.all_feature_views()                   # builds every view
+"""
+
+import importlib
+
+# Feature view name -> module in this package
+FEATURE_VIEW_MODULES = {
+    "business_features": "business_features",
+    "business_hypertrack_features": "business_hypertrack_features",
+    "business_no_show_features": "business_no_show_features",
+    "pro_amplitude_features": "pro_amplitude_features",
+    "pro_attire_features": "pro_attire_features",
+    "pro_business_features": "pro_business_features",
+    "pro_company_features": "pro_company_features",
+    "pro_core_features": "pro_core_features",
+    "pro_education_features": "pro_education_features",
+    "pro_experience_features": "pro_experience_features",
+    "pro_hypertrack_features": "pro_hypertrack_features",
+    "pro_position_rating_features": "pro_position_rating_features",
+    "pro_quality_ratings_features": "pro_quality_ratings_features",
+    "pro_quiz_features": "pro_quiz_features",
+    "pro_referral_features": "pro_referral_features",
+    "pro_resume_features": "pro_resume_features",
+    "pro_shift_features": "pro_shift_features",
+    "pro_shift_outcome_features": "pro_shift_outcome_features",
+    "pro_skill_vector_features": "pro_skill_vector_features",
+    "pro_ticket_features": "pro_ticket_features",
+    "pro_time_features": "pro_time_features",
+    "shift_benefits_features": "shift_benefits_features",
+    "shift_core_features": "shift_core_features",
+}
+
+# Feature view name -> entity
+FEATURE_VIEW_ENTITIES = {
+    "business_features": "business",
+    "business_hypertrack_features": "business",
+    "business_no_show_features": "business",
+    "pro_amplitude_features": "worker",
+    "pro_attire_features": "worker",
+    "pro_business_features": "worker",
+    "pro_company_features": "worker",
+    "pro_core_features": "worker",
+    "pro_education_features": "worker",
+    "pro_experience_features": "worker",
+    "pro_hypertrack_features": "worker",
+    "pro_position_rating_features": "worker",
+    "pro_quality_ratings_features": "worker",
+    "pro_quiz_features": "worker",
+    "pro_referral_features": "worker",
+    "pro_resume_features": "worker",
+    "pro_shift_features": "worker",
+    "pro_shift_outcome_features": "worker",
+    "pro_skill_vector_features": "worker",
+    "pro_ticket_features": "worker",
+    "pro_time_features": "worker",
+    "shift_benefits_features": "shift",
+    "shift_core_features": "shift",
+}
+
+
+def _load_module(view_name):
+    return importlib.import_module(f"{__name__}.{FEATURE_VIEW_MODULES[view_name]}")
+
+
+def get_feature_view(view_name):
+    """Construct (on first access) and return a feature view by name"""
+    return getattr(_load_module(view_name), f"{view_name}_fv")
+
+
+def all_feature_views():
+    """Construct and return every feature view"""
+    return [get_feature_view(view_name) for view_name in FEATURE_VIEW_MODULES]
+
+
+def feature_views_for_entity(entity_name):
+    """Construct and return the feature views of one entity"""
+    return [
+        get_feature_view(view_name)
+        for view_name, view_entity in FEATURE_VIEW_ENTITIES.items()
+        if view_entity == entity_name
+    ]
+
+
+def __getattr__(attr):
+    # <view>_fv and <view>_source resolve to the lazily imported module
+    for suffix in ("_fv", "_source"):
+        view_name = attr[: -len(suffix)]
+        if attr.endswith(suffix) and view_name in FEATURE_VIEW_MODULES:
+            return getattr(_load_module(view_name), attr)
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
@@ -0,0 +1,40 @@
+"""
+Business Hypertrack Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Float64, Int64
+from datetime import timedelta
+from entities import business_entity
+
+# Business Hypertrack Features
+business_hypertrack_features_source = RedshiftSource(
+    name="business_hypertrack_features_source",
+    schema="dbt-cchia",
+    table="business_hypertrack_features_inference",
+    timestamp_field="ts_ds",
+)
+
+business_hypertrack_features_fv = FeatureView(
+    name="business_hypertrack_features",
+    entities=[business_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="rv_int_n_business_shifts", dtype=Int64),
+        Field(name="rv_float_avg_business_tracking_rate", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_avg_business_time_in_fence", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_avg_business_active_time", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_avg_business_total_duration", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_avg_business_in_fence_rate", dtype=Float64, tags={"online_encoding": "float32"}),
+    ],
+    source=business_hypertrack_features_source,
+    tags={
+        "source": "redshift",
+        "table": "business_hypertrack_features_inference",
+        "entity": "business"
+    },
+)
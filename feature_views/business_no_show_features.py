@@ -0,0 +1,42 @@
+"""
+Business No Show Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Float64, Int64
+from datetime import timedelta
+from entities import business_entity
+
+# Business No Show Features
+business_no_show_features_source = RedshiftSource(
+    name="business_no_show_features_source",
+    schema="dbt-cchia",
+    table="business_no_show_features_inference",
+    timestamp_field="ts_ds",
+)
+
+business_no_show_features_fv = FeatureView(
+    name="business_no_show_features",
+    entities=[business_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="rv_int_cumulative_auto_no_shows", dtype=Int64),
+        Field(name="rv_int_business_cumulative_filled_shifts", dtype=Int64),
+        Field(name="rv_int_cumulative_corrected_auto_no_shows", dtype=Int64),
+        Field(name="rv_int_cumulative_corrected_manual_no_shows", dtype=Int64),
+        Field(name="rv_int_cumulative_manual_no_shows", dtype=Int64),
+        Field(name="rv_float_correction_rate", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_manual_no_show_rate", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_auto_no_show_rate", dtype=Float64, tags={"online_encoding": "float32"}),
+    ],
+    source=business_no_show_features_source,
+    tags={
+        "source": "redshift",
+        "table": "business_no_show_features_inference",
+        "entity": "business"
+    },
+)
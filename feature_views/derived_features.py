@@ -0,0 +1,57 @@
+"""
+Derived Features
+
+Features that are arithmetic over other stored features of the same view.
+Once a feature is left out of the online schema (online_schema.py), it is
+computed over the batch at online read time by
+instawork_feast.retrieval.get_online_features (see instawork_feast/derived.py)
+instead of being stored in the online store; until then reads return the
+stored column.
+
+This module is maintained by hand; codegen does not overwrite it. Before you
+add a feature to ONLINE_EXCLUDE, run
+`python scripts/check_derived_features.py data`. It confirms that the
+declaration reproduces the stored values.
+"""
+
+from instawork_feast.derived import flag, ratio
+
+DERIVED_FEATURES = [
+    # pro_attire_features
+    ratio(
+        "pro_attire_features",
+        "rv_float_attire_acceptance_rate",
+        "rv_int_offshift_num_accepted_attires",
+        "rv_int_offshift_num_attire_submissions",
+    ),
+    ratio(
+        "pro_attire_features",
+        "rv_float_attire_rejection_rate",
+        "rv_int_offshift_num_rejected_attires",
+        "rv_int_offshift_num_attire_submissions",
+    ),
+    flag("pro_attire_features", "b_has_accepted_attire", "rv_int_offshift_num_accepted_attires"),
+    flag("pro_attire_features", "b_has_rejected_attire", "rv_int_offshift_num_rejected_attires"),
+    flag(
+        "pro_attire_features", "b_has_attire_submissions", "rv_int_offshift_num_attire_submissions"
+    ),
+    # pro_amplitude_features
+    ratio(
+        "pro_amplitude_features",
+        "rv_float_events_per_session",
+        "rv_int_total_events",
+        "rv_int_total_unique_sessions",
+    ),
+    ratio(
+        "pro_amplitude_features",
+        "rv_float_unique_event_types_per_session",
+        "rv_int_total_unique_event_types",
+        "rv_int_total_unique_sessions",
+    ),
+    ratio(
+        "pro_amplitude_features",
+        "rv_float_total_time_per_session",
+        "rv_int_total_session_time_seconds",
+        "rv_int_total_unique_sessions",
+    ),
+]
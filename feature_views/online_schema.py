@@ -0,0 +1,22 @@
+"""
+Online Schema
+
+Features left out of the online store. They remain available through
+get_historical_features. instawork_feast.materialize writes every other
+feature. See instawork_feast/online_schema.py.
+
+This module is maintained by hand; codegen does not overwrite it. Nothing is
+excluded by default. To fill it, run
+`python scripts/feature_usage_report.py --suggest --days 30` and copy the
+entries it prints into ONLINE_EXCLUDE, or add a pattern here when a whole
+family of columns (e.g. "ts_*") appears in it for every view. The report's
+online counts come from a 1% sample of requests, so a feature read only by a
+rare request path can show no reads: treat its output as candidates and
+confirm with the owners of every online model before excluding a feature.
+"""
+
+# fnmatch patterns left out of every view's online schema, e.g. ["ts_*"]
+ONLINE_EXCLUDE_PATTERNS = []
+
+# Per-view features left out of the online schema
+ONLINE_EXCLUDE = {}
@@ -0,0 +1,79 @@
+"""
+Pro Amplitude Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Float64, Int32, Int64, UnixTimestamp
+from datetime import timedelta
+from entities import worker_entity
+
+# Pro Amplitude Features
+pro_amplitude_features_source = RedshiftSource(
+    name="pro_amplitude_features_source",
+    schema="dbt-cchia",
+    table="pro_amplitude_features_inference",
+    timestamp_field="ts_ds",
+)
+
+pro_amplitude_features_fv = FeatureView(
+    name="pro_amplitude_features",
+    entities=[worker_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="rv_int_lte_1_day_num_sessions", dtype=Int64),
+        Field(name="rv_int_lte_3_day_num_sessions", dtype=Int64),
+        Field(name="rv_int_lte_7_day_num_sessions", dtype=Int64),
+        Field(name="rv_int_lte_30_day_num_sessions", dtype=Int64),
+        Field(name="rv_int_gt_30_day_num_sessions", dtype=Int64),
+        Field(name="rv_int_lte_1_day_session_length_seconds", dtype=Int64),
+        Field(name="rv_int_lte_3_day_session_length_seconds", dtype=Int64),
+        Field(name="rv_int_lte_7_day_session_length_seconds", dtype=Int64),
+        Field(name="rv_int_lte_30_day_session_length_seconds", dtype=Int64),
+        Field(name="rv_int_gt_30_day_session_length_seconds", dtype=Int64),
+        Field(name="rv_int_lte_1_day_num_event_types", dtype=Int64),
+        Field(name="rv_int_lte_3_day_num_event_types", dtype=Int64),
+        Field(name="rv_int_lte_7_day_num_event_types", dtype=Int64),
+        Field(name="rv_int_lte_30_day_num_event_types", dtype=Int64),
+        Field(name="rv_int_gt_30_day_num_event_types", dtype=Int64),
+        Field(name="rv_int_lte_1_day_num_unique_event_types", dtype=Int64),
+        Field(name="rv_int_lte_3_day_num_unique_event_types", dtype=Int64),
+        Field(name="rv_int_lte_7_day_num_unique_event_types", dtype=Int64),
+        Field(name="rv_int_lte_30_day_num_unique_event_types", dtype=Int64),
+        Field(name="rv_int_gt_30_day_num_unique_event_types", dtype=Int64),
+        Field(name="rv_int_lte_1_day_num_unique_event_id", dtype=Int64),
+        Field(name="rv_int_lte_3_day_num_unique_event_id", dtype=Int64),
+        Field(name="rv_int_lte_7_day_num_unique_event_id", dtype=Int64),
+        Field(name="rv_int_lte_30_day_num_unique_event_id", dtype=Int64),
+        Field(name="rv_int_gt_30_day_num_unique_event_id", dtype=Int64),
+        Field(name="rv_int_total_unique_sessions", dtype=Int64),
+        Field(name="rv_float_avg_session_length_seconds", dtype=Int64),
+        Field(name="rv_int_total_session_time_seconds", dtype=Int64),
+        Field(name="rv_int_total_events", dtype=Int64),
+        Field(name="rv_int_total_unique_event_types", dtype=Int64),
+        Field(name="rv_int_total_unique_event_ids", dtype=Int64),
+        Field(name="ts_first_session_time", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_last_session_time", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="rv_int_session_span_days", dtype=Int64),
+        Field(name="b_is_active_today", dtype=Int32),
+        Field(name="b_is_active_l3d", dtype=Int32),
+        Field(name="b_is_active_l7d", dtype=Int32),
+        Field(name="b_is_active_l30d", dtype=Int32),
+        Field(name="b_is_active_older", dtype=Int32),
+        Field(name="rv_float_avg_session_length_seconds_calc", dtype=Int64),
+        Field(name="rv_float_events_per_session", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_unique_event_types_per_session", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_event_type_diversity_ratio", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_sessions_per_day", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_total_time_per_session", dtype=Float64, tags={"online_encoding": "float32"}),
+    ],
+    source=pro_amplitude_features_source,
+    tags={
+        "source": "redshift",
+        "table": "pro_amplitude_features_inference",
+        "entity": "worker"
+    },
+)
@@ -0,0 +1,77 @@
+"""
+Pro Attire Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Float64, Int32, Int64
+from datetime import timedelta
+from entities import worker_entity
+
+# Pro Attire Features
+pro_attire_features_source = RedshiftSource(
+    name="pro_attire_features_source",
+    schema="dbt-cchia",
+    table="pro_attire_features_inference",
+    timestamp_field="ts_ds",
+)
+
+pro_attire_features_fv = FeatureView(
+    name="pro_attire_features",
+    entities=[worker_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="b_accepted_black_bistro_attire", dtype=Int32),
+        Field(name="b_accepted_black_clothes_attire", dtype=Int32),
+        Field(name="b_accepted_business_casual_attire", dtype=Int32),
+        Field(name="b_accepted_chef_uniform_attire", dtype=Int32),
+        Field(name="b_accepted_kitchen_black_attire", dtype=Int32),
+        Field(name="b_accepted_warehouse_safety_attire", dtype=Int32),
+        Field(name="b_accepted_white_bistro_attire", dtype=Int32),
+        Field(name="rv_int_offshift_num_attire_submissions", dtype=Int64),
+        Field(name="rv_int_offshift_num_uploaded_attires", dtype=Int64),
+        Field(name="rv_int_offshift_num_accepted_attires", dtype=Int64),
+        Field(name="rv_int_offshift_num_rejected_attires", dtype=Int64),
+        Field(name="rv_int_offshift_num_attire_score_great_photo", dtype=Int64),
+        Field(name="rv_int_offshift_num_attire_score_pass", dtype=Int64),
+        Field(name="rv_int_offshift_num_attire_score_bad_faith_upload", dtype=Int64),
+        Field(name="rv_int_offshift_num_attire_score_earnest_effort", dtype=Int64),
+        Field(name="rv_int_offshift_num_front_of_house_attire_submissions", dtype=Int64),
+        Field(name="rv_int_offshift_num_back_of_house_attire_submissions", dtype=Int64),
+        Field(name="rv_int_offshift_num_generic_attire_submissions", dtype=Int64),
+        Field(name="rv_int_num_unique_attire_types", dtype=Int64),
+        Field(name="rv_int_first_submission_accepted_count", dtype=Int64),
+        Field(name="rv_int_first_submission_rejected_count", dtype=Int64),
+        Field(name="rv_int_first_submission_pending_count", dtype=Int64),
+        Field(name="rv_int_current_accepted_attire_types", dtype=Int64),
+        Field(name="rv_int_current_rejected_attire_types", dtype=Int64),
+        Field(name="rv_int_current_pending_attire_types", dtype=Int64),
+        Field(name="rv_int_n_earnest_effort_attire_uploads", dtype=Int64),
+        Field(name="rv_int_n_great_photo_attire_uploads", dtype=Int64),
+        Field(name="rv_int_n_pass_attire_uploads", dtype=Int64),
+        Field(name="rv_int_n_bad_faith_upload_attire_uploads", dtype=Int64),
+        Field(name="rv_int_pos_attire_cat_ratings", dtype=Int64),
+        Field(name="rv_int_neg_attire_cat_ratings", dtype=Int64),
+        Field(name="rv_float_attire_acceptance_rate", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_attire_rejection_rate", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_attire_pending_rate", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="b_has_accepted_attire", dtype=Int32),
+        Field(name="b_has_rejected_attire", dtype=Int32),
+        Field(name="b_has_pending_attire", dtype=Int32),
+        Field(name="b_has_attire_submissions", dtype=Int32),
+        Field(name="b_has_accepted_attire_history", dtype=Int32),
+        Field(name="b_has_rejected_attire_history", dtype=Int32),
+        Field(name="b_has_pending_attire_history", dtype=Int32),
+        Field(name="b_has_positive_attire_feedback", dtype=Int32),
+        Field(name="b_has_negative_attire_feedback", dtype=Int32),
+    ],
+    source=pro_attire_features_source,
+    tags={
+        "source": "redshift",
+        "table": "pro_attire_features_inference",
+        "entity": "worker"
+    },
+)
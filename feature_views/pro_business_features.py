@@ -0,0 +1,86 @@
+"""
+Pro Business Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Float64, Int32, Int64, String, UnixTimestamp
+from datetime import timedelta
+from entities import worker_entity
+
+# Pro Business Features
+pro_business_features_source = RedshiftSource(
+    name="pro_business_features_source",
+    schema="dbt-cchia",
+    table="pro_business_features_inference",
+    timestamp_field="ts_ds",
+)
+
+pro_business_features_fv = FeatureView(
+    name="pro_business_features",
+    entities=[worker_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="id_business_id", dtype=Int32),
+        Field(name="id_company_id", dtype=Int32),
+        Field(name="b_is_favorite_business", dtype=Int32),
+        Field(name="b_is_blocked_business", dtype=Int32),
+        Field(name="rv_int_total_shifts_at_business", dtype=Int64),
+        Field(name="rv_int_filled_shifts_at_business", dtype=Int64),
+        Field(name="rv_int_completed_shifts_at_business", dtype=Int64),
+        Field(name="rv_int_bqo_count_at_business", dtype=Int64),
+        Field(name="rv_int_f3_shifts_at_business", dtype=Int64),
+        Field(name="rv_int_total_shifts_at_business_l90d", dtype=Int64),
+        Field(name="rv_int_total_shifts_at_business_l30d", dtype=Int64),
+        Field(name="rv_int_filled_shifts_at_business_l90d", dtype=Int64),
+        Field(name="rv_int_completed_shifts_at_business_l90d", dtype=Int64),
+        Field(name="rv_int_bqo_count_at_business_l90d", dtype=Int64),
+        Field(name="rv_int_f3_shifts_at_business_l90d", dtype=Int64),
+        Field(name="rv_float_avg_business_rating_at_business", dtype=Int64),
+        Field(name="rv_float_avg_worker_rating_at_business", dtype=Int64),
+        Field(name="rv_float_avg_business_rating_at_business_l90d", dtype=Int64),
+        Field(name="rv_float_avg_worker_rating_at_business_l90d", dtype=Int64),
+        Field(name="rv_float_avg_business_rating_by_worker", dtype=Int64),
+        Field(name="rv_float_avg_worker_rating_by_business", dtype=Int64),
+        Field(name="rv_float_avg_business_rate_at_business", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_avg_worker_rate_at_business", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_avg_business_rate_at_business_l90d", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_avg_worker_rate_at_business_l90d", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_avg_booked_shift_group_size_at_business", dtype=Int64),
+        Field(name="rv_float_avg_filled_shift_group_size_at_business", dtype=Int64),
+        Field(name="rv_float_shift_group_fill_rate_at_business", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="mc_str_relationship_strength_at_business", dtype=String),
+        Field(name="rv_float_assignment_rate", dtype=Int64),
+        Field(name="rv_float_bqo_rate_at_business", dtype=Int64),
+        Field(name="rv_float_f3_shift_rate_at_business", dtype=Int64),
+        Field(name="rv_float_assignment_rate_l90d", dtype=Int64),
+        Field(name="rv_float_bqo_rate_at_business_l90d", dtype=Int64),
+        Field(name="rv_float_f3_shift_rate_at_business_l90d", dtype=Int64),
+        Field(name="rv_int_unique_shift_groups_at_business", dtype=Int64),
+        Field(name="rv_int_unique_shift_days_at_business", dtype=Int64),
+        Field(name="rv_int_unique_shift_groups_at_business_l90d", dtype=Int64),
+        Field(name="rv_int_unique_shift_days_at_business_l90d", dtype=Int64),
+        Field(name="rv_int_total_ratings_by_business", dtype=Int64),
+        Field(name="rv_int_total_ratings_by_workers", dtype=Int64),
+        Field(name="rv_float_avg_filled_shift_business_rate", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_avg_unfilled_shift_business_rate", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_int_business_cumulative_filled_shifts", dtype=Int64),
+        Field(name="rv_int_cancelled_filled_shifts", dtype=Int64),
+        Field(name="rv_int_n_booked_shifts", dtype=Int64),
+        Field(name="rv_int_n_completed_shifts", dtype=Int64),
+        Field(name="rv_int_pre_booked_shifts", dtype=Int64),
+        Field(name="ts_first_shift_at_business", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_last_shift_at_business", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="rv_int_days_since_first_shift_at_business", dtype=Int64),
+        Field(name="rv_int_days_since_last_shift_at_business", dtype=Int64),
+    ],
+    source=pro_business_features_source,
+    tags={
+        "source": "redshift",
+        "table": "pro_business_features_inference",
+        "entity": "worker"
+    },
+)
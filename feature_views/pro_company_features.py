@@ -0,0 +1,35 @@
+"""
+Pro Company Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Int64
+from datetime import timedelta
+from entities import worker_entity
+
+# Pro Company Features
+pro_company_features_source = RedshiftSource(
+    name="pro_company_features_source",
+    schema="dbt-cchia",
+    table="pro_company_features_inference",
+    timestamp_field="ts_ds",
+)
+
+pro_company_features_fv = FeatureView(
+    name="pro_company_features",
+    entities=[worker_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="rv_int_n_companies", dtype=Int64),
+    ],
+    source=pro_company_features_source,
+    tags={
+        "source": "redshift",
+        "table": "pro_company_features_inference",
+        "entity": "worker"
+    },
+)
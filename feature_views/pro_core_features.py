@@ -0,0 +1,121 @@
+"""
+Pro Core Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Int32, Int64, String, UnixTimestamp
+from datetime import timedelta
+from entities import worker_entity
+
+# Pro Core Features
+pro_core_features_source = RedshiftSource(
+    name="pro_core_features_source",
+    schema="dbt-cchia",
+    table="pro_core_features_inference",
+    timestamp_field="ts_ds",
+)
+
+pro_core_features_fv = FeatureView(
+    name="pro_core_features",
+    entities=[worker_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="b_has_name", dtype=Int32),
+        Field(name="b_is_email_verified", dtype=Int32),
+        Field(name="b_is_phonenum_verified", dtype=Int32),
+        Field(name="b_is_unsubscribe", dtype=Int32),
+        Field(name="b_has_address", dtype=Int32),
+        Field(name="b_has_resume", dtype=Int32),
+        Field(name="b_has_profileimagename", dtype=Int32),
+        Field(name="b_has_bank_account_number", dtype=Int32),
+        Field(name="b_has_bank_routing_number", dtype=Int32),
+        Field(name="b_has_date_of_birth", dtype=Int32),
+        Field(name="b_has_ssn", dtype=Int32),
+        Field(name="b_is_device", dtype=Int32),
+        Field(name="b_is_partial", dtype=Int32),
+        Field(name="mc_str_applicant_app_os", dtype=String),
+        Field(name="b_is_unsubscribe_introductions", dtype=Int32),
+        Field(name="b_is_unsubscribe_looking", dtype=Int32),
+        Field(name="b_is_reference_signup", dtype=Int32),
+        Field(name="b_has_carpool_preference", dtype=Int32),
+        Field(name="b_can_carpool", dtype=Int32),
+        Field(name="b_has_vehicle_filled", dtype=Int32),
+        Field(name="b_has_vehicle", dtype=Int32),
+        Field(name="b_has_driving_license_filled", dtype=Int32),
+        Field(name="b_has_driving_license", dtype=Int32),
+        Field(name="b_is_video_approved", dtype=Int32),
+        Field(name="b_has_followed_region_onboarding", dtype=Int32),
+        Field(name="b_has_contacts_sync", dtype=Int32),
+        Field(name="b_created_from_staff_list", dtype=Int32),
+        Field(name="b_has_limited_gig_access", dtype=Int32),
+        Field(name="b_w2_eligible", dtype=Int32),
+        Field(name="mc_int_background_check_status", dtype=Int32),
+        Field(name="mc_int_motor_vehicle_check_status", dtype=Int32),
+        Field(name="mc_int_w2_status", dtype=Int32),
+        Field(name="b_has_hypertrack_user_id", dtype=Int32),
+        Field(name="b_is_pushtoken_active", dtype=Int32),
+        Field(name="b_has_work_experience", dtype=Int32),
+        Field(name="mc_str_worker_status", dtype=String),
+        Field(name="mc_str_worker_level", dtype=String),
+        Field(name="ts_worker_level_updated_at", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="rv_int_days_at_worker_level", dtype=Int32),
+        Field(name="rv_int_count_gold_level", dtype=Int64),
+        Field(name="rv_int_count_silver_level", dtype=Int64),
+        Field(name="rv_int_count_bronze_level", dtype=Int64),
+        Field(name="rv_int_count_platinum_level", dtype=Int64),
+        Field(name="ts_latest_date_gold_achieved", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_oldest_date_gold_achieved", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_latest_date_silver_achieved", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_oldest_date_silver_achieved", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_latest_date_bronze_achieved", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_oldest_date_bronze_achieved", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_latest_date_platinum_achieved", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_oldest_date_platinum_achieved", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="rv_int_max_level_achieved", dtype=Int32),
+        Field(name="rv_int_like_count", dtype=Int32),
+        Field(name="rv_int_noshow_count", dtype=Int32),
+        Field(name="rv_int_unlike_count", dtype=Int32),
+        Field(name="rv_int_days_from_last_active", dtype=Int32),
+        Field(name="rv_int_days_from_last_login", dtype=Int32),
+        Field(name="rv_int_days_from_last_modified", dtype=Int32),
+        Field(name="ts_last_active", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_last_login", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_date_created", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_date_modified", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="b_has_food_handlers_card", dtype=Int32),
+        Field(name="b_has_drivers_license_cert", dtype=Int32),
+        Field(name="b_has_alcohol_certificate", dtype=Int32),
+        Field(name="b_has_other_certification", dtype=Int32),
+        Field(name="b_has_forklift_certification", dtype=Int32),
+        Field(name="b_has_vaccination_certificate", dtype=Int32),
+        Field(name="b_has_california_rbs_certificate", dtype=Int32),
+        Field(name="mt_offshift_interested_positions", dtype=String),
+        Field(name="rv_int_offshift_num_pos_interests", dtype=Int64),
+        Field(name="mt_interested_positions", dtype=String),
+        Field(name="rv_int_num_pos_interests", dtype=Int64),
+        Field(name="rv_int_total_ratings_received", dtype=Int64),
+        Field(name="rv_int_total_ratings_given", dtype=Int64),
+        Field(name="rv_float_avg_rating_by_worker", dtype=Int64),
+        Field(name="b_active_last_7_days", dtype=Int32),
+        Field(name="b_active_last_30_days", dtype=Int32),
+        Field(name="b_logged_in_last_7_days", dtype=Int32),
+        Field(name="b_logged_in_last_30_days", dtype=Int32),
+        Field(name="rv_int_account_age_days", dtype=Int64),
+        Field(name="b_veteran_account", dtype=Int32),
+        Field(name="b_new_account", dtype=Int32),
+        Field(name="rv_int_n_favorites", dtype=Int64),
+        Field(name="rv_int_n_blocks", dtype=Int64),
+        Field(name="rv_int_n_company_preferences", dtype=Int64),
+        Field(name="ts_feats_end_date", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+    ],
+    source=pro_core_features_source,
+    tags={
+        "source": "redshift",
+        "table": "pro_core_features_inference",
+        "entity": "worker"
+    },
+)
@@ -0,0 +1,59 @@
+"""
+Pro Education Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Int32, Int64, String
+from datetime import timedelta
+from entities import worker_entity
+
+# Pro Education Features
+pro_education_features_source = RedshiftSource(
+    name="pro_education_features_source",
+    schema="dbt-cchia",
+    table="pro_education_features_inference",
+    timestamp_field="ts_ds",
+)
+
+pro_education_features_fv = FeatureView(
+    name="pro_education_features",
+    entities=[worker_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="b_has_degree_associates", dtype=Int32),
+        Field(name="b_has_degree_bachelors", dtype=Int32),
+        Field(name="b_has_degree_masters", dtype=Int32),
+        Field(name="b_has_degree_phd", dtype=Int32),
+        Field(name="b_has_degree_culinary_school", dtype=Int32),
+        Field(name="b_has_degree_hospitality_school", dtype=Int32),
+        Field(name="b_has_degree_hotel_school", dtype=Int32),
+        Field(name="b_has_degree_high_school", dtype=Int32),
+        Field(name="b_has_degree_some_college", dtype=Int32),
+        Field(name="b_has_offshift_degree_culinary_school", dtype=Int32),
+        Field(name="b_has_offshift_degree_hospitality_school", dtype=Int32),
+        Field(name="b_has_offshift_degree_hotel_school", dtype=Int32),
+        Field(name="b_has_offshift_degree_some_college", dtype=Int32),
+        Field(name="rv_int_education_level", dtype=Int32),
+        Field(name="rv_int_total_education_entries", dtype=Int64),
+        Field(name="rv_int_unique_schools_attended", dtype=Int64),
+        Field(name="rv_int_unique_degrees_earned", dtype=Int64),
+        Field(name="rv_float_avg_education_duration_years", dtype=Int64),
+        Field(name="rv_int_earliest_education_start_year", dtype=Int32),
+        Field(name="rv_int_latest_education_end_year", dtype=Int32),
+        Field(name="rv_int_years_since_last_education", dtype=Int32),
+        Field(name="b_has_completed_degree", dtype=Int32),
+        Field(name="b_has_relevant_industry_education", dtype=Int32),
+        Field(name="b_has_higher_education", dtype=Int32),
+        Field(name="mc_str_education_level_category", dtype=String),
+    ],
+    source=pro_education_features_source,
+    tags={
+        "source": "redshift",
+        "table": "pro_education_features_inference",
+        "entity": "worker"
+    },
+)
@@ -0,0 +1,195 @@
+"""
+Pro Experience Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Int64
+from datetime import timedelta
+from entities import worker_entity
+
+# Pro Experience Features
+pro_experience_features_source = RedshiftSource(
+    name="pro_experience_features_source",
+    schema="dbt-cchia",
+    table="pro_experience_features_inference",
+    timestamp_field="ts_ds",
+)
+
+pro_experience_features_fv = FeatureView(
+    name="pro_experience_features",
+    entities=[worker_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="rv_int_forklift_driver_tenure", dtype=Int64),
+        Field(name="rv_int_cashier_tenure", dtype=Int64),
+        Field(name="rv_int_warehouse_associate_tenure", dtype=Int64),
+        Field(name="rv_int_server_tenure", dtype=Int64),
+        Field(name="rv_int_busser_tenure", dtype=Int64),
+        Field(name="rv_int_line_cook_tenure", dtype=Int64),
+        Field(name="rv_int_prep_cook_tenure", dtype=Int64),
+        Field(name="rv_int_housekeeper_tenure", dtype=Int64),
+        Field(name="rv_int_general_labor_tenure", dtype=Int64),
+        Field(name="rv_int_driver_tenure", dtype=Int64),
+        Field(name="rv_int_porter_tenure", dtype=Int64),
+        Field(name="rv_int_fast_food_tenure", dtype=Int64),
+        Field(name="rv_int_delivery_companies_tenure", dtype=Int64),
+        Field(name="rv_int_retail_tenure", dtype=Int64),
+        Field(name="rv_int_customer_service_tenure", dtype=Int64),
+        Field(name="rv_int_warehouse_tenure", dtype=Int64),
+        Field(name="rv_int_staffing_agency_tenure", dtype=Int64),
+        Field(name="rv_int_food_services_tenure", dtype=Int64),
+        Field(name="rv_int_restaurant_tenure", dtype=Int64),
+        Field(name="rv_int_cafe_tenure", dtype=Int64),
+        Field(name="rv_int_military_tenure", dtype=Int64),
+        Field(name="rv_int_mcdonalds_tenure", dtype=Int64),
+        Field(name="rv_int_walmart_tenure", dtype=Int64),
+        Field(name="rv_int_uber_tenure", dtype=Int64),
+        Field(name="rv_int_amazon_tenure", dtype=Int64),
+        Field(name="rv_int_home_depot_tenure", dtype=Int64),
+        Field(name="rv_int_whole_foods_tenure", dtype=Int64),
+        Field(name="rv_int_people_ready_tenure", dtype=Int64),
+        Field(name="rv_int_ups_tenure", dtype=Int64),
+        Field(name="rv_int_popeyes_tenure", dtype=Int64),
+        Field(name="rv_int_target_tenure", dtype=Int64),
+        Field(name="rv_int_taco_bell_tenure", dtype=Int64),
+        Field(name="rv_int_fedex_ground_tenure", dtype=Int64),
+        Field(name="rv_int_chipotle_tenure", dtype=Int64),
+        Field(name="rv_int_starbucks_tenure", dtype=Int64),
+        Field(name="rv_int_applebees_tenure", dtype=Int64),
+        Field(name="rv_int_burger_king_tenure", dtype=Int64),
+        Field(name="rv_int_subway_tenure", dtype=Int64),
+        Field(name="rv_int_wendys_tenure", dtype=Int64),
+        Field(name="rv_int_doordash_tenure", dtype=Int64),
+        Field(name="rv_int_chick_fil_a_tenure", dtype=Int64),
+        Field(name="rv_int_pizza_hut_tenure", dtype=Int64),
+        Field(name="rv_int_ihop_tenure", dtype=Int64),
+        Field(name="rv_int_panera_bread_tenure", dtype=Int64),
+        Field(name="rv_int_olive_garden_tenure", dtype=Int64),
+        Field(name="rv_int_buffalo_wild_wings_tenure", dtype=Int64),
+        Field(name="rv_int_instacart_tenure", dtype=Int64),
+        Field(name="rv_int_dominos_tenure", dtype=Int64),
+        Field(name="rv_int_chilis_tenure", dtype=Int64),
+        Field(name="rv_int_sonic_tenure", dtype=Int64),
+        Field(name="rv_int_waffle_house_tenure", dtype=Int64),
+        Field(name="rv_int_red_lobster_tenure", dtype=Int64),
+        Field(name="rv_int_dennys_tenure", dtype=Int64),
+        Field(name="rv_int_kfc_tenure", dtype=Int64),
+        Field(name="rv_int_the_cheesecake_factory_tenure", dtype=Int64),
+        Field(name="rv_int_jack_in_the_box_tenure", dtype=Int64),
+        Field(name="rv_int_dollar_tree_tenure", dtype=Int64),
+        Field(name="rv_int_little_caesars_pizza_tenure", dtype=Int64),
+        Field(name="rv_int_walgreens_tenure", dtype=Int64),
+        Field(name="rv_int_whataburger_tenure", dtype=Int64),
+        Field(name="rv_int_aramark_tenure", dtype=Int64),
+        Field(name="rv_int_macys_tenure", dtype=Int64),
+        Field(name="rv_int_family_dollar_tenure", dtype=Int64),
+        Field(name="rv_int_allied_universal_tenure", dtype=Int64),
+        Field(name="rv_int_self_employed_tenure", dtype=Int64),
+        Field(name="rv_int_lowes_home_improvement_tenure", dtype=Int64),
+        Field(name="rv_int_outback_steakhouse_tenure", dtype=Int64),
+        Field(name="rv_int_seven_eleven_tenure", dtype=Int64),
+        Field(name="rv_int_kroger_tenure", dtype=Int64),
+        Field(name="rv_int_tgi_fridays_tenure", dtype=Int64),
+        Field(name="rv_int_united_states_postal_service_tenure", dtype=Int64),
+        Field(name="rv_int_five_guys_tenure", dtype=Int64),
+        Field(name="rv_int_ross_dress_for_less_tenure", dtype=Int64),
+        Field(name="rv_int_dollar_general_tenure", dtype=Int64),
+        Field(name="rv_int_papa_johns_pizza_tenure", dtype=Int64),
+        Field(name="rv_int_dunkin_donuts_tenure", dtype=Int64),
+        Field(name="rv_int_safeway_tenure", dtype=Int64),
+        Field(name="rv_int_wingstop_tenure", dtype=Int64),
+        Field(name="rv_int_cracker_barrel_tenure", dtype=Int64),
+        Field(name="rv_int_shake_shack_tenure", dtype=Int64),
+        Field(name="rv_int_sodexo_tenure", dtype=Int64),
+        Field(name="rv_int_costco_wholesale_tenure", dtype=Int64),
+        Field(name="rv_int_levy_restaurants_tenure", dtype=Int64),
+        Field(name="rv_int_postmates_tenure", dtype=Int64),
+        Field(name="rv_int_texas_roadhouse_tenure", dtype=Int64),
+        Field(name="rv_int_red_robin_tenure", dtype=Int64),
+        Field(name="rv_int_jimmy_johns_tenure", dtype=Int64),
+        Field(name="rv_int_us_army_tenure", dtype=Int64),
+        Field(name="rv_int_wonolo_tenure", dtype=Int64),
+        Field(name="rv_int_bjs_tenure", dtype=Int64),
+        Field(name="rv_int_circle_k_tenure", dtype=Int64),
+        Field(name="rv_int_burlington_tenure", dtype=Int64),
+        Field(name="rv_int_steak_n_shake_tenure", dtype=Int64),
+        Field(name="rv_int_raising_canes_tenure", dtype=Int64),
+        Field(name="rv_int_panda_express_tenure", dtype=Int64),
+        Field(name="rv_int_kohls_tenure", dtype=Int64),
+        Field(name="rv_int_best_buy_tenure", dtype=Int64),
+        Field(name="rv_int_chuck_e_cheese_tenure", dtype=Int64),
+        Field(name="rv_int_zaxbys_chicken_fingers_buffalo_wings_tenure", dtype=Int64),
+        Field(name="rv_int_nordstrom_tenure", dtype=Int64),
+        Field(name="rv_int_cvs_tenure", dtype=Int64),
+        Field(name="rv_int_arbys_tenure", dtype=Int64),
+        Field(name="rv_int_lgc_hospitality_tenure", dtype=Int64),
+        Field(name="rv_int_in_n_out_burger_tenure", dtype=Int64),
+        Field(name="rv_int_sams_club_tenure", dtype=Int64),
+        Field(name="rv_int_dave_and_busters_tenure", dtype=Int64),
+        Field(name="rv_int_forever_21_tenure", dtype=Int64),
+        Field(name="rv_int_pf_changs_tenure", dtype=Int64),
+        Field(name="rv_int_ruby_tuesday_tenure", dtype=Int64),
+        Field(name="rv_int_jcpenney_tenure", dtype=Int64),
+        Field(name="rv_int_jersey_mikes_subs_tenure", dtype=Int64),
+        Field(name="rv_int_hooters_tenure", dtype=Int64),
+        Field(name="rv_int_golden_corral_tenure", dtype=Int64),
+        Field(name="rv_int_autozone_tenure", dtype=Int64),
+        Field(name="rv_int_topgolf_tenure", dtype=Int64),
+        Field(name="rv_int_hellofresh_tenure", dtype=Int64),
+        Field(name="rv_int_marshalls_tenure", dtype=Int64),
+        Field(name="rv_int_old_navy_tenure", dtype=Int64),
+        Field(name="rv_int_express_employment_professionals_tenure", dtype=Int64),
+        Field(name="rv_int_tesla_tenure", dtype=Int64),
+        Field(name="rv_int_securitas_tenure", dtype=Int64),
+        Field(name="rv_int_us_navy_tenure", dtype=Int64),
+        Field(name="rv_int_tj_maxx_tenure", dtype=Int64),
+        Field(name="rv_int_white_castle_tenure", dtype=Int64),
+        Field(name="rv_int_dairy_queen_tenure", dtype=Int64),
+        Field(name="rv_int_longhorn_steakhouse_tenure", dtype=Int64),
+        Field(name="rv_int_boston_market_tenure", dtype=Int64),
+        Field(name="rv_int_lyft_tenure", dtype=Int64),
+        Field(name="rv_int_del_taco_tenure", dtype=Int64),
+        Field(name="rv_int_wawa_tenure", dtype=Int64),
+        Field(name="rv_int_bluecrew_tenure", dtype=Int64),
+        Field(name="rv_int_heb_tenure", dtype=Int64),
+        Field(name="rv_int_checkers_tenure", dtype=Int64),
+        Field(name="rv_int_qwick_tenure", dtype=Int64),
+        Field(name="rv_int_compass_group_tenure", dtype=Int64),
+        Field(name="rv_int_cheddars_scratch_kitchen_tenure", dtype=Int64),
+        Field(name="rv_int_round_table_pizza_tenure", dtype=Int64),
+        Field(name="rv_int_goodwill_tenure", dtype=Int64),
+        Field(name="rv_int_sofi_stadium_tenure", dtype=Int64),
+        Field(name="rv_int_pappadeaux_seafood_kitchen_tenure", dtype=Int64),
+        Field(name="rv_int_sprouts_farmers_market_tenure", dtype=Int64),
+        Field(name="rv_int_bath_and_body_works_tenure", dtype=Int64),
+        Field(name="rv_int_generic_warehouse_tenure", dtype=Int64),
+        Field(name="rv_int_albertsons_tenure", dtype=Int64),
+        Field(name="rv_int_sweetgreen_tenure", dtype=Int64),
+        Field(name="rv_int_bed_bath_and_beyond_tenure", dtype=Int64),
+        Field(name="rv_int_ihss_tenure", dtype=Int64),
+        Field(name="rv_int_carls_jr_tenure", dtype=Int64),
+        Field(name="rv_int_quicktrip_tenure", dtype=Int64),
+        Field(name="rv_int_foot_locker_tenure", dtype=Int64),
+        Field(name="rv_int_jewel_osco_tenure", dtype=Int64),
+        Field(name="rv_int_party_city_tenure", dtype=Int64),
+        Field(name="rv_int_trader_joes_tenure", dtype=Int64),
+        Field(name="rv_int_num_unique_current_exps", dtype=Int64),
+        Field(name="rv_int_num_unique_past_exps", dtype=Int64),
+        Field(name="rv_int_num_unique_staffing_agency_exps", dtype=Int64),
+        Field(name="rv_int_num_unique_non_staffing_agency_exps", dtype=Int64),
+        Field(name="rv_int_current_exp_months", dtype=Int64),
+        Field(name="rv_int_past_exp_months", dtype=Int64),
+        Field(name="rv_int_staffing_agency_exp", dtype=Int64),
+        Field(name="rv_int_non_staffing_agency_exp", dtype=Int64),
+    ],
+    source=pro_experience_features_source,
+    tags={
+        "source": "redshift",
+        "table": "pro_experience_features_inference",
+        "entity": "worker"
+    },
+)
@@ -0,0 +1,37 @@
+"""
+Pro Hypertrack Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Float64, Int64
+from datetime import timedelta
+from entities import worker_entity
+
+# Pro Hypertrack Features
+pro_hypertrack_features_source = RedshiftSource(
+    name="pro_hypertrack_features_source",
+    schema="dbt-cchia",
+    table="pro_hypertrack_features_inference",
+    timestamp_field="ts_ds",
+)
+
+pro_hypertrack_features_fv = FeatureView(
+    name="pro_hypertrack_features",
+    entities=[worker_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="rv_int_cumulative_filled_shifts", dtype=Int64),
+        Field(name="rv_float_cumulative_avg_pro_tracking_rate", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_cumulative_avg_pro_in_fence_rate", dtype=Float64, tags={"online_encoding": "float32"}),
+    ],
+    source=pro_hypertrack_features_source,
+    tags={
+        "source": "redshift",
+        "table": "pro_hypertrack_features_inference",
+        "entity": "worker"
+    },
+)
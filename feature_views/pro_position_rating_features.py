@@ -0,0 +1,38 @@
+"""
+Pro Position Rating Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Float64, Int32, String
+from datetime import timedelta
+from entities import worker_entity
+
+# Pro Position Rating Features
+pro_position_rating_features_source = RedshiftSource(
+    name="pro_position_rating_features_source",
+    schema="dbt-cchia",
+    table="pro_position_rating_features_inference",
+    timestamp_field="ts_ds",
+)
+
+pro_position_rating_features_fv = FeatureView(
+    name="pro_position_rating_features",
+    entities=[worker_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="id_position_id", dtype=Int32),
+        Field(name="mc_str_ai_coach_approval", dtype=String),
+        Field(name="mc_str_resume_position_ai_rating", dtype=Float64),
+        Field(name="b_ai_strong_yes_coach_approval", dtype=Int32),
+    ],
+    source=pro_position_rating_features_source,
+    tags={
+        "source": "redshift",
+        "table": "pro_position_rating_features_inference",
+        "entity": "worker"
+    },
+)
@@ -0,0 +1,216 @@
+"""
+Pro Quality Ratings Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Int64
+from datetime import timedelta
+from entities import worker_entity
+
+# Pro Quality Ratings Features
+pro_quality_ratings_features_source = RedshiftSource(
+    name="pro_quality_ratings_features_source",
+    schema="dbt-cchia",
+    table="pro_quality_ratings_features_inference",
+    timestamp_field="ts_ds",
+)
+
+pro_quality_ratings_features_fv = FeatureView(
+    name="pro_quality_ratings_features",
+    entities=[worker_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="rv_int_n_negative_attitude_ratings", dtype=Int64),
+        Field(name="rv_int_n_positive_attitude_ratings", dtype=Int64),
+        Field(name="rv_int_n_negative_trust_and_safety_ratings", dtype=Int64),
+        Field(name="rv_int_n_positive_trust_and_safety_ratings", dtype=Int64),
+        Field(name="rv_int_n_total_positive_partner_captain_ratings", dtype=Int64),
+        Field(name="rv_int_n_total_negative_partner_captain_ratings", dtype=Int64),
+        Field(name="rv_int_n_total_blocks", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_barback", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_barback", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_barback", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_barback", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_barback", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_barback", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_barback", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_bartender", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_bartender", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_bartender", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_bartender", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_bartender", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_bartender", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_bartender", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_brand_ambassador", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_brand_ambassador", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_brand_ambassador", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_brand_ambassador", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_brand_ambassador", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_brand_ambassador", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_brand_ambassador", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_busser", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_busser", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_busser", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_busser", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_busser", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_busser", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_busser", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_concession__stand_worker", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_concession__stand_worker", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_concession__stand_worker", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_concession__stand_worker", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_concession__stand_worker", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_concession__stand_worker", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_concession__stand_worker", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_counter_staff__cashier", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_counter_staff__cashier", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_counter_staff__cashier", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_counter_staff__cashier", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_counter_staff__cashier", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_counter_staff__cashier", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_counter_staff__cashier", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_custodial", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_custodial", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_custodial", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_custodial", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_custodial", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_custodial", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_custodial", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_dishwasher", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_dishwasher", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_dishwasher", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_dishwasher", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_dishwasher", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_dishwasher", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_dishwasher", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_event_server", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_event_server", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_event_server", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_event_server", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_event_server", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_event_server", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_event_server", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_event_setup_and_takedown", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_event_setup_and_takedown", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_event_setup_and_takedown", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_event_setup_and_takedown", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_event_setup_and_takedown", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_event_setup_and_takedown", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_event_setup_and_takedown", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_food_service_worker", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_food_service_worker", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_food_service_worker", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_food_service_worker", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_food_service_worker", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_food_service_worker", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_food_service_worker", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_forklift_driver", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_forklift_driver", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_forklift_driver", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_forklift_driver", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_forklift_driver", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_forklift_driver", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_forklift_driver", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_general_labor", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_general_labor", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_general_labor", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_general_labor", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_general_labor", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_general_labor", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_general_labor", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_housekeeper", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_housekeeper", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_housekeeper", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_housekeeper", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_housekeeper", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_housekeeper", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_housekeeper", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_housekeeping_assistant", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_housekeeping_assistant", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_housekeeping_assistant", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_housekeeping_assistant", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_housekeeping_assistant", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_housekeeping_assistant", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_housekeeping_assistant", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_line_cook", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_line_cook", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_line_cook", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_line_cook", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_line_cook", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_line_cook", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_line_cook", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_merchandiser", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_merchandiser", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_merchandiser", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_merchandiser", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_merchandiser", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_merchandiser", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_merchandiser", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_onsite_captain", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_onsite_captain", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_onsite_captain", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_onsite_captain", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_onsite_captain", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_onsite_captain", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_onsite_captain", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_prep_cook", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_prep_cook", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_prep_cook", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_prep_cook", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_prep_cook", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_prep_cook", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_prep_cook", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_runner", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_runner", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_runner", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_runner", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_runner", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_runner", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_runner", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_supervisor", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_supervisor", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_supervisor", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_supervisor", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_supervisor", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_supervisor", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_supervisor", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_vip_event_server", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_vip_event_server", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_vip_event_server", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_vip_event_server", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_vip_event_server", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_vip_event_server", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_vip_event_server", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_warehouse_admin", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_warehouse_admin", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_warehouse_admin", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_warehouse_admin", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_warehouse_admin", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_warehouse_admin", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_warehouse_admin", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_warehouse_associate_entry_level", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_warehouse_associate_entry_level", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_warehouse_associate_entry_level", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_warehouse_associate_entry_level", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_warehouse_associate_entry_level", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_warehouse_associate_entry_level", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_warehouse_associate_entry_level", dtype=Int64),
+        Field(name="rv_int_n_pos_skill_cat_ratings_warehouse_associate_intermediate", dtype=Int64),
+        Field(name="rv_int_n_neg_skill_cat_ratings_warehouse_associate_intermediate", dtype=Int64),
+        Field(name="rv_int_n_pos_attire_cat_ratings_warehouse_associate_intermediate", dtype=Int64),
+        Field(name="rv_int_n_neg_attire_cat_ratings_warehouse_associate_intermediate", dtype=Int64),
+        Field(name="rv_int_n_positive_partner_captain_ratings_warehouse_associate_intermediate", dtype=Int64),
+        Field(name="rv_int_n_negative_partner_captain_ratings_warehouse_associate_intermediate", dtype=Int64),
+        Field(name="rv_int_n_blocked_shifts_warehouse_associate_intermediate", dtype=Int64),
+    ],
+    source=pro_quality_ratings_features_source,
+    tags={
+        "source": "redshift",
+        "table": "pro_quality_ratings_features_inference",
+        "entity": "worker"
+    },
+)
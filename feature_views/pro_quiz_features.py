@@ -0,0 +1,76 @@
+"""
+Pro Quiz Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Float64, Int32, Int64, UnixTimestamp
+from datetime import timedelta
+from entities import worker_entity
+
+# Pro Quiz Features
+pro_quiz_features_source = RedshiftSource(
+    name="pro_quiz_features_source",
+    schema="dbt-cchia",
+    table="pro_quiz_features_inference",
+    timestamp_field="ts_ds",
+)
+
+pro_quiz_features_fv = FeatureView(
+    name="pro_quiz_features",
+    entities=[worker_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="rv_int_num_quiz_attempted", dtype=Int64),
+        Field(name="rv_int_num_quiz_passed", dtype=Int64),
+        Field(name="rv_int_total_correct_answers", dtype=Float64),
+        Field(name="rv_int_total_questions_attempted", dtype=Float64),
+        Field(name="rv_int_quiz_attempt_days", dtype=Int64),
+        Field(name="rv_int_quiz_attempts_l30d", dtype=Int64),
+        Field(name="rv_int_quiz_attempts_l90d", dtype=Int64),
+        Field(name="rv_int_num_unique_quiz_configs", dtype=Int64),
+        Field(name="rv_float_avg_pass_quiz_score", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_int_offshift_num_quiz_attempted", dtype=Int64),
+        Field(name="rv_int_offshift_num_quiz_passed", dtype=Int64),
+        Field(name="rv_float_offshift_avg_quiz_score", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_int_offshift_total_correct_answers", dtype=Float64),
+        Field(name="rv_int_offshift_total_questions_attempted", dtype=Float64),
+        Field(name="rv_float_offshift_avg_quiz_accuracy", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_avg_quiz_accuracy", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_avg_quiz_score", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_min_quiz_score", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_max_quiz_score", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_quiz_score_stddev", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_quiz_pass_rate", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_barback_overview_score", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_cocktail_tools_score", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_coffee_drinks_score", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_dish_prep_score", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_food_safety_score", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_glassware_score", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_housekeeper_score", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_serving_technique_score", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_line_cook_quiz_score", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_quiz_barback_overview_score", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="ts_earliest_quiz_attempt", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_latest_quiz_attempt", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="rv_int_num_days_from_earliest_attempt", dtype=Int64),
+        Field(name="rv_int_num_days_from_latest_attempt", dtype=Int64),
+        Field(name="rv_int_days_since_first_quiz", dtype=Int64),
+        Field(name="rv_int_days_since_last_quiz", dtype=Int64),
+        Field(name="b_has_taken_quiz", dtype=Int32),
+        Field(name="b_has_passed_quiz", dtype=Int32),
+        Field(name="b_high_quiz_performer", dtype=Int32),
+        Field(name="b_consistent_quiz_performer", dtype=Int32),
+        Field(name="b_recent_quiz_activity", dtype=Int32),
+    ],
+    source=pro_quiz_features_source,
+    tags={
+        "source": "redshift",
+        "table": "pro_quiz_features_inference",
+        "entity": "worker"
+    },
+)
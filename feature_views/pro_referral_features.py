@@ -0,0 +1,65 @@
+"""
+Pro Referral Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Float64, Int32, Int64, String, UnixTimestamp
+from datetime import timedelta
+from entities import worker_entity
+
+# Pro Referral Features
+pro_referral_features_source = RedshiftSource(
+    name="pro_referral_features_source",
+    schema="dbt-cchia",
+    table="pro_referral_features_inference",
+    timestamp_field="ts_ds",
+)
+
+pro_referral_features_fv = FeatureView(
+    name="pro_referral_features",
+    entities=[worker_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="rv_int_num_references", dtype=Int64),
+        Field(name="rv_float_avg_reference_completeness", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_int_num_complete_references", dtype=Int64),
+        Field(name="rv_int_num_high_quality_references", dtype=Int64),
+        Field(name="rv_int_num_references_with_email", dtype=Int64),
+        Field(name="rv_int_num_references_with_phone", dtype=Int64),
+        Field(name="ts_earliest_reference_date", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_latest_reference_date", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="rv_int_days_since_first_reference", dtype=Int64),
+        Field(name="rv_int_days_since_last_reference", dtype=Int64),
+        Field(name="rv_int_references_added_l30d", dtype=Int64),
+        Field(name="rv_int_references_added_l90d", dtype=Int64),
+        Field(name="b_has_references", dtype=Int32),
+        Field(name="b_has_strong_reference_network", dtype=Int32),
+        Field(name="b_has_high_quality_references", dtype=Int32),
+        Field(name="b_recent_reference_activity", dtype=Int32),
+        Field(name="b_is_reference_signup", dtype=Int32),
+        Field(name="mc_str_acquisition_type", dtype=String),
+        Field(name="rv_float_referrer_quality_score", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_referrer_avg_rating", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_int_referrer_n_filled_shifts", dtype=Int64),
+        Field(name="rv_int_referrers_time_tenure_days", dtype=Int64),
+        Field(name="rv_int_referrer_referrees_n_filled_shifts", dtype=Int64),
+        Field(name="rv_float_referrer_referrees_avg_rating", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_int_referrer_referrees_n_pos_rated_shifts", dtype=Int64),
+        Field(name="rv_int_referrer_referrees_n_neg_rated_shifts", dtype=Int64),
+        Field(name="rv_float_referrer_avg_rating_duplicate", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_referrer_referrees_avg_rating_duplicate", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_reference_completeness_rate", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_high_quality_reference_rate", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_overall_referral_network_score", dtype=Float64, tags={"online_encoding": "float32"}),
+    ],
+    source=pro_referral_features_source,
+    tags={
+        "source": "redshift",
+        "table": "pro_referral_features_inference",
+        "entity": "worker"
+    },
+)
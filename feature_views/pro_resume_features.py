@@ -0,0 +1,49 @@
+"""
+Pro Resume Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Float64, Int32, Int64, String, UnixTimestamp
+from datetime import timedelta
+from entities import worker_entity
+
+# Pro Resume Features
+pro_resume_features_source = RedshiftSource(
+    name="pro_resume_features_source",
+    schema="dbt-cchia",
+    table="pro_resume_features_inference",
+    timestamp_field="ts_ds",
+)
+
+pro_resume_features_fv = FeatureView(
+    name="pro_resume_features",
+    entities=[worker_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="rv_int_resume_text_len", dtype=Int32),
+        Field(name="rv_float_resume_professionalism_ai_rating", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="mc_str_rating_type", dtype=String),
+        Field(name="b_has_resume_text", dtype=Int32),
+        Field(name="b_has_substantial_resume", dtype=Int32),
+        Field(name="b_has_detailed_resume", dtype=Int32),
+        Field(name="ts_resume_created_at", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_resume_updated_at", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_ai_evaluation_created_at", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="rv_int_days_since_resume_created", dtype=Int64),
+        Field(name="rv_int_days_since_resume_updated", dtype=Int64),
+        Field(name="rv_int_days_since_ai_evaluation", dtype=Int64),
+        Field(name="b_resume_updated_recently", dtype=Int32),
+        Field(name="b_resume_updated_l90d", dtype=Int32),
+        Field(name="b_ai_evaluation_recent", dtype=Int32),
+    ],
+    source=pro_resume_features_source,
+    tags={
+        "source": "redshift",
+        "table": "pro_resume_features_inference",
+        "entity": "worker"
+    },
+)
@@ -0,0 +1,88 @@
+"""
+Pro Shift Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Float64, Int32, Int64, UnixTimestamp
+from datetime import timedelta
+from entities import worker_entity
+
+# Pro Shift Features
+pro_shift_features_source = RedshiftSource(
+    name="pro_shift_features_source",
+    schema="dbt-cchia",
+    table="pro_shift_features_inference",
+    timestamp_field="ts_ds",
+)
+
+pro_shift_features_fv = FeatureView(
+    name="pro_shift_features",
+    entities=[worker_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="id_shift_id", dtype=Int32),
+        Field(name="id_shift_group_id", dtype=Int32),
+        Field(name="id_business_id", dtype=Int32),
+        Field(name="id_position_id", dtype=Int32),
+        Field(name="id_company_id", dtype=Int32),
+        Field(name="b_is_filled", dtype=Int32),
+        Field(name="b_is_cancelled", dtype=Int32),
+        Field(name="ts_shift_group_starts_at", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_shift_group_ends_at", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="rv_int_shift_duration_hours", dtype=Int64),
+        Field(name="rv_float_rating_by_business", dtype=Int32),
+        Field(name="rv_float_rating_by_worker", dtype=Int32),
+        Field(name="b_has_business_rating", dtype=Int32),
+        Field(name="b_has_worker_rating", dtype=Int32),
+        Field(name="rv_float_business_rate_usd", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_worker_rate_usd", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_int_day_of_week", dtype=Int32),
+        Field(name="rv_int_hour_of_day", dtype=Int32),
+        Field(name="b_is_weekend", dtype=Int32),
+        Field(name="b_is_daytime", dtype=Int32),
+        Field(name="b_has_shift_group", dtype=Int32),
+        Field(name="b_has_excellent_business_rating", dtype=Int32),
+        Field(name="b_has_excellent_worker_rating", dtype=Int32),
+        Field(name="b_has_good_business_rating", dtype=Int32),
+        Field(name="b_has_good_worker_rating", dtype=Int32),
+        Field(name="b_is_morning_shift", dtype=Int32),
+        Field(name="b_is_afternoon_shift", dtype=Int32),
+        Field(name="b_is_evening_night_shift", dtype=Int32),
+        Field(name="b_is_short_shift", dtype=Int32),
+        Field(name="b_is_regular_shift", dtype=Int32),
+        Field(name="b_is_long_shift", dtype=Int32),
+        Field(name="b_is_shift_lead", dtype=Int32),
+        Field(name="rv_int_days_between_shift_and_worker_assigned", dtype=Int64),
+        Field(name="rv_float_booking_applicant_rate_usd", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_current_applicant_rate_usd", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_pro_booking_rate_shift_earning", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_pro_current_rate_shift_earning", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="b_is_background_check_required", dtype=Int32),
+        Field(name="b_is_break_paid", dtype=Int32),
+        Field(name="b_is_free_food_provided", dtype=Int32),
+        Field(name="b_is_long_term_shift", dtype=Int32),
+        Field(name="b_is_w2_required", dtype=Int32),
+        Field(name="b_is_parking_available", dtype=Int32),
+        Field(name="mc_str_local_day_of_week", dtype=Int32),
+        Field(name="mc_str_local_start_hour", dtype=Int32),
+        Field(name="ts_local_starts_at", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="id_original_shift_group_id", dtype=Int32),
+        Field(name="rv_int_break_length", dtype=Int32),
+        Field(name="ts_event_created_at", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_event_recorded_at", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="mc_str_event", dtype=Int32),
+        Field(name="rv_float_original_shift_duration_hours", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_original_total_shift_amount", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_shift_booking_fee", dtype=Float64, tags={"online_encoding": "float32"}),
+    ],
+    source=pro_shift_features_source,
+    tags={
+        "source": "redshift",
+        "table": "pro_shift_features_inference",
+        "entity": "worker"
+    },
+)
@@ -0,0 +1,66 @@
+"""
+Pro Shift Outcome Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Int64
+from datetime import timedelta
+from entities import worker_entity
+
+# Pro Shift Outcome Features
+pro_shift_outcome_features_source = RedshiftSource(
+    name="pro_shift_outcome_features_source",
+    schema="dbt-cchia",
+    table="pro_shift_outcome_features_inference",
+    timestamp_field="ts_ds",
+)
+
+pro_shift_outcome_features_fv = FeatureView(
+    name="pro_shift_outcome_features",
+    entities=[worker_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="rv_int_n_filled_shifts", dtype=Int64),
+        Field(name="rv_int_n_non_urgent_defect", dtype=Int64),
+        Field(name="rv_int_n_urgent_defect_auto_cancel", dtype=Int64),
+        Field(name="rv_int_n_urgent_defect", dtype=Int64),
+        Field(name="rv_int_n_business_cancelled", dtype=Int64),
+        Field(name="rv_int_n_other_urgent_defect", dtype=Int64),
+        Field(name="rv_int_n_assigned_shifts", dtype=Int64),
+        Field(name="rv_int_n_filled_barback", dtype=Int64),
+        Field(name="rv_int_n_filled_bartender", dtype=Int64),
+        Field(name="rv_int_n_filled_brand_ambassador", dtype=Int64),
+        Field(name="rv_int_n_filled_busser", dtype=Int64),
+        Field(name="rv_int_n_filled_concession__stand_worker", dtype=Int64),
+        Field(name="rv_int_n_filled_counter_staff__cashier", dtype=Int64),
+        Field(name="rv_int_n_filled_custodial", dtype=Int64),
+        Field(name="rv_int_n_filled_dishwasher", dtype=Int64),
+        Field(name="rv_int_n_filled_event_server", dtype=Int64),
+        Field(name="rv_int_n_filled_event_setup_and_takedown", dtype=Int64),
+        Field(name="rv_int_n_filled_food_service_worker", dtype=Int64),
+        Field(name="rv_int_n_filled_forklift_driver", dtype=Int64),
+        Field(name="rv_int_n_filled_general_labor", dtype=Int64),
+        Field(name="rv_int_n_filled_housekeeper", dtype=Int64),
+        Field(name="rv_int_n_filled_housekeeping_assistant", dtype=Int64),
+        Field(name="rv_int_n_filled_line_cook", dtype=Int64),
+        Field(name="rv_int_n_filled_merchandiser", dtype=Int64),
+        Field(name="rv_int_n_filled_onsite_captain", dtype=Int64),
+        Field(name="rv_int_n_filled_prep_cook", dtype=Int64),
+        Field(name="rv_int_n_filled_runner", dtype=Int64),
+        Field(name="rv_int_n_filled_supervisor", dtype=Int64),
+        Field(name="rv_int_n_filled_vip_event_server", dtype=Int64),
+        Field(name="rv_int_n_filled_warehouse_admin", dtype=Int64),
+        Field(name="rv_int_n_filled_warehouse_associate_entry_level", dtype=Int64),
+        Field(name="rv_int_n_filled_warehouse_associate_intermediate", dtype=Int64),
+    ],
+    source=pro_shift_outcome_features_source,
+    tags={
+        "source": "redshift",
+        "table": "pro_shift_outcome_features_inference",
+        "entity": "worker"
+    },
+)
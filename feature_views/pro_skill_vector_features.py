@@ -0,0 +1,37 @@
+"""
+Pro Skill Vector Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import String
+from datetime import timedelta
+from entities import worker_entity
+
+# Pro Skill Vector Features
+pro_skill_vector_features_source = RedshiftSource(
+    name="pro_skill_vector_features_source",
+    schema="dbt-cchia",
+    table="pro_skill_vector_features_inference",
+    timestamp_field="ts_ds",
+)
+
+pro_skill_vector_features_fv = FeatureView(
+    name="pro_skill_vector_features",
+    entities=[worker_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="mt_level_vector_str", dtype=String),
+        Field(name="mt_confidence_level_vector_str", dtype=String),
+        Field(name="mt_source_vector_str", dtype=String),
+    ],
+    source=pro_skill_vector_features_source,
+    tags={
+        "source": "redshift",
+        "table": "pro_skill_vector_features_inference",
+        "entity": "worker"
+    },
+)
@@ -0,0 +1,35 @@
+"""
+Pro Ticket Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Int64
+from datetime import timedelta
+from entities import worker_entity
+
+# Pro Ticket Features
+pro_ticket_features_source = RedshiftSource(
+    name="pro_ticket_features_source",
+    schema="dbt-cchia",
+    table="pro_ticket_features_inference",
+    timestamp_field="ts_ds",
+)
+
+pro_ticket_features_fv = FeatureView(
+    name="pro_ticket_features",
+    entities=[worker_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="rv_int_n_pro_tickets", dtype=Int64),
+    ],
+    source=pro_ticket_features_source,
+    tags={
+        "source": "redshift",
+        "table": "pro_ticket_features_inference",
+        "entity": "worker"
+    },
+)
@@ -0,0 +1,62 @@
+"""
+Pro Time Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Float64, Int32, Int64
+from datetime import timedelta
+from entities import worker_entity
+
+# Pro Time Features
+pro_time_features_source = RedshiftSource(
+    name="pro_time_features_source",
+    schema="dbt-cchia",
+    table="pro_time_features_inference",
+    timestamp_field="ts_ds",
+)
+
+pro_time_features_fv = FeatureView(
+    name="pro_time_features",
+    entities=[worker_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="id_business_id", dtype=Int32),
+        Field(name="mc_str_business_region", dtype=Int32),
+        Field(name="rv_int_future_worker_assignments", dtype=Int64),
+        Field(name="rv_int_future_worker_unassignments", dtype=Int64),
+        Field(name="rv_int_future_business_cancellations", dtype=Int64),
+        Field(name="rv_int_future_auto_cancellations", dtype=Int64),
+        Field(name="rv_int_future_worker_cancellations", dtype=Int64),
+        Field(name="rv_int_future_excuse_cancellations", dtype=Int64),
+        Field(name="rv_int_future_shift_leads", dtype=Int64),
+        Field(name="rv_int_future_running_assigneds_with_business", dtype=Int64),
+        Field(name="rv_int_future_running_unassigneds_with_business", dtype=Int64),
+        Field(name="rv_int_historical_running_worker_assigneds", dtype=Int64),
+        Field(name="rv_int_historical_running_worker_unassigneds", dtype=Int64),
+        Field(name="rv_int_historical_running_business_cancels", dtype=Int64),
+        Field(name="rv_int_historical_running_no_shows", dtype=Int64),
+        Field(name="rv_int_historical_running_no_shows_corrected", dtype=Int64),
+        Field(name="rv_int_historical_running_auto_cancels", dtype=Int64),
+        Field(name="rv_int_historical_running_worker_cancels", dtype=Int64),
+        Field(name="rv_int_historical_running_excuse_cancels", dtype=Int64),
+        Field(name="rv_int_historical_running_minor_tardies", dtype=Int64),
+        Field(name="rv_int_historical_running_major_tardies", dtype=Int64),
+        Field(name="rv_int_historical_running_shift_leads", dtype=Int64),
+        Field(name="rv_int_historical_running_assigneds_with_business", dtype=Int64),
+        Field(name="rv_int_historical_running_unassigneds_with_business", dtype=Int64),
+        Field(name="rv_float_historical_assignment_reliability", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_historical_no_show_rate", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_historical_cancellation_rate", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_historical_tardiness_rate", dtype=Float64, tags={"online_encoding": "float32"}),
+    ],
+    source=pro_time_features_source,
+    tags={
+        "source": "redshift",
+        "table": "pro_time_features_inference",
+        "entity": "worker"
+    },
+)
@@ -0,0 +1,39 @@
+"""
+Shift Benefits Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
+
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import Int32
+from datetime import timedelta
+from entities import shift_entity
+
+# Shift Benefits Features
+shift_benefits_features_source = RedshiftSource(
+    name="shift_benefits_features_source",
+    schema="dbt-cchia",
+    table="shift_benefits_features_inference",
+    timestamp_field="ts_ds",
+)
+
+shift_benefits_features_fv = FeatureView(
+    name="shift_benefits_features",
+    entities=[shift_entity],
+    ttl=timedelta(days=365),
+    schema=[
+        Field(name="id_business_id", dtype=Int32),
+        Field(name="id_company_id", dtype=Int32),
+        Field(name="b_has_free_meals", dtype=Int32),
+        Field(name="b_has_parking", dtype=Int32),
+        Field(name="b_is_flexible_time_task", dtype=Int32),
+    ],
+    source=shift_benefits_features_source,
+    tags={
+        "source": "redshift",
+        "table": "shift_benefits_features_inference",
+        "entity": "shift"
+    },
+)
@@ -1,8 +1,9 @@
 """
-Shift Feature Views
-Auto-generated from Redshift metadata on 2025-11-20 14:27:02
+Shift Core Features
+Auto-generated from Redshift metadata on 2026-10-19 10:56:27
 
-This file contains all shift-related feature view definitions.
+This module contains a single feature view definition. It is imported on first
+access through the feature_views package.
 """
 
 from feast import FeatureView, Field, RedshiftSource
@@ -10,36 +11,6 @@ from feast.types import Float64, Int32, Int64, String, UnixTimestamp
 from datetime import timedelta
 from entities import shift_entity
 
-# SHIFT FEATURE VIEWS
-# ============================================================================
-
-# Shift Benefits Features
-shift_benefits_features_source = RedshiftSource(
-    name="shift_benefits_features_source",
-    schema="dbt-cchia",
-    table="shift_benefits_features_inference",
-    timestamp_field="ts_ds",
-)
-
-shift_benefits_features_fv = FeatureView(
-    name="shift_benefits_features",
-    entities=[shift_entity],
-    ttl=timedelta(days=365),
-    schema=[
-        Field(name="id_business_id", dtype=Int32),
-        Field(name="id_company_id", dtype=Int32),
-        Field(name="b_has_free_meals", dtype=Int32),
-        Field(name="b_has_parking", dtype=Int32),
-        Field(name="b_is_flexible_time_task", dtype=Int32),
-    ],
-    source=shift_benefits_features_source,
-    tags={
-        "source": "redshift",
-        "table": "shift_benefits_features_inference",
-        "entity": "shift"
-    },
-)
-
 # Shift Core Features
 shift_core_features_source = RedshiftSource(
     name="shift_core_features_source",
@@ -59,10 +30,10 @@ shift_core_features_fv = FeatureView(
         Field(name="id_company_id", dtype=Int32),
         Field(name="id_position_id", dtype=Int32),
         Field(name="id_regionmapping_id", dtype=Int32),
-        Field(name="ts_shift_created_at", dtype=UnixTimestamp),
-        Field(name="ts_shift_starts_at", dtype=UnixTimestamp),
-        Field(name="ts_shift_ends_at", dtype=UnixTimestamp),
-        Field(name="ts_shift_group_created_at", dtype=UnixTimestamp),
+        Field(name="ts_shift_created_at", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_shift_starts_at", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_shift_ends_at", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
+        Field(name="ts_shift_group_created_at", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}),
         Field(name="b_w2_employees_only", dtype=Int32),
         Field(name="b_is_filled", dtype=Int32),
         Field(name="b_worker_no_show", dtype=Int32),
@@ -70,8 +41,8 @@ shift_core_features_fv = FeatureView(
         Field(name="rv_float_rating_by_business", dtype=Int32),
         Field(name="b_has_rating_by_worker", dtype=Int32),
         Field(name="b_has_rating_by_business", dtype=Int32),
-        Field(name="rv_float_business_rate_usd", dtype=Float64),
-        Field(name="rv_float_applicant_rate_usd", dtype=Float64),
+        Field(name="rv_float_business_rate_usd", dtype=Float64, tags={"online_encoding": "float32"}),
+        Field(name="rv_float_applicant_rate_usd", dtype=Float64, tags={"online_encoding": "float32"}),
         Field(name="rv_int_created_to_start_hours", dtype=Int64),
         Field(name="rv_int_group_created_to_start_hours", dtype=Int64),
         Field(name="rv_int_shift_duration_hours", dtype=Int64),
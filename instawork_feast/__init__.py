@@ -0,0 +1,6 @@
+"""
+Instawork Feast extensions
+
+Runtime helpers used alongside the generated feature definitions. This package
+is listed in .feastignore so `feast apply` does not scan it for objects.
+"""
@@ -0,0 +1,182 @@
+"""
+Zstd dictionary compression of per-entity online values
+
+For a view listed in the online store's compress_views, the store writes one
+hash field per entity holding all of that view's values, instead of one field
+per feature. The blob is compressed with a zstd dictionary trained on a sample
+of the view's own rows. Single rows are a few hundred bytes and compress
+poorly on their own, but rows of one view share feature names, value types and
+typical values, and a dictionary captures that.
+
+    blob = <uint32 dictionary version> <zstd frame>
+    frame payload = repeated (<uint16 name length> <name> <uint32 value length> <ValueProto bytes>)
+
+Dictionaries are stored next to the data and never change once written:
+
+    {<project>:<view>}:zdict:<version>   dictionary bytes
+    {<project>:<view>}:zdict:current     version new writes use
+    {<project>:<view>}:zdict:versions    last version allocated
+
+Each blob names its dictionary version, so retraining never invalidates values
+already written. Readers cache decompressors per (view, version) for the life
+of the process. Version 0 means no dictionary (plain zstd), used until a view
+has enough rows to train on.
+
+Requires the `zstandard` package.
+"""
+
+import struct
+import threading
+from typing import Optional
+
+import zstandard
+
+NO_DICTIONARY = 0
+
+_VERSION = struct.Struct("<I")
+_NAME_LENGTH = struct.Struct("<H")
+_VALUE_LENGTH = struct.Struct("<I")
+
+
+def dictionary_keys(project: str, view: str) -> tuple[str, str]:
+    """(key prefix for dictionary versions, current version key)"""
+    base = f"{{{project}:{view}}}:zdict"
+    return base, f"{base}:current"
+
+
+def pack_values(values: dict[str, bytes]) -> bytes:
+    """Length-prefixed name / serialized value pairs"""
+    parts = []
+    for name, value in values.items():
+        encoded = name.encode("utf-8")
+        parts.append(_NAME_LENGTH.pack(len(encoded)))
+        parts.append(encoded)
+        parts.append(_VALUE_LENGTH.pack(len(value)))
+        parts.append(value)
+    return b"".join(parts)
+
+
+def unpack_values(payload: bytes) -> dict[str, bytes]:
+    values = {}
+    offset = 0
+    while offset < len(payload):
+        (name_length,) = _NAME_LENGTH.unpack_from(payload, offset)
+        offset += _NAME_LENGTH.size
+        name = payload[offset : offset + name_length].decode("utf-8")
+        offset += name_length
+        (value_length,) = _VALUE_LENGTH.unpack_from(payload, offset)
+        offset += _VALUE_LENGTH.size
+        values[name] = payload[offset : offset + value_length]
+        offset += value_length
+    return values
+
+
+def train_dictionary(samples: list[bytes], dict_size: int) -> Optional[bytes]:
+    """Trained dictionary, or None when the sample is too small to train on"""
+    if len(samples) < 8:
+        return None
+    try:
+        return zstandard.train_dictionary(dict_size, samples).as_bytes()
+    except zstandard.ZstdError:
+        return None
+
+
+class ValueCompressor:
+    """
+    Compresses and decompresses one view's per-entity blobs
+
+    zstd contexts are not thread safe, so each thread gets its own pair built
+    from the shared, pre-digested dictionary.
+    """
+
+    def __init__(self, version: int, dictionary: Optional[bytes], level: int = 3):
+        self.version = version
+        self.level = level
+        self._dictionary = zstandard.ZstdCompressionDict(dictionary) if dictionary else None
+        if self._dictionary is not None:
+            self._dictionary.precompute_compress(level=level)
+        self._local = threading.local()
+
+    def _contexts(self):
+        contexts = getattr(self._local, "contexts", None)
+        if contexts is None:
+            contexts = (
+                zstandard.ZstdCompressor(level=self.level, dict_data=self._dictionary),
+                zstandard.ZstdDecompressor(dict_data=self._dictionary),
+            )
+            self._local.contexts = contexts
+        return contexts
+
+    def compress(self, payload: bytes) -> bytes:
+        """Blob for a pack_values payload"""
+        return _VERSION.pack(self.version) + self._contexts()[0].compress(payload)
+
+    def decompress(self, blob: bytes) -> dict[str, bytes]:
+        return unpack_values(self._contexts()[1].decompress(blob[_VERSION.size :]))
+
+
+def blob_version(blob: bytes) -> int:
+    return _VERSION.unpack_from(blob)[0]
+
+
+class CompressionDictionaries:
+    """Per-view dictionaries in Redis; compressors are cached per (view, version)"""
+
+    def __init__(
+        self,
+        client,
+        project: str,
+        dict_size: int = 16 * 1024,
+        level: int = 3,
+        retrain: bool = False,
+    ):
+        self.client = client
+        self.project = project
+        self.dict_size = dict_size
+        self.level = level
+        self.retrain = retrain
+        self._compressors: dict[tuple[str, int], ValueCompressor] = {}
+        # view -> compressor this process writes with
+        self._writers: dict[str, ValueCompressor] = {}
+        self._lock = threading.Lock()
+
+    def _compressor(self, view: str, version: int) -> ValueCompressor:
+        key = (view, version)
+        compressor = self._compressors.get(key)
+        if compressor is None:
+            dictionary = None
+            if version != NO_DICTIONARY:
+                prefix, _ = dictionary_keys(self.project, view)
+                dictionary = self.client.get(f"{prefix}:{version}")
+            compressor = ValueCompressor(version, dictionary, self.level)
+            with self._lock:
+                self._compressors[key] = compressor
+        return compressor
+
+    def writer(self, view: str, samples: list[bytes]) -> ValueCompressor:
+        """
+        Compressor for a write batch; samples are the batch's pack_values payloads
+
+        Uses the view's current dictionary. A dictionary is trained from the
+        batch's payloads when the view has none yet, or once per process when
+        retrain is set.
+        """
+        writer = self._writers.get(view)
+        if writer is not None and (writer.version != NO_DICTIONARY or len(samples) < 8):
+            return writer
+
+        prefix, current_key = dictionary_keys(self.project, view)
+        current = int(self.client.get(current_key) or NO_DICTIONARY)
+        if current == NO_DICTIONARY or self.retrain:
+            dictionary = train_dictionary(samples, self.dict_size)
+            if dictionary is not None:
+                current = self.client.incr(f"{prefix}:versions")
+                self.client.set(f"{prefix}:{current}", dictionary)
+                self.client.set(current_key, current)
+
+        writer = self._compressor(view, current)
+        self._writers[view] = writer
+        return writer
+
+    def decompress(self, view: str, blob: bytes) -> dict[str, bytes]:
+        return self._compressor(view, blob_version(blob)).decompress(blob)
@@ -0,0 +1,136 @@
+"""
+On-demand derived features
+
+Many stored features are arithmetic over other stored features of the same
+view: acceptance / rejection rates, per-session averages, b_has_* flags. A
+derived feature declares that arithmetic once, as a vectorized NumPy function
+over whole columns. It is then computed over the batch at online read time
+instead of being materialized and stored per entity in Redis.
+
+Declarations live next to the generated views in
+feature_views/derived_features.py (hand-written, not touched by codegen):
+
+    DERIVED_FEATURES = [
+        ratio("pro_attire_features", "rv_float_attire_acceptance_rate",
+              "rv_int_offshift_num_accepted_attires",
+              "rv_int_offshift_num_attire_submissions"),
+        flag("pro_attire_features", "b_has_accepted_attire",
+             "rv_int_offshift_num_accepted_attires"),
+    ]
+
+Missing inputs (None from the online store) become NaN, propagate through the
+arithmetic, and come back out as None.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+from instawork_feast.repo_modules import load_repo_module
+
+DERIVED_FEATURES_MODULE = os.path.join("feature_views", "derived_features.py")
+
+_INTEGER_DTYPES = ("Int32", "Int64")
+
+
+@dataclass(frozen=True)
+class DerivedFeature:
+    """A feature computed from other features of the same view"""
+
+    view: str
+    name: str
+    inputs: tuple[str, ...]
+    fn: Callable[..., np.ndarray]
+    dtype: str = "Float64"
+
+    @property
+    def ref(self) -> str:
+        return f"{self.view}:{self.name}"
+
+    @property
+    def input_refs(self) -> list[str]:
+        return [f"{self.view}:{name}" for name in self.inputs]
+
+    def compute_arrays(self, arrays: list[np.ndarray]) -> np.ndarray:
+        """Float64 result over float64 input columns; NaN marks missing"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.asarray(self.fn(*arrays), dtype=np.float64)
+
+    def compute(self, columns: list[list]) -> list:
+        """Compute over response columns (lists with None), returning a list with None"""
+        out = self.compute_arrays([np.array(c, dtype=np.float64) for c in columns])
+        missing = np.isnan(out)
+        if self.dtype in _INTEGER_DTYPES:
+            values = np.where(missing, 0, out).astype(np.int64).astype(object)
+        else:
+            values = out.astype(object)
+        values[missing] = None
+        return values.tolist()
+
+
+def ratio(
+    view: str, name: str, numerator: str, denominator: str, zero_division: float = np.nan
+) -> DerivedFeature:
+    """numerator / denominator; zero_division where the denominator is 0"""
+
+    def fn(num, den):
+        return np.where(den == 0, zero_division, num / den)
+
+    return DerivedFeature(view, name, (numerator, denominator), fn)
+
+
+def flag(view: str, name: str, column: str, threshold: float = 0) -> DerivedFeature:
+    """1 where column > threshold, else 0"""
+
+    def fn(values):
+        return np.where(np.isnan(values), np.nan, (values > threshold).astype(np.float64))
+
+    return DerivedFeature(view, name, (column,), fn, dtype="Int32")
+
+
+# repo path -> (declarations module, features by ref)
+_indexed: dict[str, tuple[object, dict[str, DerivedFeature]]] = {}
+
+# Shared, so a repo without declarations compares identical between loads
+_NO_DERIVED_FEATURES: dict[str, DerivedFeature] = {}
+
+
+def load_derived_features(repo_path: str = ".") -> dict[str, DerivedFeature]:
+    """
+    Derived features declared in the repo, keyed by `view:feature` ref
+
+    Reloaded when the declarations file changes; empty if it does not exist.
+    """
+    module = load_repo_module(repo_path, DERIVED_FEATURES_MODULE)
+    if module is None:
+        return _NO_DERIVED_FEATURES
+    cached = _indexed.get(repo_path)
+    if cached is None or cached[0] is not module:
+        cached = (module, {feature.ref: feature for feature in module.DERIVED_FEATURES})
+        _indexed[repo_path] = cached
+    return cached[1]
+
+
+def expand_refs(
+    feature_refs: list[str], derived: dict[str, DerivedFeature]
+) -> tuple[list[str], list[DerivedFeature]]:
+    """
+    Replace derived refs by their inputs
+
+    Returns:
+        (refs to fetch, without duplicates, in request order; derived features requested)
+    """
+    fetch, requested = [], []
+    seen = set()
+    for ref in feature_refs:
+        feature = derived.get(ref)
+        refs = feature.input_refs if feature else [ref]
+        if feature:
+            requested.append(feature)
+        for input_ref in refs:
+            if input_ref not in seen:
+                seen.add(input_ref)
+                fetch.append(input_ref)
+    return fetch, requested
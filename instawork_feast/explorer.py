@@ -0,0 +1,145 @@
+"""
+Explorer data layer
+
+Metadata and sample entity IDs for scripts/feast_ui.py and other tooling,
+built so that a page render never deserializes the whole registry or reads a
+full Parquet file:
+
+- registry_metadata() flattens the memory-mapped registry index into plain
+  dicts, cheap to cache (st.cache_data) and to page through
+- sample_entity_ids() SCANs a bounded number of keys from the Redis online
+  store, in Feast or compact format (entity_keys.py), falling back to the
+  entity column of a single Parquet row group chosen from the file footer
+"""
+
+import logging
+import os
+from pathlib import Path
+
+import pyarrow.parquet as pq
+import yaml
+
+from instawork_feast.entity_keys import key_patterns, parse_redis_key
+from instawork_feast.offline import local_dataset_path
+from instawork_feast.registry_cache import get_registry_index
+
+logger = logging.getLogger(__name__)
+
+SCAN_COUNT = 1000
+
+
+def load_repo_yaml(repo_path: str = ".") -> dict:
+    """Raw feature_store.yaml without constructing a Feast RepoConfig"""
+    return yaml.safe_load((Path(repo_path) / "feature_store.yaml").read_text())
+
+
+def registry_metadata(repo_path: str = ".") -> dict:
+    """Views, entities and fields from the registry index as plain data"""
+    index = get_registry_index(repo_path)
+
+    views = []
+    for view in index.views():
+        views.append(
+            {
+                "name": view.name,
+                "entity": view.entity,
+                "join_key": view.join_keys[0] if view.join_keys else None,
+                "ttl": str(view.ttl) if view.ttl else None,
+                "online": view.online,
+                "tags": view.tags,
+                "table": view.table,
+                "n_features": len(view.schema),
+                "features": [{"name": f.name, "dtype": f.dtype} for f in view.schema],
+            }
+        )
+
+    return {
+        "views": views,
+        "entities": [
+            {"name": e.name, "join_key": e.join_key, "value_type": e.value_type}
+            for e in index.entities()
+        ],
+        "n_features": index.n_features,
+        "header": index.header,
+    }
+
+
+def sample_entity_ids_from_redis(
+    connection_string: str, project: str, join_key: str, limit: int = 100, max_scan: int = 10000
+) -> list:
+    """
+    Decode up to `limit` entity IDs from a bounded SCAN over online store keys
+
+    Keys in both formats (entity_keys.key_patterns) are scanned one pattern
+    after the other. SCAN examines about `count` keys per call whether or not
+    they match, so the scan stops after max_scan keys examined in total,
+    however few matched.
+    """
+    import redis
+    from feast.infra.online_stores.redis import RedisOnlineStore
+
+    startup_nodes, params = RedisOnlineStore._parse_connection_string(connection_string)
+    client = redis.Redis(
+        host=startup_nodes[0]["host"], port=int(startup_nodes[0]["port"]), **params
+    )
+
+    count = min(SCAN_COUNT, max_scan)
+    ids, examined = set(), 0
+    for pattern in key_patterns([join_key], project):
+        cursor = 0
+        while len(ids) < limit and examined < max_scan:
+            cursor, keys = client.scan(cursor, match=pattern, count=count)
+            examined += count
+            for key in keys:
+                parsed = parse_redis_key(key, project)
+                if parsed is not None:
+                    ids.add(parsed.values[0])
+            if cursor == 0:
+                break
+    return sorted(ids)[:limit]
+
+
+def sample_entity_ids_from_parquet(path: str, join_key: str, limit: int = 100) -> list:
+    """Entity IDs from the entity column of the last row group only"""
+    if os.path.isdir(path):
+        files = sorted(str(p) for p in Path(path).rglob("*.parquet"))
+        if not files:
+            return []
+        path = files[-1]
+
+    parquet_file = pq.ParquetFile(path)
+    if parquet_file.metadata.num_row_groups == 0:
+        return []
+    column = parquet_file.read_row_group(
+        parquet_file.metadata.num_row_groups - 1, columns=[join_key]
+    ).column(0)
+    return sorted(column.unique().drop_null().to_pylist())[:limit]
+
+
+def sample_entity_ids(
+    repo_path: str, view_name: str, join_key: str, limit: int = 100, data_dir: str = "data"
+) -> tuple[list, str]:
+    """Sample entity IDs for a view; returns (ids, where they came from)"""
+    config = load_repo_yaml(repo_path)
+    online_store = config.get("online_store") or {}
+
+    if "redis" in online_store.get("type", "").lower():
+        from redis.exceptions import RedisError
+
+        try:
+            ids = sample_entity_ids_from_redis(
+                online_store.get("connection_string", "localhost:6379"),
+                config["project"],
+                join_key,
+                limit,
+            )
+            if ids:
+                return ids, "redis"
+        except RedisError as e:
+            # Redis unreachable from this machine: fall back to local Parquet
+            logger.warning("Sampling entity IDs from Redis failed, using Parquet: %s", e)
+
+    path = local_dataset_path(os.path.join(repo_path, data_dir), view_name)
+    if os.path.exists(path):
+        return sample_entity_ids_from_parquet(path, join_key, limit), path
+    return [], "none"
@@ -0,0 +1,122 @@
+"""
+Per-view freshness of the online store
+
+Every materialization of a view (materialize.py) records what it wrote in one
+Redis hash next to the data, so serving can check staleness with a single
+HGETALL instead of scanning keys:
+
+    {<project>}:freshness    <view> -> {"watermark": "2024-06-01",
+                                        "materialized_at": "...",
+                                        "rows_written": 1234, ...}
+
+watermark is the latest ts_ds written for the view. It only moves forward: a
+backfill of older dates keeps the newer watermark. Readers cache the hash
+in-process for cache_seconds.
+
+Usage:
+    from instawork_feast.freshness import read_freshness
+
+    freshness = read_freshness(store)
+    if freshness["pro_core_features"].age_days() > 2:
+        ...
+"""
+
+import json
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from feast import FeatureStore
+from feast.infra.online_stores.redis import RedisOnlineStore
+
+DEFAULT_CACHE_SECONDS = 30
+
+
+def freshness_key(project: str) -> str:
+    return f"{{{project}}}:freshness"
+
+
+@dataclass(frozen=True)
+class ViewFreshness:
+    view: str
+    watermark: Optional[date]
+    """Latest ts_ds materialized"""
+    materialized_at: datetime
+    rows_written: int = 0
+
+    def age_days(self, today: Optional[date] = None) -> Optional[int]:
+        """Days between the watermark and today (UTC); None if nothing was written"""
+        if self.watermark is None:
+            return None
+        today = today or datetime.now(timezone.utc).date()
+        return (today - self.watermark).days
+
+    def is_stale(self, max_age_days: int, today: Optional[date] = None) -> bool:
+        age = self.age_days(today)
+        return age is None or age > max_age_days
+
+    @classmethod
+    def from_json(cls, view: str, raw: bytes) -> "ViewFreshness":
+        entry = json.loads(raw)
+        return cls(
+            view=view,
+            watermark=date.fromisoformat(entry["watermark"]) if entry.get("watermark") else None,
+            materialized_at=datetime.fromisoformat(entry["materialized_at"]),
+            rows_written=entry.get("rows_written", 0),
+        )
+
+
+def redis_client(store: FeatureStore):
+    """Client of a Redis-based online store, or None for other online stores"""
+    online_store = store._get_provider().online_store
+    if not isinstance(online_store, RedisOnlineStore):
+        return None
+    return online_store._get_client(store.config.online_store)
+
+
+def record_freshness(
+    client, project: str, view: str, watermark: Optional[date], stats: dict
+) -> Optional[date]:
+    """Store a view's materialization; returns the watermark kept (the newer of old and new)"""
+    key = freshness_key(project)
+    previous = client.hget(key, view)
+    if previous:
+        old = ViewFreshness.from_json(view, previous).watermark
+        if old is not None and (watermark is None or old > watermark):
+            watermark = old
+    entry = {
+        **stats,
+        "watermark": watermark.isoformat() if watermark else None,
+        "materialized_at": datetime.now(timezone.utc).isoformat(),
+    }
+    client.hset(key, view, json.dumps(entry, separators=(",", ":"), default=str))
+    return watermark
+
+
+# project -> (loaded at, {view: ViewFreshness})
+_cache: dict[str, tuple[float, dict[str, ViewFreshness]]] = {}
+_lock = threading.Lock()
+
+
+def read_freshness(
+    store: FeatureStore, cache_seconds: float = DEFAULT_CACHE_SECONDS
+) -> dict[str, ViewFreshness]:
+    """{view: ViewFreshness} for every materialized view; {} without a Redis online store"""
+    cached = _cache.get(store.project)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < cache_seconds:
+        return cached[1]
+
+    client = redis_client(store)
+    if client is None:
+        return {}
+    entries = client.hgetall(freshness_key(store.project))
+    freshness = {
+        view.decode("utf-8"): ViewFreshness.from_json(view.decode("utf-8"), raw)
+        for view, raw in entries.items()
+    }
+    with _lock:
+        _cache[store.project] = (now, freshness)
+    return freshness
@@ -0,0 +1,323 @@
+"""
+Blue/green generations of online views
+
+Materializing a view in place overwrites the hash fields that readers are
+reading, so a nightly refresh competes with serving and a request can see
+some entities refreshed and others not. With online_generations enabled
+(online_store.py), a view's hash fields are namespaced by a generation, and
+readers resolve each view's live generation through one pointer hash:
+
+    {<project>}:generations           <view> -> {"generation": 3, "features": [...],
+                                                 "at": "..."}
+    {<project>}:generations:next      <view> -> last generation allocated
+    {<project>}:generations:retired   <view>@<n> -> {"generation": 2, "features": [...],
+                                                     "at": "..."}
+    {<project>}:generations:pending   <view>@<n> -> {"generation": 4, "features": [...],
+                                                     "at": "..."}
+
+Generation 0 is Feast's layout (fields `mmh3("<view>:<feature>")` and
+`_ts:<view>`); generation n > 0 writes `<view>@<n>` in place of the view name.
+Keys (one hash per entity, shared by the entity's views) and the interned
+string and zstd dictionaries are the same in every generation.
+
+A blue/green materialization (materialize.py):
+1. allocates the next generation of the view and records it as pending
+2. writes every entity of the view under it, without reading `_ts` first,
+   since the namespace starts empty
+3. switches the pointer, retires the old generation and clears the pending
+   entry in one transaction
+4. schedules the retired generation on a GarbageCollector, which waits for
+   readers' cached pointers to expire, then SCANs the view's keys and HDELs
+   the generation's fields on a background thread. Redis removes hashes
+   left empty, i.e. entities the new generation no longer has.
+
+Readers reload the pointers every cache_seconds, so a switch reaches every
+reader within that time; the collector waits at least twice as long.
+Retired generations a collector did not finish (e.g. the process exited)
+are collected by the next blue/green materialization of the view. So are
+pending generations of a run that failed before its switch: the next run
+retires them (abandon_generations) before it allocates its own. Blue/green
+runs of one view must therefore not overlap.
+
+Usage:
+    from instawork_feast.materialize import materialize_incremental
+
+    materialize_incremental(store, datetime.now(timezone.utc), blue_green=True)
+"""
+
+import json
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+
+from feast.infra.online_stores.helpers import _mmh3
+
+from instawork_feast.entity_keys import key_patterns
+
+DEFAULT_CACHE_SECONDS = 5
+DEFAULT_GRACE_SECONDS = 60
+
+# Hash field of a compressed view's blob (online_store.COMPRESSED_FIELD)
+_COMPRESSED_FIELD = "__zstd__"
+
+
+def generation_keys(project: str) -> tuple[str, str, str, str]:
+    """(pointers, counters, retired, pending) keys; the hash tag keeps them in one cluster slot"""
+    base = f"{{{project}}}:generations"
+    return base, f"{base}:next", f"{base}:retired", f"{base}:pending"
+
+
+def generation_namespace(view: str, generation: int) -> str:
+    """Name under which a generation's hash fields are written"""
+    return f"{view}@{generation}" if generation else view
+
+
+@dataclass(frozen=True)
+class Generation:
+    view: str
+    generation: int
+    features: tuple[str, ...]
+    """Features written, so a retired generation's fields can be deleted"""
+    at: Optional[str] = None
+    """When the generation was switched to, or retired"""
+
+    @property
+    def namespace(self) -> str:
+        return generation_namespace(self.view, self.generation)
+
+    def hash_fields(self) -> list[bytes]:
+        """Every hash field the generation may have written"""
+        fields = [_mmh3(f"{self.namespace}:{f}") for f in (*self.features, _COMPRESSED_FIELD)]
+        return [*fields, f"_ts:{self.namespace}".encode("utf-8")]
+
+    def to_json(self) -> str:
+        entry = {"generation": self.generation, "features": list(self.features), "at": self.at}
+        return json.dumps(entry, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, view: str, raw: bytes) -> "Generation":
+        entry = json.loads(raw)
+        return cls(view, int(entry["generation"]), tuple(entry["features"]), entry.get("at"))
+
+
+class Generations:
+    """Live generation of every view, with an in-process read cache"""
+
+    def __init__(self, client, project: str, cache_seconds: float = DEFAULT_CACHE_SECONDS):
+        self.client = client
+        self.project = project
+        self.cache_seconds = cache_seconds
+        # (loaded at, {view: live generation})
+        self._cache: tuple[float, dict[str, int]] = (float("-inf"), {})
+        self._lock = threading.Lock()
+
+    def live(self, view: str) -> int:
+        """Generation readers use for a view; 0 if it was never switched"""
+        loaded_at, live = self._cache
+        now = time.monotonic()
+        if now - loaded_at >= self.cache_seconds:
+            with self._lock:
+                pointers = self.client.hgetall(generation_keys(self.project)[0])
+                live = {
+                    name.decode("utf-8"): json.loads(raw)["generation"]
+                    for name, raw in pointers.items()
+                }
+                self._cache = (now, live)
+        return live.get(view, 0)
+
+
+# Generation written by online_write_batch per view, inside write_generation
+_writing: ContextVar[dict[str, int]] = ContextVar("online_write_generation", default={})
+
+
+@contextmanager
+def write_generation(view: str, generation: int):
+    """Write a view's rows under `generation` instead of the live one"""
+    token = _writing.set({**_writing.get(), view: generation})
+    try:
+        yield
+    finally:
+        _writing.reset(token)
+
+
+def writing_generation(view: str) -> Optional[int]:
+    """Generation set by an enclosing write_generation for a view, if any"""
+    return _writing.get().get(view)
+
+
+def allocate_generation(client, project: str, view: str, features: list[str]) -> int:
+    """Next generation of a view, never handed out before, recorded as pending"""
+    _, counters, _, pending_key = generation_keys(project)
+    generation = int(client.hincrby(counters, view, 1))
+    pending = Generation(view, generation, tuple(features), datetime.now(timezone.utc).isoformat())
+    client.hset(pending_key, f"{view}@{generation}", pending.to_json())
+    return generation
+
+
+def abandon_generations(client, project: str, view: str) -> list[Generation]:
+    """
+    Retire a view's pending generations, left by runs that failed before their switch
+
+    Returns the generations retired; retired_generations lists them until
+    they are collected.
+    """
+    pointers, _, retired_key, pending_key = generation_keys(project)
+    now = datetime.now(timezone.utc).isoformat()
+
+    def abandon(pipe) -> list[Generation]:
+        raw = pipe.hget(pointers, view)
+        live = Generation.from_json(view, raw).generation if raw else 0
+        abandoned = [
+            Generation.from_json(view, entry)
+            for name, entry in pipe.hgetall(pending_key).items()
+            if name.decode("utf-8").rpartition("@")[0] == view
+        ]
+        abandoned = [Generation(view, g.generation, g.features, now) for g in abandoned]
+        pipe.multi()
+        for generation in abandoned:
+            pipe.hdel(pending_key, f"{view}@{generation.generation}")
+            if generation.generation != live:
+                pipe.hset(retired_key, f"{view}@{generation.generation}", generation.to_json())
+        return [g for g in abandoned if g.generation != live]
+
+    return client.transaction(abandon, pointers, pending_key, value_from_callable=True)
+
+
+def switch_generation(
+    client,
+    project: str,
+    view: str,
+    generation: int,
+    features: list[str],
+    in_place_features: Optional[list[str]] = None,
+) -> Generation:
+    """
+    Make `generation` the live generation of a view; returns the retired one
+
+    The pointer update, the retired entry and clearing the pending entry are
+    one transaction, watched so that concurrent switches of the view cannot
+    both retire the same generation. A view switched for the first time
+    retires generation 0, the in-place layout, with in_place_features (every
+    feature of the view, including any the new generation no longer writes)
+    or else the same features.
+    """
+    pointers, _, retired_key, pending_key = generation_keys(project)
+    now = datetime.now(timezone.utc).isoformat()
+    live = Generation(view, generation, tuple(features), now)
+
+    def switch(pipe) -> Generation:
+        raw = pipe.hget(pointers, view)
+        if raw:
+            old = Generation.from_json(view, raw)
+        else:
+            old = Generation(view, 0, tuple(in_place_features or features))
+        retired = Generation(view, old.generation, old.features, now)
+        pipe.multi()
+        pipe.hset(pointers, view, live.to_json())
+        pipe.hset(retired_key, f"{view}@{retired.generation}", retired.to_json())
+        pipe.hdel(pending_key, f"{view}@{generation}")
+        return retired
+
+    return client.transaction(switch, pointers, retired_key, value_from_callable=True)
+
+
+def retired_generations(client, project: str, view: str) -> list[Generation]:
+    """Generations of a view retired and not collected yet"""
+    entries = client.hgetall(generation_keys(project)[2])
+    retired = [
+        Generation.from_json(view, raw)
+        for name, raw in entries.items()
+        if name.decode("utf-8").rpartition("@")[0] == view
+    ]
+    return sorted(retired, key=lambda g: g.generation)
+
+
+def collect_generation(client, project: str, retired: Generation, join_keys: list[str], batch: int = 1000) -> int:
+    """Delete a retired generation's fields from every key of its entity; returns keys changed"""
+    fields = retired.hash_fields()
+    changed = 0
+    keys: list[bytes] = []
+
+    def delete():
+        nonlocal changed
+        with client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.hdel(key, *fields)
+            changed += sum(1 for removed in pipe.execute() if removed)
+        keys.clear()
+
+    for pattern in key_patterns(join_keys, project):
+        for key in client.scan_iter(pattern, count=batch):
+            keys.append(key)
+            if len(keys) >= batch:
+                delete()
+    if keys:
+        delete()
+    client.hdel(generation_keys(project)[2], f"{retired.view}@{retired.generation}")
+    return changed
+
+
+@dataclass
+class Collection:
+    """What collecting one retired generation did"""
+
+    view: str
+    generation: int
+    keys_changed: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+class GarbageCollector:
+    """
+    Collects retired generations on a background thread
+
+    Each generation is collected grace_seconds after it was scheduled, one at
+    a time. wait() blocks until everything scheduled has been collected.
+    """
+
+    def __init__(self, client, project: str, grace_seconds: float = DEFAULT_GRACE_SECONDS):
+        self.client = client
+        self.project = project
+        self.grace_seconds = grace_seconds
+        self.collections: list[Collection] = []
+        self._queue: queue.Queue = queue.Queue()
+        self._scheduled: set[tuple[str, int]] = set()
+        self._thread = threading.Thread(target=self._run, name="generation-gc", daemon=True)
+        self._thread.start()
+
+    def schedule(self, retired: Generation, join_keys: list[str]):
+        if (retired.view, retired.generation) in self._scheduled:
+            return
+        self._scheduled.add((retired.view, retired.generation))
+        self._queue.put((time.monotonic() + self.grace_seconds, retired, join_keys))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            not_before, retired, join_keys = item
+            time.sleep(max(0.0, not_before - time.monotonic()))
+            collection = Collection(retired.view, retired.generation)
+            started = time.perf_counter()
+            try:
+                collection.keys_changed = collect_generation(
+                    self.client, self.project, retired, join_keys
+                )
+            except Exception as e:
+                # Stays retired, so the next blue/green run of the view retries it
+                collection.error = repr(e)
+            collection.seconds = time.perf_counter() - started
+            self.collections.append(collection)
+
+    def wait(self) -> list[Collection]:
+        """Collect everything scheduled, then stop the thread"""
+        self._queue.put(None)
+        self._thread.join()
+        return self.collections
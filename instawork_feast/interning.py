@@ -0,0 +1,164 @@
+"""
+Interned categorical strings for the online store
+
+Low-cardinality `mc_str_*` features (worker level, partner status, education
+level, ...) repeat a handful of strings across millions of entities. The
+online store (see online_store.py) writes them as small integer codes. The
+strings are kept once per view in a Redis hash:
+
+    {<project>:<view>}:intern           "<feature>\\x1f<value>" -> code
+    {<project>:<view>}:intern:size      "<feature>" -> number of codes
+    {<project>:<view>}:intern:version   bumped by every write that adds values
+
+Dictionaries are append-only, so codes already written stay valid across
+materializations. A new value gets the next code atomically (one Lua call per
+feature and batch). Features whose dictionary reaches max_values keep their
+new values as plain strings, so a high-cardinality `mc_str_*` column degrades
+gracefully instead of growing the dictionary without bound.
+
+Readers cache each view's dictionary in-process and reload it when they see a
+code beyond the cached dictionary or the cache is older than its TTL.
+"""
+
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+SEPARATOR = "\x1f"
+
+# KEYS: codes hash, sizes hash, version counter
+# ARGV: max values, feature, values...
+_ASSIGN_CODES = """
+local codes = {}
+local added = 0
+local size = tonumber(redis.call("HGET", KEYS[2], ARGV[2]) or "0")
+for i = 3, #ARGV do
+    local field = ARGV[2] .. "\\31" .. ARGV[i]
+    local code = redis.call("HGET", KEYS[1], field)
+    if not code then
+        if size < tonumber(ARGV[1]) then
+            redis.call("HSET", KEYS[1], field, size)
+            code = size
+            size = size + 1
+            added = added + 1
+        else
+            code = -1
+        end
+    end
+    codes[#codes + 1] = tonumber(code)
+end
+if added > 0 then
+    redis.call("HSET", KEYS[2], ARGV[2], size)
+    redis.call("INCR", KEYS[3])
+end
+return codes
+"""
+
+
+def dictionary_keys(project: str, view: str) -> tuple[str, str, str]:
+    """(codes, sizes, version) keys; the hash tag keeps them in one cluster slot"""
+    base = f"{{{project}:{view}}}:intern"
+    return base, f"{base}:size", f"{base}:version"
+
+
+class StringDictionary:
+    """Categories of one feature, indexed by code"""
+
+    def __init__(self, categories: list[str]):
+        self.categories = categories
+        self._index = {value: code for code, value in enumerate(categories)}
+
+    def __len__(self) -> int:
+        return len(self.categories)
+
+    def code(self, value: str) -> Optional[int]:
+        return self._index.get(value)
+
+    def decode(self, code: int) -> Optional[str]:
+        return self.categories[code] if 0 <= code < len(self.categories) else None
+
+    def to_categorical(self, codes: np.ndarray) -> pd.Categorical:
+        """Codes (-1 for missing) as a pandas Categorical, without materializing strings"""
+        return pd.Categorical.from_codes(codes, categories=self.categories)
+
+
+class InternedStrings:
+    """Per-view string dictionaries in Redis with an in-process read cache"""
+
+    def __init__(self, client, project: str, max_values: int = 4096, cache_ttl_seconds: int = 300):
+        self.client = client
+        self.project = project
+        self.max_values = max_values
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._assign = client.register_script(_ASSIGN_CODES)
+        # view -> (loaded at, version, {feature: StringDictionary})
+        self._cache: dict[str, tuple[float, int, dict[str, StringDictionary]]] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------ write
+
+    def encode(self, view: str, feature: str, values: list[str]) -> dict[str, int]:
+        """
+        Codes for the distinct values of one feature, assigning new codes as needed
+
+        Values left out of the result did not fit in the dictionary and are
+        stored as plain strings.
+        """
+        distinct = list(dict.fromkeys(values))
+        if not distinct:
+            return {}
+        codes = self._assign(
+            keys=list(dictionary_keys(self.project, view)),
+            args=[self.max_values, feature, *distinct],
+        )
+        return {value: code for value, code in zip(distinct, codes) if code >= 0}
+
+    # ------------------------------------------------------------------- read
+
+    def _load(self, view: str) -> tuple[int, dict[str, StringDictionary]]:
+        codes_key, _, version_key = dictionary_keys(self.project, view)
+        with self.client.pipeline(transaction=False) as pipe:
+            pipe.get(version_key)
+            pipe.hgetall(codes_key)
+            version, fields = pipe.execute()
+
+        by_feature: dict[str, dict[int, str]] = {}
+        for field, code in fields.items():
+            feature, value = field.decode("utf-8").split(SEPARATOR, 1)
+            by_feature.setdefault(feature, {})[int(code)] = value
+
+        dictionaries = {}
+        for feature, values in by_feature.items():
+            # Codes are dense; a gap can only come from a partially failed script
+            dictionaries[feature] = StringDictionary(
+                [values.get(code, "") for code in range(max(values) + 1)]
+            )
+        return int(version or 0), dictionaries
+
+    def dictionary(self, view: str, feature: str, max_code: int = -1) -> Optional[StringDictionary]:
+        """
+        Cached dictionary of one feature of a view
+
+        The view's dictionaries are reloaded when older than the cache TTL, or
+        when max_code (the largest code about to be decoded) is not in the
+        cached dictionary yet, i.e. a newer materialization added values.
+        """
+        cached = self._cache.get(view)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.cache_ttl_seconds:
+            dictionary = cached[2].get(feature)
+            if max_code < (len(dictionary) if dictionary else 0):
+                return dictionary
+
+        with self._lock:
+            version, dictionaries = self._load(view)
+            self._cache[view] = (now, version, dictionaries)
+        return dictionaries.get(feature)
+
+    def version(self, view: str) -> Optional[int]:
+        """Version of the cached dictionary of a view, if loaded"""
+        cached = self._cache.get(view)
+        return cached[1] if cached else None
@@ -0,0 +1,347 @@
+"""
+Materialization of each view's online schema
+
+FeatureStore.materialize writes every feature of a view to the online store.
+These wrappers materialize a copy of each view projected to its online schema
+(see online_schema.py), so offline-only features are neither pulled from the
+offline store nor written to Redis. The registry records the materialization
+against the original view, so `feast materialize-incremental` and these
+functions share one watermark.
+
+Each view runs the same stages as Feast's local engine (pull the latest rows
+per entity from the offline store, convert them to protos, write them in
+batches) and is measured stage by stage:
+- rows read from the offline store and rows written online
+- Arrow bytes read
+- offline query time and online write time
+- the ts_ds watermark, i.e. the latest ts_ds written
+
+The stats are returned, printed, exported as Prometheus metrics, and recorded
+per view in the online store, where read_freshness (freshness.py) reads them.
+When MATERIALIZE_PUSHGATEWAY is set (host:port), the metrics are pushed there
+after every view, since a materialization job exits before any scrape.
+
+With blue_green=True (and online_generations on the online store), each view
+is written in full into a new generation and switched to when complete, so
+readers never see a half-refreshed view; the old generation is deleted on a
+background thread (generations.py). Since a new generation starts empty,
+materialize_incremental then reads each view's whole ttl window. With
+read_replicas, a view is switched once the replicas have caught up. A run
+that fails before the switch leaves its generation pending; the next
+blue/green run of the view retires and deletes it.
+
+Usage:
+    from instawork_feast.materialize import materialize_incremental
+
+    materialize_incremental(store, datetime.now(timezone.utc))
+    materialize_incremental(store, datetime.now(timezone.utc), blue_green=True)
+"""
+
+import os
+import time
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+import pyarrow.compute as pc
+from feast import FeatureStore, FeatureView
+from feast.infra.online_stores.redis import _versioned_fv_name
+from feast.utils import _convert_arrow_to_proto, _get_column_names, _run_pyarrow_field_mapping
+from prometheus_client import CollectorRegistry, Counter, Gauge, push_to_gateway
+from tqdm import tqdm
+
+from instawork_feast.freshness import record_freshness, redis_client
+from instawork_feast.generations import (
+    GarbageCollector,
+    abandon_generations,
+    allocate_generation,
+    retired_generations,
+    switch_generation,
+    write_generation,
+)
+from instawork_feast.online_schema import OnlineSchema, load_online_schema
+from instawork_feast.replicas import wait_for_replication
+
+DEFAULT_WRITE_BATCH_ROWS = 10_000
+
+# Own registry, so a push only sends materialization metrics
+METRICS = CollectorRegistry()
+ROWS = Counter(
+    "instawork_feast_materialize_rows",
+    "Rows read from the offline store / written to the online store",
+    ["view", "stage"],
+    registry=METRICS,
+)
+BYTES = Counter(
+    "instawork_feast_materialize_bytes",
+    "Arrow bytes read from the offline store",
+    ["view"],
+    registry=METRICS,
+)
+SECONDS = Counter(
+    "instawork_feast_materialize_seconds",
+    "Time spent in the offline query / online write",
+    ["view", "stage"],
+    registry=METRICS,
+)
+WATERMARK = Gauge(
+    "instawork_feast_materialize_watermark_timestamp_seconds",
+    "Latest ts_ds written to the online store",
+    ["view"],
+    registry=METRICS,
+)
+
+
+@dataclass
+class ViewMaterialization:
+    """What one materialization of a view read, wrote and took"""
+
+    view: str
+    start_date: datetime
+    end_date: datetime
+    rows_read: int = 0
+    rows_written: int = 0
+    bytes_read: int = 0
+    offline_seconds: float = 0.0
+    online_seconds: float = 0.0
+    watermark: Optional[date] = None
+    generation: Optional[int] = None
+    """Blue/green generation written"""
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_written / max(self.offline_seconds + self.online_seconds, 1e-9)
+
+
+def _tzaware(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def online_feature_view(feature_view: FeatureView, schema: OnlineSchema) -> FeatureView:
+    """Copy of a view with only its online features; the view itself if nothing is excluded"""
+    names = [f.name for f in feature_view.features]
+    online = set(schema.online_features(feature_view.name, names))
+    if len(online) == len(names):
+        return feature_view
+
+    projected = feature_view.__copy__()
+    projected.features = [f for f in feature_view.features if f.name in online]
+    projected.projection.features = [
+        f for f in projected.projection.features if f.name in online
+    ]
+    return projected
+
+
+def _feature_views(store: FeatureStore, feature_views: Optional[list[str]]) -> list[FeatureView]:
+    if feature_views is None:
+        return [fv for fv in store.list_feature_views() if fv.online]
+    return [store.get_feature_view(name) for name in feature_views]
+
+
+def _full_start(feature_view: FeatureView, end_date: datetime) -> datetime:
+    """Start of a view's whole window: end_date - ttl, or a year back without a ttl"""
+    if feature_view.ttl and feature_view.ttl.total_seconds() > 0:
+        return end_date - feature_view.ttl
+    return end_date - timedelta(weeks=52)
+
+
+def _garbage_collector(store: FeatureStore) -> GarbageCollector:
+    online_store_config = store.config.online_store
+    client = redis_client(store)
+    if client is None or not getattr(online_store_config, "online_generations", False):
+        raise ValueError(
+            "blue_green materialization needs the Instawork Redis online store "
+            "with online_generations: true"
+        )
+    grace = max(
+        online_store_config.generation_gc_grace_seconds,
+        2 * online_store_config.generation_cache_seconds,
+    )
+    return GarbageCollector(client, store.project, grace_seconds=grace)
+
+
+def _print_collections(collector: GarbageCollector):
+    for collection in collector.wait():
+        if collection.error:
+            print(
+                f"⚠️  {collection.view} generation {collection.generation} not collected: "
+                f"{collection.error}"
+            )
+        else:
+            print(
+                f"🧹 {collection.view} generation {collection.generation} collected from "
+                f"{collection.keys_changed:,} keys in {collection.seconds:.1f}s"
+            )
+
+
+def _watermark(table, timestamp_field: str) -> Optional[date]:
+    latest = pc.max(table[timestamp_field]).as_py() if table.num_rows else None
+    return latest.date() if isinstance(latest, datetime) else latest
+
+
+def _publish(stats: ViewMaterialization, watermark: Optional[date]):
+    ROWS.labels(stats.view, "read").inc(stats.rows_read)
+    ROWS.labels(stats.view, "written").inc(stats.rows_written)
+    BYTES.labels(stats.view).inc(stats.bytes_read)
+    SECONDS.labels(stats.view, "offline").inc(stats.offline_seconds)
+    SECONDS.labels(stats.view, "online").inc(stats.online_seconds)
+    if watermark is not None:
+        WATERMARK.labels(stats.view).set(
+            datetime(watermark.year, watermark.month, watermark.day, tzinfo=timezone.utc).timestamp()
+        )
+    gateway = os.environ.get("MATERIALIZE_PUSHGATEWAY")
+    if gateway:
+        push_to_gateway(gateway, job="feast_materialize", registry=METRICS)
+
+
+def _materialize_view(
+    store: FeatureStore,
+    feature_view: FeatureView,
+    schema: OnlineSchema,
+    start_date: datetime,
+    end_date: datetime,
+    collector: Optional[GarbageCollector] = None,
+) -> ViewMaterialization:
+    projected = online_feature_view(feature_view, schema)
+    skipped = len(feature_view.features) - len(projected.features)
+    print(
+        f"{feature_view.name} from {start_date.replace(microsecond=0)}"
+        f" to {end_date.replace(microsecond=0)}"
+        + (f" ({skipped} offline-only features skipped)" if skipped else "")
+        + ":"
+    )
+    stats = ViewMaterialization(feature_view.name, start_date, end_date)
+    provider = store._get_provider()
+    entities = [store.registry.get_entity(name, store.project) for name in projected.entities]
+    join_keys, feature_names, timestamp_field, created_column = _get_column_names(
+        projected, entities
+    )
+
+    started = time.perf_counter()
+    table = provider.offline_store.pull_latest_from_table_or_query(
+        config=store.config,
+        data_source=projected.batch_source,
+        join_key_columns=join_keys,
+        feature_name_columns=feature_names,
+        timestamp_field=timestamp_field,
+        created_timestamp_column=created_column,
+        start_date=start_date,
+        end_date=end_date,
+    ).to_arrow()
+    table = _run_pyarrow_field_mapping(table, projected.batch_source.field_mapping)
+    stats.offline_seconds = time.perf_counter() - started
+    stats.rows_read = table.num_rows
+    stats.bytes_read = table.nbytes
+    stats.watermark = _watermark(table, projected.batch_source.timestamp_field)
+
+    value_types = {e.name: e.dtype.to_value_type() for e in projected.entity_columns}
+    batch_rows = (
+        store.config.materialization_config.online_write_batch_size or DEFAULT_WRITE_BATCH_ROWS
+    )
+    client = redis_client(store)
+    fv_name = _versioned_fv_name(projected, store.config)
+    features = [f.name for f in projected.features]
+    if collector is not None:
+        for abandoned in abandon_generations(client, store.project, fv_name):
+            print(f"   🧹 generation {abandoned.generation} of a failed run retired")
+        stats.generation = allocate_generation(client, store.project, fv_name, features)
+        writing = write_generation(fv_name, stats.generation)
+    else:
+        writing = nullcontext()
+    started = time.perf_counter()
+    with writing, tqdm(total=table.num_rows, ncols=100) as progress:
+        for batch in table.to_batches(max_chunksize=batch_rows):
+            rows = _convert_arrow_to_proto(batch, projected, value_types)
+            provider.online_write_batch(store.config, projected, rows, progress.update)
+            stats.rows_written += len(rows)
+    stats.online_seconds = time.perf_counter() - started
+
+    if collector is not None:
+        online_store_config = store.config.online_store
+        if online_store_config.read_replicas and not wait_for_replication(
+            client, online_store_config.replica_wait_seconds
+        ):
+            print(
+                f"⚠️  replicas still behind after {online_store_config.replica_wait_seconds:.0f}s; "
+                f"switching {fv_name} anyway"
+            )
+        # Generation 0 was written in place by Feast, which writes every feature of the view
+        in_place_features = [f.name for f in feature_view.features]
+        switch_generation(
+            client, store.project, fv_name, stats.generation, features, in_place_features
+        )
+        for retired in retired_generations(client, store.project, fv_name):
+            collector.schedule(retired, projected.join_keys)
+
+    store.registry.apply_materialization(feature_view, store.project, start_date, end_date)
+    watermark = stats.watermark
+    if client is not None:
+        record = {k: v for k, v in asdict(stats).items() if k not in ("view", "watermark")}
+        watermark = record_freshness(client, store.project, stats.view, stats.watermark, record)
+    _publish(stats, watermark)
+
+    print(
+        f"   {stats.rows_read:,} rows read ({stats.bytes_read / 1e6:,.1f} MB) in "
+        f"{stats.offline_seconds:.1f}s, {stats.rows_written:,} written in "
+        f"{stats.online_seconds:.1f}s, watermark {stats.watermark}"
+        + (f", generation {stats.generation}" if stats.generation is not None else "")
+    )
+    return stats
+
+
+def materialize(
+    store: FeatureStore,
+    start_date: datetime,
+    end_date: datetime,
+    feature_views: Optional[list[str]] = None,
+    blue_green: bool = False,
+) -> list[ViewMaterialization]:
+    """
+    Materialize the online schema of views over [start_date, end_date]
+
+    With blue_green, the window should cover every entity the view serves:
+    entities missing from it are dropped when the old generation is deleted.
+    """
+    schema = load_online_schema(str(store.repo_path))
+    start_date = _tzaware(start_date)
+    end_date = _tzaware(end_date)
+    collector = _garbage_collector(store) if blue_green else None
+    results = [
+        _materialize_view(store, feature_view, schema, start_date, end_date, collector)
+        for feature_view in _feature_views(store, feature_views)
+    ]
+    if collector is not None:
+        _print_collections(collector)
+    return results
+
+
+def materialize_incremental(
+    store: FeatureStore,
+    end_date: datetime,
+    feature_views: Optional[list[str]] = None,
+    blue_green: bool = False,
+) -> list[ViewMaterialization]:
+    """
+    Materialize the online schema of views since their last materialization
+
+    Views never materialized start at end_date - ttl, or a year back without a
+    ttl. With blue_green every view starts there, since a new generation has to
+    hold every entity of the view.
+    """
+    schema = load_online_schema(str(store.repo_path))
+    end_date = _tzaware(end_date)
+    collector = _garbage_collector(store) if blue_green else None
+    results = []
+    for feature_view in _feature_views(store, feature_views):
+        start_date = None if blue_green else feature_view.most_recent_end_time
+        if start_date is None:
+            start_date = _full_start(feature_view, end_date)
+        results.append(
+            _materialize_view(
+                store, feature_view, schema, _tzaware(start_date), end_date, collector
+            )
+        )
+    if collector is not None:
+        _print_collections(collector)
+    return results
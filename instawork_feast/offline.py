@@ -0,0 +1,176 @@
+"""
+Pruned offline retrieval
+
+Every source is keyed by `ts_ds`, so the rows a point-in-time join can ever
+match lie in [min(entity timestamp) - ttl, max(entity timestamp)].
+
+- Redshift: FeatureStore.get_historical_features already bounds each view's
+  timestamp field to that range and selects only the requested columns, so
+  retrieval.py calls it as is.
+- Local Parquet (data/<view>.parquet or a data/<view>/ dataset): this module
+  applies the same range as a `ts_ds` predicate, and the requested columns as
+  a projection, in the Arrow dataset scanner, which skips row groups and
+  partitions by their statistics before the as-of join.
+"""
+
+import os
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from feast import FeatureStore
+from feast.errors import FeatureNameCollisionError, FeatureViewNotFoundException
+
+from instawork_feast.registry_cache import get_registry_index
+
+ENTITY_TIMESTAMP_COLUMN = "event_timestamp"
+
+
+def entity_date_bounds(
+    entity_df: pd.DataFrame, ttl: timedelta, timestamp_column: str = ENTITY_TIMESTAMP_COLUMN
+) -> tuple[date, date]:
+    """ts_ds range a view must cover for the given entity dataframe"""
+    timestamps = pd.to_datetime(entity_df[timestamp_column], utc=True)
+    lower = timestamps.min() - ttl if ttl else pd.Timestamp("1970-01-01", tz="UTC")
+    return lower.date(), timestamps.max().date()
+
+
+def check_feature_name_collisions(feature_refs: list[str], full_feature_names: bool):
+    """Raise like Feast when two refs would produce the same output column"""
+    seen: set[str] = set()
+    collisions = []
+    for ref in feature_refs:
+        name = ref.replace(":", "__") if full_feature_names else ref.split(":", 1)[1]
+        if name in seen:
+            collisions.append(ref)
+        seen.add(name)
+    if collisions:
+        raise FeatureNameCollisionError(collisions, full_feature_names)
+
+
+def group_feature_refs(feature_refs: list[str]) -> dict[str, list[str]]:
+    """{view name: [features]} in request order"""
+    grouped: dict[str, list[str]] = {}
+    for ref in feature_refs:
+        view_name, feature_name = ref.split(":", 1)
+        grouped.setdefault(view_name, []).append(feature_name)
+    return grouped
+
+
+# ============================================================================
+# LOCAL PARQUET
+# ============================================================================
+
+
+def local_dataset_path(data_dir: str, view_name: str) -> str:
+    """data/<view>/ if a partitioned dataset exists, otherwise data/<view>.parquet"""
+    dataset_dir = os.path.join(data_dir, view_name)
+    if os.path.isdir(dataset_dir):
+        return dataset_dir
+    return os.path.join(data_dir, f"{view_name}.parquet")
+
+
+def _date_scalar(value: date, field_type: pa.DataType) -> pa.Scalar:
+    """A date bound typed to match the ts_ds column, so the filter stays pushable"""
+    if pa.types.is_timestamp(field_type):
+        moment = datetime(value.year, value.month, value.day)
+        if field_type.tz:
+            moment = pd.Timestamp(moment, tz="UTC").to_pydatetime()
+        return pa.scalar(moment, type=field_type)
+    if pa.types.is_string(field_type) or pa.types.is_large_string(field_type):
+        return pa.scalar(value.isoformat(), type=field_type)
+    return pa.scalar(value, type=pa.date32()).cast(field_type)
+
+
+def read_local_view(
+    path: str,
+    join_keys: list[str],
+    features: list[str],
+    lower: date,
+    upper: date,
+    timestamp_field: str = "ts_ds",
+) -> pd.DataFrame:
+    """Scan only the requested columns and the ts_ds range of a local view"""
+    dataset = ds.dataset(path, format="parquet", partitioning="hive")
+    field_type = dataset.schema.field(timestamp_field).type
+
+    # ts_ds <= upper is inclusive of the whole upper day for timestamp columns
+    predicate = (ds.field(timestamp_field) >= _date_scalar(lower, field_type)) & (
+        ds.field(timestamp_field) < _date_scalar(upper + timedelta(days=1), field_type)
+    )
+
+    table = dataset.to_table(
+        columns=[*join_keys, timestamp_field, *features], filter=predicate
+    )
+    return table.to_pandas()
+
+
+def get_historical_features_local(
+    store: FeatureStore,
+    entity_df: pd.DataFrame,
+    features: list[str],
+    data_dir: str = "data",
+    full_feature_names: bool = False,
+    ttl: Optional[timedelta] = None,
+) -> pd.DataFrame:
+    """
+    Point-in-time join against local Parquet, pruned by date and column
+
+    Matches Feast semantics: for each entity row the latest source row with
+    entity timestamp - ttl <= ts_ds <= entity timestamp. ttl overrides every
+    view's own ttl (e.g. to size a backfill over a longer lookback).
+
+    Raises FeatureNameCollisionError when two refs share a feature name and
+    full_feature_names is False, as Feast does.
+    """
+    check_feature_name_collisions(features, full_feature_names)
+    result = entity_df.copy()
+    result["_row"] = range(len(result))
+    entity_ts = pd.to_datetime(result[ENTITY_TIMESTAMP_COLUMN], utc=True).dt.tz_localize(None)
+    result["_entity_ts"] = entity_ts.astype("datetime64[ns]")
+
+    registry_index = get_registry_index(str(store.repo_path))
+
+    for view_name, feature_names in group_feature_refs(features).items():
+        fv = registry_index.view(view_name)
+        if fv is None:
+            raise FeatureViewNotFoundException(view_name, store.project)
+        timestamp_field = fv.timestamp_field
+        join_keys = fv.join_keys
+        view_ttl = ttl if ttl is not None else fv.ttl
+        lower, upper = entity_date_bounds(entity_df, view_ttl)
+
+        view_df = read_local_view(
+            local_dataset_path(data_dir, view_name),
+            join_keys,
+            feature_names,
+            lower,
+            upper,
+            timestamp_field,
+        )
+        view_df["_view_ts"] = pd.to_datetime(view_df.pop(timestamp_field), utc=True)
+        view_df["_view_ts"] = view_df["_view_ts"].dt.tz_localize(None).astype("datetime64[ns]")
+        view_df = view_df.astype({key: result[key].dtype for key in join_keys})
+
+        if full_feature_names:
+            view_df = view_df.rename(
+                columns={name: f"{view_name}__{name}" for name in feature_names}
+            )
+
+        result = pd.merge_asof(
+            result.sort_values("_entity_ts"),
+            view_df.sort_values("_view_ts"),
+            left_on="_entity_ts",
+            right_on="_view_ts",
+            by=join_keys,
+            direction="backward",
+            tolerance=pd.Timedelta(view_ttl) if view_ttl else None,
+        ).drop(columns="_view_ts")
+
+    return (
+        result.sort_values("_row")
+        .drop(columns=["_row", "_entity_ts"])
+        .reset_index(drop=True)
+    )
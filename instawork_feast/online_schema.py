@@ -0,0 +1,76 @@
+"""
+Online schema subsets
+
+Every feature in a view is available offline, but only the features models
+read online need to be materialized into Redis. The subset is declared in
+feature_views/online_schema.py (hand-written, not touched by codegen):
+
+    # fnmatch patterns left out of every view's online schema
+    ONLINE_EXCLUDE_PATTERNS = []
+
+    # Per-view features left out of the online schema
+    ONLINE_EXCLUDE = {
+        "pro_amplitude_features": ["rv_int_gt_30_day_num_event_types"],
+    }
+
+Both are empty by default. scripts/feature_usage_report.py --suggest prints
+ONLINE_EXCLUDE entries for features that no sampled online request has read;
+online usage is sampled, so those are candidates to confirm, not proof.
+materialize.py writes only the online subset of each view;
+get_historical_features still reads every feature.
+"""
+
+import os
+from fnmatch import fnmatchcase
+
+from instawork_feast.repo_modules import load_repo_module
+
+ONLINE_SCHEMA_MODULE = os.path.join("feature_views", "online_schema.py")
+
+# repo path -> (declaration module, schema built from it)
+_schemas: dict[str, tuple[object, "OnlineSchema"]] = {}
+
+
+class OnlineSchema:
+    """Which features of each view are materialized online"""
+
+    def __init__(self, exclude_patterns: list[str] = (), exclude: dict[str, list[str]] = None):
+        self.exclude_patterns = list(exclude_patterns)
+        self.exclude = {view: set(names) for view, names in (exclude or {}).items()}
+
+    def is_online(self, view_name: str, feature_name: str) -> bool:
+        if feature_name in self.exclude.get(view_name, ()):
+            return False
+        return not any(fnmatchcase(feature_name, p) for p in self.exclude_patterns)
+
+    def online_features(self, view_name: str, feature_names: list[str]) -> list[str]:
+        return [name for name in feature_names if self.is_online(view_name, name)]
+
+    def offline_only(self, feature_refs: list[str]) -> list[str]:
+        """Refs from a request that are not materialized online"""
+        return [
+            ref for ref in feature_refs if not self.is_online(*ref.split(":", 1))
+        ]
+
+
+# Shared, so an undeclared schema compares identical between loads
+_EVERYTHING_ONLINE = OnlineSchema()
+
+
+def load_online_schema(repo_path: str = ".") -> OnlineSchema:
+    """
+    Online schema declared in the repo; everything is online if undeclared
+
+    The schema is rebuilt only when the declarations file changes.
+    """
+    module = load_repo_module(repo_path, ONLINE_SCHEMA_MODULE)
+    if module is None:
+        return _EVERYTHING_ONLINE
+    cached = _schemas.get(repo_path)
+    if cached is None or cached[0] is not module:
+        schema = OnlineSchema(
+            getattr(module, "ONLINE_EXCLUDE_PATTERNS", []), getattr(module, "ONLINE_EXCLUDE", {})
+        )
+        cached = (module, schema)
+        _schemas[repo_path] = cached
+    return cached[1]
@@ -0,0 +1,896 @@
+"""
+Instawork Redis online store
+
+A RedisOnlineStore with compact value encodings. Enable it in
+feature_store.yaml:
+
+    online_store:
+      type: instawork_feast.online_store.InstaworkRedisOnlineStore
+      connection_string: "localhost:6379"
+      intern_prefixes: ["mc_str_"]      # String features written as dictionary codes
+
+By default keys and hash fields are the same as RedisOnlineStore's, and
+values of features without a compact encoding are unchanged, so the store
+reads data written by `type: redis`. A feature's encoding comes from its
+`online_encoding` field tag, which the codegen emits, or from
+intern_prefixes:
+
+- interned (interning.py): String features matching intern_prefixes are
+  written as Int32 codes into a per-view dictionary.
+- epoch_days: `date` columns are written as Int32 days since the epoch
+  instead of Int64 seconds.
+- epoch_seconds: `timestamp` columns keep Feast's Int64 seconds; the tag only
+  tells read_frame to decode them to datetime64.
+- float32: Float64 features are written as 4-byte floats. Offline data keeps
+  full precision. A view tagged `online_encoding: float32` applies it to all of
+  its Float64 features.
+
+Views listed in compress_views are written as one zstd blob per entity,
+compressed with a dictionary trained on the view's rows (compression.py;
+requires `zstandard`). The per-feature encodings above are applied first.
+While compress_fallback is set, entities without a blob are read from the
+per-feature fields written before the view was compressed, and writing a blob
+deletes them, so a view can be added to compress_views before it is
+rematerialized.
+
+With entity_key_format: compact, Redis keys use the compact format of
+entity_keys.py (a one-byte join key id and a 4-byte value instead of Feast's
+serialized entity key). Data under Feast keys is then not read unless
+entity_key_fallback is set, which re-reads entities missing a compact key
+under their Feast key, until scripts/migrate_entity_keys.py has rewritten
+them. The async read paths do not fall back.
+
+With online_generations, each view's hash fields are namespaced by the view's
+live blue/green generation (generations.py), which readers resolve from a
+cached pointer hash. A blue/green materialization writes a new generation
+next to the live one and switches the pointer when it is complete.
+
+With read_replicas, feature reads go to healthy replicas of the primary,
+round robin (replicas.py). With write_rows_per_second, writes go to the
+primary in chunks paced by a token bucket (throttle.py), so a materialization
+cannot starve serving.
+
+get_online_features decodes every encoding back to the values Feast wrote.
+read_frame is a columnar read path for batch scoring. It returns one
+DataFrame column per feature, decoded a column at a time (Categoricals for
+interned strings, datetime64[s] for dates and timestamps, float32 arrays for
+float32 features), instead of per-entity ValueProtos (see
+instawork_feast.retrieval.get_online_frame).
+
+Redis keys of a batch are serialized at once and shared by the views of a
+request (entity_keys.py).
+
+The read hooks report per-phase timings of the current request
+(instrumentation.py).
+"""
+
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from feast import FeatureView, RepoConfig, ValueType, utils
+from feast.infra.online_stores.helpers import _mmh3
+from feast.infra.online_stores.redis import (
+    RedisClient,
+    RedisOnlineStore,
+    RedisOnlineStoreConfig,
+    RedisType,
+    _versioned_fv_name,
+)
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.type_map import feast_value_type_to_python_type
+from feast.types import Float64, String
+from google.protobuf.timestamp_pb2 import Timestamp
+from redis import Redis
+
+from instawork_feast.entity_keys import (
+    IntEntityKeys,
+    feast_key,
+    key_patterns,
+    parse_redis_key,
+    redis_keys,
+)
+from instawork_feast.generations import (
+    Generations,
+    generation_keys,
+    generation_namespace,
+    writing_generation,
+)
+from instawork_feast.instrumentation import switch_phase
+from instawork_feast.interning import InternedStrings
+from instawork_feast.replicas import ReplicaPool
+from instawork_feast.throttle import TokenBucket
+
+STORE_TYPE = "instawork_feast.online_store.InstaworkRedisOnlineStore"
+
+# Field tag selecting a feature's online encoding
+ONLINE_ENCODING_TAG = "online_encoding"
+
+INTERNED = "interned"
+EPOCH_DAYS = "epoch_days"
+EPOCH_SECONDS = "epoch_seconds"
+FLOAT32 = "float32"
+
+SECONDS_PER_DAY = 86400
+
+# Hash field holding a compressed view's values (as mmh3("<view>:__zstd__"))
+COMPRESSED_FIELD = "__zstd__"
+
+# entity_key_format values
+FEAST_KEYS = "feast"
+COMPACT_KEYS = "compact"
+
+
+class InstaworkRedisOnlineStoreConfig(RedisOnlineStoreConfig):
+    """Online store config for the Instawork Redis store"""
+
+    type: Literal["instawork_feast.online_store.InstaworkRedisOnlineStore"] = STORE_TYPE
+    """Online store type selector"""
+
+    intern_prefixes: List[str] = ["mc_str_"]
+    """String features with these prefixes are written as dictionary codes"""
+
+    intern_max_values: int = 4096
+    """Values per feature dictionary; further values are written as plain strings"""
+
+    intern_cache_ttl_seconds: int = 300
+    """How long readers reuse a cached dictionary before checking for new values"""
+
+    compress_views: List[str] = []
+    """Feature views written as one zstd dictionary-compressed blob per entity"""
+
+    zstd_level: int = 3
+    """zstd compression level for compressed views"""
+
+    zstd_dict_size: int = 16384
+    """Size in bytes of the dictionary trained per compressed view"""
+
+    zstd_retrain: bool = False
+    """Train a new dictionary version in every materialization process"""
+
+    compress_fallback: bool = True
+    """Read per-feature fields of compressed entities without a blob; blob writes delete them"""
+
+    entity_key_format: Literal["feast", "compact"] = FEAST_KEYS
+    """compact: Redis keys with a one-byte join key id and a 4-byte value (entity_keys.py)"""
+
+    entity_key_fallback: bool = False
+    """With compact keys, also read Feast keys of entities without a compact key (migration)"""
+
+    online_generations: bool = False
+    """Read and write each view's live blue/green generation (generations.py)"""
+
+    generation_cache_seconds: float = 5
+    """How long readers reuse the generation pointers before reloading them"""
+
+    generation_gc_grace_seconds: float = 60
+    """Wait after a switch before deleting the old generation (at least 2x the cache)"""
+
+    read_replicas: List[str] = []
+    """Connection strings of replicas of connection_string that serve feature reads"""
+
+    replica_check_seconds: float = 5
+    """Interval of replica health checks"""
+
+    replica_max_lag_bytes: int = 1024 * 1024
+    """Replicas further behind the primary's replication offset are skipped"""
+
+    replica_wait_seconds: float = 30
+    """How long a blue/green materialization waits for replicas before switching a view"""
+
+    write_rows_per_second: Optional[float] = None
+    """Token-bucket limit on rows written per process (throttle.py); None is unlimited"""
+
+    write_burst_rows: Optional[int] = None
+    """Rows per throttled write chunk, and the bucket size; default a tenth of a second of rows"""
+
+
+def field_encodings(config: RepoConfig, table: FeatureView) -> dict[str, str]:
+    """{feature: online encoding} for the features of a view that have one"""
+    prefixes = tuple(config.online_store.intern_prefixes)
+    view_float32 = table.tags.get(ONLINE_ENCODING_TAG) == FLOAT32
+    encodings = {}
+    for f in table.features:
+        encoding = f.tags.get(ONLINE_ENCODING_TAG)
+        if encoding is None and f.dtype == String and prefixes and f.name.startswith(prefixes):
+            encoding = INTERNED
+        elif encoding is None and f.dtype == Float64 and view_float32:
+            encoding = FLOAT32
+        if encoding:
+            encodings[f.name] = encoding
+    return encodings
+
+
+def _hash_writes(
+    fv_name: str,
+    keys: List[bytes],
+    data: List[Tuple[EntityKeyProto, Dict[str, ValueProto], Any, Any]],
+    previous: Sequence[Optional[bytes]],
+) -> list[tuple[bytes, dict]]:
+    """
+    (key, hash fields) of the rows to write, as RedisOnlineStore.online_write_batch
+
+    Rows not newer than the stored `_ts` (previous) or an earlier row of the
+    batch for the same key are skipped.
+    """
+    ts_key = f"_ts:{fv_name}"
+    latest: dict[bytes, int] = {}
+    writes = []
+    for key, stored, (_, values, timestamp, _) in zip(keys, previous, data):
+        ts = Timestamp()
+        ts.FromDatetime(utils.make_tzaware(timestamp))
+        nanos = ts.seconds * 1_000_000_000 + ts.nanos
+        seen = latest.get(key, 0)
+        if stored:
+            stored_ts = Timestamp()
+            stored_ts.ParseFromString(stored)
+            seen = max(seen, stored_ts.seconds * 1_000_000_000 + stored_ts.nanos)
+        if seen and nanos <= seen:
+            continue
+        latest[key] = nanos
+        mapping = {ts_key: ts.SerializeToString()}
+        for feature, val in values.items():
+            mapping[_mmh3(f"{fv_name}:{feature}")] = val.SerializeToString()
+        writes.append((key, mapping))
+    return writes
+
+
+def _chunks(rows: list, size: int):
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+def _parse_values(raw: Sequence[Optional[bytes]]) -> list[Optional[ValueProto]]:
+    values = []
+    for val_bin in raw:
+        if val_bin:
+            val = ValueProto()
+            val.ParseFromString(val_bin)
+            values.append(val)
+        else:
+            values.append(None)
+    return values
+
+
+def _encode_value(encoding: str, val: ValueProto) -> ValueProto:
+    """Compact form of a value written by Feast (interned strings are encoded per batch)"""
+    kind = val.WhichOneof("val")
+    if encoding == EPOCH_DAYS and kind == "unix_timestamp_val":
+        return ValueProto(int32_val=val.unix_timestamp_val // SECONDS_PER_DAY)
+    if encoding == FLOAT32 and kind == "double_val":
+        return ValueProto(float_val=val.double_val)
+    return val
+
+
+def _decode_value(encoding: str, val: ValueProto) -> ValueProto:
+    """Value as Feast wrote it (interned strings are decoded per column; float32 stays float32)"""
+    if encoding == EPOCH_DAYS and val.WhichOneof("val") == "int32_val":
+        return ValueProto(unix_timestamp_val=val.int32_val * SECONDS_PER_DAY)
+    return val
+
+
+def _datetime_column(values: list[Optional[ValueProto]]) -> np.ndarray:
+    """datetime64[s] column from epoch days (int32_val) or Feast seconds"""
+    seconds = np.zeros(len(values), dtype=np.int64)
+    missing = np.ones(len(values), dtype=bool)
+    for i, v in enumerate(values):
+        kind = v.WhichOneof("val") if v is not None else None
+        if kind == "int32_val":
+            seconds[i] = v.int32_val * SECONDS_PER_DAY
+            missing[i] = False
+        elif kind == "unix_timestamp_val":
+            seconds[i] = v.unix_timestamp_val
+            missing[i] = False
+    column = seconds.astype("datetime64[s]")
+    column[missing] = np.datetime64("NaT")
+    return column
+
+
+def _float32_column(values: list[Optional[ValueProto]]) -> np.ndarray:
+    """float32 column from float_val or double_val; NaN marks missing"""
+    column = np.full(len(values), np.nan, dtype=np.float32)
+    for i, v in enumerate(values):
+        kind = v.WhichOneof("val") if v is not None else None
+        if kind == "float_val":
+            column[i] = v.float_val
+        elif kind == "double_val":
+            column[i] = v.double_val
+    return column
+
+
+class InstaworkRedisOnlineStore(RedisOnlineStore):
+    """RedisOnlineStore with compact value encodings and a columnar read path"""
+
+    def __init__(self):
+        super().__init__()
+        self._interned: Optional[InternedStrings] = None
+        self._compression = None
+        self._generations: Optional[Generations] = None
+        self._replicas: Optional[ReplicaPool] = None
+        self._throttle: Optional[TokenBucket] = None
+        self._repo_config: Optional[RepoConfig] = None
+        # versioned view name -> last view read under that name
+        self._tables: dict[str, FeatureView] = {}
+        # versioned view name -> (view, {feature: encoding})
+        self._encodings: dict[str, tuple[FeatureView, dict[str, str]]] = {}
+
+    def _bind(self, config: RepoConfig):
+        """Remember the repo config; decoding hooks that Feast calls do not receive it"""
+        self._repo_config = config
+
+    def _interning(self, config: RepoConfig) -> InternedStrings:
+        if self._interned is None:
+            online_store_config = config.online_store
+            self._interned = InternedStrings(
+                self._get_client(online_store_config),
+                config.project,
+                max_values=online_store_config.intern_max_values,
+                cache_ttl_seconds=online_store_config.intern_cache_ttl_seconds,
+            )
+        return self._interned
+
+    def _compression_dictionaries(self, config: RepoConfig):
+        if self._compression is None:
+            from instawork_feast.compression import CompressionDictionaries
+
+            online_store_config = config.online_store
+            self._compression = CompressionDictionaries(
+                self._get_client(online_store_config),
+                config.project,
+                dict_size=online_store_config.zstd_dict_size,
+                level=online_store_config.zstd_level,
+                retrain=online_store_config.zstd_retrain,
+            )
+        return self._compression
+
+    def _namespace(self, config: RepoConfig, fv_name: str) -> str:
+        """Name the view's hash fields are read and written under (its generation's)"""
+        online_store_config = config.online_store
+        if not online_store_config.online_generations:
+            return fv_name
+        generation = writing_generation(fv_name)
+        if generation is None:
+            if self._generations is None:
+                self._generations = Generations(
+                    self._get_client(online_store_config),
+                    config.project,
+                    cache_seconds=online_store_config.generation_cache_seconds,
+                )
+            generation = self._generations.live(fv_name)
+        return generation_namespace(fv_name, generation)
+
+    @staticmethod
+    def _compressed(config: RepoConfig, table: FeatureView) -> bool:
+        return table.name in config.online_store.compress_views
+
+    @staticmethod
+    def _compress_fallback(config: RepoConfig, table: FeatureView) -> bool:
+        online_store_config = config.online_store
+        return table.name in online_store_config.compress_views and online_store_config.compress_fallback
+
+    @staticmethod
+    def _compact_keys(config: RepoConfig) -> bool:
+        return config.online_store.entity_key_format == COMPACT_KEYS
+
+    def _view_encodings(self, fv_name: str, table: FeatureView) -> dict[str, str]:
+        cached = self._encodings.get(fv_name)
+        if cached is None or cached[0] is not table:
+            cached = (table, field_encodings(self._repo_config, table))
+            self._encodings[fv_name] = cached
+        return cached[1]
+
+    # ------------------------------------------------------------ write path
+
+    def _encode_batch(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        data: List[Tuple[EntityKeyProto, Dict[str, ValueProto], Any, Any]],
+    ) -> List[Tuple[EntityKeyProto, Dict[str, ValueProto], Any, Any]]:
+        """Rows with values replaced by their online encodings"""
+        encodings = field_encodings(config, table)
+        if not encodings or not data:
+            return data
+
+        fv_name = _versioned_fv_name(table, config)
+        interned_codes: dict[str, dict[str, ValueProto]] = {}
+        for feature, encoding in encodings.items():
+            if encoding != INTERNED:
+                continue
+            strings = [
+                values[feature].string_val
+                for _, values, _, _ in data
+                if feature in values and values[feature].WhichOneof("val") == "string_val"
+            ]
+            codes = self._interning(config).encode(fv_name, feature, strings)
+            interned_codes[feature] = {
+                value: ValueProto(int32_val=code) for value, code in codes.items()
+            }
+
+        encoded = []
+        for entity_key, values, timestamp, created in data:
+            values = dict(values)
+            for feature, encoding in encodings.items():
+                val = values.get(feature)
+                if val is None:
+                    continue
+                if encoding == INTERNED:
+                    if val.WhichOneof("val") == "string_val":
+                        values[feature] = interned_codes[feature].get(val.string_val, val)
+                else:
+                    values[feature] = _encode_value(encoding, val)
+            encoded.append((entity_key, values, timestamp, created))
+        return encoded
+
+    def _compress_batch(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        data: List[Tuple[EntityKeyProto, Dict[str, ValueProto], Any, Any]],
+    ) -> List[Tuple[EntityKeyProto, Dict[str, ValueProto], Any, Any]]:
+        """Rows with all values of the view replaced by one compressed blob"""
+        from instawork_feast.compression import pack_values
+
+        payloads = [
+            pack_values({name: val.SerializeToString() for name, val in values.items()})
+            for _, values, _, _ in data
+        ]
+        writer = self._compression_dictionaries(config).writer(
+            _versioned_fv_name(table, config), payloads[:10000]
+        )
+        return [
+            (entity_key, {COMPRESSED_FIELD: ValueProto(bytes_val=writer.compress(payload))}, ts, created)
+            for (entity_key, _, ts, created), payload in zip(data, payloads)
+        ]
+
+    def _prepare_batch(self, config: RepoConfig, table: FeatureView, data):
+        self._bind(config)
+        data = self._encode_batch(config, table, data)
+        if data and self._compressed(config, table):
+            data = self._compress_batch(config, table, data)
+        return data
+
+    def online_write_batch(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        data: List[Tuple[EntityKeyProto, Dict[str, ValueProto], Any, Any]],
+        progress: Optional[Callable[[int], Any]],
+    ) -> None:
+        data = self._prepare_batch(config, table, data)
+        throttle = self._write_throttle(config)
+        if throttle is None:
+            return self._write_prepared(config, table, data, progress)
+        for chunk in _chunks(data, int(throttle.capacity)):
+            throttle.acquire(len(chunk))
+            self._write_prepared(config, table, chunk, progress)
+
+    def _write_prepared(self, config: RepoConfig, table: FeatureView, data, progress):
+        fv_name = _versioned_fv_name(table, config)
+        namespace = self._namespace(config, fv_name)
+        uncompressed_fields = self._uncompressed_fields(config, table, namespace)
+        if not self._compact_keys(config) and namespace == fv_name and not uncompressed_fields:
+            return super().online_write_batch(config, table, data, progress)
+
+        # RedisOnlineStore serializes Feast keys and field names itself, so
+        # compact keys and generations are written here
+        online_store_config = config.online_store
+        client = self._get_client(online_store_config)
+        keys = self._generate_redis_keys_for_entities(config, [row[0] for row in data])
+        previous = [None] * len(keys)
+        if self._dedup(config, fv_name):
+            with client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.hget(key, f"_ts:{namespace}")
+                previous = pipe.execute()
+        with client.pipeline(transaction=False) as pipe:
+            for key, mapping in _hash_writes(namespace, keys, data, previous):
+                pipe.hset(key, mapping=mapping)
+                if uncompressed_fields:
+                    pipe.hdel(key, *uncompressed_fields)
+                if online_store_config.key_ttl_seconds:
+                    pipe.expire(key, online_store_config.key_ttl_seconds)
+            pipe.execute()
+        if progress:
+            progress(len(data))
+
+    async def online_write_batch_async(self, config: RepoConfig, table: FeatureView, data, progress):
+        data = self._prepare_batch(config, table, data)
+        throttle = self._write_throttle(config)
+        if throttle is None:
+            return await self._write_prepared_async(config, table, data, progress)
+        for chunk in _chunks(data, int(throttle.capacity)):
+            await throttle.acquire_async(len(chunk))
+            await self._write_prepared_async(config, table, chunk, progress)
+
+    async def _write_prepared_async(self, config: RepoConfig, table: FeatureView, data, progress):
+        fv_name = _versioned_fv_name(table, config)
+        namespace = self._namespace(config, fv_name)
+        uncompressed_fields = self._uncompressed_fields(config, table, namespace)
+        if not self._compact_keys(config) and namespace == fv_name and not uncompressed_fields:
+            return await super().online_write_batch_async(config, table, data, progress)
+
+        online_store_config = config.online_store
+        client = await self._get_client_async(online_store_config)
+        keys = self._generate_redis_keys_for_entities(config, [row[0] for row in data])
+        previous = [None] * len(keys)
+        if self._dedup(config, fv_name):
+            async with client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.hget(key, f"_ts:{namespace}")
+                previous = await pipe.execute()
+        async with client.pipeline(transaction=False) as pipe:
+            for key, mapping in _hash_writes(namespace, keys, data, previous):
+                pipe.hset(key, mapping=mapping)
+                if uncompressed_fields:
+                    pipe.hdel(key, *uncompressed_fields)
+                if online_store_config.key_ttl_seconds:
+                    pipe.expire(key, online_store_config.key_ttl_seconds)
+            await pipe.execute()
+        if progress:
+            progress(len(data))
+
+    def _write_throttle(self, config: RepoConfig) -> Optional[TokenBucket]:
+        online_store_config = config.online_store
+        rate = online_store_config.write_rows_per_second
+        if not rate:
+            return None
+        if self._throttle is None:
+            burst = online_store_config.write_burst_rows or max(1, int(rate / 10))
+            self._throttle = TokenBucket(rate, burst)
+        return self._throttle
+
+    def _uncompressed_fields(self, config: RepoConfig, table: FeatureView, namespace: str) -> list:
+        """Per-feature fields a blob write replaces, while compress_fallback is set"""
+        if not self._compress_fallback(config, table):
+            return []
+        return [_mmh3(f"{namespace}:{f.name}") for f in table.features]
+
+    @staticmethod
+    def _dedup(config: RepoConfig, fv_name: str) -> bool:
+        """Read stored `_ts` before writing; not needed in a new generation, which starts empty"""
+        return not config.online_store.skip_dedup and writing_generation(fv_name) is None
+
+    # ------------------------------------------------------------ deletes
+
+    def delete_entity_values(self, config: RepoConfig, join_keys: List[str]):
+        """Delete an entity's keys in both key formats"""
+        client = self._get_client(config.online_store)
+        with client.pipeline(transaction=False) as pipe:
+            for pattern in key_patterns(join_keys, config.project):
+                for key in client.scan_iter(pattern):
+                    pipe.delete(key)
+            pipe.execute()
+
+    def delete_table(self, config: RepoConfig, table: FeatureView):
+        """
+        RedisOnlineStore.delete_table over keys in both formats
+
+        Deletes compressed fields too, and the fields of the live generation
+        as well as generation 0.
+        """
+        client = self._get_client(config.online_store)
+        fv_name = _versioned_fv_name(table, config)
+        names = [*(f.name for f in table.features), COMPRESSED_FIELD]
+        ts_keys, fields = set(), []
+        for namespace in {fv_name, self._namespace(config, fv_name)}:
+            ts_keys.add(f"_ts:{namespace}".encode("utf-8"))
+            fields.extend(_mmh3(f"{namespace}:{f}") for f in names)
+        fields.extend(ts_keys)
+
+        keys = [
+            key
+            for pattern in key_patterns(table.join_keys, config.project)
+            for key in client.scan_iter(pattern)
+        ]
+        if config.online_store.online_generations:
+            client.hdel(generation_keys(config.project)[0], fv_name)
+        if not keys:
+            return
+        with client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.hkeys(key)
+            all_fields = pipe.execute()
+        with client.pipeline(transaction=False) as pipe:
+            for key, names in zip(keys, all_fields):
+                views = {name for name in names if name.startswith(b"_ts:")}
+                if not views & ts_keys:
+                    continue
+                if views <= ts_keys:
+                    pipe.delete(key)
+                else:
+                    pipe.hdel(key, *fields)
+            pipe.execute()
+
+    # ------------------------------------------------------------- read path
+
+    def _generate_hset_keys_for_features(
+        self,
+        feature_view: FeatureView,
+        requested_features: Optional[List[str]] = None,
+        fv_name_override: Optional[str] = None,
+    ):
+        # Every read path passes the view here before decoding values by view name
+        fv_name = fv_name_override or feature_view.name
+        self._tables[fv_name] = feature_view
+        requested_features, hset_keys = super()._generate_hset_keys_for_features(
+            feature_view, requested_features, fv_name_override
+        )
+        namespace = self._namespace(self._repo_config, fv_name)
+        if self._compressed(self._repo_config, feature_view):
+            # One blob field and the timestamp; _expand_compressed restores the columns
+            hset_keys = [_mmh3(f"{namespace}:{COMPRESSED_FIELD}"), f"_ts:{namespace}"]
+            if self._compress_fallback(self._repo_config, feature_view):
+                # Per-feature fields of entities written before the view was compressed
+                fields = [_mmh3(f"{namespace}:{f}") for f in requested_features[:-1]]
+                hset_keys[1:1] = fields
+        elif namespace != fv_name:
+            hset_keys = [_mmh3(f"{namespace}:{f}") for f in requested_features[:-1]]
+            hset_keys.append(f"_ts:{namespace}")
+        return requested_features, hset_keys
+
+    def _generate_redis_keys_for_entities(
+        self, config: RepoConfig, entity_keys: Union[List[EntityKeyProto], IntEntityKeys]
+    ) -> List[bytes]:
+        # Batch serialization, shared by the views of a request (entity_keys.py)
+        return redis_keys(
+            entity_keys,
+            config.project,
+            config.entity_key_serialization_version,
+            compact=self._compact_keys(config),
+        )
+
+    def _expand_compressed(
+        self, fv_name: str, redis_values, requested_features: List[str]
+    ) -> list[list[Optional[bytes]]]:
+        """
+        [blob, ts] rows as per-feature values followed by ts, like an uncompressed HMGET
+
+        With compress_fallback, rows are [blob, *per-feature values, ts], and a
+        row without a blob keeps its per-feature values.
+        """
+        dictionaries = self._compression_dictionaries(self._repo_config)
+        features = requested_features[:-1]
+        expanded = []
+        for row in redis_values:
+            blob_bin, ts_bin = row[0], row[-1]
+            if blob_bin:
+                blob = ValueProto()
+                blob.ParseFromString(blob_bin)
+                values = dictionaries.decompress(fv_name, blob.bytes_val)
+                expanded.append([values.get(f) for f in features] + [ts_bin])
+            elif len(row) > 2:
+                expanded.append(list(row[1:]))
+            else:
+                expanded.append([None] * len(features) + [ts_bin])
+        return expanded
+
+    def online_read(self, config: RepoConfig, *args, **kwargs):
+        self._bind(config)
+        switch_phase("entity_key_serialization")
+        return super().online_read(config, *args, **kwargs)
+
+    def _read_features_per_fv(self, config: RepoConfig, *args, **kwargs):
+        self._bind(config)
+        switch_phase("entity_key_serialization")
+        return super()._read_features_per_fv(config, *args, **kwargs)
+
+    async def online_read_async(self, config: RepoConfig, *args, **kwargs):
+        self._bind(config)
+        switch_phase("entity_key_serialization")
+        return await super().online_read_async(config, *args, **kwargs)
+
+    async def _read_features_per_fv_async(self, config: RepoConfig, *args, **kwargs):
+        # The async paths pipeline without _read_hash_fields, so their Redis
+        # round trip is counted in entity_key_serialization
+        self._bind(config)
+        switch_phase("entity_key_serialization")
+        return await super()._read_features_per_fv_async(config, *args, **kwargs)
+
+    def _read_hash_fields(self, config: RepoConfig, commands):
+        if commands:
+            # The last hash field of every command is the view's "_ts:<view>[@<generation>]" key
+            first, last = commands[0][1][-1], commands[-1][1][-1]
+            view = first[len("_ts:") :].partition("@")[0] if first == last else "multiple"
+            switch_phase("redis_io", view)
+        values = self._hmget(config, commands)
+        if self._compact_keys(config) and config.online_store.entity_key_fallback:
+            values = self._read_feast_keys(config, commands, values)
+        return values
+
+    def _replica_pool(self, config: RepoConfig) -> Optional[ReplicaPool]:
+        online_store_config = config.online_store
+        if not online_store_config.read_replicas:
+            return None
+        if self._replicas is None:
+            if online_store_config.redis_type != RedisType.redis:
+                raise ValueError(
+                    "read_replicas needs redis_type: redis; for a cluster, add "
+                    "read_from_replicas=true to connection_string"
+                )
+            replicas = {}
+            for connection_string in online_store_config.read_replicas:
+                nodes, kwargs = self._parse_connection_string(connection_string)
+                host, port = nodes[0]["host"], nodes[0]["port"]
+                replicas[f"{host}:{port}"] = Redis(host=host, port=port, **kwargs)
+            self._replicas = ReplicaPool(
+                self._get_client(online_store_config),
+                replicas,
+                check_seconds=online_store_config.replica_check_seconds,
+                max_lag_bytes=online_store_config.replica_max_lag_bytes,
+            )
+        return self._replicas
+
+    def _hmget(self, config: RepoConfig, commands):
+        """One HMGET reply per (key, fields), from a healthy replica when there are replicas"""
+        replicas = self._replica_pool(config)
+        if replicas is None or config.online_store.client == RedisClient.glide:
+            return super()._read_hash_fields(config, commands)
+
+        def read(client):
+            with client.pipeline(transaction=False) as pipe:
+                for redis_key, fields in commands:
+                    pipe.hmget(redis_key, fields)
+                return pipe.execute()
+
+        return replicas.execute(read)
+
+    def _read_feast_keys(self, config: RepoConfig, commands, values):
+        """Replies of compact keys with no data, re-read under their Int64 and Int32 Feast keys"""
+        retries = []
+        for i, ((key, fields), row) in enumerate(zip(commands, values)):
+            if any(v is not None for v in row):
+                continue
+            parsed = parse_redis_key(key, config.project)
+            if parsed is not None and parsed.compact:
+                retries.append((i, fields, parsed))
+        if not retries:
+            return values
+
+        replies = self._hmget(
+            config,
+            [
+                (feast_key(parsed, config.project, value_type), fields)
+                for _, fields, parsed in retries
+                for value_type in (ValueType.INT64, ValueType.INT32)
+            ],
+        )
+        values = list(values)
+        for n, (i, _, _) in enumerate(retries):
+            for row in replies[2 * n : 2 * n + 2]:
+                if any(v is not None for v in row):
+                    values[i] = row
+                    break
+        return values
+
+    def _decode_interned(
+        self, fv_name: str, feature: str, values: list[Optional[ValueProto]]
+    ) -> list[Optional[ValueProto]]:
+        """String ValueProtos for interned codes; other values are returned unchanged"""
+        codes = [
+            v.int32_val for v in values if v is not None and v.WhichOneof("val") == "int32_val"
+        ]
+        if not codes:
+            return values
+
+        dictionary = self._interning(self._repo_config).dictionary(fv_name, feature, max(codes))
+        strings: dict[int, ValueProto] = {}
+        decoded = []
+        for v in values:
+            if v is not None and v.WhichOneof("val") == "int32_val":
+                code = v.int32_val
+                if code not in strings:
+                    value = dictionary.decode(code) if dictionary else None
+                    strings[code] = ValueProto(string_val=value) if value is not None else ValueProto()
+                v = strings[code]
+            decoded.append(v)
+        return decoded
+
+    def _convert_redis_values_to_protobuf(
+        self,
+        redis_values: Sequence[Sequence[Optional[bytes]]],
+        feature_view: str,
+        requested_features: List[str],
+    ):
+        switch_phase("protobuf_decoding", feature_view)
+        table = self._tables[feature_view]
+        if self._compressed(self._repo_config, table):
+            redis_values = self._expand_compressed(feature_view, redis_values, requested_features)
+        rows = super()._convert_redis_values_to_protobuf(
+            redis_values, feature_view, requested_features
+        )
+        encodings = self._view_encodings(feature_view, table)
+        for feature in requested_features:
+            encoding = encodings.get(feature)
+            if encoding is None:
+                continue
+            if encoding == INTERNED:
+                column = [res[feature] if res else None for _, res in rows]
+                decoded = self._decode_interned(feature_view, feature, column)
+                for (_, res), val in zip(rows, decoded):
+                    if res:
+                        res[feature] = val
+            else:
+                for _, res in rows:
+                    if res:
+                        res[feature] = _decode_value(encoding, res[feature])
+        switch_phase("response_building")
+        return rows
+
+    # --------------------------------------------------------- columnar read
+
+    def read_frame(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: Union[List[EntityKeyProto], IntEntityKeys],
+        requested_features: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Features of a view as a DataFrame, one row per entity key in order
+
+        entity_keys may be an IntEntityKeys array of ids, which skips building
+        EntityKey protos.
+
+        Interned strings come back as Categoricals over the cached dictionary,
+        which pa.Table.from_pandas turns into Arrow dictionary arrays. Dates
+        and timestamps come back as datetime64[s], float32 features as
+        float32. Missing values are NaN / NaT / None.
+        """
+        self._bind(config)
+        switch_phase("entity_key_serialization")
+        fv_name = _versioned_fv_name(table, config)
+        features, hset_keys = self._generate_hset_keys_for_features(
+            table, list(requested_features or []), fv_name_override=fv_name
+        )
+        redis_keys = self._generate_redis_keys_for_entities(config, entity_keys)
+        rows = self._read_hash_fields(config, [(key, hset_keys) for key in redis_keys])
+        switch_phase("protobuf_decoding", fv_name)
+        if self._compressed(config, table):
+            rows = self._expand_compressed(fv_name, rows, features)
+        features = features[:-1]  # drop the _ts key
+
+        encodings = self._view_encodings(fv_name, table)
+        columns = list(zip(*rows)) if rows else [()] * len(features)
+        frame = {}
+        for feature, raw in zip(features, columns):
+            values = _parse_values(raw)
+            encoding = encodings.get(feature)
+            if encoding == INTERNED:
+                frame[feature] = self._categorical(fv_name, feature, values)
+            elif encoding in (EPOCH_DAYS, EPOCH_SECONDS):
+                frame[feature] = _datetime_column(values)
+            elif encoding == FLOAT32:
+                frame[feature] = _float32_column(values)
+            else:
+                frame[feature] = [
+                    feast_value_type_to_python_type(v) if v is not None else None for v in values
+                ]
+        switch_phase("response_building")
+        return pd.DataFrame(frame, index=pd.RangeIndex(len(entity_keys)))
+
+    def _categorical(
+        self, fv_name: str, feature: str, values: list[Optional[ValueProto]]
+    ) -> pd.Categorical:
+        """Interned column as a Categorical over the view's dictionary"""
+        codes = np.full(len(values), -1, dtype=np.int32)
+        plain = False
+        for i, v in enumerate(values):
+            kind = v.WhichOneof("val") if v is not None else None
+            if kind == "int32_val":
+                codes[i] = v.int32_val
+            elif kind == "string_val":
+                plain = True
+
+        dictionary = self._interning(self._repo_config).dictionary(
+            fv_name, feature, int(codes.max(initial=-1))
+        )
+        if not plain and dictionary is not None:
+            return dictionary.to_categorical(np.where(codes < len(dictionary), codes, -1))
+
+        # Values written before interning, or past the dictionary cap
+        decoded = self._decode_interned(fv_name, feature, values)
+        return pd.Categorical(
+            [v.string_val if v is not None and v.HasField("string_val") else None for v in decoded]
+        )
@@ -0,0 +1,436 @@
+"""
+Memory-mapped registry index
+
+Loading data/registry.db means parsing the whole registry protobuf and turning
+every feature view into Python objects, which every worker and serving process
+pays at startup and again whenever it lists views. This module compiles the
+registry once into a flat, memory-mapped index (data/registry.db.idx) of views,
+fields and entities:
+
+- opening the index parses a small JSON header; the tables are numpy views over
+  the mapped file and pages are loaded by the OS on first touch
+- view and `view:feature` lookups are a binary search over sorted 64-bit hashes
+- strings are decoded only when a record is read, and decoded records are memoized
+- reading needs only numpy; Feast itself is imported only to recompile
+
+RegistryIndexCache re-checks the registry every `ttl_seconds` and recompiles
+the index when `feast apply` has written a newer registry. The registry must
+be a local file; remote registries (s3://, gs://, sql) are rejected.
+
+Usage:
+    from instawork_feast.registry_cache import get_registry_index
+
+    index = get_registry_index(".")
+    index.view("pro_core_features").schema
+    index.field("pro_core_features:mc_str_worker_level").dtype
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import yaml
+
+INDEX_MAGIC = b"IWRIDX01"
+INDEX_VERSION = 1
+DEFAULT_INDEX_SUFFIX = ".idx"
+
+_STR = [("off", "<u4"), ("len", "<u4")]
+VIEW_DTYPE = np.dtype(
+    [
+        ("name", _STR),
+        ("entity", _STR),
+        ("join_key", _STR),
+        ("table", _STR),
+        ("timestamp_field", _STR),
+        ("tags", _STR),
+        ("ttl_seconds", "<i8"),
+        ("field_start", "<u4"),
+        ("field_count", "<u4"),
+        ("online", "<u1"),
+        ("_pad", "<u1", 7),
+    ]
+)
+FIELD_DTYPE = np.dtype([("name", _STR), ("dtype", _STR)])
+ENTITY_DTYPE = np.dtype([("name", _STR), ("join_key", _STR), ("value_type", _STR)])
+HASH_DTYPE = np.dtype([("hash", "<u8"), ("view", "<u4"), ("field", "<u4")])
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+@dataclass(frozen=True)
+class FieldInfo:
+    name: str
+    dtype: str
+
+
+@dataclass(frozen=True)
+class EntityInfo:
+    name: str
+    join_key: str
+    value_type: str
+
+
+@dataclass(frozen=True)
+class ViewInfo:
+    """Lightweight stand-in for a FeatureView, read from the index"""
+
+    name: str
+    entity: str
+    join_keys: list[str]
+    table: str
+    timestamp_field: str
+    ttl: Optional[timedelta]
+    online: bool
+    tags: dict[str, str] = field(default_factory=dict)
+    schema: list[FieldInfo] = field(default_factory=list)
+
+    @property
+    def entities(self) -> list[str]:
+        return [self.entity] if self.entity else []
+
+
+# ============================================================================
+# COMPILE
+# ============================================================================
+
+
+class _StringTable:
+    def __init__(self):
+        self.blob = bytearray()
+        self.offsets: dict[str, tuple[int, int]] = {}
+
+    def add(self, value: str) -> tuple[int, int]:
+        if value not in self.offsets:
+            encoded = value.encode("utf-8")
+            self.offsets[value] = (len(self.blob), len(encoded))
+            self.blob += encoded
+        return self.offsets[value]
+
+
+def _align(buf: bytearray, to: int = 8):
+    buf += b"\x00" * (-len(buf) % to)
+
+
+def compile_registry_index(registry_path: str, index_path: str, project: str = None) -> dict:
+    """Compile a Feast registry.db into a memory-mappable index; returns the header"""
+    from feast import ValueType
+    from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
+    from feast.types import from_value_type
+
+    registry = RegistryProto()
+    with open(registry_path, "rb") as f:
+        registry.ParseFromString(f.read())
+
+    strings = _StringTable()
+    views, fields, entities, view_hashes, ref_hashes = [], [], [], [], []
+
+    feature_view_protos = sorted(
+        (fv for fv in registry.feature_views if project is None or fv.spec.project == project),
+        key=lambda fv: fv.spec.name,
+    )
+    for view_idx, fv in enumerate(feature_view_protos):
+        spec = fv.spec
+        source = spec.batch_source
+        table = source.redshift_options.table or source.file_options.uri or source.name
+        join_key = spec.entity_columns[0].name if spec.entity_columns else ""
+        ttl = spec.ttl.ToTimedelta().total_seconds() if spec.HasField("ttl") else 0
+
+        views.append(
+            (
+                strings.add(spec.name),
+                strings.add(spec.entities[0] if spec.entities else ""),
+                strings.add(join_key),
+                strings.add(table),
+                strings.add(source.timestamp_field),
+                strings.add(json.dumps(dict(spec.tags), sort_keys=True)),
+                int(ttl),
+                len(fields),
+                len(spec.features),
+                int(spec.online),
+                (0,) * 7,
+            )
+        )
+        view_hashes.append((_hash(spec.name), view_idx, 0))
+
+        for field_idx, feature in enumerate(spec.features):
+            dtype = str(from_value_type(ValueType(feature.value_type)))
+            fields.append((strings.add(feature.name), strings.add(dtype)))
+            ref_hashes.append((_hash(f"{spec.name}:{feature.name}"), view_idx, field_idx))
+
+    for entity in sorted(registry.entities, key=lambda e: e.spec.name):
+        # Skip Feast's internal __dummy entity
+        if entity.spec.name.startswith("__"):
+            continue
+        if project is not None and entity.spec.project != project:
+            continue
+        entities.append(
+            (
+                strings.add(entity.spec.name),
+                strings.add(entity.spec.join_key),
+                strings.add(ValueType(entity.spec.value_type).name),
+            )
+        )
+
+    tables = {
+        "views": np.array(views, dtype=VIEW_DTYPE),
+        "fields": np.array(fields, dtype=FIELD_DTYPE),
+        "entities": np.array(entities, dtype=ENTITY_DTYPE),
+        "view_hashes": np.sort(np.array(view_hashes, dtype=HASH_DTYPE), order="hash"),
+        "ref_hashes": np.sort(np.array(ref_hashes, dtype=HASH_DTYPE), order="hash"),
+    }
+
+    body = bytearray()
+    sections = {}
+    for name, array in tables.items():
+        _align(body)
+        sections[name] = [len(body), len(array)]
+        body += array.tobytes()
+    _align(body)
+    sections["strings"] = [len(body), len(strings.blob)]
+    body += strings.blob
+
+    header = {
+        "version": INDEX_VERSION,
+        "registry_mtime": os.path.getmtime(registry_path),
+        "last_updated": registry.last_updated.ToJsonString(),
+        "sections": sections,
+    }
+    header_bytes = json.dumps(header).encode("utf-8")
+    prefix = bytearray(INDEX_MAGIC + len(header_bytes).to_bytes(4, "little") + header_bytes)
+    _align(prefix)
+
+    # Write then rename so readers never map a half-written index
+    tmp_path = f"{index_path}.tmp.{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(prefix)
+        f.write(body)
+    os.replace(tmp_path, index_path)
+    return header
+
+
+# ============================================================================
+# READ
+# ============================================================================
+
+
+def read_index_header(index_path: str) -> dict:
+    """Header of a compiled index, read without mapping the file"""
+    with open(index_path, "rb") as f:
+        prefix = f.read(12)
+        if prefix[:8] != INDEX_MAGIC:
+            raise ValueError(f"{index_path} is not a registry index")
+        return json.loads(f.read(int.from_bytes(prefix[8:12], "little")))
+
+
+class RegistryIndex:
+    """Read-only, memory-mapped view of a compiled registry index"""
+
+    def __init__(self, index_path: str):
+        self.path = index_path
+        with open(index_path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:8] != INDEX_MAGIC:
+            raise ValueError(f"{index_path} is not a registry index")
+        header_len = int.from_bytes(self._mmap[8:12], "little")
+        self.header = json.loads(self._mmap[12 : 12 + header_len])
+        if self.header["version"] != INDEX_VERSION:
+            raise ValueError(f"{index_path} has index version {self.header['version']}")
+        base = 12 + header_len + (-(12 + header_len) % 8)
+
+        def section(name, dtype):
+            offset, count = self.header["sections"][name]
+            return np.frombuffer(self._mmap, dtype=dtype, count=count, offset=base + offset)
+
+        self._views = section("views", VIEW_DTYPE)
+        self._fields = section("fields", FIELD_DTYPE)
+        self._entities = section("entities", ENTITY_DTYPE)
+        self._view_hashes = section("view_hashes", HASH_DTYPE)
+        self._ref_hashes = section("ref_hashes", HASH_DTYPE)
+        strings_offset, strings_len = self.header["sections"]["strings"]
+        self._strings = memoryview(self._mmap)[
+            base + strings_offset : base + strings_offset + strings_len
+        ]
+        self._view_memo: dict[str, Optional[ViewInfo]] = {}
+        self._field_memo: dict[str, Optional[FieldInfo]] = {}
+
+    def _str(self, ref) -> str:
+        off, length = int(ref[0]), int(ref[1])
+        return bytes(self._strings[off : off + length]).decode("utf-8")
+
+    def _find(self, table: np.ndarray, key: str, match) -> Optional[np.void]:
+        """Binary search a hash table, confirming the name on each candidate"""
+        h = np.uint64(_hash(key))
+        i = int(np.searchsorted(table["hash"], h))
+        while i < len(table) and table["hash"][i] == h:
+            if match(table[i]):
+                return table[i]
+            i += 1
+        return None
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    @property
+    def n_features(self) -> int:
+        return len(self._fields)
+
+    def feature_view_names(self) -> list[str]:
+        return [self._str(v["name"]) for v in self._views]
+
+    def _view_info(self, idx: int) -> ViewInfo:
+        v = self._views[idx]
+        start, count = int(v["field_start"]), int(v["field_count"])
+        join_key = self._str(v["join_key"])
+        return ViewInfo(
+            name=self._str(v["name"]),
+            entity=self._str(v["entity"]),
+            join_keys=[join_key] if join_key else [],
+            table=self._str(v["table"]),
+            timestamp_field=self._str(v["timestamp_field"]),
+            ttl=timedelta(seconds=int(v["ttl_seconds"])) if v["ttl_seconds"] else None,
+            online=bool(v["online"]),
+            tags=json.loads(self._str(v["tags"])),
+            schema=[
+                FieldInfo(self._str(f["name"]), self._str(f["dtype"]))
+                for f in self._fields[start : start + count]
+            ],
+        )
+
+    def view(self, name: str) -> Optional[ViewInfo]:
+        if name not in self._view_memo:
+            hit = self._find(
+                self._view_hashes, name, lambda r: self._str(self._views[r["view"]]["name"]) == name
+            )
+            self._view_memo[name] = None if hit is None else self._view_info(int(hit["view"]))
+        return self._view_memo[name]
+
+    def views(self) -> list[ViewInfo]:
+        return [self.view(name) for name in self.feature_view_names()]
+
+    def field(self, feature_ref: str) -> Optional[FieldInfo]:
+        if feature_ref not in self._field_memo:
+            self._field_memo[feature_ref] = self._lookup_field(feature_ref)
+        return self._field_memo[feature_ref]
+
+    def _lookup_field(self, feature_ref: str) -> Optional[FieldInfo]:
+        view_name, feature_name = feature_ref.split(":", 1)
+
+        def match(r):
+            v = self._views[r["view"]]
+            f = self._fields[int(v["field_start"]) + int(r["field"])]
+            return self._str(v["name"]) == view_name and self._str(f["name"]) == feature_name
+
+        hit = self._find(self._ref_hashes, feature_ref, match)
+        if hit is None:
+            return None
+        f = self._fields[int(self._views[hit["view"]]["field_start"]) + int(hit["field"])]
+        return FieldInfo(feature_name, self._str(f["dtype"]))
+
+    def entities(self) -> list[EntityInfo]:
+        return [
+            EntityInfo(self._str(e["name"]), self._str(e["join_key"]), self._str(e["value_type"]))
+            for e in self._entities
+        ]
+
+
+# ============================================================================
+# TTL CACHE
+# ============================================================================
+
+
+class RegistryIndexCache:
+    """
+    Keeps a RegistryIndex mapped and refreshes it at most every ttl_seconds
+
+    A refresh stats the registry file; if it is newer than the index the index
+    is recompiled (atomically) and remapped. ttl_seconds=0 never refreshes,
+    matching Feast's registry cache_ttl_seconds semantics.
+    """
+
+    def __init__(self, registry_path: str, index_path: str = None, ttl_seconds: int = 60):
+        self.registry_path = registry_path
+        self.index_path = index_path or registry_path + DEFAULT_INDEX_SUFFIX
+        self.ttl_seconds = ttl_seconds
+        self._index: Optional[RegistryIndex] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _stale(self) -> bool:
+        if not os.path.exists(self.index_path):
+            return True
+        if self._index is not None:
+            compiled_mtime = self._index.header["registry_mtime"]
+        else:
+            compiled_mtime = read_index_header(self.index_path)["registry_mtime"]
+        return os.path.getmtime(self.registry_path) > compiled_mtime
+
+    def get(self) -> RegistryIndex:
+        now = time.monotonic()
+        if self._index is not None and (
+            self.ttl_seconds == 0 or now - self._checked_at < self.ttl_seconds
+        ):
+            return self._index
+
+        with self._lock:
+            if self._index is None or now - self._checked_at >= self.ttl_seconds:
+                if self._stale():
+                    compile_registry_index(self.registry_path, self.index_path)
+                    self._index = None
+                if self._index is None:
+                    self._index = RegistryIndex(self.index_path)
+                self._checked_at = now
+        return self._index
+
+
+_caches: dict[str, RegistryIndexCache] = {}
+
+
+def registry_path_for_repo(repo_path: str = ".") -> tuple[str, int]:
+    """
+    Registry path and cache_ttl_seconds from the repo's feature_store.yaml
+
+    Raises ValueError for registries that are not a local file, which the
+    index cannot stat or map.
+    """
+    config = yaml.safe_load((Path(repo_path) / "feature_store.yaml").read_text())
+    registry = config["registry"]
+    if isinstance(registry, str):
+        registry = {"path": registry}
+
+    path = registry["path"]
+    if path.startswith("file://"):
+        path = path[len("file://") :]
+    elif "://" in path or registry.get("registry_type", "file") != "file":
+        raise ValueError(
+            f"The registry index needs a local registry file, not {path!r}; "
+            "use FeatureStore's registry for remote registries"
+        )
+
+    registry_path = Path(path)
+    if not registry_path.is_absolute():
+        registry_path = Path(repo_path) / registry_path
+    # Feast's own default registry cache TTL
+    return str(registry_path), registry.get("cache_ttl_seconds", 600)
+
+
+def get_registry_index(repo_path: str = ".", ttl_seconds: int = None) -> RegistryIndex:
+    """Process-wide cached index for a feature repo"""
+    key = os.path.abspath(repo_path)
+    if key not in _caches:
+        registry_path, config_ttl = registry_path_for_repo(repo_path)
+        _caches[key] = RegistryIndexCache(
+            registry_path, ttl_seconds=config_ttl if ttl_seconds is None else ttl_seconds
+        )
+    return _caches[key].get()
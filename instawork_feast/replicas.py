@@ -0,0 +1,167 @@
+"""
+Read replicas of the online store
+
+With read_replicas configured (online_store.py), the feature reads of online
+requests (the pipelined HMGETs of get_online_features, online_read and
+read_frame) go to replicas of the primary in connection_string, one replica
+per request, round robin. Writes, and the small cached reads of interned
+string dictionaries, zstd dictionaries and generation pointers, stay on the
+primary.
+
+    online_store:
+      type: instawork_feast.online_store.InstaworkRedisOnlineStore
+      connection_string: "redis-primary:6379"
+      read_replicas: ["redis-replica-1:6379", "redis-replica-2:6379,password=..."]
+
+A background thread checks every replica each replica_check_seconds with
+INFO replication. A replica is healthy when it answers, its link to the
+primary is up, it is not syncing, and its replication offset
+(slave_repl_offset) is within replica_max_lag_bytes of the primary's
+master_repl_offset, read once per check. The difference is the replication
+stream the replica has not applied yet, i.e. writes it would not serve; a
+replica that heard from the primary recently can still be far behind. A read
+that fails on a replica with a connection error marks it unhealthy and is
+retried on the next one. With no healthy replica, reads go to the primary.
+
+Replicas lag the primary. wait_for_replication lets a blue/green
+materialization switch a view only once every replica has its new generation.
+
+This applies to standalone Redis. With redis_type: redis_cluster, add
+`read_from_replicas=true` to connection_string instead, which redis-py
+handles per shard.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+
+from redis.exceptions import ConnectionError, RedisError, TimeoutError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECK_SECONDS = 5.0
+DEFAULT_MAX_LAG_BYTES = 1024 * 1024
+
+T = TypeVar("T")
+
+
+def primary_offset(client) -> Optional[int]:
+    """The primary's replication offset; None if it cannot be read"""
+    try:
+        return int(client.info("replication").get("master_repl_offset", 0))
+    except RedisError as e:
+        logger.warning("Could not read the online store primary's replication offset: %s", e)
+        return None
+
+
+def replica_health(client, primary_offset: Optional[int], max_lag_bytes: int) -> tuple[bool, str]:
+    """
+    (healthy, reason) of one replica
+
+    primary_offset is read before the replica's, so the lag is never
+    underestimated; without it, the lag is not checked.
+    """
+    try:
+        info = client.info("replication")
+    except RedisError as e:
+        return False, f"unreachable ({e})"
+    if info.get("role") != "slave":
+        return False, f"role is {info.get('role')}"
+    if info.get("master_link_status") != "up":
+        return False, "link to primary is down"
+    if info.get("master_sync_in_progress"):
+        return False, "syncing"
+    if primary_offset is not None:
+        lag = primary_offset - int(info.get("slave_repl_offset", 0))
+        if lag > max_lag_bytes:
+            return False, f"{lag:,} bytes behind the primary"
+    return True, "ok"
+
+
+class ReplicaPool:
+    """Round-robin reads over healthy replicas, falling back to the primary"""
+
+    def __init__(
+        self,
+        primary,
+        replicas: dict[str, object],
+        check_seconds: float = DEFAULT_CHECK_SECONDS,
+        max_lag_bytes: int = DEFAULT_MAX_LAG_BYTES,
+    ):
+        self.primary = primary
+        self.replicas = replicas
+        self.check_seconds = check_seconds
+        self.max_lag_bytes = max_lag_bytes
+        # Replicas start healthy; the first check runs right away
+        self._healthy: dict[str, bool] = {name: True for name in replicas}
+        self._turn = itertools.count()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="replica-health", daemon=True)
+        self._thread.start()
+
+    def healthy(self) -> list[str]:
+        return [name for name, healthy in self._healthy.items() if healthy]
+
+    def _mark(self, name: str, healthy: bool, reason: str):
+        if self._healthy[name] != healthy:
+            if healthy:
+                logger.info("Online store replica %s is healthy again", name)
+            else:
+                logger.warning("Online store replica %s is unhealthy: %s", name, reason)
+        self._healthy[name] = healthy
+
+    def check(self):
+        """Check every replica once against the primary's current offset"""
+        offset = primary_offset(self.primary)
+        for name, client in self.replicas.items():
+            self._mark(name, *replica_health(client, offset, self.max_lag_bytes))
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self.check()
+            self._stopped.wait(self.check_seconds)
+
+    def stop(self):
+        self._stopped.set()
+
+    def execute(self, read: Callable[[object], T]) -> T:
+        """
+        read(client) on the next healthy replica
+
+        A replica that fails with a connection error or timeout is marked
+        unhealthy until its next successful check, and the read moves on to
+        the next one, then to the primary.
+        """
+        healthy = self.healthy()
+        if healthy:
+            start = next(self._turn) % len(healthy)
+            for name in healthy[start:] + healthy[:start]:
+                try:
+                    return read(self.replicas[name])
+                except (ConnectionError, TimeoutError) as e:
+                    self._mark(name, False, repr(e))
+        return read(self.primary)
+
+
+def wait_for_replication(client, timeout_seconds: float, poll_seconds: float = 0.1) -> bool:
+    """
+    Wait until every replica of the primary `client` has caught up with its
+    current replication offset; False if one has not within timeout_seconds
+    """
+    target = client.info("replication").get("master_repl_offset", 0)
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        info = client.info("replication")
+        offsets = [
+            entry.get("offset", 0)
+            for name, entry in info.items()
+            if name.startswith("slave") and isinstance(entry, dict)
+        ]
+        if all(offset >= target for offset in offsets):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(poll_seconds)
+
@@ -0,0 +1,34 @@
+"""
+Hand-maintained declaration modules in the feature repo
+
+Files such as feature_views/derived_features.py are plain Python modules of
+declarations. They are loaded by path so that serving code does not need the
+repo on sys.path. A loaded module is reused until the file changes.
+"""
+
+import importlib.util
+import os
+from types import ModuleType
+from typing import Optional
+
+_loaded: dict[str, tuple[float, ModuleType]] = {}
+
+
+def load_repo_module(repo_path: str, relative_path: str) -> Optional[ModuleType]:
+    """Load <repo_path>/<relative_path>, or None if it does not exist"""
+    path = os.path.join(repo_path, relative_path)
+    if not os.path.exists(path):
+        return None
+
+    mtime = os.path.getmtime(path)
+    cached = _loaded.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    module_name = "_instawork_" + os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    _loaded[path] = (mtime, module)
+    return module
@@ -0,0 +1,325 @@
+"""
+Feature retrieval entry points
+
+Thin wrappers around FeatureStore.get_online_features and
+FeatureStore.get_historical_features that route requests spanning several
+views of one entity to that entity's snapshot view (see snapshots.py) and
+return results under the names the caller asked for. Online, derived features
+(see derived.py) left out of the online schema are computed from their inputs
+over the whole batch. Every request's refs are counted by the sampled usage
+tracker (see usage.py), and online requests are timed phase by phase (see
+instrumentation.py).
+
+get_online_frame returns a DataFrame through the columnar read path of the
+Instawork online store (see online_store.py); with any other online store it
+falls back to get_online_features.
+
+Usage:
+    from instawork_feast.retrieval import get_online_features
+
+    features = get_online_features(
+        store,
+        features=[
+            "pro_core_features:mc_str_worker_level",
+            "pro_quiz_features:rv_float_avg_quiz_score",
+        ],
+        entity_rows=[{"id_worker_id": 12345}],
+    )
+"""
+
+import threading
+import time
+import warnings
+from typing import Union
+from weakref import WeakKeyDictionary
+
+import numpy as np
+import pandas as pd
+from feast import FeatureStore, FeatureView, ValueType
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.type_map import python_values_to_proto_values
+
+from instawork_feast.derived import DerivedFeature, expand_refs, load_derived_features
+from instawork_feast.entity_keys import IntEntityKeys
+from instawork_feast.instrumentation import online_request, switch_phase
+from instawork_feast.offline import (
+    check_feature_name_collisions,
+    get_historical_features_local,
+    group_feature_refs,
+)
+from instawork_feast.online_schema import OnlineSchema, load_online_schema
+from instawork_feast.online_store import InstaworkRedisOnlineStore
+from instawork_feast.registry_cache import RegistryIndex, get_registry_index
+from instawork_feast.snapshots import SnapshotIndex
+from instawork_feast.usage import get_tracker
+
+# How often online requests check the declaration modules for changes
+DECLARATIONS_CHECK_SECONDS = 5
+
+_snapshot_indexes: "WeakKeyDictionary[FeatureStore, tuple[RegistryIndex, SnapshotIndex]]" = (
+    WeakKeyDictionary()
+)
+
+
+def snapshot_index(store: FeatureStore) -> SnapshotIndex:
+    """Snapshot routing index for a store, rebuilt when its registry index refreshes"""
+    registry_index = get_registry_index(str(store.repo_path))
+    cached = _snapshot_indexes.get(store)
+    if cached is None or cached[0] is not registry_index:
+        cached = (registry_index, SnapshotIndex(registry_index.views()))
+        _snapshot_indexes[store] = cached
+    return cached[1]
+
+
+def _output_renames(
+    feature_refs: list[str], routed_refs: list[str], full_feature_names: bool
+) -> dict[str, str]:
+    """Map output names produced by routed refs back to the requested names"""
+    renames = {}
+    for ref, routed_ref in zip(feature_refs, routed_refs):
+        if ref == routed_ref:
+            continue
+        view_name, feature_name = ref.split(":", 1)
+        snapshot, column = routed_ref.split(":", 1)
+        if full_feature_names:
+            renames[f"{snapshot}__{column}"] = f"{view_name}__{feature_name}"
+        else:
+            renames[column] = feature_name
+    return renames
+
+
+class OnlineDeclarations:
+    """
+    A repo's online schema and the derived features computed online
+
+    Like RegistryIndexCache, it checks the declaration modules (by mtime, in
+    load_repo_module) and the registry index at most every check_seconds, and
+    rebuilds the derived mapping only when one of them changed, so a request
+    does not stat files or rebuild sets.
+    """
+
+    def __init__(self, repo_path: str, check_seconds: float = DECLARATIONS_CHECK_SECONDS):
+        self.repo_path = repo_path
+        self.check_seconds = check_seconds
+        self._sources: tuple = ()
+        self._schema = OnlineSchema()
+        self._derived: dict[str, DerivedFeature] = {}
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def get(self) -> tuple[OnlineSchema, dict[str, DerivedFeature]]:
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_seconds:
+            with self._lock:
+                if now - self._checked_at >= self.check_seconds:
+                    self._refresh()
+                    self._checked_at = now
+        return self._schema, self._derived
+
+    def _refresh(self):
+        schema = load_online_schema(self.repo_path)
+        registry_index = get_registry_index(self.repo_path)
+        declared = load_derived_features(self.repo_path)
+        sources = (schema, registry_index, declared)
+        if len(self._sources) == len(sources) and all(
+            new is old for new, old in zip(sources, self._sources)
+        ):
+            return
+        # A declaration replaces a stored feature only once that feature is
+        # left out of the online schema; see online_derived_features
+        self._derived = {
+            ref: feature
+            for ref, feature in declared.items()
+            if registry_index.field(ref) is None or not schema.is_online(feature.view, feature.name)
+        }
+        self._schema = schema
+        self._sources = sources
+
+
+_declarations: dict[str, OnlineDeclarations] = {}
+
+
+def online_declarations(store: FeatureStore) -> tuple[OnlineSchema, dict[str, DerivedFeature]]:
+    """(online schema, derived features computed online) of a store's repo, cached"""
+    repo_path = str(store.repo_path)
+    declarations = _declarations.get(repo_path)
+    if declarations is None:
+        declarations = _declarations.setdefault(repo_path, OnlineDeclarations(repo_path))
+    return declarations.get()
+
+
+def online_derived_features(store: FeatureStore) -> dict[str, DerivedFeature]:
+    """
+    Derived features computed at online read time instead of read from Redis
+
+    A declaration replaces a stored feature only once that feature is left
+    out of the online schema, after check_derived_features.py has verified
+    it against the stored column; until then reads return the stored value,
+    as historical reads do. Declarations with no stored feature always apply.
+    """
+    return online_declarations(store)[1]
+
+
+def _expand_online_request(store: FeatureStore, features: list[str]):
+    """Derived inputs to fetch and derived features to compute; records usage"""
+    online_schema, derived_features = online_declarations(store)
+    fetch, derived = expand_refs(features, derived_features)
+    get_tracker().record(fetch, "online")
+
+    offline_only = online_schema.offline_only(fetch)
+    if offline_only:
+        warnings.warn(
+            f"Not materialized online (see feature_views/online_schema.py): {offline_only}",
+            stacklevel=3,
+        )
+    return fetch, derived
+
+
+def get_online_features(
+    store: FeatureStore,
+    features: list[str],
+    entity_rows: list[dict],
+    full_feature_names: bool = False,
+) -> dict[str, list]:
+    """
+    Online lookup with derived features and snapshot routing
+
+    Returns the same dict as .to_dict(): join keys, then the requested
+    features in request order.
+    """
+    with online_request("get_online_features"):
+        switch_phase("ref_parsing")
+        fetch, derived = _expand_online_request(store, features)
+        routed = snapshot_index(store).route(fetch)
+
+        switch_phase("registry_lookup")
+        response = store.get_online_features(
+            features=routed,
+            entity_rows=entity_rows,
+            full_feature_names=full_feature_names,
+        ).to_dict()
+
+        switch_phase("response_building")
+        return _build_response(response, features, fetch, routed, derived, full_feature_names)
+
+
+def _build_response(response, features, fetch, routed, derived, full_feature_names):
+    """Requested names, derived features and request order for a to_dict() response"""
+    renames = _output_renames(fetch, routed, full_feature_names)
+    response = {renames.get(name, name): values for name, values in response.items()}
+    if not derived:
+        return response
+
+    def output_name(ref):
+        return ref.replace(":", "__") if full_feature_names else ref.split(":", 1)[1]
+
+    for feature in derived:
+        response[output_name(feature.ref)] = feature.compute(
+            [response[output_name(ref)] for ref in feature.input_refs]
+        )
+
+    # Drop inputs fetched only for derivation, keeping the requested order
+    feature_names = {output_name(ref) for ref in fetch} | {output_name(ref) for ref in features}
+    result = {name: values for name, values in response.items() if name not in feature_names}
+    for ref in features:
+        result[output_name(ref)] = response[output_name(ref)]
+    return result
+
+
+def _entity_keys(
+    feature_view: FeatureView, entity_df: pd.DataFrame
+) -> Union[list[EntityKeyProto], IntEntityKeys]:
+    """One entity key per entity row, for the view's join keys; an id array for one int key"""
+    if len(feature_view.entity_columns) == 1:
+        column = feature_view.entity_columns[0]
+        value_type = column.dtype.to_value_type()
+        ids = entity_df[column.name]
+        if value_type in (ValueType.INT32, ValueType.INT64) and ids.notna().all():
+            return IntEntityKeys(column.name, value_type, ids.to_numpy())
+    join_keys = [column.name for column in feature_view.entity_columns]
+    values = [
+        python_values_to_proto_values(
+            entity_df[column.name].tolist(), column.dtype.to_value_type()
+        )
+        for column in feature_view.entity_columns
+    ]
+    return [
+        EntityKeyProto(join_keys=join_keys, entity_values=list(row)) for row in zip(*values)
+    ]
+
+
+def get_online_frame(
+    store: FeatureStore,
+    features: list[str],
+    entity_rows: list[dict],
+    full_feature_names: bool = False,
+) -> pd.DataFrame:
+    """
+    Online lookup as a DataFrame: join keys, then the requested features
+
+    Columns are decoded a whole column at a time by the Instawork online
+    store, e.g. interned strings come back as Categoricals.
+    """
+    online_store = store._get_provider().online_store
+    if not isinstance(online_store, InstaworkRedisOnlineStore):
+        return pd.DataFrame(get_online_features(store, features, entity_rows, full_feature_names))
+
+    with online_request("get_online_frame"):
+        switch_phase("ref_parsing")
+        fetch, derived = _expand_online_request(store, features)
+        routed = snapshot_index(store).route(fetch)
+        requested_ref = dict(zip(routed, fetch))
+
+        def output_name(ref):
+            return ref.replace(":", "__") if full_feature_names else ref.split(":", 1)[1]
+
+        entity_df = pd.DataFrame(entity_rows)
+        frame = entity_df.copy()
+        for view_name, names in group_feature_refs(routed).items():
+            switch_phase("registry_lookup")
+            feature_view = store.get_feature_view(view_name)
+            switch_phase("entity_key_serialization")
+            view_frame = online_store.read_frame(
+                store.config, feature_view, _entity_keys(feature_view, entity_df), names
+            )
+            for name in names:
+                frame[output_name(requested_ref[f"{view_name}:{name}"])] = view_frame[name].values
+
+        for feature in derived:
+            inputs = [
+                pd.to_numeric(frame[output_name(ref)]).to_numpy(dtype=np.float64, na_value=np.nan)
+                for ref in feature.input_refs
+            ]
+            frame[output_name(feature.ref)] = feature.compute_arrays(inputs)
+
+        return frame[[*entity_df.columns, *(output_name(ref) for ref in features)]]
+
+
+def get_historical_features(
+    store: FeatureStore,
+    entity_df: pd.DataFrame,
+    features: list[str],
+    full_feature_names: bool = False,
+    data_dir: str = None,
+) -> pd.DataFrame:
+    """
+    Point-in-time join with snapshot routing; returns the joined dataframe
+
+    Pass data_dir to join against local Parquet, pruned to the ts_ds range and
+    columns the request needs (see offline.py), instead of the offline store.
+    """
+    get_tracker().record(features, "offline")
+    # Routed refs have distinct snapshot columns; check the names they map back to
+    check_feature_name_collisions(features, full_feature_names)
+    routed = snapshot_index(store).route(features)
+
+    if data_dir:
+        df = get_historical_features_local(
+            store, entity_df, routed, data_dir, full_feature_names
+        )
+    else:
+        df = store.get_historical_features(
+            entity_df=entity_df, features=routed, full_feature_names=full_feature_names
+        ).to_df()
+
+    return df.rename(columns=_output_renames(features, routed, full_feature_names))
@@ -0,0 +1,219 @@
+"""
+Inverted index for feature search
+
+Feature names follow naming conventions, and the search index is built on
+them:
+
+- type prefix:  rv_int_, rv_float_, b_, mc_str_, mc_int_, ts_, mt_, id_
+- time windows: lte_7_day, gt_30_day, last_30_days, l90d
+- the remaining words of the name
+
+Each feature `view:feature` is indexed under those tokens plus its view, entity,
+Feast dtype and view tags. Postings are sorted lists of feature ids. A query
+intersects the postings of its terms, which takes microseconds at a few thousand
+features.
+
+The index is saved next to the registry index (data/registry.db.search.json).
+get_search_index rebuilds it when it is missing or older than the registry,
+i.e. on the first query after `feast apply`; run
+`python scripts/search_features.py --build` after apply to build it up front.
+
+Query syntax: bare words match name tokens by prefix ("quiz sco"), and
+`key:value` terms filter exactly:
+    prefix:rv_float  window:lte_7_day  entity:worker  view:pro_core_features
+    dtype:Float64    tag:team=ml
+"""
+
+import bisect
+import json
+import os
+import re
+from typing import Optional
+
+from instawork_feast.registry_cache import RegistryIndex, get_registry_index
+
+SEARCH_INDEX_SUFFIX = ".search.json"
+SEARCH_INDEX_VERSION = 1
+
+FEATURE_PREFIXES = ("rv_int", "rv_float", "mc_str", "mc_int", "mt", "b", "ts", "id")
+WINDOW_PATTERN = re.compile(
+    r"(?:^|_)((?:lte|gte|lt|gt|last)_\d+_(?:hour|day|week|month|year)s?|l\d+[dwm])(?=_|$)"
+)
+FILTER_KEYS = ("prefix", "window", "entity", "view", "dtype", "tag")
+
+
+def feature_prefix(feature_name: str) -> Optional[str]:
+    """Naming-convention type prefix of a feature (e.g. 'rv_float'), if any"""
+    for prefix in FEATURE_PREFIXES:
+        if feature_name.startswith(prefix + "_"):
+            return prefix
+    return None
+
+
+def feature_windows(feature_name: str) -> list[str]:
+    """Time-window tokens in a feature name (e.g. ['lte_7_day'])"""
+    return WINDOW_PATTERN.findall(feature_name)
+
+
+def feature_terms(view_name: str, entity: str, feature_name: str, dtype: str, tags: dict) -> set[str]:
+    """Every index term for one feature"""
+    prefix = feature_prefix(feature_name)
+    windows = feature_windows(feature_name)
+
+    stem = feature_name[len(prefix) + 1 :] if prefix else feature_name
+    for window in windows:
+        stem = stem.replace(window, " ")
+    words = {w for w in re.split(r"[_\s]+", stem) if w}
+    words.update(w for w in view_name.split("_") if w)
+    if prefix:
+        words.update(prefix.split("_"))
+
+    terms = {f"word:{w}" for w in words}
+    terms.add(f"view:{view_name}")
+    terms.add(f"dtype:{dtype}")
+    if prefix:
+        terms.add(f"prefix:{prefix}")
+    if entity:
+        terms.add(f"entity:{entity}")
+    terms.update(f"window:{w}" for w in windows)
+    terms.update(f"tag:{k}={v}" for k, v in tags.items())
+    terms.update(f"tag:{k}" for k in tags)
+    return terms
+
+
+def build_search_index(index: RegistryIndex) -> dict:
+    """Build postings for every feature in a registry index"""
+    refs, dtypes, postings = [], [], {}
+    for view in index.views():
+        for field in view.schema:
+            feature_id = len(refs)
+            refs.append(f"{view.name}:{field.name}")
+            dtypes.append(field.dtype)
+            for term in feature_terms(view.name, view.entity, field.name, field.dtype, view.tags):
+                postings.setdefault(term, []).append(feature_id)
+
+    return {
+        "version": SEARCH_INDEX_VERSION,
+        "registry_mtime": index.header["registry_mtime"],
+        "refs": refs,
+        "dtypes": dtypes,
+        "postings": postings,
+    }
+
+
+def write_search_index(data: dict, path: str):
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def rebuild_search_index(index: RegistryIndex) -> dict:
+    """Build and save the search index of a registry index"""
+    data = build_search_index(index)
+    write_search_index(data, search_index_path(index))
+    return data
+
+
+class FeatureSearchIndex:
+    """Loaded search index; all queries are set intersections over postings"""
+
+    def __init__(self, data: dict):
+        self.registry_mtime = data["registry_mtime"]
+        self.refs: list[str] = data["refs"]
+        self.dtypes: list[str] = data["dtypes"]
+        self.postings: dict[str, frozenset] = {
+            term: frozenset(ids) for term, ids in data["postings"].items()
+        }
+        # Sorted word terms for prefix matching with bisect
+        self._words = sorted(t[5:] for t in self.postings if t.startswith("word:"))
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+    def values(self, key: str) -> list[str]:
+        """Distinct values of a filter key, e.g. values('window')"""
+        marker = key + ":"
+        return sorted(t[len(marker) :] for t in self.postings if t.startswith(marker))
+
+    def _word_matches(self, word: str) -> frozenset:
+        start = bisect.bisect_left(self._words, word)
+        matched = set()
+        for candidate in self._words[start:]:
+            if not candidate.startswith(word):
+                break
+            matched |= self.postings[f"word:{candidate}"]
+        return frozenset(matched)
+
+    def _term_matches(self, term: str) -> frozenset:
+        key, _, value = term.partition(":")
+        if value and key in FILTER_KEYS:
+            return self.postings.get(term, frozenset())
+        # Bare word, or an exact ref pasted in: match every part by prefix
+        result = None
+        for word in re.split(r"[_:\s]+", term.lower()):
+            if not word:
+                continue
+            matches = self._word_matches(word)
+            result = matches if result is None else result & matches
+        return result if result is not None else frozenset(range(len(self.refs)))
+
+    def search(self, query: str = "", limit: Optional[int] = None, **filters) -> list[str]:
+        """
+        Feature refs matching every term of the query, in registry order
+
+        Filters can also be passed as keywords, e.g.
+        search("sessions", prefix="rv_int", window="lte_7_day", entity="worker").
+        """
+        terms = query.split()
+        terms += [f"{key}:{value}" for key, value in filters.items() if value]
+
+        result = None
+        for term in terms:
+            matches = self._term_matches(term)
+            result = matches if result is None else result & matches
+            if not result:
+                return []
+
+        ids = sorted(result) if result is not None else range(len(self.refs))
+        refs = [self.refs[i] for i in ids]
+        return refs[:limit] if limit is not None else refs
+
+
+def search_index_path(index: RegistryIndex) -> str:
+    """Search index file kept next to the registry index"""
+    path = index.path
+    if path.endswith(".idx"):
+        path = path[: -len(".idx")]
+    return path + SEARCH_INDEX_SUFFIX
+
+
+_loaded: dict[str, FeatureSearchIndex] = {}
+
+
+def get_search_index(repo_path: str = ".", rebuild: bool = False) -> FeatureSearchIndex:
+    """
+    Search index for a repo, rebuilt when the registry index is newer
+
+    The loaded index is kept per process and reused until the registry changes.
+    """
+    index = get_registry_index(repo_path)
+    registry_mtime = index.header["registry_mtime"]
+    path = search_index_path(index)
+
+    loaded = _loaded.get(path)
+    if loaded is not None and loaded.registry_mtime == registry_mtime and not rebuild:
+        return loaded
+
+    data = None
+    if not rebuild and os.path.exists(path):
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") != SEARCH_INDEX_VERSION or data["registry_mtime"] != registry_mtime:
+            data = None
+
+    if data is None:
+        data = rebuild_search_index(index)
+
+    _loaded[path] = FeatureSearchIndex(data)
+    return _loaded[path]
@@ -0,0 +1,102 @@
+"""
+Pre-joined entity snapshot views
+
+Every feature view of an entity type is keyed by the same join key and
+refreshed on the same `ts_ds` cadence, so a request spanning many of them pays
+one as-of join (offline) or one key lookup (online) per view. A snapshot view
+pre-joins the member views of one entity type into a single wide,
+column-pruned table:
+
+- worker_snapshot   <- pro_* views
+- business_snapshot <- business_* views
+- shift_snapshot    <- shift_* views
+
+Snapshot columns are named `<member view>__<feature>`, the same shape Feast
+uses for full feature names, so they never collide and map back to the
+original refs. The member views are listed in the `snapshot_of` tag, which is
+all the router needs from the registry.
+"""
+
+SNAPSHOT_TAG = "snapshot_of"
+COLUMN_SEPARATOR = "__"
+
+
+def snapshot_view_name(entity_name: str) -> str:
+    """Feature view name of the snapshot for an entity (e.g. 'worker_snapshot')"""
+    return f"{entity_name}_snapshot"
+
+
+def snapshot_table_name(entity_name: str) -> str:
+    """Redshift table / Parquet dataset name backing a snapshot view"""
+    return f"{entity_name}_snapshot_inference"
+
+
+def snapshot_column(view_name: str, feature_name: str) -> str:
+    """Column name of a member view feature inside the snapshot"""
+    return f"{view_name}{COLUMN_SEPARATOR}{feature_name}"
+
+
+def split_snapshot_column(column: str) -> tuple[str, str]:
+    """Inverse of snapshot_column (view names never contain '__')"""
+    view_name, feature_name = column.split(COLUMN_SEPARATOR, 1)
+    return view_name, feature_name
+
+
+class SnapshotIndex:
+    """Lookup of which member view features are served by which snapshot view"""
+
+    def __init__(self, feature_views: list):
+        """feature_views: FeatureViews or registry_cache.ViewInfo records"""
+        # member view -> (snapshot view, features available in the snapshot)
+        self.members: dict[str, tuple[str, set[str]]] = {}
+
+        for fv in feature_views:
+            if SNAPSHOT_TAG not in fv.tags:
+                continue
+            available: dict[str, set[str]] = {}
+            for field in fv.schema:
+                view_name, feature_name = split_snapshot_column(field.name)
+                available.setdefault(view_name, set()).add(feature_name)
+            for view_name in fv.tags[SNAPSHOT_TAG].split(","):
+                self.members[view_name] = (fv.name, available.get(view_name, set()))
+
+    def __bool__(self) -> bool:
+        return bool(self.members)
+
+    def route(self, feature_refs: list[str]) -> list[str]:
+        """
+        Rewrite refs to read from snapshot views where that saves lookups
+
+        A member view is routed only when every feature requested from it is
+        in the snapshot, and only when at least two member views of the same
+        snapshot qualify; a single-view request is already one lookup.
+
+        Returns the refs in the original order.
+        """
+        requested: dict[str, list[str]] = {}
+        for ref in feature_refs:
+            view_name, feature_name = ref.split(":", 1)
+            requested.setdefault(view_name, []).append(feature_name)
+
+        routable: dict[str, list[str]] = {}
+        for view_name, feature_names in requested.items():
+            if view_name not in self.members:
+                continue
+            snapshot, available = self.members[view_name]
+            if all(name in available for name in feature_names):
+                routable.setdefault(snapshot, []).append(view_name)
+
+        routed_views = {
+            view_name: snapshot
+            for snapshot, view_names in routable.items()
+            if len(view_names) > 1
+            for view_name in view_names
+        }
+
+        routed_refs = []
+        for ref in feature_refs:
+            view_name, feature_name = ref.split(":", 1)
+            if view_name in routed_views:
+                ref = f"{routed_views[view_name]}:{snapshot_column(view_name, feature_name)}"
+            routed_refs.append(ref)
+        return routed_refs
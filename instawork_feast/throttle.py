@@ -0,0 +1,56 @@
+"""
+Token-bucket rate limit for online store writes
+
+A nightly materialization writes as fast as Redis accepts pipelines, which
+leaves serving reads on the same primary queued behind them. With
+write_rows_per_second set (online_store.py), online_write_batch writes each
+batch in chunks of at most write_burst_rows rows, and every chunk first takes
+a token per row from a bucket that refills at write_rows_per_second:
+
+    online_store:
+      type: instawork_feast.online_store.InstaworkRedisOnlineStore
+      write_rows_per_second: 20000
+      write_burst_rows: 2000         # default: a tenth of a second of rows
+
+A chunk larger than the tokens left borrows against the refill, so the rate
+holds over any run of batches. The bucket is per process.
+"""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """Rows per second with bursts of up to `capacity` rows"""
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self.waited_seconds = 0.0
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, n: float) -> float:
+        """Take n tokens; returns the seconds to wait before using them"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= n
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.waited_seconds += wait
+            return wait
+
+    def acquire(self, n: float):
+        wait = self.reserve(n)
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self, n: float):
+        wait = self.reserve(n)
+        if wait:
+            await asyncio.sleep(wait)
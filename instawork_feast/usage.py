@@ -0,0 +1,124 @@
+"""
+Sampled feature usage tracking
+
+Records which `view:feature` refs are read, online and offline, so that
+features no model reads can be left out of materialization (see
+online_schema.py and scripts/feature_usage_report.py).
+
+Online requests are sampled: a request is counted with probability
+sample_rate and weighted by 1 / sample_rate, so an unsampled request costs one
+random() call. Offline requests are rare and always counted. Counts are kept
+in memory and appended as one JSON line per flush to
+<usage_dir>/usage-<host>-<pid>.jsonl, so concurrent processes never share a
+file.
+
+Configuration (environment):
+    FEATURE_USAGE_SAMPLE_RATE   default 0.01; 0 disables tracking
+    FEATURE_USAGE_DIR           default data/feature_usage
+"""
+
+import atexit
+import json
+import os
+import random
+import socket
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Optional
+
+DEFAULT_SAMPLE_RATE = 0.01
+DEFAULT_USAGE_DIR = os.path.join("data", "feature_usage")
+DEFAULT_FLUSH_SECONDS = 60
+
+
+class UsageTracker:
+    """In-process, sampled counter of feature ref reads"""
+
+    def __init__(
+        self,
+        usage_dir: str = DEFAULT_USAGE_DIR,
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+        flush_seconds: float = DEFAULT_FLUSH_SECONDS,
+    ):
+        self.usage_dir = usage_dir
+        self.sample_rate = sample_rate
+        self.flush_seconds = flush_seconds
+        self._counts: dict[str, Counter] = {"online": Counter(), "offline": Counter()}
+        self._flushed_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, feature_refs: list[str], mode: str = "online"):
+        """Count a request's refs; online requests are sampled"""
+        if mode == "online":
+            if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+                return
+            weight = 1.0 / self.sample_rate
+        else:
+            weight = 1.0
+
+        with self._lock:
+            counts = self._counts[mode]
+            for ref in feature_refs:
+                counts[ref] += weight
+        if time.monotonic() - self._flushed_at >= self.flush_seconds:
+            self.flush()
+
+    def flush(self):
+        """Append pending counts to this process's usage log"""
+        with self._lock:
+            pending = {mode: dict(counts) for mode, counts in self._counts.items() if counts}
+            for counts in self._counts.values():
+                counts.clear()
+            self._flushed_at = time.monotonic()
+        if not pending:
+            return
+
+        os.makedirs(self.usage_dir, exist_ok=True)
+        path = os.path.join(self.usage_dir, f"usage-{socket.gethostname()}-{os.getpid()}.jsonl")
+        line = json.dumps(
+            {"time": datetime.now(timezone.utc).isoformat(), "counts": pending},
+            separators=(",", ":"),
+        )
+        with open(path, "a") as f:
+            f.write(line + "\n")
+
+
+def read_usage(usage_dir: str = DEFAULT_USAGE_DIR, since: Optional[datetime] = None) -> dict:
+    """
+    Estimated reads per ref from every usage log in a directory
+
+    Returns:
+        {"online": Counter, "offline": Counter}
+    """
+    totals = {"online": Counter(), "offline": Counter()}
+    if not os.path.isdir(usage_dir):
+        return totals
+
+    for name in sorted(os.listdir(usage_dir)):
+        if not name.endswith(".jsonl"):
+            continue
+        with open(os.path.join(usage_dir, name)) as f:
+            for line in f:
+                entry = json.loads(line)
+                if since is not None and datetime.fromisoformat(entry["time"]) < since:
+                    continue
+                for mode, counts in entry["counts"].items():
+                    totals.setdefault(mode, Counter()).update(counts)
+    return totals
+
+
+_tracker: Optional[UsageTracker] = None
+
+
+def get_tracker() -> UsageTracker:
+    """Process-wide tracker configured from the environment"""
+    global _tracker
+    if _tracker is None:
+        _tracker = UsageTracker(
+            usage_dir=os.environ.get("FEATURE_USAGE_DIR", DEFAULT_USAGE_DIR),
+            sample_rate=float(os.environ.get("FEATURE_USAGE_SAMPLE_RATE", DEFAULT_SAMPLE_RATE)),
+        )
+        atexit.register(_tracker.flush)
+    return _tracker
@@ -3,32 +3,34 @@ import glob
 import os
 from pathlib import Path
 
-import pandas as pd
+import pyarrow.dataset as ds
 
 
 def infer_feast_type(dtype):
-    """Convert pandas dtype to FEAST type"""
+    """Convert pandas or Arrow dtype to FEAST type"""
     dtype_str = str(dtype).lower()
 
     if "int" in dtype_str:
         return "Int64" if "64" in dtype_str else "Int32"
     elif "float" in dtype_str:
         return "Float64" if "64" in dtype_str else "Float32"
+    elif "double" in dtype_str:
+        return "Float64"
     elif "bool" in dtype_str:
         return "Int32"
     elif "object" in dtype_str or "string" in dtype_str:
         return "String"
-    elif "datetime" in dtype_str:
+    elif "datetime" in dtype_str or "timestamp" in dtype_str or "date" in dtype_str:
         return "UnixTimestamp"
     else:
         return "String"
 
 
-def detect_entity(df):
+def detect_entity(columns):
     """Automatically detect entity column"""
     # Look for columns starting with 'id_' and ending with '_id'
     entity_cols = [
-        col for col in df.columns if col.startswith("id_") and col.endswith("_id")
+        col for col in columns if col.startswith("id_") and col.endswith("_id")
     ]
 
     if not entity_cols:
@@ -55,9 +57,14 @@ def generate_view_name(filename):
 
 
 def scan_parquet_files(data_dir="data"):
-    """Scan directory for all parquet files"""
+    """Scan directory for parquet files and dataset directories of parquet files"""
     pattern = os.path.join(data_dir, "*.parquet")
     files = glob.glob(pattern)
+    files += [
+        d.rstrip(os.sep)
+        for d in glob.glob(os.path.join(data_dir, "*", ""))
+        if glob.glob(os.path.join(d, "**", "*.parquet"), recursive=True)
+    ]
 
     # Exclude registry and temp files
     files = [
@@ -68,18 +75,19 @@ def scan_parquet_files(data_dir="data"):
 
 
 def analyze_file(filepath):
-    """Analyze a parquet file and extract metadata"""
-    df = pd.read_parquet(filepath)
+    """Analyze a parquet file or dataset directory from its schema only"""
+    schema = ds.dataset(filepath, format="parquet", partitioning="hive").schema
+    dtypes = {field.name: field.type for field in schema}
     filename = os.path.basename(filepath)
 
-    entity_col, entity_name = detect_entity(df)
+    entity_col, entity_name = detect_entity(dtypes)
 
     # Get feature columns (exclude entity and timestamp columns)
     skip_cols = {"event_timestamp", "created_at"}
     if entity_col:
         skip_cols.add(entity_col)
 
-    feature_cols = [col for col in df.columns if col not in skip_cols]
+    feature_cols = [col for col in dtypes if col not in skip_cols]
 
     return {
         "filepath": filepath,
@@ -87,7 +95,7 @@ def analyze_file(filepath):
         "entity_col": entity_col,
         "entity_name": entity_name,
         "feature_cols": feature_cols,
-        "df": df,
+        "dtypes": dtypes,
         "view_name": generate_view_name(filename),
     }
 
@@ -192,7 +200,7 @@ from feast.types import Float32, Float64, Int32, Int64, String, UnixTimestamp
 
             # Fields
             for col in metadata["feature_cols"]:
-                feast_type = infer_feast_type(metadata["df"][col].dtype)
+                feast_type = infer_feast_type(metadata["dtypes"][col])
                 f.write(f'        Field(name="{col}", dtype={feast_type}),\n')
 
             f.write(f"    ],\n")
@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+"""
+Benchmark Redis entity-key serialization for large batches
+
+A ranking request reads --entities workers from --views views. This times
+building its Redis keys (v3 entity key + project) per request with:
+    per_key       serialize_entity_key per entity and view, as Feast does
+    batch         redis_keys on the view's EntityKey protos, no cache
+    batch_cached  redis_keys with a cache shared by the views of the request,
+                  as the online store does
+    ids_cached    redis_keys on an IntEntityKeys id array (get_online_frame)
+
+With --connection-string it also runs the request as one pipelined read of
+real views (data loaded by benchmark_online_serving.py under --project), once
+with per-key serialization and once with the online store's batch path, and
+reports each phase's share of the request, so the serialization can be
+compared with the Redis round trip and decoding around it.
+
+Usage: python benchmark_entity_keys.py [--entities 5000] [--views 18] [--repeat 20]
+           [--connection-string localhost:6379] [--project serving_benchmark]
+           [--output results.json]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.online_stores.redis import RedisOnlineStore
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.value_type import ValueType
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from instawork_feast.entity_keys import EntityKeyCache, IntEntityKeys, redis_keys  # noqa: E402
+
+JOIN_KEY = "id_worker_id"
+PROJECT = "instawork_feature_store"
+
+
+def entity_key_protos(ids: np.ndarray) -> list[EntityKeyProto]:
+    return [
+        EntityKeyProto(join_keys=[JOIN_KEY], entity_values=[ValueProto(int64_val=i)])
+        for i in ids.tolist()
+    ]
+
+
+def time_request(build, requests: list) -> float:
+    """Fastest seconds per request"""
+    best = float("inf")
+    for request in requests:
+        start = time.perf_counter()
+        build(request)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def serialization(entities: int, views: int, repeat: int, workers: int, seed: int) -> dict:
+    rng = np.random.default_rng(seed)
+    requests = []
+    for _ in range(repeat):
+        ids = rng.integers(1, workers + 1, entities)
+        # Feast builds new protos for every view of a request
+        requests.append((ids, [entity_key_protos(ids) for _ in range(views)]))
+    suffix = PROJECT.encode("utf-8")
+
+    def per_key(request):
+        for protos in request[1]:
+            [serialize_entity_key(ek, entity_key_serialization_version=3) + suffix for ek in protos]
+
+    def batch(request):
+        for protos in request[1]:
+            redis_keys(protos, PROJECT, cache=None)
+
+    def batch_cached(request):
+        cache = EntityKeyCache()
+        for protos in request[1]:
+            redis_keys(protos, PROJECT, cache=cache)
+
+    def ids_cached(request):
+        cache = EntityKeyCache()
+        for _ in request[1]:
+            redis_keys(IntEntityKeys(JOIN_KEY, ValueType.INT64, request[0]), PROJECT, cache=cache)
+
+    methods = {"per_key": per_key, "batch": batch, "batch_cached": batch_cached, "ids_cached": ids_cached}
+    results = {}
+    for name, build in methods.items():
+        seconds = time_request(build, requests)
+        results[name] = {
+            "ms_per_request": seconds * 1e3,
+            "us_per_key": seconds / (entities * views) * 1e6,
+            "speedup": None,
+        }
+    for result in results.values():
+        result["speedup"] = results["per_key"]["ms_per_request"] / result["ms_per_request"]
+    return results
+
+
+def phase_shares(args) -> dict:
+    """Phase times of a pipelined request with per-key and batch serialization"""
+    import feature_views
+    from benchmark_online_serving import read_pipelined, repo_config
+
+    from instawork_feast.instrumentation import online_request, switch_phase, trace_online_requests
+    from instawork_feast.online_schema import load_online_schema
+    from instawork_feast.online_store import InstaworkRedisOnlineStore
+    from instawork_feast.materialize import online_feature_view
+
+    class PerKeyStore(InstaworkRedisOnlineStore):
+        def _generate_redis_keys_for_entities(self, config, entity_keys):
+            return RedisOnlineStore._generate_redis_keys_for_entities(self, config, entity_keys)
+
+    config = repo_config(args.connection_string, args.project, [])
+    schema = load_online_schema(args.repo_path)
+    names = [name for name in feature_views.FEATURE_VIEW_MODULES if name.startswith("pro_")]
+    views = [online_feature_view(feature_views.get_feature_view(name), schema) for name in names[: args.views]]
+    rng = np.random.default_rng(args.seed)
+
+    shares = {}
+    for mode, store in (("per_key", PerKeyStore()), ("batch", InstaworkRedisOnlineStore())):
+        totals: dict[str, float] = {}
+        wall = float("inf")
+        for _ in range(args.repeat):
+            ids = rng.integers(1, args.workers + 1, args.entities)
+            request = [(view, entity_key_protos(ids), [f.name for f in view.features]) for view in views]
+            with trace_online_requests() as traces:
+                with online_request("benchmark_entity_keys"):
+                    switch_phase("entity_key_serialization")
+                    read_pipelined(store, config, request)
+            clock = traces[0]
+            elapsed = sum(span.seconds for span in clock.spans)
+            if elapsed < wall:
+                wall, totals = elapsed, clock.phase_totals()
+        shares[mode] = {
+            "ms_per_request": wall * 1e3,
+            "phases_ms": {phase: seconds * 1e3 for phase, seconds in totals.items()},
+            "serialization_share": totals.get("entity_key_serialization", 0.0) / wall,
+        }
+    return shares
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batch entity-key serialization")
+    parser.add_argument("--entities", type=int, default=5000, help="Entities per request")
+    parser.add_argument("--views", type=int, default=18, help="Views per request")
+    parser.add_argument("--repeat", type=int, default=20, help="Requests per method; the fastest is kept")
+    parser.add_argument("--workers", type=int, default=100_000, help="Worker ids to draw from")
+    parser.add_argument("--connection-string", help="Also time a pipelined read against this Redis")
+    parser.add_argument("--project", default="serving_benchmark", help="Project of the loaded data")
+    parser.add_argument("--repo-path", default=".")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"Entity Key Serialization ({args.entities:,} entities x {args.views} views)")
+    print("=" * 70)
+
+    started_at = datetime.now(timezone.utc).isoformat()
+    results = serialization(args.entities, args.views, args.repeat, args.workers, args.seed)
+    print(f"\n🔑 Keys per request")
+    for name, result in results.items():
+        print(
+            f"   {name:<14} {result['ms_per_request']:9.2f} ms/request  "
+            f"{result['us_per_key']:7.3f} µs/key  {result['speedup']:6.1f}x"
+        )
+
+    shares = None
+    if args.connection_string:
+        shares = phase_shares(args)
+        print(f"\n⏱️  Pipelined read ({args.connection_string}, project {args.project})")
+        for mode, share in shares.items():
+            phases = "  ".join(f"{phase} {ms:.1f}" for phase, ms in share["phases_ms"].items())
+            print(
+                f"   {mode:<8} {share['ms_per_request']:9.2f} ms/request, "
+                f"serialization {share['serialization_share']:.0%}  ({phases} ms)"
+            )
+
+    if args.output:
+        report = {
+            "run": {
+                "started_at": started_at,
+                "host": platform.node(),
+                "python": platform.python_version(),
+                "entities": args.entities,
+                "views": args.views,
+                "repeat": args.repeat,
+            },
+            "serialization": results,
+            "pipelined_read": shares,
+        }
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"\n✅ Results written to {args.output}")
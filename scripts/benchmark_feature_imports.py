@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""
+Benchmark import time of the lazily loaded feature_views package
+
+Each scenario runs in a fresh interpreter with Feast already imported, so the
+numbers are the cost of constructing feature definitions only:
+- single_purpose: the three views a typical service needs
+- one_entity:     every worker view
+- all_views:      every view (what importing the old grouped modules cost)
+
+Usage: python benchmark_feature_imports.py [repo_path] [--runs 5] [--output results.json]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SCENARIOS = {
+    "single_purpose": (
+        "from feature_views import pro_core_features_fv, pro_quiz_features_fv, "
+        "business_features_fv\n"
+        "views = [pro_core_features_fv, pro_quiz_features_fv, business_features_fv]"
+    ),
+    "one_entity": (
+        "import feature_views\n"
+        "views = feature_views.feature_views_for_entity('worker')"
+    ),
+    "all_views": "import feature_views\nviews = feature_views.all_feature_views()",
+}
+
+HARNESS = """
+import sys, time
+sys.path.insert(0, {repo!r})
+import feast
+t0 = time.perf_counter()
+{scenario}
+elapsed = time.perf_counter() - t0
+print(elapsed, len(views), sum(len(fv.schema) for fv in views))
+"""
+
+
+def run_scenario(repo_path: str, scenario: str, runs: int) -> dict:
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", HARNESS.format(repo=repo_path, scenario=scenario)],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=repo_path,
+        )
+        elapsed, n_views, n_fields = out.stdout.strip().splitlines()[-1].split()
+        timings.append(float(elapsed))
+
+    return {
+        "median_ms": statistics.median(timings) * 1000,
+        "min_ms": min(timings) * 1000,
+        "views": int(n_views),
+        "fields": int(n_fields),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark feature definition import time")
+    parser.add_argument("repo_path", nargs="?", default=".")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    repo_path = str(Path(args.repo_path).resolve())
+
+    print("=" * 70)
+    print("Feature Definition Import Benchmark")
+    print("=" * 70)
+
+    results = {}
+    for name, scenario in SCENARIOS.items():
+        results[name] = run_scenario(repo_path, scenario, args.runs)
+        r = results[name]
+        print(
+            f"   {name:<16} {r['median_ms']:8.1f} ms (min {r['min_ms']:.1f})"
+            f"   {r['views']:>3} views, {r['fields']:>4} fields"
+        )
+
+    speedup = results["all_views"]["median_ms"] / results["single_purpose"]["median_ms"]
+    print(f"\n✅ Single-purpose import is {speedup:.1f}x faster than loading every view")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"✅ Results written to {args.output}")
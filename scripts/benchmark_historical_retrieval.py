@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+"""
+Benchmark historical retrieval on the local offline path
+
+Runs the point-in-time join of instawork_feast.offline (local Parquet, e.g.
+from generate_synthetic_data.py) over a sweep of:
+- entity dataframe size: --sizes (10k up to 50M rows)
+- number of pro_* views joined: --view-counts
+- timestamp skew: --skews; 0 spreads entity timestamps uniformly over
+  --span-days before the latest ts_ds, larger values concentrate them on the
+  most recent days (timestamp = latest - span * u^(1 + skew))
+- ttl: --ttls in days, overriding each view's own ttl
+
+Each configuration runs in a fresh process, so the reported peak RSS is that
+configuration's own. It reports wall time of the join, peak RSS, entity rows
+per second and the fraction of rows that matched a source row, and writes
+everything as JSON so training jobs can be sized and join regressions caught.
+
+Usage: python benchmark_historical_retrieval.py [data_dir] [--sizes 10000 100000 1000000]
+           [--view-counts 1 4 18] [--skews 0 2] [--ttls 7 365] [--features-per-view 10]
+           [--workers 100000] [--span-days 30] [--repeat 1] [--output results.json]
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from itertools import product
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from instawork_feast.offline import local_dataset_path  # noqa: E402
+from instawork_feast.registry_cache import get_registry_index  # noqa: E402
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process (ru_maxrss is KB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def latest_day(data_dir: str, view: str) -> pd.Timestamp:
+    dataset = ds.dataset(local_dataset_path(data_dir, view), format="parquet", partitioning="hive")
+    return pd.Timestamp(pc.max(dataset.to_table(columns=["ts_ds"])["ts_ds"]).as_py())
+
+
+def entity_dataframe(
+    size: int, workers: int, latest: pd.Timestamp, span_days: int, skew: float, seed: int
+) -> pd.DataFrame:
+    """Random workers at timestamps up to span_days before the end of the latest day"""
+    rng = np.random.default_rng(seed)
+    end = latest + pd.Timedelta(days=1)
+    offsets = span_days * 86400 * rng.random(size) ** (1 + skew)
+    return pd.DataFrame(
+        {
+            "id_worker_id": rng.integers(1, workers + 1, size),
+            "event_timestamp": end - pd.to_timedelta(offsets.astype(np.int64), unit="s"),
+        }
+    )
+
+
+def run_config(job: dict) -> dict:
+    """One configuration, in its own process"""
+    from feast import FeatureStore
+
+    from instawork_feast.offline import get_historical_features_local
+
+    store = FeatureStore(repo_path=job["repo_path"])
+    entity_df = entity_dataframe(
+        job["size"],
+        job["workers"],
+        pd.Timestamp(job["latest"]),
+        job["span_days"],
+        job["skew"],
+        job["seed"],
+    )
+    baseline_mb = peak_rss_mb()
+
+    start = time.perf_counter()
+    result = get_historical_features_local(
+        store,
+        entity_df,
+        job["features"],
+        job["data_dir"],
+        ttl=timedelta(days=job["ttl_days"]),
+    )
+    wall = time.perf_counter() - start
+
+    first_feature = job["features"][0].split(":", 1)[1]
+    return {
+        "wall_seconds": wall,
+        "rows_per_s": len(entity_df) / max(wall, 1e-9),
+        "peak_rss_mb": peak_rss_mb(),
+        "entity_df_rss_mb": baseline_mb,
+        "matched_fraction": float(result[first_feature].notna().mean()),
+        "output_columns": result.shape[1],
+    }
+
+
+def print_result(result: dict):
+    print(
+        f"   {result['entity_rows']:>11,} rows {result['views']:>2} views skew {result['skew']:<4g} "
+        f"ttl {result['ttl_days']:>4}d  {result['wall_seconds']:8.2f}s  "
+        f"{result['rows_per_s']:>11,.0f} rows/s  peak {result['peak_rss_mb']:8,.0f} MB  "
+        f"matched {result['matched_fraction']:.0%}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark local historical retrieval")
+    parser.add_argument("data_dir", nargs="?", default="data")
+    parser.add_argument("--repo-path", default=".")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--view-counts", type=int, nargs="+", default=[1, 4, 18])
+    parser.add_argument("--skews", type=float, nargs="+", default=[0, 2])
+    parser.add_argument("--ttls", type=int, nargs="+", default=[7, 365], help="TTL in days")
+    parser.add_argument("--features-per-view", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=100_000, help="Worker ids in the data")
+    parser.add_argument("--span-days", type=int, default=30, help="Days of entity timestamps")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per configuration; the fastest is kept")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Historical Retrieval Benchmark (local offline path)")
+    print("=" * 70)
+
+    index = get_registry_index(args.repo_path)
+    views = [
+        view
+        for view in index.views()
+        if view.name.startswith("pro_") and Path(local_dataset_path(args.data_dir, view.name)).exists()
+    ]
+    if not views:
+        sys.exit(f"❌ No pro_* views with local data in {args.data_dir}")
+    latest = latest_day(args.data_dir, views[0].name)
+    print(f"\n📂 {len(views)} pro_* views with local data, latest ts_ds {latest.date()}")
+
+    started_at = datetime.now(timezone.utc).isoformat()
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for size, view_count, skew, ttl_days in product(args.sizes, args.view_counts, args.skews, args.ttls):
+        joined = views[:view_count]
+        features = [
+            f"{view.name}:{f.name}"
+            for view in joined
+            for f in [f for f in view.schema if f.name not in view.join_keys][: args.features_per_view]
+        ]
+        job = {
+            "repo_path": args.repo_path,
+            "data_dir": args.data_dir,
+            "size": size,
+            "workers": args.workers,
+            "latest": latest.isoformat(),
+            "span_days": args.span_days,
+            "skew": skew,
+            "ttl_days": ttl_days,
+            "seed": args.seed,
+            "features": features,
+        }
+        runs = []
+        for _ in range(args.repeat):
+            with context.Pool(1) as pool:
+                runs.append(pool.apply(run_config, (job,)))
+        result = {
+            "entity_rows": size,
+            "views": len(joined),
+            "features": len(features),
+            "skew": skew,
+            "ttl_days": ttl_days,
+            **min(runs, key=lambda run: run["wall_seconds"]),
+        }
+        print_result(result)
+        results.append(result)
+
+    if args.output:
+        report = {
+            "run": {
+                "started_at": started_at,
+                "host": platform.node(),
+                "python": platform.python_version(),
+                "pandas": pd.__version__,
+                "data_dir": args.data_dir,
+                "latest_ts_ds": str(latest.date()),
+                "span_days": args.span_days,
+                "repeat": args.repeat,
+            },
+            "results": results,
+        }
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"\n✅ Results written to {args.output}")
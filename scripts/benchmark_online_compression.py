@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+"""
+Benchmark zstd dictionary compression of online values per feature view
+
+For each view with local Parquet data (data/<view>.parquet or data/<view>/),
+samples rows and serializes them the way the online store writes them. It then
+compares, per entity:
+- the per-field layout of `type: redis`: one hash field per feature
+- one zstd blob per entity without a dictionary
+- one zstd blob per entity with a dictionary trained on half of the sample
+  and evaluated on the other half, for each --dict-sizes
+
+It reports the average stored bytes, the compression ratio, and the compress
+and decompress cost per entity. Use the results to decide which views to add
+to the online store's compress_views.
+
+Usage: python benchmark_online_compression.py [data_dir] [--views a b] [--rows 20000]
+           [--dict-sizes 4096 16384 65536] [--level 3] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pyarrow.dataset as ds
+import zstandard
+from feast.type_map import pa_to_feast_value_type, python_values_to_proto_values
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from instawork_feast.compression import (  # noqa: E402
+    ValueCompressor,
+    pack_values,
+    train_dictionary,
+)
+from instawork_feast.offline import local_dataset_path  # noqa: E402
+from instawork_feast.registry_cache import get_registry_index  # noqa: E402
+
+# Per hash field: 4-byte mmh3 field name plus Redis listpack entry headers
+FIELD_OVERHEAD_BYTES = 4 + 4
+
+
+def sample_rows(path: str, features: list[str], rows: int) -> list[dict[str, bytes]]:
+    """Serialized ValueProtos per feature for the last `rows` rows of a dataset"""
+    dataset = ds.dataset(path, format="parquet", partitioning="hive")
+    columns = [f for f in features if f in dataset.schema.names]
+    table = dataset.to_table(columns=columns)
+    table = table.slice(max(table.num_rows - rows, 0))
+
+    serialized = {}
+    for name in columns:
+        value_type = pa_to_feast_value_type(str(table.schema.field(name).type))
+        values = python_values_to_proto_values(table[name].to_pylist(), value_type)
+        serialized[name] = [v.SerializeToString() for v in values]
+    return [
+        {name: serialized[name][i] for name in columns} for i in range(table.num_rows)
+    ]
+
+
+def measure(compressor: ValueCompressor, payloads: list[bytes]) -> dict:
+    start = time.perf_counter()
+    blobs = [compressor.compress(p) for p in payloads]
+    compress_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for blob in blobs:
+        compressor.decompress(blob)
+    decompress_seconds = time.perf_counter() - start
+
+    return {
+        "bytes_per_entity": sum(len(b) for b in blobs) / len(blobs),
+        "compress_us": compress_seconds / len(blobs) * 1e6,
+        "decompress_us": decompress_seconds / len(blobs) * 1e6,
+    }
+
+
+def benchmark_view(view, data_dir: str, rows: int, dict_sizes: list[int], level: int):
+    path = local_dataset_path(data_dir, view.name)
+    if not os.path.exists(path):
+        return None
+
+    sample = sample_rows(path, [f.name for f in view.schema], rows)
+    if len(sample) < 16:
+        return None
+    train, test = sample[: len(sample) // 2], sample[len(sample) // 2 :]
+    train_payloads = [pack_values(values) for values in train]
+    test_payloads = [pack_values(values) for values in test]
+
+    per_field = sum(
+        sum(len(v) + FIELD_OVERHEAD_BYTES for v in values.values()) for values in test
+    ) / len(test)
+    result = {
+        "view": view.name,
+        "features": len(test[0]),
+        "rows": len(sample),
+        "per_field_bytes_per_entity": per_field,
+        "no_dictionary": measure(ValueCompressor(0, None, level), test_payloads),
+        "dictionaries": [],
+    }
+    result["no_dictionary"]["ratio"] = per_field / result["no_dictionary"]["bytes_per_entity"]
+
+    for dict_size in dict_sizes:
+        start = time.perf_counter()
+        dictionary = train_dictionary(train_payloads, dict_size)
+        train_seconds = time.perf_counter() - start
+        if dictionary is None:
+            continue
+        stats = measure(ValueCompressor(1, dictionary, level), test_payloads)
+        stats.update(
+            dict_size=dict_size,
+            train_seconds=train_seconds,
+            ratio=per_field / stats["bytes_per_entity"],
+        )
+        result["dictionaries"].append(stats)
+    return result
+
+
+def print_result(result: dict):
+    print(f"\n📦 {result['view']}: {result['features']} features, {result['rows']:,} rows")
+    print(f"   per-field layout:   {result['per_field_bytes_per_entity']:8.1f} B/entity")
+    rows = [("zstd, no dict", result["no_dictionary"])]
+    rows += [(f"zstd, {d['dict_size'] // 1024} KB dict", d) for d in result["dictionaries"]]
+    for label, stats in rows:
+        print(
+            f"   {label:<18} {stats['bytes_per_entity']:8.1f} B/entity  "
+            f"{stats['ratio']:5.2f}x  compress {stats['compress_us']:6.1f} µs  "
+            f"decompress {stats['decompress_us']:6.1f} µs"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark zstd dictionary compression")
+    parser.add_argument("data_dir", nargs="?", default="data")
+    parser.add_argument("--repo-path", default=".")
+    parser.add_argument("--views", nargs="+", help="Only these feature views")
+    parser.add_argument("--rows", type=int, default=20000, help="Rows sampled per view")
+    parser.add_argument("--dict-sizes", type=int, nargs="+", default=[4096, 16384, 65536])
+    parser.add_argument("--level", type=int, default=3, help="zstd compression level")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"Online Value Compression Benchmark (zstd {zstandard.ZSTD_VERSION})")
+    print("=" * 70)
+
+    results = []
+    for view in get_registry_index(args.repo_path).views():
+        if args.views and view.name not in args.views:
+            continue
+        result = benchmark_view(view, args.data_dir, args.rows, args.dict_sizes, args.level)
+        if result is None:
+            print(f"\n⚠️  {view.name}: no local data")
+            continue
+        print_result(result)
+        results.append(result)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"\n✅ Results written to {args.output}")
@@ -0,0 +1,356 @@
+#!/usr/bin/env python
+"""
+Benchmark online serving latency against a local Redis
+
+Loads the latest ts_ds of each view's local Parquet data (e.g. from
+generate_synthetic_data.py) into Redis through the Instawork online store,
+exactly as materialization writes it (online schema, encodings, compression),
+then replays requests over a matrix of:
+- scenario: one view, all 18 pro_* views, and the example_usage.py requests
+- features per view: --feature-counts (e.g. 5, 25, all)
+- batch size: entities per request
+- read path:
+    sync       online_read per view, one Redis round trip per view
+    pipelined  every view's HMGETs in one pipeline, as get_online_features does
+    frame      read_frame per view, the columnar get_online_frame path
+
+For each cell it reports p50/p99/mean latency and request and entity-row
+throughput of a single client, and writes everything as JSON so runs can be
+compared across changes.
+
+--read-replicas spreads the reads over replicas of --connection-string, and
+--write-rows-per-second paces the load, as the online store options of the
+same names do.
+
+Usage: python benchmark_online_serving.py [data_dir] [--connection-string localhost:6379]
+           [--entities 100000] [--batch-sizes 1 10 100 1000] [--feature-counts 5 25 all]
+           [--scenarios single all_pro example_worker] [--modes sync pipelined frame]
+           [--requests 200] [--compress-views a b] [--skip-load] [--output results.json]
+           [--read-replicas localhost:6380 localhost:6381] [--write-rows-per-second 20000]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from feast import Entity, RepoConfig
+from feast.infra.online_stores.redis import _versioned_fv_name
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.type_map import python_values_to_proto_values
+from feast.utils import _convert_arrow_to_proto
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import entities  # noqa: E402
+import feature_views  # noqa: E402
+from instawork_feast.materialize import online_feature_view  # noqa: E402
+from instawork_feast.offline import local_dataset_path  # noqa: E402
+from instawork_feast.online_schema import load_online_schema  # noqa: E402
+from instawork_feast.online_store import STORE_TYPE, InstaworkRedisOnlineStore  # noqa: E402
+from instawork_feast.replicas import wait_for_replication  # noqa: E402
+
+SINGLE_VIEW = "pro_core_features"
+WRITE_BATCH_ROWS = 10_000
+
+# The requests in example_usage.py
+EXAMPLE_SCENARIOS = {
+    "example_worker": [
+        "pro_core_features:b_is_email_verified",
+        "pro_core_features:mc_str_worker_level",
+        "pro_core_features:rv_int_account_age_days",
+        "pro_core_features:b_active_last_7_days",
+        "pro_quiz_features:rv_int_num_quiz_passed",
+        "pro_quiz_features:rv_float_avg_quiz_score",
+    ],
+    "example_business": [
+        "business_features:rv_float_fill_rate",
+        "business_features:rv_int_total_shifts",
+        "business_features:mc_str_partner_status",
+        "business_no_show_features:rv_float_auto_no_show_rate",
+    ],
+    "example_batch": [
+        "pro_core_features:mc_str_worker_level",
+        "pro_core_features:rv_int_account_age_days",
+        "pro_shift_outcome_features:rv_int_n_filled_shifts",
+    ],
+}
+SCENARIOS = ["single", "all_pro", *EXAMPLE_SCENARIOS]
+MODES = ["sync", "pipelined", "frame"]
+
+
+def repo_config(
+    connection_string: str, project: str, compress_views: list[str], **online_store_options
+) -> RepoConfig:
+    return RepoConfig(
+        project=project,
+        provider="local",
+        registry=str(Path(__file__).resolve().parent.parent / "data" / "registry.db"),
+        online_store={
+            "type": STORE_TYPE,
+            "connection_string": connection_string,
+            "compress_views": compress_views,
+            **online_store_options,
+        },
+        entity_key_serialization_version=3,
+    )
+
+
+def view_entity(feature_view) -> Entity:
+    by_name = {e.name: e for e in vars(entities).values() if isinstance(e, Entity)}
+    return by_name[feature_view.entities[0]]
+
+
+def entity_keys(entity: Entity, ids) -> list[EntityKeyProto]:
+    join_key = entity.join_key
+    values = python_values_to_proto_values(list(ids), entity.value_type)
+    return [EntityKeyProto(join_keys=[join_key], entity_values=[v]) for v in values]
+
+
+# ============================================================================
+# LOAD
+# ============================================================================
+
+
+def load_view(store, config, feature_view, data_dir: str, max_entities: int) -> dict:
+    """Write the latest day of a view's local data; returns load stats and its entity ids"""
+    entity = view_entity(feature_view)
+    timestamp_field = feature_view.batch_source.timestamp_field
+    dataset = ds.dataset(local_dataset_path(data_dir, feature_view.name), format="parquet", partitioning="hive")
+    latest = pc.max(dataset.to_table(columns=[timestamp_field])[timestamp_field])
+    columns = [entity.join_key, timestamp_field, *(f.name for f in feature_view.features)]
+    table = dataset.to_table(columns=columns, filter=ds.field(timestamp_field) == latest)
+    table = table.slice(0, max_entities)
+
+    start = time.perf_counter()
+    for offset in range(0, table.num_rows, WRITE_BATCH_ROWS):
+        batch = table.slice(offset, WRITE_BATCH_ROWS).combine_chunks()
+        rows = _convert_arrow_to_proto(batch, feature_view, {entity.join_key: entity.value_type})
+        store.online_write_batch(config, feature_view, rows, None)
+    seconds = time.perf_counter() - start
+
+    return {
+        "view": feature_view.name,
+        "rows": table.num_rows,
+        "features": len(feature_view.features),
+        "seconds": seconds,
+        "rows_per_s": table.num_rows / max(seconds, 1e-9),
+        "ids": table[entity.join_key].to_numpy(),
+    }
+
+
+# ============================================================================
+# READ PATHS
+# ============================================================================
+
+
+def read_sync(store, config, request):
+    return [store.online_read(config, fv, keys, features) for fv, keys, features in request]
+
+
+def read_pipelined(store, config, request):
+    """One pipeline for every view, as RedisOnlineStore._read_features_per_fv"""
+    store._bind(config)
+    commands, plans = [], []
+    for fv, keys, features in request:
+        fv_name = _versioned_fv_name(fv, config)
+        names, hset_keys = store._generate_hset_keys_for_features(
+            fv, list(features), fv_name_override=fv_name
+        )
+        redis_keys = store._generate_redis_keys_for_entities(config, keys)
+        commands.extend((key, hset_keys) for key in redis_keys)
+        plans.append((fv_name, names, len(redis_keys)))
+
+    values = store._read_hash_fields(config, commands)
+    results, offset = [], 0
+    for fv_name, names, n in plans:
+        results.append(
+            store._convert_redis_values_to_protobuf(values[offset : offset + n], fv_name, names)
+        )
+        offset += n
+    return results
+
+
+def read_frame(store, config, request):
+    return [store.read_frame(config, fv, keys, features) for fv, keys, features in request]
+
+
+READERS = {"sync": read_sync, "pipelined": read_pipelined, "frame": read_frame}
+
+
+# ============================================================================
+# MATRIX
+# ============================================================================
+
+
+def scenario_features(scenario: str, views: dict, feature_count) -> dict[str, list[str]]:
+    """{view: features} one request of a scenario reads"""
+    if scenario in EXAMPLE_SCENARIOS:
+        requested = {}
+        for ref in EXAMPLE_SCENARIOS[scenario]:
+            view_name, feature = ref.split(":", 1)
+            if view_name in views and feature in {f.name for f in views[view_name].features}:
+                requested.setdefault(view_name, []).append(feature)
+        return requested
+
+    names = [SINGLE_VIEW] if scenario == "single" else [v for v in views if v.startswith("pro_")]
+    return {
+        name: [f.name for f in views[name].features][: None if feature_count == "all" else int(feature_count)]
+        for name in names
+        if name in views
+    }
+
+
+def run_cell(store, config, mode, views, ids, features, batch_size, requests, rng) -> dict:
+    entity_by_view = {name: view_entity(views[name]) for name in features}
+
+    def make_request():
+        request = []
+        for name, names in features.items():
+            sample = rng.choice(ids[name], batch_size)
+            request.append((views[name], entity_keys(entity_by_view[name], sample.tolist()), names))
+        return request
+
+    reader = READERS[mode]
+    for _ in range(min(5, requests)):
+        reader(store, config, make_request())
+
+    latencies = np.empty(requests)
+    for i in range(requests):
+        request = make_request()
+        start = time.perf_counter()
+        reader(store, config, request)
+        latencies[i] = time.perf_counter() - start
+
+    total = latencies.sum()
+    return {
+        "p50_ms": float(np.percentile(latencies, 50) * 1e3),
+        "p99_ms": float(np.percentile(latencies, 99) * 1e3),
+        "mean_ms": float(latencies.mean() * 1e3),
+        "requests_per_s": requests / total,
+        "entity_rows_per_s": requests * batch_size / total,
+    }
+
+
+def print_cell(cell: dict):
+    print(
+        f"   {cell['scenario']:<17} {cell['views']:>2} views {cell['features_per_view']:>4} feat "
+        f"batch {cell['batch_size']:>5}  {cell['mode']:<9} p50 {cell['p50_ms']:8.2f} ms  "
+        f"p99 {cell['p99_ms']:8.2f} ms  {cell['entity_rows_per_s']:>10,.0f} rows/s"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark online serving against a local Redis")
+    parser.add_argument("data_dir", nargs="?", default="data")
+    parser.add_argument("--connection-string", default="localhost:6379")
+    parser.add_argument("--project", default="serving_benchmark", help="Key prefix for benchmark data")
+    parser.add_argument("--repo-path", default=".")
+    parser.add_argument("--entities", type=int, default=100_000, help="Entities loaded per view")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--feature-counts", nargs="+", default=["5", "25", "all"])
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+    parser.add_argument("--requests", type=int, default=200, help="Timed requests per cell")
+    parser.add_argument("--compress-views", nargs="+", default=[])
+    parser.add_argument("--skip-load", action="store_true", help="Reuse data from a previous run")
+    parser.add_argument("--read-replicas", nargs="+", default=[], help="Replicas that serve the reads")
+    parser.add_argument("--write-rows-per-second", type=float, help="Throttle the load")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"Online Serving Benchmark ({args.connection_string})")
+    print("=" * 70)
+
+    started_at = datetime.now(timezone.utc).isoformat()
+    config = repo_config(
+        args.connection_string,
+        args.project,
+        args.compress_views,
+        read_replicas=args.read_replicas,
+        write_rows_per_second=args.write_rows_per_second,
+    )
+    store = InstaworkRedisOnlineStore()
+    schema = load_online_schema(args.repo_path)
+
+    needed = {SINGLE_VIEW} if "single" in args.scenarios else set()
+    if "all_pro" in args.scenarios:
+        needed |= {name for name in feature_views.FEATURE_VIEW_MODULES if name.startswith("pro_")}
+    for scenario in set(args.scenarios) & set(EXAMPLE_SCENARIOS):
+        needed |= {ref.split(":", 1)[0] for ref in EXAMPLE_SCENARIOS[scenario]}
+    views = {
+        name: online_feature_view(feature_views.get_feature_view(name), schema)
+        for name in sorted(needed)
+    }
+
+    print(f"\n📥 {'Reading' if args.skip_load else 'Loading'} {len(views)} views")
+    loads, ids = [], {}
+    for name, view in list(views.items()):
+        if not Path(local_dataset_path(args.data_dir, name)).exists():
+            print(f"   ⚠️  {name}: no local data, skipped")
+            del views[name]
+            continue
+        if args.skip_load:
+            ids[name] = np.arange(1, args.entities + 1)
+            continue
+        stats = load_view(store, config, view, args.data_dir, args.entities)
+        ids[name] = stats.pop("ids")
+        loads.append(stats)
+        print(f"   ✓ {name}: {stats['rows']:,} rows in {stats['seconds']:.1f}s ({stats['rows_per_s']:,.0f} rows/s)")
+
+    client = store._get_client(config.online_store)
+    if args.read_replicas and not wait_for_replication(client, 60):
+        print("   ⚠️  replicas still behind after 60s")
+    redis_memory = client.info("memory").get("used_memory")
+    rng = np.random.default_rng(args.seed)
+    results = []
+    print(f"\n⏱️  {args.requests} requests per cell")
+    for scenario in args.scenarios:
+        counts = ["all"] if scenario in EXAMPLE_SCENARIOS else args.feature_counts
+        for feature_count in counts:
+            features = scenario_features(scenario, views, feature_count)
+            if not features:
+                continue
+            for batch_size in args.batch_sizes:
+                for mode in args.modes:
+                    cell = {
+                        "scenario": scenario,
+                        "views": len(features),
+                        "features_per_view": feature_count,
+                        "features": sum(len(names) for names in features.values()),
+                        "batch_size": batch_size,
+                        "mode": mode,
+                    }
+                    cell.update(
+                        run_cell(store, config, mode, views, ids, features, batch_size, args.requests, rng)
+                    )
+                    print_cell(cell)
+                    results.append(cell)
+
+    if args.output:
+        report = {
+            "run": {
+                "started_at": started_at,
+                "host": platform.node(),
+                "python": platform.python_version(),
+                "connection_string": args.connection_string,
+                "entities": args.entities,
+                "requests_per_cell": args.requests,
+                "compress_views": args.compress_views,
+                "read_replicas": args.read_replicas,
+                "write_rows_per_second": args.write_rows_per_second,
+                "redis_used_memory_bytes": redis_memory,
+            },
+            "load": loads,
+            "results": results,
+        }
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"\n✅ Results written to {args.output}")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+"""
+Benchmark FeatureStore registry startup vs the memory-mapped registry index
+
+Measures, for the registry in a feature repo:
+- cold start: a fresh interpreter that opens the registry and lists every view
+  (FeatureStore + list_feature_views vs get_registry_index + views)
+- per-request lookups: resolving a view and a feature ref in a warm process
+
+Pass --scale N to also benchmark a synthetic registry with N copies of every
+feature view, to see how both paths grow past the current 959 features.
+
+Usage: python benchmark_registry_startup.py [repo_path] [--scale 10] [--runs 5] [--output results.json]
+"""
+
+import argparse
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from instawork_feast.registry_cache import (  # noqa: E402
+    compile_registry_index,
+    get_registry_index,
+    registry_path_for_repo,
+)
+
+PACKAGE_ROOT = str(Path(__file__).resolve().parent.parent)
+
+FEAST_COLD_START = """
+import time
+t0 = time.perf_counter()
+from feast import FeatureStore
+store = FeatureStore(repo_path={repo!r})
+views = store.list_feature_views()
+n = sum(len(fv.schema) for fv in views)
+print(time.perf_counter() - t0)
+"""
+
+INDEX_COLD_START = """
+import sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, {root!r})
+from instawork_feast.registry_cache import get_registry_index
+views = get_registry_index({repo!r}).views()
+n = sum(len(v.schema) for v in views)
+print(time.perf_counter() - t0)
+"""
+
+
+def time_subprocess(code: str, runs: int) -> list:
+    """Run a snippet in fresh interpreters; each prints its own elapsed seconds"""
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        timings.append(float(out.stdout.strip().splitlines()[-1]))
+    return timings
+
+
+def time_calls(fn, n: int) -> float:
+    """Mean microseconds per call"""
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def make_scaled_repo(repo_path: str, scale: int) -> str:
+    """Copy a repo's registry with `scale` copies of every feature view"""
+    from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
+
+    registry_path, _ = registry_path_for_repo(repo_path)
+    registry = RegistryProto()
+    registry.ParseFromString(Path(registry_path).read_bytes())
+
+    originals = list(registry.feature_views)
+    for copy_idx in range(1, scale):
+        for fv in originals:
+            clone = registry.feature_views.add()
+            clone.CopyFrom(fv)
+            clone.spec.name = f"{fv.spec.name}_copy{copy_idx}"
+
+    scaled_repo = Path(tempfile.mkdtemp(prefix="registry_bench_"))
+    shutil.copy(Path(repo_path) / "feature_store.yaml", scaled_repo / "feature_store.yaml")
+    scaled_registry = scaled_repo / Path(registry_path).relative_to(Path(repo_path))
+    scaled_registry.parent.mkdir(parents=True, exist_ok=True)
+    scaled_registry.write_bytes(registry.SerializeToString())
+    return str(scaled_repo)
+
+
+def benchmark_repo(repo_path: str, runs: int, lookups: int = 10000) -> dict:
+    from feast import FeatureStore
+
+    registry_path, _ = registry_path_for_repo(repo_path)
+    compile_start = time.perf_counter()
+    compile_registry_index(registry_path, registry_path + ".idx")
+    compile_seconds = time.perf_counter() - compile_start
+
+    feast_cold = time_subprocess(FEAST_COLD_START.format(repo=repo_path), runs)
+    index_cold = time_subprocess(
+        INDEX_COLD_START.format(repo=repo_path, root=PACKAGE_ROOT), runs
+    )
+
+    store = FeatureStore(repo_path=repo_path)
+    index = get_registry_index(repo_path)
+    view = index.views()[0]
+    ref = f"{view.name}:{view.schema[0].name}"
+    store.list_feature_views(allow_cache=True)
+
+    return {
+        "repo_path": repo_path,
+        "feature_views": len(index),
+        "features": index.n_features,
+        "index_bytes": Path(registry_path + ".idx").stat().st_size,
+        "registry_bytes": Path(registry_path).stat().st_size,
+        "index_compile_seconds": compile_seconds,
+        "cold_start_seconds": {
+            "feast_median": statistics.median(feast_cold),
+            "index_median": statistics.median(index_cold),
+        },
+        "lookup_us": {
+            "feast_get_feature_view": time_calls(
+                lambda: store.get_feature_view(view.name, allow_registry_cache=True),
+                max(lookups // 100, 10),
+            ),
+            "feast_list_feature_views": time_calls(
+                lambda: store.list_feature_views(allow_cache=True), 10
+            ),
+            "index_view": time_calls(lambda: index.view(view.name), lookups),
+            "index_field": time_calls(lambda: index.field(ref), lookups),
+        },
+    }
+
+
+def print_result(result: dict):
+    cold = result["cold_start_seconds"]
+    lookup = result["lookup_us"]
+    print(f"\n📦 {result['feature_views']} views, {result['features']} features")
+    print(f"   Registry: {result['registry_bytes'] / 1024:.1f} KB, index: {result['index_bytes'] / 1024:.1f} KB")
+    print(f"   Index compile: {result['index_compile_seconds'] * 1000:.1f} ms")
+    print(f"   Cold start (median)   feast: {cold['feast_median'] * 1000:8.1f} ms   index: {cold['index_median'] * 1000:8.1f} ms")
+    print(f"   get_feature_view:     {lookup['feast_get_feature_view']:10.1f} µs   index.view:  {lookup['index_view']:6.2f} µs")
+    print(f"   list_feature_views:   {lookup['feast_list_feature_views']:10.1f} µs   index.field: {lookup['index_field']:6.2f} µs")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark registry startup and lookups")
+    parser.add_argument("repo_path", nargs="?", default=".")
+    parser.add_argument("--scale", type=int, default=0, help="Also benchmark N× the views")
+    parser.add_argument("--runs", type=int, default=5, help="Cold-start runs per path")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Registry Startup Benchmark")
+    print("=" * 70)
+
+    results = [benchmark_repo(args.repo_path, args.runs)]
+    print_result(results[0])
+
+    if args.scale > 1:
+        scaled_repo = make_scaled_repo(args.repo_path, args.scale)
+        try:
+            results.append(benchmark_repo(scaled_repo, args.runs))
+            print_result(results[-1])
+        finally:
+            shutil.rmtree(scaled_repo)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"\n✅ Results written to {args.output}")
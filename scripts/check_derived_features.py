@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""
+Check derived feature declarations against the stored columns they replace
+
+For every feature in feature_views/derived_features.py, reads the inputs and
+the stored column from local Parquet (data/<view>.parquet or data/<view>/),
+recomputes the feature, and reports how many rows agree. Run it before you
+drop a stored column from materialization.
+
+Usage: python check_derived_features.py [data_dir] [--repo-path .] [--rtol 1e-6]
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pyarrow.dataset as ds
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from instawork_feast.derived import load_derived_features  # noqa: E402
+from instawork_feast.offline import local_dataset_path  # noqa: E402
+
+
+def check_feature(feature, data_dir, rtol):
+    """(rows, mismatching rows) for one derived feature, or None without data"""
+    path = local_dataset_path(data_dir, feature.view)
+    if not os.path.exists(path):
+        return None
+
+    table = ds.dataset(path, format="parquet", partitioning="hive").to_table(
+        columns=[*feature.inputs, feature.name]
+    )
+    arrays = [
+        table[name].to_numpy(zero_copy_only=False).astype(np.float64) for name in feature.inputs
+    ]
+    derived = feature.compute_arrays(arrays)
+    stored = table[feature.name].to_numpy(zero_copy_only=False).astype(np.float64)
+
+    agree = np.isclose(derived, stored, rtol=rtol, equal_nan=True)
+    return len(stored), int((~agree).sum())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check derived features against stored columns")
+    parser.add_argument("data_dir", nargs="?", default="data")
+    parser.add_argument("--repo-path", default=".")
+    parser.add_argument("--rtol", type=float, default=1e-6)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Derived Feature Check")
+    print("=" * 70)
+
+    failures = 0
+    for ref, feature in sorted(load_derived_features(args.repo_path).items()):
+        result = check_feature(feature, args.data_dir, args.rtol)
+        if result is None:
+            print(f"   ⚠️  {ref}: no local data")
+            continue
+        rows, mismatches = result
+        if mismatches:
+            failures += 1
+            print(f"   ❌ {ref}: {mismatches:,} of {rows:,} rows differ")
+        else:
+            print(f"   ✓ {ref}: all {rows:,} rows match")
+
+    if failures:
+        print(f"\n❌ {failures} derived features do not reproduce the stored values")
+        sys.exit(1)
+    print("\n✅ All checked derived features match")
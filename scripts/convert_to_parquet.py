@@ -1,7 +1,228 @@
+import argparse
+import codecs
+import csv
 import os
-import sys
+import re
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+# Bytes read up front to sniff encoding and delimiter
+SNIFF_BYTES = 1024 * 1024
+# Bytes of CSV parsed per block; each block becomes one Parquet row group, so
+# memory stays around a few blocks no matter how large the file is
+BLOCK_SIZE = 64 * 1024 * 1024
+
+ENCODINGS = ["utf-8", "cp1252", "latin-1"]
+DELIMITERS = ",\t;|"
+# Encoding to restart with when a stream turns out not to be in the sniffed one
+FALLBACK_ENCODINGS = {"utf-8": "cp1252", "utf-8-sig": "cp1252", "cp1252": "latin-1"}
+
+_CONVERSION_ERROR = re.compile(r"In CSV column #(\d+):.*?CSV conversion error to (\w+)")
+_INVALID_UTF8 = "invalid UTF8"
+
+
+class EncodingMismatch(Exception):
+    """The file is not valid in the encoding it is being read with"""
+
+
+def sniff_csv(csv_file, sample_bytes=SNIFF_BYTES):
+    """
+    Detect encoding and delimiter from the start of a file
+
+    The encoding is a guess from the sample; stream_csv_to_parquet restarts
+    with the next of ENCODINGS if a later block does not decode.
+
+    Returns:
+        (encoding, delimiter)
+    """
+    with open(csv_file, "rb") as f:
+        sample = f.read(sample_bytes)
+
+    if sample.startswith(codecs.BOM_UTF8):
+        encoding = "utf-8-sig"
+    elif sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        encoding = "utf-16"
+    else:
+        # latin-1 decodes any byte sequence, so one candidate always matches
+        encoding = ENCODINGS[-1]
+        # Cut at the last newline so a multi-byte character is never split
+        cut = sample.rfind(b"\n")
+        head = sample[: cut + 1] if cut > 0 else sample
+        for candidate in ENCODINGS[:-1]:
+            try:
+                head.decode(candidate)
+                encoding = candidate
+                break
+            except UnicodeDecodeError:
+                continue
+
+    text = sample.decode(encoding, errors="ignore")
+    lines = text.splitlines()[:50]
+    try:
+        delimiter = csv.Sniffer().sniff("\n".join(lines), delimiters=DELIMITERS).delimiter
+    except csv.Error:
+        delimiter = ","
+    return encoding, delimiter
+
+
+class SkippedRows:
+    """invalid_row_handler that skips malformed rows and counts them"""
+
+    def __init__(self):
+        self.count = 0
+        self.first = None
+
+    def __call__(self, row):
+        self.count += 1
+        if self.first is None:
+            self.first = row
+        return "skip"
+
+    def report(self):
+        if self.count:
+            row = self.first
+            print(
+                f"   ⚠️  Skipped {self.count:,} malformed rows (first: row {row.number}, "
+                f"{row.actual_columns} of {row.expected_columns} columns: {row.text[:80]!r})"
+            )
+
+
+def open_csv_stream(
+    csv_file, encoding, delimiter, column_types=None, block_size=BLOCK_SIZE, skipped=None
+):
+    """Streaming, multithreaded Arrow CSV reader that skips (and counts) malformed rows"""
+    return pacsv.open_csv(
+        csv_file,
+        read_options=pacsv.ReadOptions(
+            encoding=encoding, block_size=block_size, use_threads=True
+        ),
+        parse_options=pacsv.ParseOptions(
+            delimiter=delimiter,
+            newlines_in_values=True,
+            invalid_row_handler=skipped if skipped is not None else SkippedRows(),
+        ),
+        convert_options=pacsv.ConvertOptions(column_types=column_types or {}),
+    )
+
+
+def _widen(arrow_type):
+    """Type to retry with when a later block does not fit the inferred one"""
+    if pa.types.is_integer(arrow_type) or pa.types.is_null(arrow_type):
+        return pa.float64()
+    return pa.string()
+
+
+def stream_csv_to_parquet(
+    csv_file,
+    output_file,
+    encoding,
+    delimiter,
+    block_size=BLOCK_SIZE,
+    column_types=None,
+    type_hints=None,
+):
+    """
+    Stream a CSV into a Parquet file one row group per block
+
+    Columns start from column_types, then type_hints, then the type inferred
+    from the first block. If a later block holds a value that does not fit
+    (e.g. a decimal in an int column), that column is read wider and the file
+    re-streamed. Columns that are empty in the first block are read as
+    strings. column_types are still what gets written: a widened column is
+    cast back, so "3.0" lands in an int column but "3.5" raises.
+
+    If any block does not decode as `encoding` (a column inferred as binary,
+    or invalid UTF-8 past the sniffed sample), the file is re-streamed with
+    the next of ENCODINGS; latin-1 decodes anything. Malformed rows are
+    skipped and counted. The file is written under a temporary name and
+    renamed when complete, so a failure never leaves a partial output_file.
+
+    Returns:
+        (rows, columns)
+    """
+    declared = dict(column_types or {})
+    column_types = {**(type_hints or {}), **declared}
+    tmp_file = f"{output_file}.tmp.{os.getpid()}"
+
+    while True:
+        rows = 0
+        skipped = SkippedRows()
+        try:
+            with open(csv_file, encoding=encoding, newline="") as f:
+                header = next(csv.reader(f, delimiter=delimiter))
+            reader = open_csv_stream(
+                csv_file, encoding, delimiter, column_types, block_size, skipped
+            )
+            # Arrow infers binary for a column whose values are not valid UTF-8
+            binary = [
+                f.name
+                for f in reader.schema
+                if pa.types.is_binary(f.type) and f.name not in column_types
+            ]
+            if binary:
+                raise EncodingMismatch(f"column '{binary[0]}' is not valid {encoding}")
+            schema = pa.schema(
+                [
+                    pa.field(
+                        f.name,
+                        declared.get(f.name, pa.string() if pa.types.is_null(f.type) else f.type),
+                    )
+                    for f in reader.schema
+                ]
+            )
+            with pq.ParquetWriter(tmp_file, schema, compression="snappy") as writer:
+                for batch in reader:
+                    writer.write_table(pa.Table.from_batches([batch]).cast(schema))
+                    rows += batch.num_rows
+            os.replace(tmp_file, output_file)
+            skipped.report()
+            return rows, len(schema)
+        except (EncodingMismatch, UnicodeDecodeError) as e:
+            encoding = _next_encoding(encoding, e, tmp_file)
+        except pa.ArrowInvalid as e:
+            if _INVALID_UTF8 in str(e):
+                encoding = _next_encoding(encoding, e, tmp_file)
+                continue
+            match = _CONVERSION_ERROR.search(str(e))
+            if not match:
+                _remove(tmp_file)
+                raise
+            name = header[int(match.group(1))]
+            if column_types.get(name) == pa.string():
+                _remove(tmp_file)
+                raise
+            if name in declared and pa.types.is_integer(declared[name]):
+                # Exports write nullable ints as "3.0": read every declared int
+                # column as double in one retry instead of one pass per column
+                widen = [c for c, t in declared.items() if pa.types.is_integer(t)]
+            else:
+                widen = [name]
+            for column in widen:
+                column_types[column] = _widen(column_types.get(column, pa.null()))
+            print(f"   ℹ️  Column '{name}' does not fit {match.group(2)}, retrying as {column_types[name]}")
+        except BaseException:
+            _remove(tmp_file)
+            raise
+
+
+def _remove(path):
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def _next_encoding(encoding, error, tmp_file):
+    """Encoding to re-stream with after `encoding` failed to decode; raises if none is left"""
+    _remove(tmp_file)
+    fallback = FALLBACK_ENCODINGS.get(encoding)
+    if fallback is None:
+        raise error
+    print(f"   ℹ️  Not valid {encoding} ({error}), retrying as {fallback}")
+    return fallback
 
 
 def csv_to_parquet(csv_file, output_file=None):
@@ -24,84 +245,17 @@ def csv_to_parquet(csv_file, output_file=None):
     try:
         print(f"📖 Reading CSV: {csv_file}")
 
-        # Try different encodings in order of likelihood
-        encodings = ["utf-8", "latin-1", "cp1252", "iso-8859-1", "utf-16"]
-        df = None
-
-        # Check pandas version for compatibility
-        pandas_version = pd.__version__
-        use_on_bad_lines = tuple(map(int, pandas_version.split(".")[:2])) >= (1, 3)
-
-        # Try different reading strategies
-        reading_strategies = [
-            # Strategy 1: Standard C engine with common options
-            {
-                "engine": "c",
-                "sep": ",",
-                "low_memory": False,
-            },
-            # Strategy 2: Python engine (more forgiving)
-            {
-                "engine": "python",
-                "sep": ",",
-            },
-            # Strategy 3: Try tab delimiter
-            {
-                "engine": "python",
-                "sep": "\t",
-            },
-            # Strategy 4: Auto-detect delimiter
-            {
-                "engine": "python",
-                "sep": None,
-            },
-        ]
-
-        for encoding in encodings:
-            for strategy in reading_strategies:
-                try:
-                    read_kwargs = {
-                        "encoding": encoding,
-                        **strategy,
-                    }
-                    # Add bad line handling based on pandas version
-                    if use_on_bad_lines:
-                        read_kwargs["on_bad_lines"] = "skip"
-                    else:
-                        read_kwargs["error_bad_lines"] = False
-                        read_kwargs["warn_bad_lines"] = False
-
-                    # Remove sep=None if present (pandas will auto-detect)
-                    if read_kwargs.get("sep") is None:
-                        read_kwargs.pop("sep")
-
-                    df = pd.read_csv(csv_file, **read_kwargs)
-
-                    if encoding != "utf-8":
-                        print(f"   ℹ️  Detected encoding: {encoding}")
-                    if strategy["engine"] == "python":
-                        print("   ℹ️  Used Python engine (more forgiving parser)")
-                    break
-                except (UnicodeDecodeError, pd.errors.ParserError, ValueError):
-                    continue
-                except Exception:
-                    # For other errors, try next strategy
-                    continue
-
-            if df is not None:
-                break
-
-        if df is None:
-            print(
-                "❌ Error: Could not read file with any combination of encodings and strategies"
-            )
-            return False
-
-        print(f"   ✓ Loaded {len(df):,} rows, {len(df.columns)} columns")
-        print(f"   ✓ Memory usage: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+        encoding, delimiter = sniff_csv(csv_file)
+        if encoding != "utf-8":
+            print(f"   ℹ️  Detected encoding: {encoding}")
+        if delimiter != ",":
+            print(f"   ℹ️  Detected delimiter: {delimiter!r}")
 
         print(f"\n💾 Writing Parquet: {output_file}")
-        df.to_parquet(output_file, index=False, compression="snappy")
+        rows, columns = stream_csv_to_parquet(csv_file, output_file, encoding, delimiter)
+        row_groups = pq.ParquetFile(output_file).metadata.num_row_groups
+
+        print(f"   ✓ Converted {rows:,} rows, {columns} columns in {row_groups} row groups")
 
         # Get file sizes
         csv_size = os.path.getsize(csv_file) / 1024**2
@@ -120,15 +274,226 @@ def csv_to_parquet(csv_file, output_file=None):
         return False
 
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python csv_to_parquet.py <input.csv> [output.parquet]")
-        print("\nExample:")
-        print("  python csv_to_parquet.py data/myfile.csv")
-        print("  python csv_to_parquet.py data/myfile.csv data/output.parquet")
-        sys.exit(1)
+# ============================================================================
+# DIRECTORY MODE
+# ============================================================================
+
+REDSHIFT_ARROW_TYPES = {
+    "integer": pa.int32(),
+    "smallint": pa.int32(),
+    "bigint": pa.int64(),
+    "double precision": pa.float64(),
+    "numeric": pa.float64(),
+    "character varying": pa.string(),
+    "date": pa.date32(),
+    "timestamp without time zone": pa.timestamp("us"),
+}
+
+DEFAULT_COLUMNS_CSV = Path(__file__).resolve().parent / "feature_store_columns.csv"
+
+_CHUNK_SUFFIX = re.compile(r"([_-](part|chunk)?[_-]?\d+)+$")
+
+
+def load_declared_types(columns_csv):
+    """{table_name: {column: arrow type}} from feature_store_columns.csv"""
+    declared = {}
+    with open(columns_csv, newline="") as f:
+        for row in csv.DictReader(f):
+            arrow_type = REDSHIFT_ARROW_TYPES.get(row["data_type"])
+            if arrow_type is not None:
+                declared.setdefault(row["table_name"], {})[row["column_name"]] = arrow_type
+    return declared
+
+
+def table_for_file(filename, tables=()):
+    """
+    Table a chunk file belongs to
+
+    The longest known table name the file name starts with; otherwise the file
+    name without its chunk suffix (pro_core_features_inference_0001_part_00.csv
+    -> pro_core_features_inference).
+    """
+    stem = filename.split(".")[0]
+    matches = [t for t in tables if stem.startswith(t)]
+    if matches:
+        return max(matches, key=len)
+    return _CHUNK_SUFFIX.sub("", stem)
+
+
+def dataset_name(table_name):
+    """Dataset directory for a table, named like its feature view"""
+    return table_name.replace("_inference", "")
+
+
+def sniff_file_schema(path):
+    """Schema of a chunk from its Parquet footer or its first CSV block"""
+    if path.endswith(".parquet"):
+        return pq.read_schema(path)
+    encoding, delimiter = sniff_csv(path)
+    return open_csv_stream(path, encoding, delimiter, block_size=SNIFF_BYTES).schema
+
+
+def unify_schema(schemas, declared):
+    """Union of chunk schemas, widened where chunks disagree; declared types win"""
+    unified = pa.unify_schemas(schemas, promote_options="permissive")
+    fields = []
+    for f in unified:
+        arrow_type = declared.get(f.name, f.type)
+        if pa.types.is_null(arrow_type):
+            arrow_type = pa.string()
+        fields.append(pa.field(f.name, arrow_type))
+    return pa.schema(fields)
+
+
+def conform_table(table, schema):
+    """Cast a table to a schema, adding columns it is missing as nulls"""
+    columns = [
+        table[f.name].cast(f.type) if f.name in table.column_names else pa.nulls(len(table), f.type)
+        for f in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def conform_parquet(src, dst, schema):
+    """Rewrite a Parquet file to a schema one row group at a time"""
+    parquet_file = pq.ParquetFile(src)
+    with pq.ParquetWriter(dst, schema, compression="snappy") as writer:
+        for i in range(parquet_file.num_row_groups):
+            writer.write_table(conform_table(parquet_file.read_row_group(i), schema))
+    return parquet_file.metadata.num_rows
+
 
-    csv_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else None
+def convert_chunk(src, dst, schema, declared):
+    """
+    Convert one chunk to Parquet (runs in a worker process)
+
+    Returns:
+        (rows, schema actually written)
+    """
+    if src.endswith(".parquet"):
+        rows = conform_parquet(src, dst, schema)
+    else:
+        encoding, delimiter = sniff_csv(src)
+        rows, _ = stream_csv_to_parquet(
+            src,
+            dst,
+            encoding,
+            delimiter,
+            column_types={f.name: f.type for f in schema if f.name in declared},
+            type_hints={f.name: f.type for f in schema},
+        )
+    return rows, pq.read_schema(dst)
+
+
+def _conform_in_place(path, schema):
+    tmp_path = path + ".tmp"
+    conform_parquet(path, tmp_path, schema)
+    os.replace(tmp_path, path)
+
+
+def convert_directory(input_dir, output_dir, columns_csv=None, workers=None):
+    """
+    Convert every CSV / Parquet chunk in a directory into one dataset per table
+
+    Chunks are grouped by table and converted in a process pool. Each table
+    gets one schema: the types in feature_store_columns.csv where the column is
+    listed, otherwise the widest type any chunk needed. Output is
+    <output_dir>/<view name>/part-NNNNN.parquet, which instawork_feast.offline
+    and auto_generate_features.py read as one dataset.
+
+    Returns:
+        {dataset name: rows} for every table converted
+    """
+    files = sorted(
+        str(p) for p in Path(input_dir).rglob("*") if p.suffix in (".csv", ".parquet")
+    )
+    if not files:
+        print(f"❌ No CSV or Parquet files found in {input_dir}")
+        return {}
+
+    declared = load_declared_types(columns_csv) if columns_csv else {}
+    groups = {}
+    for path in files:
+        groups.setdefault(table_for_file(os.path.basename(path), declared), []).append(path)
+
+    print(f"📂 {len(files)} files across {len(groups)} tables")
+    os.makedirs(output_dir, exist_ok=True)
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Pass 1: chunk schemas from footers / first blocks
+        schemas = dict(zip(files, pool.map(sniff_file_schema, files)))
+
+        # Pass 2: convert every chunk with its table's schema
+        jobs = {}
+        for table, paths in groups.items():
+            table_types = declared.get(table, {})
+            schema = unify_schema([schemas[p] for p in paths], table_types)
+            staging = os.path.join(output_dir, dataset_name(table) + ".tmp")
+            shutil.rmtree(staging, ignore_errors=True)
+            os.makedirs(staging)
+            for i, path in enumerate(paths):
+                dst = os.path.join(staging, f"part-{i:05d}.parquet")
+                jobs[pool.submit(convert_chunk, path, dst, schema, table_types)] = (table, path, dst)
+
+        written = {}
+        failed = set()
+        for future in as_completed(jobs):
+            table, path, dst = jobs[future]
+            try:
+                rows, actual = future.result()
+                written.setdefault(table, []).append((dst, rows, actual))
+            except Exception as e:
+                failed.add(table)
+                print(f"   ❌ {os.path.basename(path)}: {e}")
+
+        # Pass 3: a chunk may have widened a column past the sniffed type;
+        # bring every chunk of the table to the final schema
+        conform_jobs = []
+        for table, chunks in written.items():
+            if table in failed:
+                continue
+            table_types = declared.get(table, {})
+            final = unify_schema([actual for _, _, actual in chunks], table_types)
+            for dst, _, actual in chunks:
+                if not actual.equals(final):
+                    conform_jobs.append(pool.submit(_conform_in_place, dst, final))
+        for future in conform_jobs:
+            future.result()
+
+    for table in sorted(groups):
+        name = dataset_name(table)
+        staging = os.path.join(output_dir, name + ".tmp")
+        if table in failed or table not in written:
+            shutil.rmtree(staging, ignore_errors=True)
+            print(f"   ❌ {name}: not written")
+            continue
+        target = os.path.join(output_dir, name)
+        shutil.rmtree(target, ignore_errors=True)
+        os.replace(staging, target)
+        results[name] = sum(rows for _, rows, _ in written[table])
+        source = "feature_store_columns.csv" if table in declared else "inferred"
+        print(f"   ✓ {name}/: {len(written[table])} chunks, {results[name]:,} rows ({source} types)")
+
+    print(f"\n✅ Converted {len(results)} of {len(groups)} tables into {output_dir}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Convert a CSV file, or a directory of chunked exports, to Parquet"
+    )
+    parser.add_argument("input", help="CSV file, or directory of CSV/Parquet chunks")
+    parser.add_argument("output", nargs="?", help="Parquet file, or output directory")
+    parser.add_argument(
+        "--columns",
+        default=str(DEFAULT_COLUMNS_CSV) if DEFAULT_COLUMNS_CSV.exists() else None,
+        help="feature_store_columns.csv with the declared column types (directory mode)",
+    )
+    parser.add_argument("--workers", type=int, help="Worker processes (directory mode)")
+    args = parser.parse_args()
 
-    csv_to_parquet(csv_file, output_file)
+    if os.path.isdir(args.input):
+        convert_directory(args.input, args.output or "data", args.columns, args.workers)
+    else:
+        csv_to_parquet(args.input, args.output)
@@ -1,184 +1,275 @@
-import streamlit as st
-from feast import FeatureStore
+import sys
+from pathlib import Path
+
 import pandas as pd
+import streamlit as st
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from instawork_feast.explorer import load_repo_yaml, registry_metadata, sample_entity_ids  # noqa: E402
+from instawork_feast.search import get_search_index  # noqa: E402
+
+REPO_PATH = "."
+PAGE_SIZE = 25
 
 st.set_page_config(page_title="FEAST Feature Store UI", layout="wide")
 
 st.title("🍽️ FEAST Feature Store Explorer")
 
-# Initialize feature store
+
+# Registry metadata comes from the memory-mapped registry index, so reruns
+# never deserialize the registry or construct FeatureView objects
+@st.cache_data(ttl=60)
+def get_metadata():
+    return registry_metadata(REPO_PATH)
+
+
+@st.cache_resource(ttl=60)
+def get_search():
+    return get_search_index(REPO_PATH)
+
+
+@st.cache_data(ttl=300)
+def get_sample_ids(view_name, join_key):
+    return sample_entity_ids(REPO_PATH, view_name, join_key)
+
+
 @st.cache_resource
 def get_feature_store():
-    return FeatureStore(repo_path=".")
+    from feast import FeatureStore
+
+    return FeatureStore(repo_path=REPO_PATH)
+
 
-store = get_feature_store()
+def paginate(df, key):
+    """Show one page of a dataframe with a page selector"""
+    n_pages = max((len(df) - 1) // PAGE_SIZE + 1, 1)
+    page_num = st.number_input(f"Page (of {n_pages})", 1, n_pages, 1, key=key)
+    start = (page_num - 1) * PAGE_SIZE
+    st.dataframe(df.iloc[start : start + PAGE_SIZE], use_container_width=True, hide_index=True)
+
+
+metadata = get_metadata()
+views = metadata["views"]
+views_by_name = {v["name"]: v for v in views}
 
 # Sidebar
 st.sidebar.header("Navigation")
-page = st.sidebar.radio("Go to", ["Overview", "Feature Views", "Entities", "Query Features"])
+page = st.sidebar.radio(
+    "Go to", ["Overview", "Search Features", "Feature Views", "Entities", "Query Features"]
+)
 
 # Overview Page
 if page == "Overview":
     st.header("📊 Overview")
-    
+
     col1, col2, col3 = st.columns(3)
-    
+
     with col1:
-        fvs = store.list_feature_views()
-        st.metric("Feature Views", len(fvs))
-    
+        st.metric("Feature Views", len(views))
+
     with col2:
-        entities = store.list_entities()
-        st.metric("Entities", len(entities))
-    
+        st.metric("Entities", len(metadata["entities"]))
+
     with col3:
-        # Count features
-        total_features = sum(len(fv.schema) for fv in fvs)
-        st.metric("Total Features", total_features)
-    
+        st.metric("Total Features", metadata["n_features"])
+
+    config = load_repo_yaml(REPO_PATH)
     st.subheader("Project Info")
-    st.write(f"**Project:** {store.project}")
-    st.write(f"**Registry:** {store.config.registry}")
-    st.write(f"**Provider:** {store.config.provider}")
+    st.write(f"**Project:** {config.get('project')}")
+    st.write(f"**Registry:** {config.get('registry')}")
+    st.write(f"**Provider:** {config.get('provider')}")
+
+    st.subheader("Features per Entity")
+    per_entity = pd.DataFrame(views).groupby("entity")["n_features"].agg(["count", "sum"])
+    per_entity.columns = ["Feature Views", "Features"]
+    st.dataframe(per_entity, use_container_width=True)
+
+# Search Features Page
+elif page == "Search Features":
+    st.header("🔎 Search Features")
+
+    search = get_search()
+    query = st.text_input("Search", placeholder="e.g. quiz score, sessions window:lte_7_day")
+
+    filter_cols = st.columns(4)
+    filters = {}
+    for col, key in zip(filter_cols, ["entity", "prefix", "window", "dtype"]):
+        with col:
+            value = st.selectbox(key.title(), ["Any"] + search.values(key))
+            filters[key] = None if value == "Any" else value
+
+    matches = search.search(query, **filters)
+    dtypes = dict(zip(search.refs, search.dtypes))
+    st.write(f"**{len(matches)}** of {len(search)} features")
+
+    if matches:
+        results_df = pd.DataFrame(
+            [
+                {"View": ref.split(":", 1)[0], "Feature": ref.split(":", 1)[1], "Type": dtypes[ref]}
+                for ref in matches
+            ]
+        )
+        paginate(results_df, key=f"search_page_{query}_{filters}")
+        st.download_button(
+            label="📥 Download refs",
+            data="\n".join(matches),
+            file_name="feature_refs.txt",
+            mime="text/plain"
+        )
 
 # Feature Views Page
 elif page == "Feature Views":
     st.header("📋 Feature Views")
-    
-    fvs = store.list_feature_views()
-    
-    for fv in fvs:
-        with st.expander(f"🔹 {fv.name}", expanded=True):
-            # Fix: entities might be strings or objects
-            entity_names = []
-            for e in fv.entities:
-                if isinstance(e, str):
-                    entity_names.append(e)
-                else:
-                    entity_names.append(e.name)
-            
-            st.write(f"**Entities:** {entity_names}")
-            st.write(f"**TTL:** {fv.ttl}")
-            st.write(f"**Online:** {fv.online}")
-            st.write(f"**Tags:** {fv.tags}")
-            
-            st.subheader("Features")
-            features_df = pd.DataFrame([
-                {"Feature": f.name, "Type": str(f.dtype)}
-                for f in fv.schema
-            ])
-            st.dataframe(features_df, use_container_width=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        entity_filter = st.selectbox(
+            "Entity", ["All"] + sorted({v["entity"] for v in views if v["entity"]})
+        )
+    with col2:
+        name_filter = st.text_input("Filter view names")
+
+    filtered = [
+        v
+        for v in views
+        if (entity_filter == "All" or v["entity"] == entity_filter)
+        and name_filter.lower() in v["name"].lower()
+    ]
+
+    summary_df = pd.DataFrame(
+        [
+            {
+                "View": v["name"],
+                "Entity": v["entity"],
+                "Features": v["n_features"],
+                "TTL": v["ttl"],
+                "Online": v["online"],
+                "Table": v["table"],
+            }
+            for v in filtered
+        ]
+    )
+    st.write(f"**{len(filtered)}** feature views")
+    if not summary_df.empty:
+        paginate(summary_df, key="views_page")
+
+        # Only the selected view's fields are rendered
+        st.subheader("🔹 Inspect View")
+        selected = st.selectbox("Feature view", [v["name"] for v in filtered])
+        fv = views_by_name[selected]
+        st.write(f"**Entity:** {fv['entity']} (`{fv['join_key']}`)")
+        st.write(f"**TTL:** {fv['ttl']}")
+        st.write(f"**Online:** {fv['online']}")
+        st.write(f"**Tags:** {fv['tags']}")
+
+        features_df = pd.DataFrame(
+            [{"Feature": f["name"], "Type": f["dtype"]} for f in fv["features"]]
+        )
+        paginate(features_df, key=f"features_page_{selected}")
 
 # Entities Page
 elif page == "Entities":
     st.header("🏷️ Entities")
-    
-    entities = store.list_entities()
-    
-    for entity in entities:
-        with st.expander(f"🔹 {entity.name}", expanded=True):
-            st.write(f"**Description:** {entity.description}")
-            st.write(f"**Value Type:** {entity.value_type}")
-            if hasattr(entity, 'tags') and entity.tags:
-                st.write(f"**Tags:** {entity.tags}")
+
+    for entity in metadata["entities"]:
+        with st.expander(f"🔹 {entity['name']}"):
+            st.write(f"**Join Key:** {entity['join_key']}")
+            st.write(f"**Value Type:** {entity['value_type']}")
+            entity_views = [v["name"] for v in views if v["entity"] == entity["name"]]
+            st.write(f"**Feature Views ({len(entity_views)}):** {', '.join(entity_views)}")
 
 # Query Features Page
 elif page == "Query Features":
     st.header("🔍 Query Features")
-    
-    # Load data to get worker IDs
-    try:
-        df = pd.read_parquet("data/pro_education_features.parquet")
-        all_worker_ids = df['id_worker_id'].unique()
-        
-        st.subheader("Select Workers")
-        
-        # Input method
-        input_method = st.radio("Input method:", ["Select from list", "Enter manually"])
-        
-        if input_method == "Select from list":
-            selected_workers = st.multiselect(
-                "Select worker IDs:",
-                options=all_worker_ids[:100].tolist(),  # Show first 100
-                default=all_worker_ids[:5].tolist()
-            )
-        else:
-            worker_input = st.text_input("Enter worker IDs (comma-separated):", "3,8,12,13,21")
-            selected_workers = [int(x.strip()) for x in worker_input.split(",") if x.strip()]
-        
-        # Feature selection
-        st.subheader("Select Features")
+
+    entity_names = sorted({v["entity"] for v in views if v["entity"]})
+    entity_name = st.selectbox("Entity", entity_names)
+    entity_views = [v for v in views if v["entity"] == entity_name]
+    join_key = entity_views[0]["join_key"]
+
+    st.subheader("Select Features")
+    view_names = st.multiselect(
+        "Feature views:", [v["name"] for v in entity_views], default=[entity_views[0]["name"]]
+    )
+    feature_query = st.text_input("Search features (optional):")
+    if feature_query:
         all_features = [
-            "worker_education_features:b_has_degree_bachelors",
-            "worker_education_features:b_has_degree_masters",
-            "worker_education_features:b_has_degree_phd",
-            "worker_education_features:b_has_degree_culinary_school",
-            "worker_education_features:b_has_degree_hospitality_school",
-            "worker_education_features:rv_int_education_level",
-            "worker_education_features:rv_int_total_education_entries",
-            "worker_education_features:b_has_completed_degree",
-            "worker_education_features:mc_str_education_level_category",
+            ref
+            for ref in get_search().search(feature_query, entity=entity_name)
+            if ref.split(":", 1)[0] in view_names
         ]
-        
-        selected_features = st.multiselect(
-            "Select features:",
-            options=all_features,
-            default=all_features[:5]
+    else:
+        all_features = [
+            f"{name}:{f['name']}" for name in view_names for f in views_by_name[name]["features"]
+        ]
+    selected_features = st.multiselect(
+        "Select features:", options=all_features, default=all_features[:5]
+    )
+
+    st.subheader(f"Select Entities ({join_key})")
+
+    # Input method
+    input_method = st.radio("Input method:", ["Select from sample", "Enter manually"])
+
+    if input_method == "Select from sample":
+        sample_view = view_names[0] if view_names else entity_views[0]["name"]
+        sample_ids, source = get_sample_ids(sample_view, join_key)
+        if not sample_ids:
+            st.warning("No sample IDs found in the online store or local Parquet data")
+        else:
+            st.caption(f"{len(sample_ids)} sample IDs from {source}")
+        selected_ids = st.multiselect(
+            f"Select {join_key} values:", options=sample_ids, default=sample_ids[:5]
         )
-        
-        # Query button
-        if st.button("🚀 Get Features", type="primary"):
-            if not selected_workers:
-                st.error("Please select at least one worker")
-            elif not selected_features:
-                st.error("Please select at least one feature")
-            else:
-                with st.spinner("Fetching features from Redis..."):
-                    try:
-                        features = store.get_online_features(
-                            features=selected_features,
-                            entity_rows=[{"id_worker_id": wid} for wid in selected_workers],
-                        ).to_dict()
-                        
-                        result_df = pd.DataFrame(features)
-                        
-                        st.success(f"✅ Retrieved features for {len(selected_workers)} workers")
-                        st.dataframe(result_df, use_container_width=True)
-                        
-                        # Statistics
+    else:
+        id_input = st.text_input(f"Enter {join_key} values (comma-separated):", "3,8,12,13,21")
+        selected_ids = [int(x.strip()) for x in id_input.split(",") if x.strip()]
+
+    # Query button
+    if st.button("🚀 Get Features", type="primary"):
+        if not selected_ids:
+            st.error(f"Please select at least one {entity_name}")
+        elif not selected_features:
+            st.error("Please select at least one feature")
+        else:
+            with st.spinner("Fetching features from the online store..."):
+                try:
+                    from instawork_feast.retrieval import get_online_features
+
+                    features = get_online_features(
+                        get_feature_store(),
+                        features=selected_features,
+                        entity_rows=[{join_key: entity_id} for entity_id in selected_ids],
+                    )
+
+                    result_df = pd.DataFrame(features)
+
+                    st.success(f"✅ Retrieved features for {len(selected_ids)} entities")
+                    st.dataframe(result_df, use_container_width=True)
+
+                    # Statistics for boolean features
+                    bool_columns = [c for c in result_df.columns if c.startswith("b_")]
+                    if bool_columns:
                         st.subheader("📊 Statistics")
-                        col1, col2, col3 = st.columns(3)
-                        
-                        with col1:
-                            if 'b_has_degree_bachelors' in result_df.columns:
-                                st.metric("With Bachelor's", result_df['b_has_degree_bachelors'].sum())
-                        
-                        with col2:
-                            if 'b_has_degree_masters' in result_df.columns:
-                                st.metric("With Master's", result_df['b_has_degree_masters'].sum())
-                        
-                        with col3:
-                            if 'b_has_degree_phd' in result_df.columns:
-                                st.metric("With PhD", result_df['b_has_degree_phd'].sum())
-                        
-                        # Download button
-                        csv = result_df.to_csv(index=False)
-                        st.download_button(
-                            label="📥 Download CSV",
-                            data=csv,
-                            file_name="features.csv",
-                            mime="text/csv"
-                        )
-                        
-                    except Exception as e:
-                        st.error(f"Error: {e}")
-                        import traceback
-                        st.code(traceback.format_exc())
-    
-    except FileNotFoundError:
-        st.error("Data file not found. Please ensure 'data/pro_education_features.parquet' exists.")
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
+                        cols = st.columns(min(len(bool_columns), 3))
+                        for col, name in zip(cols, bool_columns):
+                            with col:
+                                st.metric(name, int(pd.to_numeric(result_df[name], errors="coerce").sum()))
+
+                    # Download button
+                    csv = result_df.to_csv(index=False)
+                    st.download_button(
+                        label="📥 Download CSV",
+                        data=csv,
+                        file_name="features.csv",
+                        mime="text/csv"
+                    )
+
+                except Exception as e:
+                    st.error(f"Error: {e}")
+                    import traceback
+                    st.code(traceback.format_exc())
 
 # Footer
 st.sidebar.markdown("---")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Report which features are read online and offline
+
+Reads the sampled usage logs written by instawork_feast.usage and compares
+them with the features in the registry. Counts are estimates: sampled online
+requests are weighted by 1 / sample rate.
+
+Usage:
+    python feature_usage_report.py [--usage-dir data/feature_usage] [--days 30]
+    python feature_usage_report.py --suggest     # ONLINE_EXCLUDE entries for unused features
+    python feature_usage_report.py --json report.json
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from instawork_feast.online_schema import load_online_schema  # noqa: E402
+from instawork_feast.registry_cache import get_registry_index  # noqa: E402
+from instawork_feast.usage import DEFAULT_USAGE_DIR, read_usage  # noqa: E402
+
+
+def build_report(repo_path, usage_dir, since):
+    """Per-view usage: {view: {"features", "online_used", "offline_used", "online_unused", ...}}"""
+    usage = read_usage(usage_dir, since)
+    schema = load_online_schema(repo_path)
+
+    report = {}
+    for view in get_registry_index(repo_path).views():
+        names = [f.name for f in view.schema]
+        refs = {name: f"{view.name}:{name}" for name in names}
+        online_schema = schema.online_features(view.name, names)
+        report[view.name] = {
+            "features": len(names),
+            "online_schema": len(online_schema),
+            "online_reads": sum(usage["online"][ref] for ref in refs.values()),
+            "offline_reads": sum(usage["offline"][ref] for ref in refs.values()),
+            "online_used": sorted(n for n in names if usage["online"][refs[n]]),
+            "offline_used": sorted(n for n in names if usage["offline"][refs[n]]),
+            # Materialized but never read online: candidates for ONLINE_EXCLUDE
+            "online_unused": sorted(n for n in online_schema if not usage["online"][refs[n]]),
+        }
+    return report
+
+
+def print_suggestion(report, days=None):
+    window = f"the last {days} days" if days else "all usage logs"
+    print(f"# Online features with no sampled online read in {window}.")
+    print("# Online reads are sampled (FEATURE_USAGE_SAMPLE_RATE, 1% by default), so a")
+    print("# feature read only by a rare request path can be listed here. These are")
+    print("# candidates: confirm with the owners of every online model before excluding.")
+    print("ONLINE_EXCLUDE = {")
+    for view_name, row in sorted(report.items()):
+        if row["online_unused"]:
+            print(f'    "{view_name}": [')
+            for name in row["online_unused"]:
+                print(f'        "{name}",')
+            print("    ],")
+    print("}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report feature usage")
+    parser.add_argument("--repo-path", default=".")
+    parser.add_argument("--usage-dir", default=DEFAULT_USAGE_DIR)
+    parser.add_argument("--days", type=int, help="Only count usage from the last N days")
+    parser.add_argument("--suggest", action="store_true", help="Print ONLINE_EXCLUDE entries")
+    parser.add_argument("--json", help="Write the full report to this file")
+    args = parser.parse_args()
+
+    since = datetime.now(timezone.utc) - timedelta(days=args.days) if args.days else None
+    report = build_report(args.repo_path, args.usage_dir, since)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.suggest:
+        print_suggestion(report, args.days)
+        sys.exit(0)
+
+    print("=" * 70)
+    print("Feature Usage Report")
+    print("=" * 70)
+    print(f"{'view':<40} {'features':>8} {'online':>7} {'used':>5} {'offline':>8}")
+    for view_name, row in sorted(report.items()):
+        print(
+            f"{view_name:<40} {row['features']:>8} {row['online_schema']:>7}"
+            f" {len(row['online_used']):>5} {len(row['offline_used']):>8}"
+        )
+
+    total = sum(row["online_schema"] for row in report.values())
+    unused = sum(len(row["online_unused"]) for row in report.values())
+    print(f"\n📊 {unused:,} of {total:,} online features were not read online")
+    if unused:
+        print("   Online reads are sampled, so these are candidates, not proof of disuse")
+        print("   Run with --suggest to print ONLINE_EXCLUDE entries for them")
+    if args.json:
+        print(f"✅ Wrote {args.json}")
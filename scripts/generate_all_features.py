@@ -2,6 +2,10 @@
 """
 Generate all_features.py from Redshift metadata CSV (FIXED VERSION)
 Usage: python generate_all_features_fixed.py metadata.csv
+       python generate_all_features_fixed.py metadata.csv --package [package_dir]
+
+With --package, emits a lazily loaded feature_views/ package instead: one module
+per feature view plus an index of view name -> module in __init__.py.
 """
 
 import sys
@@ -22,6 +26,27 @@ TYPE_MAPPING = {
     "timestamp without time zone": "UnixTimestamp",
 }
 
+# Redshift type -> compact online encoding, emitted as the `online_encoding`
+# field tag and applied by instawork_feast.online_store
+ONLINE_ENCODINGS = {
+    "date": "epoch_days",
+    "timestamp without time zone": "epoch_seconds",
+}
+
+# Float64 features stored as float32 online (offline data keeps float64):
+# rates and averages do not need 15 significant digits at serving time
+ONLINE_FLOAT32_PREFIXES = ("rv_float_",)
+
+# TTL of every generated feature view
+TTL_DAYS = 365
+
+
+def online_encoding(column: str, data_type: str):
+    """Online encoding tag for a column, or None to store Feast's default encoding"""
+    if TYPE_MAPPING.get(data_type) == "Float64" and column.startswith(ONLINE_FLOAT32_PREFIXES):
+        return "float32"
+    return ONLINE_ENCODINGS.get(data_type)
+
 
 def identify_entity_info(table_name: str, columns: list) -> dict:
     """Identify entity information for a table"""
@@ -216,7 +241,7 @@ def generate_feature_view_code(df: pd.DataFrame, table_name: str, schema: str) -
     for col, dtype in zip(columns, data_types):
         if col not in exclude_cols:
             feast_type = TYPE_MAPPING.get(dtype, "String")
-            features.append((col, feast_type))
+            features.append((col, feast_type, online_encoding(col, dtype)))
 
     if not features:
         return f"# Skipped {table_name} - no feature columns\n\n"
@@ -234,13 +259,17 @@ def generate_feature_view_code(df: pd.DataFrame, table_name: str, schema: str) -
 {feature_view_name}_fv = FeatureView(
     name="{feature_view_name}",
     entities=[{entity_info["entity_name"]}_entity],
-    ttl=timedelta(days=365),
+    ttl=timedelta(days={TTL_DAYS}),
     schema=[
 '''
 
     # Add all feature fields
-    for col, feast_type in features:
-        code += f'        Field(name="{col}", dtype={feast_type}),\n'
+    for col, feast_type, encoding in features:
+        if encoding:
+            tags = f'tags={{"online_encoding": "{encoding}"}}'
+            code += f'        Field(name="{col}", dtype={feast_type}, {tags}),\n'
+        else:
+            code += f'        Field(name="{col}", dtype={feast_type}),\n'
 
     code += f'''    ],
     source={feature_view_name}_source,
@@ -256,23 +285,156 @@ def generate_feature_view_code(df: pd.DataFrame, table_name: str, schema: str) -
     return code
 
 
+def generate_feature_package(csv_path: str, package_dir: str = "feature_views"):
+    """Generate a lazily loaded package with one module per feature view"""
+
+    print(f"📖 Reading metadata from {csv_path}")
+    df = pd.read_csv(csv_path)
+    schema = df["table_schema"].iloc[0]
+    generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    package_path = Path(package_dir)
+    package_path.mkdir(parents=True, exist_ok=True)
+    package_name = package_path.name
+
+    view_entities = {}
+
+    for table_name in sorted(df["table_name"].unique()):
+        table_df = df[df["table_name"] == table_name]
+        entity_info = identify_entity_info(table_name, table_df["column_name"].tolist())
+        view_code = generate_feature_view_code(df, table_name, schema)
+        if not entity_info["entity_name"] or view_code.startswith("# Skipped"):
+            print(f"   ⚠️  {view_code.strip()}")
+            continue
+
+        feature_view_name = table_name.replace("_inference", "")
+        view_entities[feature_view_name] = entity_info["entity_name"]
+
+        exclude_cols = {entity_info["entity_column"], entity_info["timestamp_column"]}
+        view_types = {
+            TYPE_MAPPING.get(dtype, "String")
+            for col, dtype in zip(table_df["column_name"], table_df["data_type"])
+            if col not in exclude_cols
+        }
+
+        module_code = f'''"""
+{feature_view_name.replace("_", " ").title()}
+Auto-generated from Redshift metadata on {generated_at}
+
+This module contains a single feature view definition. It is imported on first
+access through the {package_name} package.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import {", ".join(sorted(view_types))}
+from datetime import timedelta
+from entities import {entity_info["entity_name"]}_entity
+
+'''
+        module_code += view_code
+        (package_path / f"{feature_view_name}.py").write_text(module_code.rstrip() + "\n")
+
+    index_code = f'''"""
+Feast Feature Views - Lazily Loaded Package
+Auto-generated from Redshift metadata on {generated_at}
+
+Each of the {len(view_entities)} feature views lives in its own module and is only
+constructed when it is first accessed, so a service that needs three views
+does not build them all. `feast apply` imports every module in the repo and
+still registers every view.
+
+Usage:
+    from {package_name} import pro_core_features_fv      # builds one view
+    {package_name}.get_feature_view("pro_quiz_features")
+    {package_name}.all_feature_views()                   # builds every view
+"""
+
+import importlib
+
+# Feature view name -> module in this package
+FEATURE_VIEW_MODULES = {{
+'''
+    for view_name in view_entities:
+        index_code += f'    "{view_name}": "{view_name}",\n'
+
+    index_code += """}
+
+# Feature view name -> entity
+FEATURE_VIEW_ENTITIES = {
+"""
+    for view_name, entity_name in view_entities.items():
+        index_code += f'    "{view_name}": "{entity_name}",\n'
+
+    index_code += '''}
+
+
+def _load_module(view_name):
+    return importlib.import_module(f"{__name__}.{FEATURE_VIEW_MODULES[view_name]}")
+
+
+def get_feature_view(view_name):
+    """Construct (on first access) and return a feature view by name"""
+    return getattr(_load_module(view_name), f"{view_name}_fv")
+
+
+def all_feature_views():
+    """Construct and return every feature view"""
+    return [get_feature_view(view_name) for view_name in FEATURE_VIEW_MODULES]
+
+
+def feature_views_for_entity(entity_name):
+    """Construct and return the feature views of one entity"""
+    return [
+        get_feature_view(view_name)
+        for view_name, view_entity in FEATURE_VIEW_ENTITIES.items()
+        if view_entity == entity_name
+    ]
+
+
+def __getattr__(attr):
+    # <view>_fv and <view>_source resolve to the lazily imported module
+    for suffix in ("_fv", "_source"):
+        view_name = attr[: -len(suffix)]
+        if attr.endswith(suffix) and view_name in FEATURE_VIEW_MODULES:
+            return getattr(_load_module(view_name), attr)
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+'''
+
+    (package_path / "__init__.py").write_text(index_code)
+
+    print(f"\n✅ Generated package {package_dir}/")
+    print(f"📊 Statistics:")
+    print(f"   - Feature View Modules: {len(view_entities)}")
+    print(f"   - Total Features: {len(df)}")
+
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print(
             "Usage: python generate_all_features_fixed.py <metadata.csv> [output_file]"
         )
+        print(
+            "       python generate_all_features_fixed.py <metadata.csv> --package [package_dir]"
+        )
         print("\nExample:")
         print("  python generate_all_features_fixed.py metadata.csv")
         print("  python generate_all_features_fixed.py metadata.csv all_features.py")
+        print("  python generate_all_features_fixed.py metadata.csv --package ../feature_views")
         sys.exit(1)
 
     csv_path = sys.argv[1]
-    output_path = sys.argv[2] if len(sys.argv) > 2 else "all_features.py"
 
     if not Path(csv_path).exists():
         print(f"❌ Error: File not found: {csv_path}")
         sys.exit(1)
 
+    if len(sys.argv) > 2 and sys.argv[2] == "--package":
+        package_dir = sys.argv[3] if len(sys.argv) > 3 else "feature_views"
+        generate_feature_package(csv_path, package_dir)
+        sys.exit(0)
+
+    output_path = sys.argv[2] if len(sys.argv) > 2 else "all_features.py"
+
     # Generate the all_features.py file
     generate_all_features_file(csv_path, output_path)
 
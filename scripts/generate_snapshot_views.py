@@ -0,0 +1,414 @@
+#!/usr/bin/env python
+"""
+Generate pre-joined entity snapshot views from Redshift metadata CSV
+
+For every entity type with two or more feature views this writes:
+- a snapshot FeatureView definition (snapshot_features.py)
+- the Redshift SQL that builds the snapshot table (--sql)
+- optionally, the local Parquet snapshot built from each member's local data,
+  the data/<view>/ dataset or data/<view>.parquet (--parquet-dir)
+
+Each snapshot row is keyed by an (entity, ts_ds) that appears in any member
+view and carries, per member, that member's latest row at or before ts_ds and
+within its TTL, the same as-of rule the member view itself is read with. Views
+that skip days therefore still serve their last value through the snapshot.
+
+A member row that expires before the entity's next row in that member also
+keys a row on the day after its TTL runs out, in which that member is null.
+A routed read therefore stops returning a member's value when a direct read
+of the member does (to the day), although the snapshot's TTL is the largest
+member TTL, so that the snapshot row stays readable while any member is.
+
+Pass --columns with a file of `view:feature` refs (one per line) to prune the
+snapshot down to the features models actually read.
+
+Usage: python generate_snapshot_views.py metadata.csv [output_file] [--columns refs.txt]
+                                         [--sql snapshot_tables.sql] [--parquet-dir ../data]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.dataset as ds
+
+from generate_all_features import TTL_DAYS, TYPE_MAPPING, identify_entity_info
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from instawork_feast.offline import local_dataset_path  # noqa: E402
+from instawork_feast.snapshots import (  # noqa: E402
+    SNAPSHOT_TAG,
+    snapshot_column,
+    snapshot_table_name,
+    snapshot_view_name,
+)
+
+
+def load_selected_refs(columns_path: str) -> set:
+    """Read `view:feature` refs to keep, ignoring blank lines and comments"""
+    refs = set()
+    for line in Path(columns_path).read_text().splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            refs.add(line)
+    return refs
+
+
+def member_ttl_days(view_name: str):
+    """TTL of a member view in days (None: never expires), from feature_views when it has the view"""
+    try:
+        from feature_views import get_feature_view
+
+        ttl = get_feature_view(view_name).ttl
+    except (ImportError, KeyError):
+        return TTL_DAYS
+    return ttl.days or None if ttl else None
+
+
+def snapshot_ttl_days(snapshot: dict):
+    """
+    Largest member TTL (None if a member never expires)
+
+    Each member expires on its own through its expiry rows, so the snapshot
+    TTL only has to keep a row readable as long as any member may be.
+    """
+    ttls = [member["ttl_days"] for member in snapshot["members"].values()]
+    if not all(ttls):
+        return None
+    return max(ttls)
+
+
+def collect_snapshots(df: pd.DataFrame, selected_refs: set = None) -> dict:
+    """
+    Group member views by entity
+
+    Returns {entity_name: {"entity_column", "schema", "members"}} where members
+    maps view name -> {"table", "features": [(column, redshift_type)], "ttl_days"}.
+    Entities with fewer than two member views are dropped.
+    """
+    snapshots = {}
+
+    for table_name in sorted(df["table_name"].unique()):
+        table_df = df[df["table_name"] == table_name]
+        entity_info = identify_entity_info(table_name, table_df["column_name"].tolist())
+        if not entity_info["entity_name"]:
+            continue
+
+        view_name = table_name.replace("_inference", "")
+        exclude_cols = {entity_info["entity_column"], entity_info["timestamp_column"]}
+
+        features = [
+            (col, dtype)
+            for col, dtype in zip(table_df["column_name"], table_df["data_type"])
+            if col not in exclude_cols
+            and (selected_refs is None or f"{view_name}:{col}" in selected_refs)
+        ]
+        if not features:
+            continue
+
+        snapshot = snapshots.setdefault(
+            entity_info["entity_name"],
+            {
+                "entity_column": entity_info["entity_column"],
+                "schema": table_df["table_schema"].iloc[0],
+                "members": {},
+            },
+        )
+        snapshot["members"][view_name] = {
+            "table": table_name,
+            "features": features,
+            "ttl_days": member_ttl_days(view_name),
+        }
+
+    return {
+        entity_name: snapshot
+        for entity_name, snapshot in snapshots.items()
+        if len(snapshot["members"]) > 1
+    }
+
+
+def generate_snapshot_view_code(entity_name: str, snapshot: dict) -> str:
+    """Generate the source and FeatureView definition for one snapshot"""
+
+    view_name = snapshot_view_name(entity_name)
+    table_name = snapshot_table_name(entity_name)
+    members = snapshot["members"]
+    ttl_days = snapshot_ttl_days(snapshot)
+    ttl = f"timedelta(days={ttl_days})" if ttl_days else "timedelta(0)"
+
+    code = f'''# {view_name.replace("_", " ").title()} ({len(members)} views)
+{view_name}_source = RedshiftSource(
+    name="{view_name}_source",
+    schema="{snapshot["schema"]}",
+    table="{table_name}",
+    timestamp_field="ts_ds",
+)
+
+{view_name}_fv = FeatureView(
+    name="{view_name}",
+    entities=[{entity_name}_entity],
+    ttl={ttl},
+    schema=[
+'''
+
+    for member_name, member in members.items():
+        for col, dtype in member["features"]:
+            feast_type = TYPE_MAPPING.get(dtype, "String")
+            code += f'        Field(name="{snapshot_column(member_name, col)}", dtype={feast_type}),\n'
+
+    code += f'''    ],
+    source={view_name}_source,
+    tags={{
+        "source": "redshift",
+        "table": "{table_name}",
+        "entity": "{entity_name}",
+        "{SNAPSHOT_TAG}": "{",".join(members)}"
+    }},
+)
+
+'''
+
+    return code
+
+
+def generate_snapshot_sql(entity_name: str, snapshot: dict) -> str:
+    """
+    Generate the Redshift statements that rebuild one snapshot table
+
+    Each member row is valid from its ts_ds until the entity's next row in
+    that member (LEAD), and for at most the member's TTL, so every snapshot
+    key joins the one member row Feast would return as of that day. Rows that
+    expire before the next one add a key the day after their TTL.
+    """
+
+    schema = snapshot["schema"]
+    entity_col = snapshot["entity_column"]
+    members = snapshot["members"]
+    target = f'"{schema}"."{snapshot_table_name(entity_name)}"'
+
+    key_selects = []
+    select_cols = [f"    k.{entity_col}", "    k.ts_ds"]
+    member_ctes = []
+    joins = []
+    for i, (member_name, member) in enumerate(members.items()):
+        alias = f"t{i}"
+        feature_cols = [col for col, _ in member["features"]]
+        for col in feature_cols:
+            select_cols.append(f"    {alias}.{col} AS {snapshot_column(member_name, col)}")
+        member_ctes.append(
+            f"{alias} AS (\n"
+            f"    SELECT {entity_col}, ts_ds, {', '.join(feature_cols)},\n"
+            f"        LEAD(ts_ds) OVER (PARTITION BY {entity_col} ORDER BY ts_ds) AS next_ts_ds\n"
+            f'    FROM "{schema}"."{member["table"]}"\n'
+            f")"
+        )
+        join = (
+            f"LEFT JOIN {alias}\n"
+            f"    ON {alias}.{entity_col} = k.{entity_col}\n"
+            f"    AND {alias}.ts_ds <= k.ts_ds\n"
+            f"    AND ({alias}.next_ts_ds IS NULL OR k.ts_ds < {alias}.next_ts_ds)"
+        )
+        key_selects.append(f"    SELECT {entity_col}, ts_ds FROM {alias}")
+        if member["ttl_days"]:
+            join += f"\n    AND k.ts_ds <= DATEADD(day, {member['ttl_days']}, {alias}.ts_ds)"
+            expiry = f"CAST(DATEADD(day, {member['ttl_days'] + 1}, ts_ds) AS DATE)"
+            key_selects.append(
+                f"    SELECT {entity_col}, {expiry} FROM {alias}\n"
+                f"    WHERE next_ts_ds IS NULL OR next_ts_ds > {expiry}"
+            )
+        joins.append(join)
+
+    member_sql = ",\n".join(member_ctes)
+    key_sql = "\n    UNION\n".join(key_selects)
+    select_sql = ",\n".join(select_cols)
+    join_sql = "\n".join(joins)
+
+    return f"""-- {snapshot_view_name(entity_name)}: {len(members)} views pre-joined as of ({entity_col}, ts_ds)
+BEGIN;
+DROP TABLE IF EXISTS {target};
+CREATE TABLE {target}
+DISTKEY ({entity_col})
+SORTKEY (ts_ds)
+AS
+WITH {member_sql},
+snapshot_keys AS (
+{key_sql}
+)
+SELECT
+{select_sql}
+FROM snapshot_keys k
+{join_sql};
+COMMIT;
+
+"""
+
+
+def build_snapshot_parquet(entity_name: str, snapshot: dict, data_dir: str) -> bool:
+    """
+    Pre-join the members' local data into data/<entity>_snapshot.parquet
+
+    Members are read from their data/<view>/ dataset (the ts_ds-partitioned
+    layout of optimize_parquet_layout.py) or, failing that, data/<view>.parquet.
+
+    Same rows as the Redshift table: every (entity, ts_ds) of any member and
+    the expiry day of every member row, with each member merged as of ts_ds
+    within its TTL.
+    """
+
+    entity_col = snapshot["entity_column"]
+    keys = [entity_col, "ts_ds"]
+    member_dfs = {}
+
+    for member_name, member in snapshot["members"].items():
+        member_path = local_dataset_path(data_dir, member_name)
+        if not os.path.exists(member_path):
+            print(f"   ⚠️  Skipping {member_name}: {member_path} not found")
+            continue
+
+        feature_cols = [col for col, _ in member["features"]]
+        dataset = ds.dataset(member_path, format="parquet", partitioning="hive")
+        member_df = dataset.to_table(columns=keys + feature_cols).to_pandas()
+        # A hive partition value reads back as a string
+        member_df["ts_ds"] = pd.to_datetime(member_df["ts_ds"])
+        member_df = member_df.rename(
+            columns={col: snapshot_column(member_name, col) for col in feature_cols}
+        )
+        member_dfs[member_name] = member_df.sort_values("ts_ds")
+
+    if not member_dfs:
+        return False
+
+    key_dfs = []
+    for member_name, member_df in member_dfs.items():
+        key_dfs.append(member_df[keys])
+        ttl_days = snapshot["members"][member_name]["ttl_days"]
+        if ttl_days:
+            expiry = member_df["ts_ds"] + pd.Timedelta(days=ttl_days + 1)
+            next_ts = member_df.groupby(entity_col)["ts_ds"].shift(-1)
+            expires = next_ts.isna() | (next_ts > expiry)
+            expiry_keys = {entity_col: member_df.loc[expires, entity_col], "ts_ds": expiry[expires]}
+            key_dfs.append(pd.DataFrame(expiry_keys))
+    result = pd.concat(key_dfs).drop_duplicates().sort_values("ts_ds")
+    for member_name, member_df in member_dfs.items():
+        ttl_days = snapshot["members"][member_name]["ttl_days"]
+        result = pd.merge_asof(
+            result,
+            member_df,
+            on="ts_ds",
+            by=entity_col,
+            direction="backward",
+            tolerance=pd.Timedelta(days=ttl_days) if ttl_days else None,
+        )
+
+    output_path = os.path.join(data_dir, f"{snapshot_view_name(entity_name)}.parquet")
+    result.sort_values(keys).to_parquet(output_path, index=False, compression="snappy")
+    print(f"   ✓ {output_path}: {len(result):,} rows, {len(result.columns)} columns")
+
+    # An optimized dataset of the previous snapshot would shadow the new file
+    stale_dataset = os.path.join(data_dir, snapshot_view_name(entity_name))
+    if os.path.isdir(stale_dataset):
+        shutil.rmtree(stale_dataset)
+        print(f"   ℹ️  Removed the previous {stale_dataset}/; rerun optimize_parquet_layout.py")
+    return True
+
+
+def generate_snapshot_views_file(
+    csv_path: str,
+    output_path: str = "snapshot_features.py",
+    columns_path: str = None,
+    sql_path: str = None,
+    parquet_dir: str = None,
+):
+    """Generate snapshot_features.py (and optionally SQL / local Parquet) from CSV metadata"""
+
+    print(f"📖 Reading metadata from {csv_path}")
+    df = pd.read_csv(csv_path)
+
+    selected_refs = load_selected_refs(columns_path) if columns_path else None
+    if selected_refs is not None:
+        print(f"✂️  Pruning snapshots to {len(selected_refs)} selected features")
+
+    snapshots = collect_snapshots(df, selected_refs)
+    if not snapshots:
+        print("❌ No entity has two or more feature views to pre-join")
+        return
+
+    entity_names = sorted(snapshots)
+    all_types = {
+        TYPE_MAPPING.get(dtype, "String")
+        for snapshot in snapshots.values()
+        for member in snapshot["members"].values()
+        for _, dtype in member["features"]
+    }
+
+    code = f'''"""
+Entity Snapshot Feature Views
+Auto-generated from Redshift metadata on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+
+This file contains pre-joined snapshot views, one per entity type. Requests that
+span several views of one entity are routed here by instawork_feast.retrieval.
+Regenerate with scripts/generate_snapshot_views.py.
+"""
+
+from feast import FeatureView, Field, RedshiftSource
+from feast.types import {", ".join(sorted(all_types))}
+from datetime import timedelta
+from entities import {", ".join(f"{name}_entity" for name in entity_names)}
+
+# ============================================================================
+# SNAPSHOT FEATURE VIEWS
+# ============================================================================
+
+'''
+    sql = ""
+
+    for entity_name in entity_names:
+        snapshot = snapshots[entity_name]
+        code += generate_snapshot_view_code(entity_name, snapshot)
+        sql += generate_snapshot_sql(entity_name, snapshot)
+
+        n_features = sum(len(m["features"]) for m in snapshot["members"].values())
+        print(
+            f"   - {snapshot_view_name(entity_name)}: "
+            f"{len(snapshot['members'])} views, {n_features} features"
+        )
+
+    Path(output_path).write_text(code)
+    print(f"\n✅ Generated {output_path}")
+
+    if sql_path:
+        Path(sql_path).write_text(sql)
+        print(f"✅ Generated {sql_path}")
+
+    if parquet_dir:
+        print(f"\n💾 Building local snapshots in {parquet_dir}/")
+        for entity_name in entity_names:
+            build_snapshot_parquet(entity_name, snapshots[entity_name], parquet_dir)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate entity snapshot views")
+    parser.add_argument("csv_path", help="Redshift metadata CSV")
+    parser.add_argument("output_file", nargs="?", default="snapshot_features.py")
+    parser.add_argument("--columns", help="File of view:feature refs to keep")
+    parser.add_argument("--sql", help="Write the snapshot table DDL to this file")
+    parser.add_argument("--parquet-dir", help="Build local Parquet snapshots in this directory")
+    args = parser.parse_args()
+
+    if not Path(args.csv_path).exists():
+        print(f"❌ Error: File not found: {args.csv_path}")
+        sys.exit(1)
+
+    generate_snapshot_views_file(
+        args.csv_path, args.output_file, args.columns, args.sql, args.parquet_dir
+    )
+
+    print("\n💡 Next steps:")
+    print("   1. Run the generated SQL in Redshift to build the snapshot tables")
+    print("   2. Place the generated file in the feature repo root and run: feast apply")
+    print("   3. Materialize the snapshot views like any other view")
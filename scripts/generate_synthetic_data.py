@@ -0,0 +1,300 @@
+#!/usr/bin/env python
+"""
+Generate synthetic feature data for every *_inference table
+
+Reads the column declarations in feature_store_columns.csv and writes
+realistic-looking Parquet datasets in the layout convert_to_parquet.py
+produces (data/<view>/part-*.parquet), so materialization, serving and
+retrieval can be benchmarked at production scale without Redshift exports.
+
+Values follow the feature naming conventions:
+- id_<entity>_id of the table's entity: one row per entity per day
+- other id_*: random ids from a pool sized relative to the entity counts
+- b_*: 0/1 with a per-column rate
+- rv_float_*: rates and ratios in [0, 1], ratings in [1, 5], other averages
+  and durations from a gamma distribution
+- rv_int_*: Poisson counts, scaled by the window in the name (lte_7_day, l90d)
+- mc_str_* / mc_int_*: Zipf-distributed categories from a small vocabulary
+- mt_*: comma-separated token lists
+- ts_*: timestamps up to a year before the row's ts_ds
+
+Per-column parameters (rates, vocabularies, means) derive from the column name,
+so every chunk, day and process agrees on them. About 5% of feature values are
+null. Columns are generated as whole NumPy arrays, and (table, day, chunk)
+tasks run in parallel processes, each writing its own file.
+
+Usage: python generate_synthetic_data.py [output_dir] [--workers 100000] [--days 1]
+           [--businesses N] [--shifts N] [--end-date 2024-06-01] [--tables a b]
+           [--chunk-rows 1000000] [--processes N] [--seed 0]
+"""
+
+import argparse
+import csv
+import os
+import re
+import shutil
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from convert_to_parquet import (  # noqa: E402
+    DEFAULT_COLUMNS_CSV,
+    REDSHIFT_ARROW_TYPES,
+    dataset_name,
+)
+from generate_all_features import identify_entity_info  # noqa: E402
+from instawork_feast.search import feature_windows  # noqa: E402
+
+NULL_FRACTION = 0.05
+ROW_GROUP_ROWS = 256 * 1024
+
+_EPOCH = date(1970, 1, 1)
+_FRACTION_NAME = re.compile(r"_(rate|ratio|pct|percent|share|probability)(_l\d+d)?$")
+_WINDOW_SIZE = re.compile(r"(\d+)_?(hour|day|week|month|year|d|w|m)")
+_UNIT_DAYS = {"hour": 1 / 24, "day": 1, "d": 1, "week": 7, "w": 7, "month": 30, "m": 30, "year": 365}
+
+
+def load_tables(columns_csv, tables=None):
+    """{table_name: [(column, data_type)]} in declaration order"""
+    declared = {}
+    with open(columns_csv, newline="") as f:
+        for row in csv.DictReader(f):
+            if row["data_type"] not in REDSHIFT_ARROW_TYPES:
+                continue
+            if tables and row["table_name"] not in tables and dataset_name(row["table_name"]) not in tables:
+                continue
+            declared.setdefault(row["table_name"], []).append((row["column_name"], row["data_type"]))
+    return declared
+
+
+def id_pools(workers, businesses, shifts):
+    """Number of distinct ids per id_* column"""
+    return {
+        "id_worker_id": workers,
+        "id_business_id": businesses,
+        "id_shift_id": shifts,
+        "id_company_id": max(businesses // 5, 1),
+        "id_shift_group_id": max(shifts // 4, 1),
+        "id_original_shift_group_id": max(shifts // 4, 1),
+        "id_position_id": 200,
+        "id_regionmapping_id": 60,
+    }
+
+
+def window_days(column):
+    """Length in days of the first window in a column name, or None"""
+    for window in feature_windows(column):
+        match = _WINDOW_SIZE.search(window)
+        if match:
+            return int(match.group(1)) * _UNIT_DAYS[match.group(2)]
+    return None
+
+
+def column_params(column):
+    """Generator stable across processes, seeded by the column name"""
+    return np.random.default_rng(zlib.crc32(column.encode("utf-8")))
+
+
+def _zipf_codes(params, rng, n, size):
+    weights = 1.0 / np.arange(1, size + 1) ** params.uniform(0.8, 1.6)
+    return rng.choice(size, n, p=weights / weights.sum())
+
+
+def _vocabulary(column, params):
+    stem = re.sub(r"^(mc_str|mt)_", "", column)
+    return [f"{stem}_{i}" for i in range(int(params.integers(3, 16)))]
+
+
+def _categories(column, params, rng, n):
+    """Strings via a dictionary array, so no Python string per row is built"""
+    vocabulary = _vocabulary(column, params)
+    codes = _zipf_codes(params, rng, n, len(vocabulary)).astype(np.int32)
+    return pa.DictionaryArray.from_arrays(codes, pa.array(vocabulary)).cast(pa.string())
+
+
+def _token_lists(column, params, rng, n):
+    tokens = _vocabulary(column, params)
+    combinations = [
+        ",".join(params.choice(tokens, int(params.integers(1, 4)), replace=False))
+        for _ in range(64)
+    ]
+    codes = rng.integers(0, len(combinations), n).astype(np.int32)
+    return pa.DictionaryArray.from_arrays(codes, pa.array(combinations)).cast(pa.string())
+
+
+def column_values(column, data_type, n, rng, day, entity_column, first_id, pools):
+    """One column of n rows as an Arrow array of the declared type"""
+    arrow_type = REDSHIFT_ARROW_TYPES[data_type]
+    params = column_params(column)
+    nullable = True
+
+    if column == "ts_ds":
+        day_number = (day - _EPOCH).days
+        return pa.array(np.full(n, day_number, dtype=np.int32), pa.int32()).cast(arrow_type)
+    if column == entity_column:
+        return pa.array(np.arange(first_id, first_id + n), pa.int64()).cast(arrow_type)
+
+    if column.startswith("id_"):
+        values = rng.integers(1, pools.get(column, 1000) + 1, n)
+    elif column.startswith("b_"):
+        values = (rng.random(n) < params.uniform(0.02, 0.6)).astype(np.int64)
+        nullable = False
+    elif pa.types.is_string(arrow_type):
+        if column.startswith("mt_"):
+            values = _token_lists(column, params, rng, n)
+        else:
+            values = _categories(column, params, rng, n)
+    elif column.startswith(("mc_int_", "mc_str_")):
+        # Numeric categories, e.g. mc_str_ columns declared as numeric
+        values = _zipf_codes(params, rng, n, int(params.integers(3, 12)))
+    elif column.startswith("ts_"):
+        end = np.datetime64(day, "s").astype(np.int64)
+        seconds = end - rng.integers(0, 365 * 86400, n)
+        values = pa.array(seconds, pa.timestamp("s"))
+    elif column.startswith("rv_float_") or pa.types.is_floating(arrow_type):
+        if _FRACTION_NAME.search(column):
+            a = params.uniform(0.5, 5)
+            values = rng.beta(a, a * params.uniform(0.3, 6), n)
+        elif "rating" in column:
+            values = 1 + 4 * rng.beta(params.uniform(4, 8), params.uniform(1, 2), n)
+        else:
+            shape = params.uniform(1, 4)
+            values = rng.gamma(shape, params.lognormal(2, 1.5) / shape, n)
+        # A few rv_float_ columns are declared as integers in Redshift
+        values = np.round(values, 4 if pa.types.is_floating(arrow_type) else 0)
+    else:
+        mean = params.lognormal(0.5, 1.2) * (window_days(column) or 30) / 30
+        values = rng.poisson(mean, n)
+
+    array = values if isinstance(values, pa.Array) else pa.array(values)
+    if nullable:
+        mask = pa.array(rng.random(n) < NULL_FRACTION)
+        array = pc.if_else(mask, pa.nulls(n, array.type), array)
+    return array.cast(arrow_type)
+
+
+def generate_chunk(task):
+    """Write one (table, day, chunk) file; returns (table, rows, bytes)"""
+    table, columns, entity_column, day, first_id, rows, path, seed, pools = task
+    rng = np.random.default_rng(np.random.SeedSequence(seed))
+    arrays = [
+        column_values(name, data_type, rows, rng, day, entity_column, first_id, pools)
+        for name, data_type in columns
+    ]
+    data = pa.Table.from_arrays(arrays, names=[name for name, _ in columns])
+    pq.write_table(data, path, row_group_size=ROW_GROUP_ROWS, compression="zstd")
+    return table, rows, os.path.getsize(path)
+
+
+def plan_tasks(tables, staging_dir, days, end_date, pools, chunk_rows, seed):
+    tasks = []
+    for table_index, (table, columns) in enumerate(sorted(tables.items())):
+        entity_column = identify_entity_info(table, [c for c, _ in columns])["entity_column"]
+        entities = pools.get(entity_column, pools["id_worker_id"])
+        os.makedirs(os.path.join(staging_dir, dataset_name(table) + ".tmp"), exist_ok=True)
+        for day_index in range(days):
+            day = end_date - timedelta(days=days - 1 - day_index)
+            for chunk, first_id in enumerate(range(1, entities + 1, chunk_rows)):
+                rows = min(chunk_rows, entities + 1 - first_id)
+                path = os.path.join(
+                    staging_dir,
+                    dataset_name(table) + ".tmp",
+                    f"part-{day_index:05d}-{chunk:05d}.parquet",
+                )
+                task_seed = [seed, table_index, day_index, chunk]
+                tasks.append((table, columns, entity_column, day, first_id, rows, path, task_seed, pools))
+    return tasks
+
+
+def generate(output_dir, columns_csv, workers, businesses, shifts, days, end_date,
+             tables=None, chunk_rows=1_000_000, processes=None, seed=0):
+    """Generate every table into output_dir; returns {view: rows}"""
+    declared = load_tables(columns_csv, tables)
+    pools = id_pools(workers, businesses, shifts)
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = plan_tasks(declared, output_dir, days, end_date, pools, chunk_rows, seed)
+
+    print(f"🏭 {len(declared)} tables x {days} day(s) -> {len(tasks)} chunk(s)")
+    print(f"   workers={workers:,} businesses={businesses:,} shifts={shifts:,}")
+
+    rows = {table: 0 for table in declared}
+    size = {table: 0 for table in declared}
+    start = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(generate_chunk, task) for task in tasks]
+            for future in as_completed(futures):
+                table, written, written_bytes = future.result()
+                rows[table] += written
+                size[table] += written_bytes
+    except BaseException:
+        for table in declared:
+            shutil.rmtree(os.path.join(output_dir, dataset_name(table) + ".tmp"), ignore_errors=True)
+        raise
+    elapsed = time.perf_counter() - start
+
+    results = {}
+    for table in sorted(declared):
+        name = dataset_name(table)
+        target = os.path.join(output_dir, name)
+        shutil.rmtree(target, ignore_errors=True)
+        os.replace(os.path.join(output_dir, name + ".tmp"), target)
+        results[name] = rows[table]
+        print(f"   ✓ {name}/: {rows[table]:,} rows, {size[table] / 1e6:,.1f} MB")
+
+    total = sum(rows.values())
+    print(
+        f"\n✅ Generated {total:,} rows ({sum(size.values()) / 1e9:,.2f} GB) in {elapsed:.1f}s "
+        f"({total / max(elapsed, 1e-9):,.0f} rows/s) into {output_dir}"
+    )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic feature data as Parquet")
+    parser.add_argument("output", nargs="?", default="data", help="Output directory")
+    parser.add_argument("--columns", default=str(DEFAULT_COLUMNS_CSV), help="feature_store_columns.csv")
+    parser.add_argument("--workers", type=int, default=100_000, help="Number of workers (pros)")
+    parser.add_argument("--businesses", type=int, help="Number of businesses (default: workers / 50)")
+    parser.add_argument("--shifts", type=int, help="Number of shifts (default: workers * 2)")
+    parser.add_argument("--days", type=int, default=1, help="Days of ts_ds partitions to generate")
+    parser.add_argument(
+        "--end-date",
+        type=date.fromisoformat,
+        default=date.today() - timedelta(days=1),
+        help="Last ts_ds (YYYY-MM-DD, default: yesterday)",
+    )
+    parser.add_argument("--tables", nargs="+", help="Only these tables or views")
+    parser.add_argument("--chunk-rows", type=int, default=1_000_000, help="Rows per output file")
+    parser.add_argument("--processes", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Synthetic Feature Data Generator")
+    print("=" * 70)
+
+    generate(
+        args.output,
+        args.columns,
+        args.workers,
+        args.businesses or max(args.workers // 50, 1),
+        args.shifts or args.workers * 2,
+        args.days,
+        args.end_date,
+        tables=args.tables,
+        chunk_rows=args.chunk_rows,
+        processes=args.processes,
+        seed=args.seed,
+    )
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Materialize each view's online schema to the online store
+
+Like `feast materialize-incremental`, but features excluded in
+feature_views/online_schema.py are not pulled or written to Redis. Ends with
+each view's rows, offline query and online write time, and ts_ds watermark,
+slowest first.
+
+--blue-green writes each view in full into a new generation and switches
+readers to it when it is complete (instawork_feast.generations).
+
+Usage:
+    python materialize_online.py [end_date] [--views a b] [--start 2024-01-01] [--blue-green] [--repo-path .]
+"""
+
+import argparse
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from feast import FeatureStore  # noqa: E402
+
+from instawork_feast.materialize import materialize, materialize_incremental  # noqa: E402
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Materialize online features")
+    parser.add_argument("end_date", nargs="?", help="ISO end date (default: now)")
+    parser.add_argument("--start", help="ISO start date; incremental from the last run if omitted")
+    parser.add_argument("--views", nargs="+", help="Only these feature views")
+    parser.add_argument(
+        "--blue-green",
+        action="store_true",
+        help="Write each view into a new generation and switch to it when complete",
+    )
+    parser.add_argument("--repo-path", default=".")
+    args = parser.parse_args()
+
+    end_date = datetime.fromisoformat(args.end_date) if args.end_date else datetime.now(timezone.utc)
+    store = FeatureStore(repo_path=args.repo_path)
+
+    if args.start:
+        results = materialize(
+            store, datetime.fromisoformat(args.start), end_date, args.views, args.blue_green
+        )
+    else:
+        results = materialize_incremental(store, end_date, args.views, args.blue_green)
+
+    print("\n📊 Views by time (offline query + online write)")
+    for stats in sorted(results, key=lambda s: s.offline_seconds + s.online_seconds, reverse=True):
+        print(
+            f"   {stats.view:<32} {stats.offline_seconds:7.1f}s + {stats.online_seconds:7.1f}s  "
+            f"{stats.rows_written:>12,} rows  {stats.rows_per_second:>10,.0f} rows/s  "
+            f"watermark {stats.watermark}"
+        )
+    print("✅ Materialization complete")
@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+"""
+Rewrite online store keys between Feast's entity-key format and the compact one
+
+Streams the keys of a project with SCAN and, batch by batch, moves every key
+that has a compact form (instawork_feast.entity_keys) to it:
+1. HGETALL and PTTL of the batch's keys, in one pipeline
+2. per key, a Lua script on the target key that HSETNXes every field, so
+   fields already written under the target key (by writers that switched
+   format) win, and carries the TTL over to new keys
+3. DEL of the moved keys
+
+Each step touches one key per command, so it also runs on Redis Cluster, and
+a rerun skips keys already in the target format. `--to feast` moves keys
+back, with values as --value-type.
+
+Order of a migration:
+1. deploy readers and writers with entity_key_format: compact and
+   entity_key_fallback: true; new writes go to compact keys, and reads of
+   entities not yet moved fall back to their Feast keys
+2. run this script
+3. set entity_key_fallback: false
+
+Usage: python migrate_entity_keys.py [--connection-string localhost:6379]
+           [--project instawork_feature_store] [--to compact|feast]
+           [--batch 1000] [--pause-ms 0] [--limit N] [--dry-run] [--output stats.json]
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from feast.value_type import ValueType
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from benchmark_online_serving import repo_config  # noqa: E402
+from instawork_feast.entity_keys import compact_key, feast_key, parse_redis_key  # noqa: E402
+from instawork_feast.online_store import InstaworkRedisOnlineStore  # noqa: E402
+from redis_capacity_report import sds_size  # noqa: E402
+
+# KEYS[1] target; ARGV[1] source PTTL, then field / value pairs
+MERGE_SCRIPT = """
+local existed = redis.call('EXISTS', KEYS[1])
+for i = 2, #ARGV, 2 do
+  redis.call('HSETNX', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+if existed == 0 and tonumber(ARGV[1]) > 0 then
+  redis.call('PEXPIRE', KEYS[1], ARGV[1])
+end
+return existed
+"""
+
+
+@dataclass
+class MigrationStats:
+    scanned: int = 0
+    moved: int = 0
+    """Keys moved to a new target key"""
+    merged: int = 0
+    """Keys merged into a target key that already existed"""
+    skipped: int = 0
+    """Keys already in the target format, or without one"""
+    vanished: int = 0
+    """Keys that expired or were deleted between SCAN and HGETALL"""
+    errors: int = 0
+    key_bytes_saved: int = 0
+    """Key length saved, summed over moved keys"""
+    key_memory_saved: int = 0
+    """Key string allocations saved, summed over moved keys"""
+    seconds: float = 0.0
+
+
+def target_key(key: bytes, project: str, to: str, value_type: ValueType) -> Optional[bytes]:
+    parsed = parse_redis_key(key, project)
+    if parsed is None:
+        return None
+    if to == "compact":
+        return compact_key(parsed, project)
+    return feast_key(parsed, project, value_type) if parsed.compact else None
+
+
+def migrate_batch(client, merge, pairs: list[tuple[bytes, bytes]], stats: MigrationStats, dry_run: bool):
+    if dry_run:
+        stats.moved += len(pairs)
+        for source, target in pairs:
+            stats.key_bytes_saved += len(source) - len(target)
+            stats.key_memory_saved += sds_size(len(source)) - sds_size(len(target))
+        return
+
+    with client.pipeline(transaction=False) as pipe:
+        for source, _ in pairs:
+            pipe.hgetall(source)
+            pipe.pttl(source)
+        replies = pipe.execute()
+
+    moving = []
+    with client.pipeline(transaction=False) as pipe:
+        for i, (source, target) in enumerate(pairs):
+            fields, ttl = replies[2 * i], replies[2 * i + 1]
+            if not fields:
+                stats.vanished += 1
+                continue
+            args = [ttl if ttl > 0 else 0]
+            for name, value in fields.items():
+                args.extend((name, value))
+            merge(keys=[target], args=args, client=pipe)
+            moving.append((source, target))
+        results = pipe.execute(raise_on_error=False)
+
+    with client.pipeline(transaction=False) as pipe:
+        for (source, target), existed in zip(moving, results):
+            if isinstance(existed, Exception):
+                stats.errors += 1
+                print(f"   ⚠️  {source!r}: {existed}")
+                continue
+            pipe.delete(source)
+            if existed:
+                stats.merged += 1
+            else:
+                stats.moved += 1
+            stats.key_bytes_saved += len(source) - len(target)
+            stats.key_memory_saved += sds_size(len(source)) - sds_size(len(target))
+        pipe.execute()
+
+
+def migrate(
+    client,
+    project: str,
+    to: str = "compact",
+    value_type: ValueType = ValueType.INT64,
+    batch: int = 1000,
+    pause_ms: int = 0,
+    limit: Optional[int] = None,
+    dry_run: bool = False,
+) -> MigrationStats:
+    stats = MigrationStats()
+    merge = client.register_script(MERGE_SCRIPT)
+    started = time.perf_counter()
+    pairs: list[tuple[bytes, bytes]] = []
+    reported = 0
+
+    pattern = b"*" + project.encode("utf-8").replace(b"*", b"\\*").replace(b"?", b"\\?")
+    for key in client.scan_iter(match=pattern, count=batch):
+        stats.scanned += 1
+        target = target_key(key, project, to, value_type)
+        if target is None:
+            stats.skipped += 1
+        else:
+            pairs.append((key, target))
+        if len(pairs) >= batch:
+            migrate_batch(client, merge, pairs, stats, dry_run)
+            pairs = []
+            if pause_ms:
+                time.sleep(pause_ms / 1000)
+        if stats.scanned - reported >= 100_000:
+            reported = stats.scanned
+            elapsed = time.perf_counter() - started
+            print(
+                f"   {stats.scanned:,} scanned, {stats.moved + stats.merged:,} moved "
+                f"({stats.scanned / elapsed:,.0f} keys/s)"
+            )
+        if limit is not None and stats.moved + stats.merged + len(pairs) >= limit:
+            break
+    if pairs:
+        migrate_batch(client, merge, pairs, stats, dry_run)
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rewrite online store keys to or from the compact format")
+    parser.add_argument("--connection-string", default="localhost:6379")
+    parser.add_argument("--project", default="instawork_feature_store")
+    parser.add_argument("--to", choices=["compact", "feast"], default="compact")
+    parser.add_argument(
+        "--value-type",
+        choices=["int64", "int32"],
+        default="int64",
+        help="Value type of Feast keys written by --to feast",
+    )
+    parser.add_argument("--batch", type=int, default=1000, help="Keys per SCAN and per pipeline")
+    parser.add_argument("--pause-ms", type=int, default=0, help="Pause between batches")
+    parser.add_argument("--limit", type=int, help="Stop after moving this many keys")
+    parser.add_argument("--dry-run", action="store_true", help="Count keys to move without writing")
+    parser.add_argument("--output", help="Write the stats as JSON to this file")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"Entity Key Migration to {args.to} ({args.connection_string}, project {args.project})")
+    print("=" * 70)
+
+    config = repo_config(args.connection_string, args.project, [])
+    client = InstaworkRedisOnlineStore()._get_client(config.online_store)
+    started_at = datetime.now(timezone.utc).isoformat()
+    stats = migrate(
+        client,
+        args.project,
+        to=args.to,
+        value_type=ValueType.INT64 if args.value_type == "int64" else ValueType.INT32,
+        batch=args.batch,
+        pause_ms=args.pause_ms,
+        limit=args.limit,
+        dry_run=args.dry_run,
+    )
+
+    verb = "would move:" if args.dry_run else "moved:"
+    print(f"\n{'🔍' if args.dry_run else '✅'} {stats.scanned:,} keys scanned in {stats.seconds:.1f}s")
+    print(f"   {verb:<12} {stats.moved:,}")
+    print(f"   merged:      {stats.merged:,}")
+    print(f"   skipped:     {stats.skipped:,}")
+    print(f"   vanished:    {stats.vanished:,}")
+    print(f"   errors:      {stats.errors:,}")
+    print(
+        f"   key bytes saved: {stats.key_bytes_saved / 1e6:,.1f} MB "
+        f"({stats.key_memory_saved / 1e6:,.1f} MB of allocations)"
+    )
+
+    if args.output:
+        report = {
+            "run": {
+                "started_at": started_at,
+                "project": args.project,
+                "to": args.to,
+                "dry_run": args.dry_run,
+                "batch": args.batch,
+            },
+            "stats": asdict(stats),
+        }
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"\n✅ Stats written to {args.output}")
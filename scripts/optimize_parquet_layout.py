@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+"""
+Rewrite local feature datasets into a layout built for pruned reads
+
+For each view in a data directory (data/<view>.parquet or data/<view>/):
+- partitioned by ts_ds (data/<view>/ts_ds=2024-01-01/part-0.parquet), so a
+  date-range read opens only the partitions in range
+- sorted by entity id inside each partition, so row group min/max statistics
+  on the join key are tight and entity filters skip row groups
+- row groups sized by bytes (--row-group-mb), small enough to skip, large
+  enough to scan efficiently
+- dictionary encoding on for every column, Arrow's default: low-cardinality
+  mc_str_ / mc_int_ / b_ columns stay dictionary-encoded, and a column chunk
+  whose dictionary outgrows its page falls back to plain
+- column statistics and the page index written, so readers can skip pages
+
+The rewrite is two streaming passes: Arrow's dataset writer splits the source
+by ts_ds into a staging directory, then each day is sorted and rewritten on
+its own. Memory is bounded by the largest single day.
+
+A flat data/<view>.parquet source is removed once the dataset holds all of
+its rows, so readers (instawork_feast.offline, generate_snapshot_views.py,
+auto_generate_features.py) see one copy of the view.
+
+Usage: python optimize_parquet_layout.py [data_dir] [view ...] [--row-group-mb 32]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from generate_all_features import identify_entity_info  # noqa: E402
+
+TIMESTAMP_COLUMN = "ts_ds"
+DEFAULT_ROW_GROUP_MB = 32
+
+
+def find_views(data_dir):
+    """{view name: source path} for every dataset directory and Parquet file"""
+    views = {}
+    for entry in sorted(Path(data_dir).iterdir()):
+        if entry.suffix == ".parquet" and "registry" not in entry.name:
+            views.setdefault(entry.stem, str(entry))
+        elif entry.is_dir() and not entry.name.endswith((".tmp", ".optimizing")):
+            if any(entry.rglob("*.parquet")):
+                # A dataset directory takes precedence over a flat file
+                views[entry.name] = str(entry)
+    return views
+
+
+def entity_column(view_name, columns):
+    """Join key to sort by: from the view's naming convention, else the first id_ column"""
+    entity_col = identify_entity_info(view_name, columns)["entity_column"]
+    if entity_col in columns:
+        return entity_col
+    id_columns = [c for c in columns if c.startswith("id_") and c.endswith("_id")]
+    return id_columns[0] if id_columns else None
+
+
+def rows_per_group(table, row_group_mb):
+    """Rows that make a row group of about row_group_mb uncompressed"""
+    if table.num_rows == 0:
+        return 1
+    bytes_per_row = max(table.nbytes / table.num_rows, 1)
+    return max(int(row_group_mb * 1024 * 1024 / bytes_per_row), 1024)
+
+
+def split_by_day(source, staging_dir):
+    """Pass 1: stream the source into staging/ts_ds=YYYY-MM-DD/ partitions"""
+    dataset = ds.dataset(source, format="parquet", partitioning="hive")
+    ts_type = dataset.schema.field(TIMESTAMP_COLUMN).type
+
+    columns = {name: ds.field(name) for name in dataset.schema.names}
+    if pa.types.is_timestamp(ts_type):
+        # ts_ds is a day stamp: partition on its date
+        columns[TIMESTAMP_COLUMN] = ds.field(TIMESTAMP_COLUMN).cast(pa.date32(), safe=False)
+    elif pa.types.is_string(ts_type) or pa.types.is_large_string(ts_type):
+        # Already partitioned by this script: the partition value is an ISO date
+        columns[TIMESTAMP_COLUMN] = ds.field(TIMESTAMP_COLUMN).cast(pa.date32())
+
+    ds.write_dataset(
+        ds.Scanner.from_dataset(dataset, columns=columns),
+        staging_dir,
+        format="parquet",
+        partitioning=[TIMESTAMP_COLUMN],
+        partitioning_flavor="hive",
+        existing_data_behavior="delete_matching",
+        max_partitions=100_000,
+    )
+
+
+def rewrite_day(day_dir, output_dir, entity_col, row_group_mb):
+    """Pass 2: sort one day by entity and write it with the target layout"""
+    table = ds.dataset(day_dir, format="parquet").to_table()
+    if entity_col:
+        table = table.sort_by([(entity_col, "ascending")])
+
+    os.makedirs(output_dir, exist_ok=True)
+    pq.write_table(
+        table,
+        os.path.join(output_dir, "part-0.parquet"),
+        row_group_size=rows_per_group(table, row_group_mb),
+        use_dictionary=True,
+        write_statistics=True,
+        write_page_index=True,
+        compression="snappy",
+    )
+    return table.num_rows
+
+
+def optimize_view(view_name, source, data_dir, row_group_mb=DEFAULT_ROW_GROUP_MB):
+    """Rewrite one view into data_dir/<view>/; returns a summary dict"""
+    schema = ds.dataset(source, format="parquet", partitioning="hive").schema
+    if TIMESTAMP_COLUMN not in schema.names:
+        print(f"   ⚠️  {view_name}: no {TIMESTAMP_COLUMN} column, skipped")
+        return None
+    entity_col = entity_column(view_name, schema.names)
+
+    staging = os.path.join(data_dir, f"{view_name}.tmp")
+    output = os.path.join(data_dir, f"{view_name}.optimizing")
+    for path in (staging, output):
+        shutil.rmtree(path, ignore_errors=True)
+
+    try:
+        split_by_day(source, staging)
+        rows = 0
+        days = sorted(p for p in os.listdir(staging) if p.startswith(f"{TIMESTAMP_COLUMN}="))
+        for day in days:
+            rows += rewrite_day(
+                os.path.join(staging, day), os.path.join(output, day), entity_col, row_group_mb
+            )
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    target = os.path.join(data_dir, view_name)
+    shutil.rmtree(target, ignore_errors=True)
+    os.replace(output, target)
+
+    # The dataset replaces a flat source; keep it only if rows went missing
+    if os.path.isfile(source):
+        source_rows = pq.ParquetFile(source).metadata.num_rows
+        if source_rows != rows:
+            raise RuntimeError(
+                f"{view_name}: wrote {rows:,} rows but {source} has {source_rows:,}; kept both"
+            )
+        os.remove(source)
+
+    files = list(Path(target).rglob("*.parquet"))
+    return {
+        "view": view_name,
+        "entity_column": entity_col,
+        "rows": rows,
+        "partitions": len(days),
+        "row_groups": sum(pq.ParquetFile(f).metadata.num_row_groups for f in files),
+        "bytes": sum(f.stat().st_size for f in files),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Optimize the Parquet layout of feature datasets")
+    parser.add_argument("data_dir", nargs="?", default="data")
+    parser.add_argument("views", nargs="*", help="Views to optimize (default: all)")
+    parser.add_argument("--row-group-mb", type=float, default=DEFAULT_ROW_GROUP_MB)
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("Parquet Layout Optimizer")
+    print("=" * 70)
+
+    sources = find_views(args.data_dir)
+    selected = args.views or list(sources)
+    for view_name in selected:
+        if view_name not in sources:
+            print(f"   ❌ {view_name}: no data/{view_name}.parquet or data/{view_name}/")
+            continue
+
+        source = sources[view_name]
+        flat = os.path.isfile(source)
+        if flat:
+            before = os.path.getsize(source)
+        else:
+            before = sum(f.stat().st_size for f in Path(source).rglob("*.parquet"))
+        summary = optimize_view(view_name, source, args.data_dir, args.row_group_mb)
+        if summary is None:
+            continue
+
+        print(
+            f"   ✓ {view_name}: {summary['rows']:,} rows, {summary['partitions']} days, "
+            f"{summary['row_groups']} row groups, sorted by {summary['entity_column']}, "
+            f"{before / 1024**2:.1f} MB -> {summary['bytes'] / 1024**2:.1f} MB"
+        )
+        if flat:
+            print(f"     ℹ️  {view_name}/ replaces {os.path.basename(source)}, which was removed")
+
+    print("\n✅ Done")
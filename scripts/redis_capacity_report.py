@@ -0,0 +1,594 @@
+#!/usr/bin/env python
+"""
+Redis memory capacity model and projection
+
+Samples entity keys of a project from Redis (SCAN, then HGETALL) and maps
+every hash field back to its view and feature. From the sample it reports:
+- bytes per entity per view, split by field type (boolean, integer, float64,
+  string, interned string, timestamp, null, the per-view `_ts` field, ...)
+- the same views under alternative encodings:
+    packed_booleans   all b_ features of a view in one 2-bit-per-value field
+    float32           Float64 values written as 4-byte floats
+    interned_strings  string values written as Int32 dictionary codes
+    blob              one pack_values field per view and entity
+    blob_zstd         the blob compressed with a dictionary trained on the
+                      sample, as compress_views writes it
+- memory projected for --workers / --businesses / --shifts entities under
+  each encoding
+
+Redis memory is mostly overhead, not values, so sizes are modelled the way
+Redis stores a hash:
+- a hash stays a listpack (a few bytes per field) while it has at most
+  hash-max-listpack-entries fields and no value over hash-max-listpack-value
+  bytes. Past either limit it becomes a hashtable, where every field costs a
+  dictEntry, two sds strings and a bucket (some 60 bytes) for a 4-byte name
+  and a 3-9 byte value.
+- allocations are rounded up to jemalloc size classes.
+- every key also pays for its keyspace entry, key string and object header,
+  plus an expires entry when it has a TTL.
+All views of one entity share a key, so whether a hash is a listpack depends
+on how many fields all of them write together. The limits are read from
+Redis. The model is checked against MEMORY USAGE on the sampled keys, and
+projections are scaled by that ratio when Redis reports it.
+
+Usage: python redis_capacity_report.py [--connection-string localhost:6379]
+           [--project instawork_feature_store] [--samples 2000]
+           [--workers 1000000] [--businesses 20000] [--shifts 2000000]
+           [--output capacity.json]
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from feast.infra.online_stores.helpers import _mmh3
+from feast.infra.online_stores.redis import _versioned_fv_name
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from redis.exceptions import ResponseError
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import feature_views  # noqa: E402
+from benchmark_online_serving import repo_config  # noqa: E402
+from instawork_feast.compression import ValueCompressor, pack_values, train_dictionary  # noqa: E402
+from instawork_feast.entity_keys import parse_redis_key  # noqa: E402
+from instawork_feast.generations import Generations, generation_namespace  # noqa: E402
+from instawork_feast.online_store import (  # noqa: E402
+    COMPRESSED_FIELD,
+    EPOCH_DAYS,
+    EPOCH_SECONDS,
+    INTERNED,
+    InstaworkRedisOnlineStore,
+    field_encodings,
+)
+
+ENCODINGS = ["current", "packed_booleans", "float32", "interned_strings", "blob", "blob_zstd"]
+# Redis defaults when CONFIG GET is not available
+DEFAULT_LISTPACK_ENTRIES = 128
+DEFAULT_LISTPACK_VALUE = 64
+
+# Sizes of Redis structures on 64-bit builds
+DICT_ENTRY_BYTES = 24
+ROBJ_BYTES = 16
+DICT_BYTES = 56
+BUCKET_BYTES = 8
+LISTPACK_HEADER_BYTES = 7  # total bytes + element count + end marker
+
+
+# ============================================================================
+# MEMORY MODEL
+# ============================================================================
+
+
+def jemalloc_size(size: int) -> int:
+    """Bytes jemalloc actually allocates for a request (x86_64 size classes)"""
+    if size <= 8:
+        return 8
+    if size <= 128:
+        return (size + 15) // 16 * 16
+    spacing = 1 << (math.ceil(math.log2(size)) - 3)
+    return (size + spacing - 1) // spacing * spacing
+
+
+def sds_size(length: int) -> int:
+    """Allocation of an sds string: header, bytes and terminator"""
+    header = 3 if length < 256 else 5 if length < 65536 else 9
+    return jemalloc_size(header + length + 1)
+
+
+def listpack_entry_size(length: int) -> int:
+    """A string element of a listpack: encoding header, bytes and back length"""
+    header = 1 if length < 64 else 2 if length < 4096 else 5
+    content = header + length
+    back_length = 1 if content < 128 else 2 if content < 16384 else 3
+    return content + back_length
+
+
+def varint_size(value: int) -> int:
+    return max(1, math.ceil(value.bit_length() / 7))
+
+
+def bytes_value_size(length: int) -> int:
+    """Serialized ValueProto(bytes_val=...) of a payload"""
+    return 1 + varint_size(length) + length
+
+
+@dataclass
+class RedisMemoryModel:
+    listpack_entries: int = DEFAULT_LISTPACK_ENTRIES
+    listpack_value: int = DEFAULT_LISTPACK_VALUE
+
+    def is_listpack(self, fields: list[tuple[int, int]]) -> bool:
+        return len(fields) <= self.listpack_entries and all(
+            max(name, value) <= self.listpack_value for name, value in fields
+        )
+
+    def key_cost(
+        self, key_length: int, fields: list[tuple[int, int]], has_ttl: bool
+    ) -> tuple[int, list[int], bool]:
+        """(per-key overhead, cost per (name length, value length) field, is listpack)"""
+        overhead = (
+            jemalloc_size(DICT_ENTRY_BYTES)
+            + sds_size(key_length)
+            + jemalloc_size(ROBJ_BYTES)
+            + BUCKET_BYTES
+        )
+        if has_ttl:
+            overhead += jemalloc_size(DICT_ENTRY_BYTES) + BUCKET_BYTES
+
+        if self.is_listpack(fields):
+            costs = [listpack_entry_size(n) + listpack_entry_size(v) for n, v in fields]
+            raw = LISTPACK_HEADER_BYTES + sum(costs)
+            return overhead + jemalloc_size(raw) - sum(costs), costs, True
+
+        costs = [
+            jemalloc_size(DICT_ENTRY_BYTES) + sds_size(n) + sds_size(v) + BUCKET_BYTES
+            for n, v in fields
+        ]
+        buckets = 1 << max(2, math.ceil(math.log2(max(len(fields), 1))))
+        overhead += jemalloc_size(DICT_BYTES) + BUCKET_BYTES * (buckets - len(fields))
+        return overhead, costs, False
+
+
+def redis_model(client) -> RedisMemoryModel:
+    """Listpack limits of the server; Redis < 7 names them ziplist"""
+    model = RedisMemoryModel()
+    for attribute, names in (
+        ("listpack_entries", ("hash-max-listpack-entries", "hash-max-ziplist-entries")),
+        ("listpack_value", ("hash-max-listpack-value", "hash-max-ziplist-value")),
+    ):
+        for name in names:
+            try:
+                value = client.config_get(name).get(name)
+            except ResponseError:
+                value = None
+            if value is not None:
+                setattr(model, attribute, int(value))
+                break
+    return model
+
+
+# ============================================================================
+# SAMPLING
+# ============================================================================
+
+
+@dataclass
+class Field:
+    view: str
+    feature: str
+    field_type: str
+    name_length: int
+    value: bytes
+
+
+@dataclass
+class SampledKey:
+    entity: str
+    key_length: int
+    has_ttl: bool
+    fields: list[Field]
+    memory_usage: Optional[int]
+
+
+def field_catalog(
+    config, generations: Optional[Generations] = None
+) -> tuple[dict[bytes, tuple[str, str]], dict[str, dict[str, str]]]:
+    """
+    ({hash field: (view, feature)}, {view: {feature: online encoding}}) of every view
+
+    With generations, fields are those of each view's live blue/green generation.
+    """
+    catalog, encodings = {}, {}
+    for name in feature_views.FEATURE_VIEW_MODULES:
+        view = feature_views.get_feature_view(name)
+        fv_name = _versioned_fv_name(view, config)
+        if generations is not None:
+            fv_name = generation_namespace(fv_name, generations.live(fv_name))
+        for feature in [*(f.name for f in view.features), COMPRESSED_FIELD]:
+            catalog[_mmh3(f"{fv_name}:{feature}")] = (name, feature)
+        catalog[f"_ts:{fv_name}".encode("utf-8")] = (name, "_ts")
+        encodings[name] = field_encodings(config, view)
+    return catalog, encodings
+
+
+def field_type(feature: str, encoding: Optional[str], raw: bytes) -> str:
+    if feature == "_ts":
+        return "row_timestamp"
+    if not raw:
+        return "null"
+    value = ValueProto()
+    value.ParseFromString(raw)
+    kind = value.WhichOneof("val")
+    if kind is None:
+        return "null"
+    if kind == "bytes_val":
+        return "blob"
+    if kind.endswith("_list_val"):
+        return "list"
+    if feature.startswith("b_") or kind == "bool_val":
+        return "boolean"
+    if encoding == INTERNED and kind in ("int32_val", "int64_val"):
+        return "interned_string"
+    if encoding in (EPOCH_DAYS, EPOCH_SECONDS) or kind == "unix_timestamp_val":
+        return "timestamp"
+    if kind == "double_val":
+        return "float64"
+    if kind == "float_val":
+        return "float32"
+    if kind == "string_val":
+        return "string"
+    return "integer"
+
+
+def scan_keys(client, project: str, samples: int, max_scan: int) -> dict[str, list[bytes]]:
+    """Up to `samples` keys per entity type, in SCAN order"""
+    by_entity: dict[str, list[bytes]] = defaultdict(list)
+    scanned = 0
+    for key in client.scan_iter(match=b"*" + project.encode("utf-8"), count=1000):
+        scanned += 1
+        parsed = parse_redis_key(key, project)
+        if parsed is None:
+            continue
+        entity = ",".join(parsed.join_keys)
+        if len(by_entity[entity]) < samples:
+            by_entity[entity].append(key)
+        if scanned >= max_scan:
+            break
+    return dict(by_entity)
+
+
+def read_keys(
+    client, keys: dict[str, list[bytes]], catalog: dict, encodings: dict, chunk: int = 500
+) -> list[SampledKey]:
+    sampled = []
+    for entity, entity_keys in keys.items():
+        for offset in range(0, len(entity_keys), chunk):
+            batch = entity_keys[offset : offset + chunk]
+            pipe = client.pipeline(transaction=False)
+            for key in batch:
+                pipe.hgetall(key)
+                pipe.pttl(key)
+                pipe.execute_command("MEMORY", "USAGE", key, "SAMPLES", "0")
+            replies = pipe.execute(raise_on_error=False)
+            for i, key in enumerate(batch):
+                hash_fields, ttl, usage = replies[3 * i : 3 * i + 3]
+                fields = []
+                for name, raw in hash_fields.items():
+                    view, feature = catalog.get(name, ("(unknown)", ""))
+                    kind = (
+                        "unknown"
+                        if view == "(unknown)"
+                        else field_type(feature, encodings[view].get(feature), raw)
+                    )
+                    fields.append(Field(view, feature, kind, len(name), raw))
+                sampled.append(
+                    SampledKey(
+                        entity=entity,
+                        key_length=len(key),
+                        has_ttl=isinstance(ttl, int) and ttl > 0,
+                        fields=fields,
+                        memory_usage=usage if isinstance(usage, int) else None,
+                    )
+                )
+    return sampled
+
+
+# ============================================================================
+# ALTERNATIVE ENCODINGS
+# ============================================================================
+
+# (view, field type, name length, value length)
+Layout = list[tuple[str, str, int, int]]
+
+
+def _by_view(fields: list[Field]) -> dict[str, list[Field]]:
+    views: dict[str, list[Field]] = defaultdict(list)
+    for f in fields:
+        views[f.view].append(f)
+    return views
+
+
+def _is_compressed(fields: list[Field]) -> bool:
+    return any(f.feature == COMPRESSED_FIELD for f in fields)
+
+
+def layout(sample: SampledKey, encoding: str, compressors: dict) -> Layout:
+    """Fields the key would have under an encoding"""
+    fields = []
+    for view, view_fields in _by_view(sample.fields).items():
+        if view == "(unknown)" or _is_compressed(view_fields) or encoding == "current":
+            fields.extend((view, f.field_type, f.name_length, len(f.value)) for f in view_fields)
+            continue
+
+        row_ts = [f for f in view_fields if f.feature == "_ts"]
+        values = [f for f in view_fields if f.feature != "_ts"]
+        if encoding in ("blob", "blob_zstd") and values:
+            payload = pack_values({f.feature: f.value for f in values})
+            if encoding == "blob_zstd":
+                payload = compressors[view].compress(payload)
+            values = [Field(view, COMPRESSED_FIELD, "blob", 4, b"\0" * bytes_value_size(len(payload)))]
+        elif encoding == "packed_booleans":
+            # 2 bits per value: null and true/false
+            booleans = sum(f.field_type == "boolean" or f.feature.startswith("b_") for f in values)
+            if booleans > 1:
+                payload = b"\0" * bytes_value_size(math.ceil(2 * booleans / 8))
+                values = [
+                    f for f in values if f.field_type != "boolean" and not f.feature.startswith("b_")
+                ] + [Field(view, "", "boolean", 4, payload)]
+        for f in values:
+            if encoding == "float32" and f.field_type == "float64":
+                fields.append((view, "float32", f.name_length, 5))
+            elif encoding == "interned_strings" and f.field_type == "string":
+                fields.append((view, "interned_string", f.name_length, 3))
+            else:
+                fields.append((view, f.field_type, f.name_length, len(f.value)))
+        fields.extend((view, f.field_type, f.name_length, len(f.value)) for f in row_ts)
+    return fields
+
+
+def train_compressors(sampled: list[SampledKey], dict_size: int, level: int) -> dict:
+    """One compressor per view, with a dictionary trained on the sampled payloads"""
+    payloads: dict[str, list[bytes]] = defaultdict(list)
+    for sample in sampled:
+        for view, view_fields in _by_view(sample.fields).items():
+            values = {f.feature: f.value for f in view_fields if f.feature != "_ts"}
+            if values and not _is_compressed(view_fields):
+                payloads[view].append(pack_values(values))
+    return {
+        view: ValueCompressor(1, train_dictionary(samples[:10000], dict_size), level)
+        for view, samples in payloads.items()
+    }
+
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+
+def measure(sampled: list[SampledKey], model: RedisMemoryModel, compressors: dict) -> dict:
+    """Per entity type: keys, overhead, listpack share and per-view costs under every encoding"""
+    entities: dict[str, dict] = {}
+    for sample in sampled:
+        entity = entities.setdefault(
+            sample.entity,
+            {
+                "keys": 0,
+                "modeled_bytes": 0,
+                "measured_bytes": 0,
+                "measured_keys": 0,
+                "encodings": {
+                    encoding: {"bytes": 0, "key_overhead": 0, "listpack_keys": 0} for encoding in ENCODINGS
+                },
+                "views": {},
+            },
+        )
+        entity["keys"] += 1
+        for encoding in ENCODINGS:
+            fields = layout(sample, encoding, compressors)
+            overhead, costs, listpack = model.key_cost(
+                sample.key_length, [(n, v) for _, _, n, v in fields], sample.has_ttl
+            )
+            totals = entity["encodings"][encoding]
+            totals["bytes"] += overhead + sum(costs)
+            totals["key_overhead"] += overhead
+            totals["listpack_keys"] += listpack
+
+            seen = set()
+            for (view, kind, _, value_length), cost in zip(fields, costs):
+                stats = entity["views"].setdefault(
+                    view,
+                    {
+                        "entities": 0,
+                        "fields": 0,
+                        "value_bytes": 0,
+                        "types": defaultdict(lambda: {"fields": 0, "bytes": 0}),
+                        "bytes": dict.fromkeys(ENCODINGS, 0),
+                    },
+                )
+                stats["bytes"][encoding] += cost
+                if encoding == "current":
+                    if view not in seen:
+                        stats["entities"] += 1
+                        seen.add(view)
+                    stats["fields"] += 1
+                    stats["value_bytes"] += value_length
+                    stats["types"][kind]["fields"] += 1
+                    stats["types"][kind]["bytes"] += cost
+            if encoding == "current":
+                entity["modeled_bytes"] += overhead + sum(costs)
+                if sample.memory_usage is not None:
+                    entity["measured_bytes"] += sample.memory_usage
+                    entity["measured_keys"] += 1
+    return entities
+
+
+def summarize(entities: dict, counts: dict[str, int]) -> dict:
+    """Per-entity bytes and projections; per-view bytes are per entity that has the view"""
+    summary = {}
+    for entity, stats in entities.items():
+        keys = stats["keys"]
+        modeled_measured = stats["modeled_bytes"] * stats["measured_keys"] / keys
+        calibration = stats["measured_bytes"] / modeled_measured if stats["measured_keys"] else None
+        count = counts.get(entity)
+        views = {}
+        for view, view_stats in sorted(stats["views"].items()):
+            n = max(view_stats["entities"], 1)
+            views[view] = {
+                "coverage": view_stats["entities"] / keys,
+                "fields_per_entity": view_stats["fields"] / n,
+                "value_bytes_per_entity": view_stats["value_bytes"] / n,
+                "bytes_per_entity": {e: b / n for e, b in view_stats["bytes"].items()},
+                "by_type": {
+                    kind: {"fields_per_entity": t["fields"] / n, "bytes_per_entity": t["bytes"] / n}
+                    for kind, t in sorted(view_stats["types"].items(), key=lambda kv: -kv[1]["bytes"])
+                },
+            }
+        encodings = {}
+        for encoding, totals in stats["encodings"].items():
+            per_entity = totals["bytes"] / keys
+            encodings[encoding] = {
+                "bytes_per_entity": per_entity,
+                "key_overhead_per_entity": totals["key_overhead"] / keys,
+                "listpack_share": totals["listpack_keys"] / keys,
+                "projected_bytes": None
+                if count is None
+                else count * per_entity * (calibration or 1.0),
+            }
+        summary[entity] = {
+            "sampled_keys": keys,
+            "entities": count,
+            "calibration": calibration,
+            "encodings": encodings,
+            "views": views,
+        }
+    return summary
+
+
+def print_views(summary: dict):
+    print(f"\n📐 Bytes per entity per view (current layout, per entity that has the view)")
+    for entity, stats in summary.items():
+        print(f"\n   {entity} ({stats['sampled_keys']:,} keys sampled)")
+        for view, view_stats in stats["views"].items():
+            print(
+                f"   {view:<34} {view_stats['coverage']:>5.0%}  "
+                f"{view_stats['fields_per_entity']:>6.1f} fields  "
+                f"{view_stats['value_bytes_per_entity']:>8,.0f} B values  "
+                f"{view_stats['bytes_per_entity']['current']:>9,.0f} B stored"
+            )
+            types = "  ".join(
+                f"{kind} {t['bytes_per_entity']:,.0f}" for kind, t in view_stats["by_type"].items()
+            )
+            print(f"      {types}")
+
+
+def print_encodings(summary: dict):
+    print(f"\n🔁 Bytes per entity per view under each encoding")
+    header = "".join(f"{e:>17}" for e in ENCODINGS)
+    for entity, stats in summary.items():
+        print(f"\n   {entity:<34}{header}")
+        for view, view_stats in stats["views"].items():
+            row = "".join(f"{view_stats['bytes_per_entity'][e]:>17,.0f}" for e in ENCODINGS)
+            print(f"   {view:<34}{row}")
+        overhead = "".join(
+            f"{stats['encodings'][e]['key_overhead_per_entity']:>17,.0f}" for e in ENCODINGS
+        )
+        listpack = "".join(f"{stats['encodings'][e]['listpack_share']:>17.0%}" for e in ENCODINGS)
+        total = "".join(f"{stats['encodings'][e]['bytes_per_entity']:>17,.0f}" for e in ENCODINGS)
+        print(f"   {'(key overhead)':<34}{overhead}")
+        print(f"   {'listpack keys':<34}{listpack}")
+        print(f"   {'total per entity':<34}{total}")
+
+
+def print_projection(summary: dict) -> dict:
+    print(f"\n📈 Projected memory (GB)")
+    print(f"   {'entity':<16}{'entities':>13}{'calibration':>13}" + "".join(f"{e:>17}" for e in ENCODINGS))
+    totals = dict.fromkeys(ENCODINGS, 0.0)
+    for entity, stats in summary.items():
+        if stats["entities"] is None:
+            print(f"   {entity:<16}{'(no count)':>13}")
+            continue
+        calibration = f"{stats['calibration']:.2f}" if stats["calibration"] else "n/a"
+        row = ""
+        for e in ENCODINGS:
+            projected = stats["encodings"][e]["projected_bytes"]
+            totals[e] += projected
+            row += f"{projected / 1e9:>17,.2f}"
+        print(f"   {entity:<16}{stats['entities']:>13,}{calibration:>13}{row}")
+    print(f"   {'total':<42}" + "".join(f"{totals[e] / 1e9:>17,.2f}" for e in ENCODINGS))
+    return totals
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Model and project Redis memory of the online store")
+    parser.add_argument("--connection-string", default="localhost:6379")
+    parser.add_argument("--project", default="instawork_feature_store")
+    parser.add_argument("--samples", type=int, default=2000, help="Keys sampled per entity type")
+    parser.add_argument("--max-scan", type=int, default=1_000_000, help="Keys scanned at most")
+    parser.add_argument("--workers", type=int, default=1_000_000)
+    parser.add_argument("--businesses", type=int, help="Default: workers / 50")
+    parser.add_argument("--shifts", type=int, help="Default: workers * 2")
+    parser.add_argument("--dict-size", type=int, default=16384, help="zstd dictionary size for blob_zstd")
+    parser.add_argument("--level", type=int, default=3, help="zstd level for blob_zstd")
+    parser.add_argument("--output", help="Write the report as JSON to this file")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"Redis Capacity Report ({args.connection_string}, project {args.project})")
+    print("=" * 70)
+
+    started_at = datetime.now(timezone.utc).isoformat()
+    config = repo_config(args.connection_string, args.project, [])
+    client = InstaworkRedisOnlineStore()._get_client(config.online_store)
+    model = redis_model(client)
+    print(
+        f"\n⚙️  hash-max-listpack-entries {model.listpack_entries}, "
+        f"hash-max-listpack-value {model.listpack_value}"
+    )
+
+    catalog, encodings = field_catalog(config, Generations(client, args.project))
+    keys = scan_keys(client, args.project, args.samples, args.max_scan)
+    if not keys:
+        sys.exit(f"❌ No keys of project {args.project} in Redis")
+    sampled = read_keys(client, keys, catalog, encodings)
+    print(f"🔍 Sampled {len(sampled):,} keys: " + ", ".join(f"{e} {len(k):,}" for e, k in keys.items()))
+
+    compressors = train_compressors(sampled, args.dict_size, args.level)
+    counts = {
+        "id_worker_id": args.workers,
+        "id_business_id": args.businesses or args.workers // 50,
+        "id_shift_id": args.shifts or args.workers * 2,
+    }
+    summary = summarize(measure(sampled, model, compressors), counts)
+
+    print_views(summary)
+    print_encodings(summary)
+    totals = print_projection(summary)
+
+    if args.output:
+        memory = client.info("memory")
+        report = {
+            "run": {
+                "started_at": started_at,
+                "host": platform.node(),
+                "python": platform.python_version(),
+                "connection_string": args.connection_string,
+                "project": args.project,
+                "redis_used_memory_bytes": memory.get("used_memory"),
+                "listpack_entries": model.listpack_entries,
+                "listpack_value": model.listpack_value,
+            },
+            "entity_counts": counts,
+            "projected_bytes": totals,
+            "entities": summary,
+        }
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"\n✅ Report written to {args.output}")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""
+Search feature names using the prebuilt feature search index
+
+Bare words match parts of names by prefix. key:value terms filter
+(prefix:, window:, entity:, view:, dtype:, tag:).
+
+Usage:
+    python search_features.py quiz score entity:worker
+    python search_features.py sessions --window lte_7_day --prefix rv_int
+    python search_features.py --values window
+    python search_features.py --build
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from instawork_feast.search import FILTER_KEYS, get_search_index  # noqa: E402
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Search feature names")
+    parser.add_argument("query", nargs="*", help="Words and key:value filters")
+    parser.add_argument("--repo-path", default=".")
+    for key in FILTER_KEYS:
+        parser.add_argument(f"--{key}", help=f"Only features with this {key}")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--values", choices=FILTER_KEYS, help="List the values of a filter key")
+    parser.add_argument("--build", action="store_true", help="Rebuild the search index")
+    parser.add_argument("--refs-only", action="store_true", help="Print refs only, one per line")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = get_search_index(args.repo_path, rebuild=args.build)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    if args.build:
+        print(f"✅ Indexed {len(index)} features in {load_ms:.1f} ms")
+        if not args.query:
+            sys.exit(0)
+
+    if args.values:
+        for value in index.values(args.values):
+            print(value)
+        sys.exit(0)
+
+    filters = {key: getattr(args, key) for key in FILTER_KEYS}
+    start = time.perf_counter()
+    matches = index.search(" ".join(args.query), **filters)
+    search_us = (time.perf_counter() - start) * 1e6
+
+    if args.refs_only:
+        print("\n".join(matches[: args.limit]))
+        sys.exit(0)
+
+    dtypes = dict(zip(index.refs, index.dtypes))
+    print(f"🔍 {len(matches)} features match ({search_us:.0f} µs)\n")
+    for ref in matches[: args.limit]:
+        print(f"   {ref:<70} {dtypes[ref]}")
+    if len(matches) > args.limit:
+        print(f"\n   ... {len(matches) - args.limit} more (use --limit)")
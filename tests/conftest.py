@@ -0,0 +1,122 @@
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+import fakeredis
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from feast import Entity, FeatureStore, FeatureView, Field, FileSource, RepoConfig  # noqa: E402
+from feast.types import Float64, Int32, Int64, String  # noqa: E402
+from feast.value_type import ValueType  # noqa: E402
+
+from instawork_feast.online_store import STORE_TYPE, InstaworkRedisOnlineStore  # noqa: E402
+
+PROJECT = "test_project"
+
+FEATURE_STORE_YAML = f"""project: {PROJECT}
+registry: data/registry.db
+provider: local
+online_store:
+  type: {STORE_TYPE}
+  connection_string: localhost:6379
+offline_store:
+  type: file
+entity_key_serialization_version: 3
+"""
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis()
+
+
+@pytest.fixture
+def repo_config(tmp_path):
+    """RepoConfig factory for the Instawork online store, with online store options"""
+
+    def make(**online_store) -> RepoConfig:
+        return RepoConfig(
+            project=PROJECT,
+            provider="local",
+            registry=str(tmp_path / "registry.db"),
+            online_store={"type": STORE_TYPE, **online_store},
+            entity_key_serialization_version=3,
+        )
+
+    return make
+
+
+@pytest.fixture
+def online_store(redis_client):
+    """Online store factory; each store starts with empty caches"""
+
+    def make() -> InstaworkRedisOnlineStore:
+        store = InstaworkRedisOnlineStore()
+        store._client = redis_client
+        return store
+
+    return make
+
+
+WORKER = Entity(name="worker", join_keys=["id_worker_id"], value_type=ValueType.INT64)
+
+
+def worker_view(name: str, schema: list, ttl: timedelta = timedelta(0), tags: dict = None):
+    """A view of the worker entity over data/<name>.parquet"""
+    return FeatureView(
+        name=name,
+        entities=[WORKER],
+        ttl=ttl,
+        schema=[Field(name="id_worker_id", dtype=Int64), *schema],
+        source=FileSource(path=f"data/{name}.parquet", timestamp_field="ts_ds"),
+        tags=tags or {},
+    )
+
+
+@pytest.fixture
+def feature_repo(tmp_path, redis_client):
+    """
+    A feature repo with two worker views applied to a file registry
+
+    pro_attire_features keeps a 2 day TTL; its online store reads fakeredis.
+    """
+    repo = tmp_path / "repo"
+    (repo / "data").mkdir(parents=True)
+    (repo / "feature_views").mkdir()
+    (repo / "feature_store.yaml").write_text(FEATURE_STORE_YAML)
+
+    attire = worker_view(
+        "pro_attire_features",
+        [
+            Field(name="rv_int_offshift_num_accepted_attires", dtype=Int64),
+            Field(name="rv_int_offshift_num_attire_submissions", dtype=Int64),
+            Field(name="rv_float_attire_acceptance_rate", dtype=Float64),
+            Field(name="mc_str_attire_status", dtype=String),
+        ],
+        ttl=timedelta(days=2),
+    )
+    sessions = worker_view(
+        "pro_session_features",
+        [
+            Field(name="rv_int_num_sessions_lte_7_day", dtype=Int64),
+            Field(name="rv_float_avg_session_minutes", dtype=Float64),
+            Field(name="b_has_session", dtype=Int32),
+        ],
+        tags={"team": "growth"},
+    )
+    store = FeatureStore(repo_path=str(repo))
+    store.apply([WORKER, attire, sessions])
+    store._get_provider().online_store._client = redis_client
+    return store
+
+
+def write_parquet(store: FeatureStore, view_name: str, rows: list[dict]):
+    """data/<view>.parquet of a repo from rows with a ts_ds date string"""
+    frame = pd.DataFrame(rows)
+    frame["ts_ds"] = pd.to_datetime(frame["ts_ds"])
+    frame.to_parquet(Path(store.repo_path) / "data" / f"{view_name}.parquet", index=False)
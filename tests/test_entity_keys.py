@@ -0,0 +1,197 @@
+import fnmatch
+
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import PROJECT, worker_view
+from feast import Field
+from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.types import Int64
+from feast.value_type import ValueType
+
+import migrate_entity_keys
+from instawork_feast.entity_keys import (
+    IntEntityKeys,
+    compact_key,
+    feast_key,
+    key_patterns,
+    parse_redis_key,
+    redis_keys,
+    serialize_compact_keys,
+    serialize_int_keys,
+)
+from instawork_feast.online_store import InstaworkRedisOnlineStore
+
+NOW = pd.Timestamp("2024-01-02", tz="UTC").to_pydatetime()
+
+
+def proto_key(worker_id: int, kind: str = "int64_val") -> EntityKeyProto:
+    return EntityKeyProto(join_keys=["id_worker_id"], entity_values=[ValueProto(**{kind: worker_id})])
+
+
+@pytest.fixture
+def feature_view():
+    return worker_view("pro_test_features", [Field(name="rv_int_shifts", dtype=Int64)])
+
+
+def store(client) -> InstaworkRedisOnlineStore:
+    online_store = InstaworkRedisOnlineStore()
+    online_store._client = client
+    return online_store
+
+
+def write(client, cfg, feature_view, rows: dict[int, int], timestamp=NOW):
+    data = [
+        (proto_key(worker_id), {"rv_int_shifts": ValueProto(int64_val=shifts)}, timestamp, None)
+        for worker_id, shifts in rows.items()
+    ]
+    store(client).online_write_batch(cfg, feature_view, data, None)
+
+
+def read(client, cfg, feature_view, ids) -> list:
+    frame = store(client).read_frame(
+        cfg, feature_view, IntEntityKeys("id_worker_id", ValueType.INT64, np.array(ids)), ["rv_int_shifts"]
+    )
+    return [None if pd.isna(v) else int(v) for v in frame["rv_int_shifts"]]
+
+
+# ------------------------------------------------------------- key format
+
+
+@pytest.mark.parametrize("value_type, kind", [(ValueType.INT64, "int64_val"), (ValueType.INT32, "int32_val")])
+def test_int_keys_match_feast(value_type, kind):
+    ids = np.array([0, 7, -3, 2**31 - 1])
+    expected = [
+        serialize_entity_key(proto_key(int(i), kind), entity_key_serialization_version=3) + PROJECT.encode()
+        for i in ids
+    ]
+    assert serialize_int_keys("id_worker_id", value_type, ids, PROJECT) == expected
+    assert redis_keys([proto_key(int(i), kind) for i in ids], PROJECT, cache=None) == expected
+
+
+def test_compact_keys_round_trip():
+    ids = np.array([1, -5, 2**31 - 1, 2**31])
+    keys = serialize_compact_keys("id_worker_id", ids, PROJECT)
+    assert [len(k) for k in keys[:3]] == [6 + len(PROJECT)] * 3
+
+    parsed = [parse_redis_key(k, PROJECT) for k in keys]
+    assert [p.values[0] for p in parsed] == ids.tolist()
+    assert [p.compact for p in parsed] == [True, True, True, False]
+    # Ids outside Int32 keep Feast's Int64 key
+    assert keys[3] == serialize_int_keys("id_worker_id", ValueType.INT64, ids[3:], PROJECT)[0]
+
+    feast = feast_key(parsed[0], PROJECT, ValueType.INT32)
+    assert feast == serialize_int_keys("id_worker_id", ValueType.INT32, ids[:1], PROJECT)[0]
+    assert compact_key(parse_redis_key(feast, PROJECT), PROJECT) == keys[0]
+
+
+def test_int32_and_int64_protos_share_a_compact_key():
+    int64 = redis_keys([proto_key(42)], PROJECT, cache=None, compact=True)
+    int32 = redis_keys([proto_key(42, "int32_val")], PROJECT, cache=None, compact=True)
+    assert int64 == int32 == serialize_compact_keys("id_worker_id", np.array([42]), PROJECT)
+
+
+def test_parse_redis_key_rejects_other_keys():
+    assert parse_redis_key(b"garbage" + PROJECT.encode(), PROJECT) is None
+    assert parse_redis_key(serialize_compact_keys("id_worker_id", np.array([1]), "other")[0], PROJECT) is None
+
+
+def test_key_patterns_match_both_formats():
+    feast = serialize_int_keys("id_worker_id", ValueType.INT64, np.array([3]), PROJECT)[0]
+    compact = serialize_compact_keys("id_worker_id", np.array([3]), PROJECT)[0]
+    shift = serialize_compact_keys("id_shift_id", np.array([3]), PROJECT)[0]
+    patterns = key_patterns(["id_worker_id"], PROJECT)
+
+    def matches(key):
+        text = key.decode("latin-1")
+        return any(fnmatch.fnmatchcase(text, p.decode("latin-1")) for p in patterns)
+
+    assert matches(feast) and matches(compact)
+    assert not matches(shift)
+
+
+def test_key_patterns_scan(redis_client):
+    keys = serialize_compact_keys("id_worker_id", np.array([1, 2]), PROJECT)
+    keys += serialize_int_keys("id_worker_id", ValueType.INT64, np.array([3]), PROJECT)
+    keys += serialize_compact_keys("id_business_id", np.array([1]), PROJECT)
+    for key in keys:
+        redis_client.hset(key, "f", "v")
+
+    found = set()
+    for pattern in key_patterns(["id_worker_id"], PROJECT):
+        found.update(redis_client.scan_iter(match=pattern))
+    assert found == set(keys[:3])
+
+
+# ------------------------------------------------------- fallback reads
+
+
+def test_compact_reads_fall_back_to_feast_keys(repo_config, redis_client, feature_view):
+    feast_cfg = repo_config()
+    compact_cfg = repo_config(entity_key_format="compact")
+    fallback_cfg = repo_config(entity_key_format="compact", entity_key_fallback=True)
+
+    write(redis_client, feast_cfg, feature_view, {1: 10, 2: 20})
+    write(redis_client, compact_cfg, feature_view, {2: 21, 3: 30}, NOW + pd.Timedelta(days=1))
+
+    assert read(redis_client, feast_cfg, feature_view, [1, 2, 3]) == [10, 20, None]
+    assert read(redis_client, compact_cfg, feature_view, [1, 2, 3]) == [None, 21, 30]
+    # Entities without a compact key are read under their Feast key
+    assert read(redis_client, fallback_cfg, feature_view, [1, 2, 3, 4]) == [10, 21, 30, None]
+
+
+def test_fallback_reads_int32_feast_keys(repo_config, redis_client, feature_view):
+    key = serialize_int_keys("id_worker_id", ValueType.INT32, np.array([5]), PROJECT)[0]
+    int64_key = serialize_int_keys("id_worker_id", ValueType.INT64, np.array([5]), PROJECT)[0]
+    write(redis_client, repo_config(), feature_view, {5: 50})
+    redis_client.rename(int64_key, key)
+
+    fallback_cfg = repo_config(entity_key_format="compact", entity_key_fallback=True)
+    assert read(redis_client, fallback_cfg, feature_view, [5]) == [50]
+
+
+# ------------------------------------------------------------- migration
+
+
+def test_migrate_moves_and_merges(repo_config, redis_client, feature_view):
+    feast_cfg = repo_config()
+    compact_cfg = repo_config(entity_key_format="compact")
+    write(redis_client, feast_cfg, feature_view, {1: 10, 2: 20, 3: 30})
+    # Entity 2 was already rewritten by a writer on compact keys
+    write(redis_client, compact_cfg, feature_view, {2: 21}, NOW + pd.Timedelta(days=1))
+    feast_keys = serialize_int_keys("id_worker_id", ValueType.INT64, np.array([1, 2, 3]), PROJECT)
+    redis_client.pexpire(feast_keys[0], 3_600_000)
+
+    stats = migrate_entity_keys.migrate(redis_client, PROJECT, batch=2)
+
+    assert (stats.scanned, stats.moved, stats.merged, stats.errors) == (4, 2, 1, 0)
+    assert redis_client.dbsize() == 3
+    assert not any(redis_client.exists(key) for key in feast_keys)
+    # The target key's fields win over the moved ones
+    assert read(redis_client, compact_cfg, feature_view, [1, 2, 3]) == [10, 21, 30]
+
+    compact_keys = serialize_compact_keys("id_worker_id", np.array([1, 2, 3]), PROJECT)
+    assert 0 < redis_client.pttl(compact_keys[0]) <= 3_600_000
+    assert redis_client.pttl(compact_keys[2]) == -1
+
+
+def test_migrate_rerun_skips_moved_keys(repo_config, redis_client, feature_view):
+    write(redis_client, repo_config(), feature_view, {1: 10, 2: 20})
+    migrate_entity_keys.migrate(redis_client, PROJECT)
+    before = {key: redis_client.hgetall(key) for key in redis_client.keys()}
+
+    stats = migrate_entity_keys.migrate(redis_client, PROJECT)
+
+    assert (stats.scanned, stats.skipped, stats.moved, stats.merged) == (2, 2, 0, 0)
+    assert {key: redis_client.hgetall(key) for key in redis_client.keys()} == before
+
+
+def test_migrate_back_to_feast_keys(repo_config, redis_client, feature_view):
+    write(redis_client, repo_config(entity_key_format="compact"), feature_view, {1: 10})
+
+    stats = migrate_entity_keys.migrate(redis_client, PROJECT, to="feast", value_type=ValueType.INT32)
+
+    assert stats.moved == 1
+    assert redis_client.keys() == serialize_int_keys("id_worker_id", ValueType.INT32, np.array([1]), PROJECT)
@@ -0,0 +1,122 @@
+from datetime import datetime, timezone
+
+import pytest
+from conftest import PROJECT, worker_view
+from feast import Field
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.types import Int64
+
+from instawork_feast.generations import (
+    GarbageCollector,
+    Generation,
+    abandon_generations,
+    allocate_generation,
+    generation_keys,
+    retired_generations,
+    switch_generation,
+    write_generation,
+)
+
+NOW = datetime(2024, 1, 2, tzinfo=timezone.utc)
+VIEW = "pro_test_features"
+FEATURES = ["rv_int_shifts"]
+
+
+@pytest.fixture
+def feature_view():
+    return worker_view(VIEW, [Field(name="rv_int_shifts", dtype=Int64)])
+
+
+@pytest.fixture
+def config(repo_config):
+    return repo_config(online_generations=True, generation_cache_seconds=0)
+
+
+def proto_key(worker_id: int) -> EntityKeyProto:
+    return EntityKeyProto(join_keys=["id_worker_id"], entity_values=[ValueProto(int64_val=worker_id)])
+
+
+def write(store, config, feature_view, shifts: dict[int, int]):
+    rows = [
+        (proto_key(worker_id), {"rv_int_shifts": ValueProto(int64_val=value)}, NOW, None)
+        for worker_id, value in shifts.items()
+    ]
+    store.online_write_batch(config, feature_view, rows, None)
+
+
+def read(store, config, feature_view, worker_ids: list[int]) -> list:
+    # RedisOnlineStore appends the "_ts" field to the requested features
+    results = store.online_read(config, feature_view, [proto_key(i) for i in worker_ids], list(FEATURES))
+    return [
+        values["rv_int_shifts"].int64_val if values and values["rv_int_shifts"].WhichOneof("val") else None
+        for _, values in results
+    ]
+
+
+def test_switch_moves_readers_to_the_new_generation(redis_client, config, online_store, feature_view):
+    store = online_store()
+    write(store, config, feature_view, {1: 10, 2: 20})
+
+    generation = allocate_generation(redis_client, PROJECT, VIEW, FEATURES)
+    assert generation == 1
+    with write_generation(VIEW, generation):
+        write(store, config, feature_view, {1: 11, 2: 21})
+    assert read(store, config, feature_view, [1, 2]) == [10, 20]
+
+    retired = switch_generation(redis_client, PROJECT, VIEW, generation, FEATURES, in_place_features=FEATURES)
+
+    assert read(store, config, feature_view, [1, 2]) == [11, 21]
+    assert retired == Generation(VIEW, 0, tuple(FEATURES), retired.at)
+    assert retired_generations(redis_client, PROJECT, VIEW) == [retired]
+    assert not redis_client.hgetall(generation_keys(PROJECT)[3])
+
+
+def test_garbage_collection_deletes_the_retired_generation(redis_client, config, online_store, feature_view):
+    store = online_store()
+    write(store, config, feature_view, {1: 10, 2: 20})
+    generation = allocate_generation(redis_client, PROJECT, VIEW, FEATURES)
+    with write_generation(VIEW, generation):
+        write(store, config, feature_view, {1: 11, 2: 21})
+    retired = switch_generation(redis_client, PROJECT, VIEW, generation, FEATURES)
+
+    collector = GarbageCollector(redis_client, PROJECT, grace_seconds=0)
+    collector.schedule(retired, ["id_worker_id"])
+    collections = collector.wait()
+
+    assert [(c.generation, c.keys_changed, c.error) for c in collections] == [(0, 2, None)]
+    assert retired_generations(redis_client, PROJECT, VIEW) == []
+    key = store._generate_redis_keys_for_entities(config, [proto_key(1)])[0]
+    feature, _, ts = Generation(VIEW, generation, tuple(FEATURES)).hash_fields()
+    assert set(redis_client.hkeys(key)) == {feature, ts}
+    assert read(store, config, feature_view, [1, 2]) == [11, 21]
+
+
+def test_a_second_switch_retires_the_first_generation(redis_client, config, online_store, feature_view):
+    store = online_store()
+    for shifts in (12, 13):
+        generation = allocate_generation(redis_client, PROJECT, VIEW, FEATURES)
+        with write_generation(VIEW, generation):
+            write(store, config, feature_view, {1: shifts})
+        retired = switch_generation(redis_client, PROJECT, VIEW, generation, FEATURES)
+
+    assert (retired.generation, generation) == (1, 2)
+    assert [g.generation for g in retired_generations(redis_client, PROJECT, VIEW)] == [0, 1]
+    assert read(store, config, feature_view, [1]) == [13]
+
+
+def test_abandoned_generations_are_retired(redis_client, config, online_store, feature_view):
+    store = online_store()
+    write(store, config, feature_view, {1: 10})
+    generation = allocate_generation(redis_client, PROJECT, VIEW, FEATURES)
+    with write_generation(VIEW, generation):
+        write(store, config, feature_view, {1: 11})
+
+    abandoned = abandon_generations(redis_client, PROJECT, VIEW)
+
+    assert [g.generation for g in abandoned] == [generation]
+    assert retired_generations(redis_client, PROJECT, VIEW) == abandoned
+    assert not redis_client.hgetall(generation_keys(PROJECT)[3])
+    assert read(store, config, feature_view, [1]) == [10]
+    # Generation numbers are never handed out twice
+    assert allocate_generation(redis_client, PROJECT, VIEW, FEATURES) == generation + 1
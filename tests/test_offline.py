@@ -0,0 +1,105 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from conftest import write_parquet
+from feast.errors import FeatureNameCollisionError
+
+from instawork_feast.offline import get_historical_features_local
+
+ACCEPTED = "pro_attire_features:rv_int_offshift_num_accepted_attires"
+STATUS = "pro_attire_features:mc_str_attire_status"
+SESSIONS = "pro_session_features:rv_int_num_sessions_lte_7_day"
+
+
+def attire(worker_id: int, ts_ds: str, accepted: int, status: str) -> dict:
+    return {
+        "id_worker_id": worker_id,
+        "ts_ds": ts_ds,
+        "rv_int_offshift_num_accepted_attires": accepted,
+        "mc_str_attire_status": status,
+    }
+
+
+@pytest.fixture
+def data_dir(feature_repo):
+    write_parquet(
+        feature_repo,
+        "pro_attire_features",
+        [
+            attire(1, "2024-01-01", 1, "pending"),
+            attire(1, "2024-01-03", 2, "approved"),
+            attire(2, "2024-01-01", 5, "rejected"),
+        ],
+    )
+    write_parquet(
+        feature_repo,
+        "pro_session_features",
+        [
+            {"id_worker_id": 1, "ts_ds": "2023-06-01", "rv_int_num_sessions_lte_7_day": 4},
+            {"id_worker_id": 2, "ts_ds": "2024-01-02", "rv_int_num_sessions_lte_7_day": 7},
+        ],
+    )
+    return str(Path(feature_repo.repo_path) / "data")
+
+
+def entity_df(rows: list[tuple[int, str]]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "id_worker_id": [worker_id for worker_id, _ in rows],
+            "event_timestamp": pd.to_datetime([ts for _, ts in rows], utc=True),
+        }
+    )
+
+
+def test_latest_row_within_the_ttl(feature_repo, data_dir):
+    entities = entity_df(
+        [
+            (1, "2024-01-02"),  # the 01-01 row
+            (1, "2024-01-04"),  # the 01-03 row
+            (1, "2023-12-31"),  # before the first row
+            (2, "2024-01-02"),  # within the 2 day TTL
+            (2, "2024-01-04"),  # 3 days after the only row
+        ]
+    )
+
+    result = get_historical_features_local(feature_repo, entities, [ACCEPTED, STATUS], data_dir=data_dir)
+
+    assert list(result.columns) == [
+        "id_worker_id",
+        "event_timestamp",
+        "rv_int_offshift_num_accepted_attires",
+        "mc_str_attire_status",
+    ]
+    assert result["id_worker_id"].tolist() == [1, 1, 1, 2, 2]
+    accepted = result["rv_int_offshift_num_accepted_attires"]
+    assert [None if pd.isna(v) else int(v) for v in accepted] == [1, 2, None, 5, None]
+    assert result["mc_str_attire_status"].tolist()[:2] == ["pending", "approved"]
+
+
+def test_views_without_ttl_reach_back_to_the_first_row(feature_repo, data_dir):
+    entities = entity_df([(1, "2024-01-04"), (2, "2024-01-01")])
+
+    result = get_historical_features_local(
+        feature_repo, entities, [SESSIONS, ACCEPTED], data_dir=data_dir, full_feature_names=True
+    )
+
+    sessions = result["pro_session_features__rv_int_num_sessions_lte_7_day"]
+    assert [None if pd.isna(v) else int(v) for v in sessions] == [4, None]
+    assert result["pro_attire_features__rv_int_offshift_num_accepted_attires"].tolist() == [2, 5]
+
+
+def test_ttl_override(feature_repo, data_dir):
+    entities = entity_df([(2, "2024-01-04")])
+
+    result = get_historical_features_local(
+        feature_repo, entities, [ACCEPTED], data_dir=data_dir, ttl=pd.Timedelta(days=7)
+    )
+
+    assert result["rv_int_offshift_num_accepted_attires"].tolist() == [5]
+
+
+def test_feature_name_collisions(feature_repo, data_dir):
+    refs = [ACCEPTED, "pro_session_features:rv_int_offshift_num_accepted_attires"]
+    with pytest.raises(FeatureNameCollisionError):
+        get_historical_features_local(feature_repo, entity_df([(1, "2024-01-02")]), refs, data_dir=data_dir)
@@ -0,0 +1,206 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+from conftest import worker_view
+from feast import Field
+from feast.infra.online_stores.helpers import _mmh3
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.types import Float64, Int64, String, UnixTimestamp
+from feast.value_type import ValueType
+
+from instawork_feast.entity_keys import IntEntityKeys
+from instawork_feast.online_store import COMPRESSED_FIELD
+
+NOW = datetime(2024, 1, 2, tzinfo=timezone.utc)
+DAY = 86400
+FIRST_SHIFT = 19_700 * DAY  # 2023-12-09
+LAST_SESSION = 1_704_153_600 + 3_723  # 2024-01-02 01:02:03
+
+
+def proto_key(worker_id: int) -> EntityKeyProto:
+    return EntityKeyProto(join_keys=["id_worker_id"], entity_values=[ValueProto(int64_val=worker_id)])
+
+
+@pytest.fixture
+def feature_view():
+    return worker_view(
+        "pro_core_features",
+        [
+            Field(name="mc_str_worker_level", dtype=String),
+            Field(name="ts_first_shift_date", dtype=UnixTimestamp, tags={"online_encoding": "epoch_days"}),
+            Field(
+                name="ts_last_session_time", dtype=UnixTimestamp, tags={"online_encoding": "epoch_seconds"}
+            ),
+            Field(name="rv_float_avg_rating", dtype=Float64, tags={"online_encoding": "float32"}),
+            Field(name="rv_int_num_shifts", dtype=Int64),
+        ],
+    )
+
+
+# Copied into online_read, which appends the "_ts" field to the requested features
+FEATURES = [
+    "mc_str_worker_level",
+    "ts_first_shift_date",
+    "ts_last_session_time",
+    "rv_float_avg_rating",
+    "rv_int_num_shifts",
+]
+
+
+def row(worker_id: int, level: str, rating: float, shifts: int, ts: datetime = NOW):
+    values = {
+        "mc_str_worker_level": ValueProto(string_val=level),
+        "ts_first_shift_date": ValueProto(unix_timestamp_val=FIRST_SHIFT + worker_id * DAY),
+        "ts_last_session_time": ValueProto(unix_timestamp_val=LAST_SESSION),
+        "rv_float_avg_rating": ValueProto(double_val=rating),
+        "rv_int_num_shifts": ValueProto(int64_val=shifts),
+    }
+    return proto_key(worker_id), values, ts, None
+
+
+ROWS = [row(1, "gold", 4.75, 10), row(2, "silver", 3.5, 3), row(3, "gold", 1.1, 0)]
+
+
+def stored(redis_client, store, config, feature_view, worker_id: int, feature: str) -> ValueProto:
+    key = store._generate_redis_keys_for_entities(config, [proto_key(worker_id)])[0]
+    raw = redis_client.hget(key, _mmh3(f"{feature_view.name}:{feature}"))
+    value = ValueProto()
+    value.ParseFromString(raw)
+    return value
+
+
+# ------------------------------------------------------------- encodings
+
+
+def test_values_are_stored_compactly(redis_client, repo_config, online_store, feature_view):
+    config = repo_config()
+    store = online_store()
+    store.online_write_batch(config, feature_view, ROWS, None)
+
+    level = stored(redis_client, store, config, feature_view, 1, "mc_str_worker_level")
+    assert level.WhichOneof("val") == "int32_val"
+    first_shift = stored(redis_client, store, config, feature_view, 1, "ts_first_shift_date")
+    assert first_shift.int32_val == FIRST_SHIFT // DAY + 1
+    last_session = stored(redis_client, store, config, feature_view, 1, "ts_last_session_time")
+    assert last_session.unix_timestamp_val == LAST_SESSION
+    rating = stored(redis_client, store, config, feature_view, 1, "rv_float_avg_rating")
+    assert rating.WhichOneof("val") == "float_val"
+
+
+def test_online_read_decodes_every_encoding(repo_config, online_store, feature_view):
+    config = repo_config()
+    online_store().online_write_batch(config, feature_view, ROWS, None)
+
+    # A new store reads the interned dictionary back from Redis
+    results = online_store().online_read(
+        config, feature_view, [proto_key(1), proto_key(2), proto_key(99)], list(FEATURES)
+    )
+
+    first = results[0][1]
+    assert first["mc_str_worker_level"].string_val == "gold"
+    assert results[1][1]["mc_str_worker_level"].string_val == "silver"
+    assert first["ts_first_shift_date"].unix_timestamp_val == FIRST_SHIFT + DAY
+    assert first["ts_last_session_time"].unix_timestamp_val == LAST_SESSION
+    assert first["rv_float_avg_rating"].float_val == pytest.approx(4.75)
+    assert first["rv_int_num_shifts"].int64_val == 10
+    assert not any(v.WhichOneof("val") for v in results[2][1].values())
+
+
+def test_read_frame_decodes_columns(repo_config, online_store, feature_view):
+    config = repo_config()
+    online_store().online_write_batch(config, feature_view, ROWS, None)
+
+    frame = online_store().read_frame(
+        config, feature_view, IntEntityKeys("id_worker_id", ValueType.INT64, np.array([2, 99, 1])), FEATURES
+    )
+
+    level = frame["mc_str_worker_level"]
+    assert isinstance(level.dtype, pd.CategoricalDtype)
+    assert level.tolist()[0] == "silver" and pd.isna(level[1]) and level[2] == "gold"
+    assert frame["ts_first_shift_date"].dtype == "datetime64[s]"
+    assert frame["ts_first_shift_date"][0] == pd.Timestamp(FIRST_SHIFT + 2 * DAY, unit="s")
+    assert pd.isna(frame["ts_first_shift_date"][1])
+    assert frame["ts_last_session_time"][2] == pd.Timestamp(LAST_SESSION, unit="s")
+    assert frame["rv_float_avg_rating"].dtype == np.float32
+    assert frame["rv_float_avg_rating"][2] == np.float32(4.75)
+    assert frame["rv_int_num_shifts"].tolist()[::2] == [3, 10]
+
+
+def test_strings_past_the_dictionary_limit_stay_plain(repo_config, online_store, feature_view):
+    config = repo_config(intern_max_values=1)
+    online_store().online_write_batch(config, feature_view, ROWS, None)
+
+    results = online_store().online_read(config, feature_view, [proto_key(1), proto_key(2)], FEATURES[:1])
+
+    assert [r[1]["mc_str_worker_level"].string_val for r in results] == ["gold", "silver"]
+
+
+# ----------------------------------------------------------- compression
+
+
+def test_compressed_view_round_trip(redis_client, repo_config, online_store, feature_view):
+    pytest.importorskip("zstandard")
+    config = repo_config(compress_views=[feature_view.name], compress_fallback=False)
+    online_store().online_write_batch(config, feature_view, ROWS, None)
+
+    key = online_store()._generate_redis_keys_for_entities(config, [proto_key(1)])[0]
+    assert set(redis_client.hkeys(key)) == {
+        _mmh3(f"{feature_view.name}:{COMPRESSED_FIELD}"),
+        f"_ts:{feature_view.name}".encode(),
+    }
+    results = online_store().online_read(config, feature_view, [proto_key(1), proto_key(3)], list(FEATURES))
+    assert results[0][1]["mc_str_worker_level"].string_val == "gold"
+    assert results[1][1]["rv_float_avg_rating"].float_val == pytest.approx(1.1)
+
+
+def test_compression_falls_back_to_per_feature_fields(redis_client, repo_config, online_store, feature_view):
+    pytest.importorskip("zstandard")
+    uncompressed = repo_config()
+    compressed = repo_config(compress_views=[feature_view.name])
+    online_store().online_write_batch(uncompressed, feature_view, ROWS, None)
+    expected = online_store().read_frame(
+        uncompressed, feature_view, IntEntityKeys("id_worker_id", ValueType.INT64, np.array([1, 2, 3])), FEATURES
+    )
+
+    # Entity 1 is rewritten compressed, the others keep per-feature fields
+    rewrite = [row(1, "gold", 4.75, 10, ts=NOW + timedelta(hours=1))]
+    online_store().online_write_batch(compressed, feature_view, rewrite, None)
+    key = online_store()._generate_redis_keys_for_entities(compressed, [proto_key(1)])[0]
+    assert len(redis_client.hkeys(key)) == 2
+
+    frame = online_store().read_frame(
+        compressed, feature_view, IntEntityKeys("id_worker_id", ValueType.INT64, np.array([1, 2, 3])), FEATURES
+    )
+    pd.testing.assert_frame_equal(frame, expected)
+    results = online_store().online_read(compressed, feature_view, [proto_key(2)], list(FEATURES))
+    assert results[0][1]["rv_int_num_shifts"].int64_val == 3
+
+    # Without the fallback, entities without a blob read as missing
+    no_fallback = repo_config(compress_views=[feature_view.name], compress_fallback=False)
+    results = online_store().online_read(no_fallback, feature_view, [proto_key(1), proto_key(2)], list(FEATURES))
+    assert results[0][1]["rv_int_num_shifts"].int64_val == 10
+    assert not results[1][1]["rv_int_num_shifts"].WhichOneof("val")
+
+
+# ------------------------------------------------------------- throttle
+
+
+def test_throttled_writes_are_chunked(repo_config, online_store, feature_view):
+    config = repo_config(write_rows_per_second=1_000_000, write_burst_rows=2)
+    store = online_store()
+    chunks = []
+    write_prepared = store._write_prepared
+
+    def record(config, table, data, progress):
+        chunks.append(len(data))
+        return write_prepared(config, table, data, progress)
+
+    store._write_prepared = record
+    store.online_write_batch(config, feature_view, ROWS, None)
+
+    assert chunks == [2, 1]
+    results = online_store().online_read(config, feature_view, [proto_key(3)], ["rv_int_num_shifts"])
+    assert results[0][1]["rv_int_num_shifts"].int64_val == 0
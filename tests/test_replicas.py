@@ -0,0 +1,138 @@
+from datetime import datetime, timezone
+
+import fakeredis
+import pytest
+from conftest import worker_view
+from feast import Field
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.types import Int64
+from redis.exceptions import ConnectionError
+
+from instawork_feast.replicas import ReplicaPool, replica_health
+from instawork_feast.throttle import TokenBucket
+
+MB = 1024 * 1024
+
+
+class Node(fakeredis.FakeRedis):
+    """A fake Redis node reporting a replication role and offset"""
+
+    def __init__(self, offset: int, role: str = "slave", link: str = "up", **kwargs):
+        super().__init__(**kwargs)
+        self.offset = offset
+        self.role = role
+        self.link = link
+        self.reads = 0
+
+    def info(self, section=None, *args, **kwargs):
+        if self.role == "master":
+            return {"role": "master", "master_repl_offset": self.offset}
+        return {"role": self.role, "master_link_status": self.link, "slave_repl_offset": self.offset}
+
+
+class Down(Node):
+    def hmget(self, *args, **kwargs):
+        raise ConnectionError("connection refused")
+
+
+@pytest.fixture
+def pool():
+    def make(replicas: dict[str, Node], max_lag_bytes: int = MB) -> ReplicaPool:
+        primary = Node(10 * MB, role="master")
+        primary.set("k", "primary")
+        for name, replica in replicas.items():
+            replica.set("k", name)
+            replica.hset("h", "f", name)
+        replica_pool = ReplicaPool(primary, replicas, check_seconds=3600, max_lag_bytes=max_lag_bytes)
+        # Checks run when a test asks for them
+        replica_pool.stop()
+        replica_pool.check()
+        return replica_pool
+
+    return make
+
+
+def read(client):
+    return client.get("k").decode()
+
+
+def test_replica_health():
+    assert replica_health(Node(10 * MB), 10 * MB, MB) == (True, "ok")
+    assert replica_health(Node(9 * MB), 10 * MB, MB) == (True, "ok")
+    assert replica_health(Node(9 * MB - 1), 10 * MB, MB)[0] is False
+    assert replica_health(Node(0), None, MB) == (True, "ok")
+    assert replica_health(Node(10 * MB, link="down"), 10 * MB, MB) == (False, "link to primary is down")
+    assert replica_health(Node(10 * MB, role="master"), 10 * MB, MB) == (False, "role is master")
+
+
+def test_reads_rotate_over_healthy_replicas(pool):
+    replicas = pool({"a": Node(10 * MB), "lagging": Node(0), "b": Node(10 * MB - 1)})
+
+    assert replicas.healthy() == ["a", "b"]
+    assert sorted(replicas.execute(read) for _ in range(4)) == ["a", "a", "b", "b"]
+
+
+def test_failed_replica_is_skipped(pool):
+    replicas = pool({"down": Down(10 * MB), "b": Node(10 * MB)})
+
+    def hmget(client):
+        return client.hmget("h", ["f"])
+
+    assert [replicas.execute(hmget) for _ in range(2)] == [[b"b"], [b"b"]]
+    assert replicas.healthy() == ["b"]
+
+
+def test_reads_fall_back_to_the_primary(pool):
+    replicas = pool({"lagging": Node(0), "syncing": Node(10 * MB, link="down")})
+
+    assert replicas.healthy() == []
+    assert replicas.execute(read) == "primary"
+
+
+def test_lagging_replica_recovers_on_the_next_check(pool):
+    lagging = Node(0)
+    replicas = pool({"a": lagging})
+    assert replicas.execute(read) == "primary"
+
+    lagging.offset = 10 * MB
+    replicas.check()
+
+    assert replicas.execute(read) == "a"
+
+
+def test_online_reads_go_to_a_healthy_replica(repo_config, online_store, redis_client):
+    config = repo_config(read_replicas=["replica:6379"])
+    feature_view = worker_view("pro_test_features", [Field(name="rv_int_shifts", dtype=Int64)])
+    key = EntityKeyProto(join_keys=["id_worker_id"], entity_values=[ValueProto(int64_val=1)])
+    store = online_store()
+    store.online_write_batch(
+        config,
+        feature_view,
+        [(key, {"rv_int_shifts": ValueProto(int64_val=10)}, datetime(2024, 1, 2, tzinfo=timezone.utc), None)],
+        None,
+    )
+    # The replica has not received the write yet
+    replica = Node(0)
+    store._replicas = ReplicaPool(redis_client, {"replica": replica}, check_seconds=3600)
+    store._replicas.stop()
+
+    def shifts():
+        _, values = store.online_read(config, feature_view, [key], ["rv_int_shifts"])[0]
+        return values["rv_int_shifts"].int64_val if values["rv_int_shifts"].WhichOneof("val") else None
+
+    assert shifts() is None
+    # Far enough behind the primary's offset to be routed around
+    redis_client.info = lambda *args, **kwargs: {"master_repl_offset": 10 * MB}
+    store._replicas.check()
+    assert shifts() == 10
+
+
+def test_token_bucket_waits_for_tokens_past_the_burst():
+    bucket = TokenBucket(rate=100, capacity=10)
+
+    assert bucket.reserve(10) == 0.0
+    assert bucket.reserve(5) == pytest.approx(0.05, abs=0.01)
+    assert bucket.waited_seconds == pytest.approx(0.05, abs=0.01)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, capacity=10)
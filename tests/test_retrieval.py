@@ -0,0 +1,109 @@
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+
+from instawork_feast.retrieval import OnlineDeclarations, get_online_features, get_online_frame
+
+NOW = datetime(2024, 1, 2, tzinfo=timezone.utc)
+VIEW = "pro_attire_features"
+RATE = f"{VIEW}:rv_float_attire_acceptance_rate"
+
+DERIVED_FEATURES = """
+from instawork_feast.derived import ratio
+
+DERIVED_FEATURES = [
+    ratio(
+        "pro_attire_features",
+        "rv_float_attire_acceptance_rate",
+        "rv_int_offshift_num_accepted_attires",
+        "rv_int_offshift_num_attire_submissions",
+    ),
+]
+"""
+
+
+def write_declaration(repo: Path, name: str, source: str):
+    """Write a feature_views module with a new mtime, so it is reloaded"""
+    path = repo / "feature_views" / name
+    previous = path.stat().st_mtime if path.exists() else 0
+    path.write_text(source)
+    os.utime(path, (previous + 1, previous + 1))
+
+
+@pytest.fixture
+def repo(feature_repo):
+    repo = Path(feature_repo.repo_path)
+    write_declaration(repo, "derived_features.py", DERIVED_FEATURES)
+    return repo
+
+
+def exclude_rate(repo: Path):
+    exclude = 'ONLINE_EXCLUDE = {"pro_attire_features": ["rv_float_attire_acceptance_rate"]}\n'
+    write_declaration(repo, "online_schema.py", exclude)
+
+
+@pytest.fixture
+def attire_rows(feature_repo):
+    """Two workers in fakeredis, each with a stored rate that differs from the derived one"""
+    rows = []
+    for worker_id, accepted, submissions in [(1, 3, 4), (2, 0, 0)]:
+        key = EntityKeyProto(join_keys=["id_worker_id"], entity_values=[ValueProto(int64_val=worker_id)])
+        values = {
+            "rv_int_offshift_num_accepted_attires": ValueProto(int64_val=accepted),
+            "rv_int_offshift_num_attire_submissions": ValueProto(int64_val=submissions),
+            "rv_float_attire_acceptance_rate": ValueProto(double_val=-1.0),
+            "mc_str_attire_status": ValueProto(string_val="approved"),
+        }
+        rows.append((key, values, NOW, None))
+    provider = feature_repo._get_provider()
+    provider.online_store.online_write_batch(feature_repo.config, feature_repo.get_feature_view(VIEW), rows, None)
+
+
+def test_stored_feature_is_not_replaced_while_online(repo):
+    declarations = OnlineDeclarations(str(repo), check_seconds=0)
+
+    assert declarations.get()[1] == {}
+
+    exclude_rate(repo)
+    schema, derived = declarations.get()
+
+    assert not schema.is_online(VIEW, "rv_float_attire_acceptance_rate")
+    assert list(derived) == [RATE]
+
+
+def test_declarations_are_reused_until_a_module_changes(repo):
+    declarations = OnlineDeclarations(str(repo), check_seconds=0)
+    schema, derived = declarations.get()
+
+    assert declarations.get()[0] is schema and declarations.get()[1] is derived
+    exclude_rate(repo)
+    assert declarations.get()[0] is not schema
+
+
+def test_online_features_return_the_stored_value_until_excluded(feature_repo, repo, attire_rows):
+    entity_rows = [{"id_worker_id": 1}, {"id_worker_id": 2}]
+
+    response = get_online_features(feature_repo, [RATE], entity_rows)
+
+    assert response["rv_float_attire_acceptance_rate"] == [-1.0, -1.0]
+
+
+def test_online_features_compute_excluded_derived_features(feature_repo, repo, attire_rows):
+    exclude_rate(repo)
+    entity_rows = [{"id_worker_id": 1}, {"id_worker_id": 2}, {"id_worker_id": 3}]
+
+    response = get_online_features(feature_repo, [f"{VIEW}:mc_str_attire_status", RATE], entity_rows)
+
+    assert list(response) == ["id_worker_id", "mc_str_attire_status", "rv_float_attire_acceptance_rate"]
+    assert response["rv_float_attire_acceptance_rate"] == [0.75, None, None]
+
+    frame = get_online_frame(feature_repo, [RATE, f"{VIEW}:mc_str_attire_status"], entity_rows)
+
+    assert list(frame.columns) == ["id_worker_id", "rv_float_attire_acceptance_rate", "mc_str_attire_status"]
+    assert frame["rv_float_attire_acceptance_rate"].tolist()[0] == 0.75
+    assert frame["rv_float_attire_acceptance_rate"].isna().tolist() == [False, True, True]
+    assert frame["mc_str_attire_status"].tolist()[:2] == ["approved", "approved"]
@@ -0,0 +1,42 @@
+import os
+
+import pytest
+
+from instawork_feast.search import get_search_index
+
+ATTIRE = "pro_attire_features"
+SESSIONS = "pro_session_features"
+
+
+@pytest.fixture
+def index(feature_repo):
+    return get_search_index(str(feature_repo.repo_path))
+
+
+def test_index_is_built_on_first_query_and_saved(feature_repo, index):
+    assert len(index) == 7
+    data_dir = os.path.join(feature_repo.repo_path, "data")
+    assert "registry.db.search.json" in os.listdir(data_dir)
+    assert get_search_index(str(feature_repo.repo_path)) is index
+
+
+def test_filters(index):
+    assert index.search("prefix:rv_float") == [
+        f"{ATTIRE}:rv_float_attire_acceptance_rate",
+        f"{SESSIONS}:rv_float_avg_session_minutes",
+    ]
+    assert index.search(window="lte_7_day") == [f"{SESSIONS}:rv_int_num_sessions_lte_7_day"]
+    assert index.search("tag:team=growth", prefix="b") == [f"{SESSIONS}:b_has_session"]
+    assert index.search("dtype:String") == [f"{ATTIRE}:mc_str_attire_status"]
+    assert index.search("view:nope") == []
+
+
+def test_words_match_by_prefix_in_registry_order(index):
+    assert index.search("attire sub") == [f"{ATTIRE}:rv_int_offshift_num_attire_submissions"]
+    assert index.search("num") == [
+        f"{ATTIRE}:rv_int_offshift_num_accepted_attires",
+        f"{ATTIRE}:rv_int_offshift_num_attire_submissions",
+        f"{SESSIONS}:rv_int_num_sessions_lte_7_day",
+    ]
+    assert index.search("num", limit=1) == [f"{ATTIRE}:rv_int_offshift_num_accepted_attires"]
+    assert index.search(f"{SESSIONS}:b_has_session") == [f"{SESSIONS}:b_has_session"]